@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark event capture throughput of the PostHog server.
+
+Starts a local PostHog API stub with a fixed per-request latency and
+compares capturing events with one capture_event call each (one /capture/
+request per event) with the capture_events tool, which queues events and
+sends them to /batch/ in batches. Reports wall time, events per second and
+the number of requests for sequential single-event calls, one batched call
+and a burst of concurrent batched calls.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+import src.servers.posthog.main as posthog_main
+from src.utils.posthog import api, capture
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%H:%M:%S",
+)
+# The server module configures INFO logging on import; keep the report readable
+logging.getLogger().setLevel(logging.WARNING)
+logger = logging.getLogger("gumcp-benchmark-posthog")
+
+PROJECT = {"id": 1, "name": "Benchmark", "api_token": "phc_benchmark"}
+
+
+class PostHogStub:
+    """Local PostHog stub answering the organization, /capture/ and /batch/ endpoints"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.requests = Counter()
+        self.events = 0
+        self.loop = None
+        self.runner = None
+        self.port = None
+        self.started = threading.Event()
+
+    async def organization(self, request):
+        self.requests["organization"] += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response({"teams": [PROJECT]})
+
+    async def capture(self, request):
+        self.requests["capture"] += 1
+        await request.json()
+        await asyncio.sleep(self.latency)
+        self.events += 1
+        return web.json_response({"status": 1})
+
+    async def batch(self, request):
+        self.requests["batch"] += 1
+        body = await request.json()
+        await asyncio.sleep(self.latency)
+        self.events += len(body["batch"])
+        return web.json_response({"status": 1})
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_get("/api/organizations/@current/", self.organization)
+        app.router.add_post("/capture/", self.capture)
+        app.router.add_post("/batch/", self.batch)
+        self.runner = web.AppRunner(app, access_log=None)
+        self.loop.run_until_complete(self.runner.setup())
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        self.loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self.started.set()
+        self.loop.run_forever()
+
+    def start(self):
+        threading.Thread(target=self.run, daemon=True).start()
+        self.started.wait()
+        return f"http://127.0.0.1:{self.port}"
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def event(index):
+    return {
+        "distinct_id": f"user-{index % 100}",
+        "event": "benchmark_event",
+        "properties": {"index": index, "plan": "pro"},
+    }
+
+
+async def call_tool(call_tool_handler, tool, arguments):
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=tool, arguments=arguments),
+    )
+    result = (await call_tool_handler(request)).root
+    text = result.content[0].text
+    if result.isError or '"status": "success"' not in text:
+        raise RuntimeError(text)
+    return text
+
+
+async def run_benchmark(stub, events, concurrency):
+    server = posthog_main.create_server("benchmark")
+    handler = server.request_handlers[CallToolRequest]
+
+    async def single_events():
+        for index in range(events):
+            await call_tool(handler, "capture_event", event(index))
+
+    async def batched():
+        await call_tool(
+            handler, "capture_events", {"events": [event(i) for i in range(events)]}
+        )
+
+    async def burst():
+        await asyncio.gather(*(batched() for _ in range(concurrency)))
+
+    results = []
+    # Warm the project cache and connection pool so each run measures capture only
+    await call_tool(handler, "capture_event", event(0))
+    for label, run, count in (
+        ("capture_event", single_events, events),
+        ("capture_events", batched, events),
+        (f"capture_events x{concurrency}", burst, events * concurrency),
+    ):
+        stub.requests.clear()
+        stub.events = 0
+        start = time.perf_counter()
+        await run()
+        elapsed = time.perf_counter() - start
+        if stub.events != count:
+            raise RuntimeError(f"{label}: stub received {stub.events} of {count}")
+        results.append((label, count, elapsed, sum(stub.requests.values())))
+
+    await capture.close_event_buffers()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark PostHog event capture against a local API stub."
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=20, help="Stub latency per request"
+    )
+    parser.add_argument(
+        "--events", type=int, default=1000, help="Events captured per run"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=5, help="capture_events calls in the burst"
+    )
+    args = parser.parse_args()
+
+    stub = PostHogStub(args.latency_ms / 1000)
+    base_url = stub.start()
+
+    async def get_posthog_credentials(user_id, api_key=None, service_name=None):
+        return "phx_benchmark"
+
+    posthog_main.get_posthog_credentials = get_posthog_credentials
+    posthog_main.POSTHOG_API_HOST = api.POSTHOG_API_HOST = base_url
+    posthog_main.POSTHOG_INGEST_HOST = capture.POSTHOG_INGEST_HOST = base_url
+
+    print(f"{'tool':<22}{'events':>8}{'time (s)':>10}{'events/s':>10}{'requests':>10}")
+    try:
+        results = asyncio.run(run_benchmark(stub, args.events, args.concurrency))
+        for label, count, elapsed, requests in results:
+            print(
+                f"{label:<22}{count:>8}{elapsed:>10.3f}"
+                f"{count / elapsed:>10.0f}{requests:>10}"
+            )
+    finally:
+        stub.stop()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Slack server's read_messages and get_message_thread tools.
+
+Starts a local Slack Web API stub with a fixed per-request latency and
+compares the previous pipeline (blocking WebClient, one users.info call per
+message) with the current one (AsyncWebClient on the shared session, user
+info from the workspace directory). Reports wall time and the number of
+Web API requests for a single call, a warm call and a burst of concurrent
+calls.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+from mcp.types import CallToolRequest, CallToolRequestParams
+from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
+
+import src.servers.slack.main as slack_main
+from src.utils.slack import directory
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%H:%M:%S",
+)
+# The server module configures INFO logging on import; keep the report readable
+logging.getLogger().setLevel(logging.WARNING)
+logger = logging.getLogger("gumcp-benchmark-slack")
+
+CHANNEL_ID = "C0BENCH"
+THREAD_TS = "1700000000.000000"
+
+
+class SlackStub:
+    """Local Slack Web API stub answering the methods used by the benchmarked tools"""
+
+    def __init__(self, latency, messages, users):
+        self.latency = latency
+        self.messages = messages
+        self.users = users
+        self.requests = Counter()
+        self.loop = None
+        self.runner = None
+        self.port = None
+        self.started = threading.Event()
+
+    def user(self, index):
+        return {
+            "id": f"U{index:05d}",
+            "name": f"user{index}",
+            "real_name": f"User {index}",
+            "profile": {"display_name": f"user{index}", "email": None},
+        }
+
+    def message(self, index):
+        return {
+            "type": "message",
+            "user": f"U{index % self.users:05d}",
+            "text": f"Message {index}",
+            "ts": f"{1700000000 + index}.000000",
+        }
+
+    async def handle(self, request):
+        method = request.match_info["method"]
+        self.requests[method] += 1
+        await asyncio.sleep(self.latency)
+
+        params = dict(request.query)
+        if request.can_read_body:
+            params.update(await request.post())
+        limit = int(params.get("limit") or 100)
+        cursor = int(params.get("cursor") or 0)
+
+        if method == "auth.test":
+            return web.json_response({"ok": True, "team_id": "T0BENCH"})
+        if method == "users.list":
+            members = [
+                self.user(index)
+                for index in range(cursor, min(cursor + limit, self.users))
+            ]
+            next_cursor = str(cursor + limit) if cursor + limit < self.users else ""
+            return web.json_response(
+                {
+                    "ok": True,
+                    "members": members,
+                    "response_metadata": {"next_cursor": next_cursor},
+                }
+            )
+        if method == "users.info":
+            index = int(params["user"][1:])
+            return web.json_response({"ok": True, "user": self.user(index)})
+        if method in ("conversations.history", "conversations.replies"):
+            count = min(limit, self.messages)
+            messages = [self.message(index) for index in range(count)]
+            return web.json_response(
+                {"ok": True, "messages": messages, "has_more": False}
+            )
+        return web.json_response({"ok": False, "error": "unknown_method"})
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_route("*", "/api/{method}", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        self.loop.run_until_complete(self.runner.setup())
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        self.loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self.started.set()
+        self.loop.run_forever()
+
+    def start(self):
+        threading.Thread(target=self.run, daemon=True).start()
+        self.started.wait()
+        return f"http://127.0.0.1:{self.port}/api/"
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def enrich_blocking(slack_client, messages):
+    """Previous enrichment: one users.info call per message"""
+    for message in messages:
+        user_info = slack_client.users_info(user=message["user"])
+        user_data = user_info["user"]
+        message["user_name"] = user_data.get("real_name") or user_data.get("name")
+        message["user_profile"] = user_data.get("profile", {})
+    return messages
+
+
+def read_messages_blocking(slack_client, limit):
+    """Previous read_messages pipeline"""
+    response = slack_client.conversations_history(channel=CHANNEL_ID, limit=limit)
+    return enrich_blocking(slack_client, list(reversed(response["messages"])))
+
+
+def get_message_thread_blocking(slack_client, limit):
+    """Previous get_message_thread pipeline"""
+    slack_client.conversations_history(
+        channel=CHANNEL_ID, latest=THREAD_TS, limit=1, inclusive=True
+    )
+    response = slack_client.conversations_replies(
+        channel=CHANNEL_ID, ts=THREAD_TS, limit=limit
+    )
+    return enrich_blocking(slack_client, list(reversed(response["messages"])))
+
+
+def tool_arguments(tool, limit):
+    if tool == "read_messages":
+        return {"channel": CHANNEL_ID, "limit": limit}
+    return {"channel": CHANNEL_ID, "thread_ts": THREAD_TS, "limit": limit}
+
+
+async def call_tool(call_tool_handler, tool, limit):
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=tool, arguments=tool_arguments(tool, limit)),
+    )
+    result = (await call_tool_handler(request)).root
+    if result.isError:
+        raise RuntimeError(result.content[0].text)
+    return result.content
+
+
+async def run_async_pipeline(base_url, stub, tool, limit, concurrency):
+    """Time a cold call, a warm call and a concurrent burst through the server"""
+
+    async def create_slack_client(user_id, api_key=None):
+        return AsyncWebClient(
+            token="xoxb-benchmark",
+            base_url=base_url,
+            session=slack_main.get_slack_session(),
+        )
+
+    # Start every tool from an empty workspace directory
+    directory._directories.clear()
+    directory._token_directories.clear()
+    directory._team_ids.clear()
+
+    slack_main.create_slack_client = create_slack_client
+    server = slack_main.create_server("benchmark")
+    handler = server.request_handlers[CallToolRequest]
+
+    results = []
+    for label, calls in (("cold", 1), ("warm", 1), ("burst", concurrency)):
+        stub.requests.clear()
+        start = time.perf_counter()
+        await asyncio.gather(*(call_tool(handler, tool, limit) for _ in range(calls)))
+        results.append(
+            (label, time.perf_counter() - start, sum(stub.requests.values()))
+        )
+
+    await slack_main.get_slack_session().close()
+    return results
+
+
+def run_blocking_pipeline(base_url, stub, tool, limit, concurrency):
+    """Time the previous pipeline; blocking calls serialize on the event loop"""
+    slack_client = WebClient(token="xoxb-benchmark", base_url=base_url)
+    pipeline = (
+        read_messages_blocking
+        if tool == "read_messages"
+        else get_message_thread_blocking
+    )
+
+    results = []
+    for label, calls in (("cold", 1), ("warm", 1), ("burst", concurrency)):
+        stub.requests.clear()
+        start = time.perf_counter()
+        for _ in range(calls):
+            pipeline(slack_client, limit)
+        results.append(
+            (label, time.perf_counter() - start, sum(stub.requests.values()))
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark Slack message tools against a local API stub."
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=20, help="Stub latency per request"
+    )
+    parser.add_argument(
+        "--messages", type=int, default=50, help="Messages returned per call"
+    )
+    parser.add_argument(
+        "--users", type=int, default=500, help="Users in the stub workspace"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="Tool calls in the burst"
+    )
+    args = parser.parse_args()
+
+    stub = SlackStub(args.latency_ms / 1000, args.messages, args.users)
+    base_url = stub.start()
+
+    print(f"{'tool':<20}{'pipeline':<10}{'run':<8}{'time (s)':>10}{'requests':>10}")
+    try:
+        for tool in ("read_messages", "get_message_thread"):
+            pipelines = [
+                (
+                    "blocking",
+                    run_blocking_pipeline(
+                        base_url, stub, tool, args.messages, args.concurrency
+                    ),
+                ),
+                (
+                    "async",
+                    asyncio.run(
+                        run_async_pipeline(
+                            base_url, stub, tool, args.messages, args.concurrency
+                        )
+                    ),
+                ),
+            ]
+            for pipeline, results in pipelines:
+                for label, elapsed, requests in results:
+                    print(
+                        f"{tool:<20}{pipeline:<10}{label:<8}{elapsed:>10.3f}{requests:>10}"
+                    )
+    finally:
+        stub.stop()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Benchmark 100 sequential list_tables calls of the Snowflake server.
+
+Snowflake cannot run locally, so the connector's connect() is replaced by a
+simulated connection with a fixed login latency and per-statement latency.
+Compares the previous pipeline (a new connection per tool call, closed
+afterwards) with the current one (pooled connections, connector calls in
+the Snowflake thread pool), and checks that the event loop stays
+responsive while calls run.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import snowflake.connector
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+import src.servers.snowflake.main as snowflake_main
+from src.utils.snowflake import pool
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%H:%M:%S",
+)
+# The server module configures INFO logging on import; keep the report readable
+logging.getLogger().setLevel(logging.WARNING)
+logger = logging.getLogger("gumcp-benchmark-snowflake")
+
+CREDENTIALS = {"username": "BENCH", "password": "bench", "account": "bench-account"}
+DATABASE = "BENCH_DB"
+
+
+class SimulatedCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, statement):
+        self.connection.statements += 1
+        time.sleep(self.connection.query_latency)
+        if statement.startswith("USE DATABASE "):
+            self.connection.database = statement.split()[-1].strip('"')
+            self.connection.schema = "PUBLIC"
+        return self
+
+    def fetchall(self):
+        return [("TABLE_1", DATABASE, "PUBLIC"), ("TABLE_2", DATABASE, "PUBLIC")]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SimulatedConnection:
+    """Connection with a blocking login and statement latency"""
+
+    logins = 0
+
+    def __init__(self, login_latency, query_latency, **kwargs):
+        SimulatedConnection.logins += 1
+        time.sleep(login_latency)
+        self.query_latency = query_latency
+        self.statements = 0
+        self.closed = False
+        # Session context as reported by the connector
+        self.role = "PUBLIC"
+        self.warehouse = None
+        self.database = None
+        self.schema = None
+
+    def cursor(self):
+        return SimulatedCursor(self)
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+async def measure_loop_lag(stop):
+    """Largest delay of a 10ms timer on the event loop while calls run"""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        worst = max(worst, time.perf_counter() - start - 0.01)
+    return worst
+
+
+def list_tables_per_call_connection():
+    """Previous pipeline: log in, run the tool and close the connection"""
+    conn = snowflake.connector.connect(
+        user=CREDENTIALS["username"],
+        password=CREDENTIALS["password"],
+        account=CREDENTIALS["account"],
+        client_session_keep_alive=True,
+    )
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"USE DATABASE {DATABASE}")
+        cursor.execute("SHOW TABLES")
+        return str(cursor.fetchall())
+    finally:
+        cursor.close()
+        conn.close()
+
+
+async def run_previous(calls):
+    stop = asyncio.Event()
+    lag = asyncio.create_task(measure_loop_lag(stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        # The previous handler called the connector directly on the event loop
+        list_tables_per_call_connection()
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    return elapsed, await lag
+
+
+async def run_pooled(calls):
+    server = snowflake_main.create_server("benchmark")
+    handler = server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(
+            name="list_tables", arguments={"database_name": DATABASE}
+        ),
+    )
+
+    stop = asyncio.Event()
+    lag = asyncio.create_task(measure_loop_lag(stop))
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        result = (await handler(request)).root
+        if result.isError or "TABLE_1" not in result.content[0].text:
+            raise RuntimeError(result.content[0].text)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    return elapsed, await lag
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark sequential Snowflake list_tables calls."
+    )
+    parser.add_argument("--calls", type=int, default=100, help="Tool calls to run")
+    parser.add_argument(
+        "--login-ms", type=float, default=1500, help="Simulated login latency"
+    )
+    parser.add_argument(
+        "--query-ms", type=float, default=30, help="Simulated statement latency"
+    )
+    args = parser.parse_args()
+
+    def connect(**kwargs):
+        return SimulatedConnection(args.login_ms / 1000, args.query_ms / 1000)
+
+    snowflake.connector.connect = connect
+    snowflake_main.get_snowflake_credentials = lambda user_id, api_key=None: dict(
+        CREDENTIALS
+    )
+
+    print(f"{'pipeline':<12}{'calls':>6}{'time (s)':>10}{'per call (ms)':>15}", end="")
+    print(f"{'logins':>8}{'max loop lag (ms)':>19}")
+    for label, run in (("per-call", run_previous), ("pooled", run_pooled)):
+        SimulatedConnection.logins = 0
+        pool.close_pools()
+        elapsed, lag = asyncio.run(run(args.calls))
+        print(
+            f"{label:<12}{args.calls:>6}{elapsed:>10.2f}"
+            f"{elapsed / args.calls * 1000:>15.1f}"
+            f"{SimulatedConnection.logins:>8}{lag * 1000:>19.1f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Word server's docx processing.
+
+Builds an image-heavy .docx package on disk and compares the previous
+python-docx pipeline (full download into memory, Document load, save) with
+the streaming pipeline in src/utils/microsoft/docx_stream.py for both
+read_document and write_document. Reports wall time and peak Python heap.
+"""
+import argparse
+import io
+import logging
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from docx import Document
+
+from src.utils.microsoft.docx_stream import (
+    COPY_CHUNK_SIZE,
+    append_paragraph_to_docx,
+    extract_docx_text,
+    new_spooled_file,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%H:%M:%S",
+)
+logger = logging.getLogger("gumcp-benchmark-word")
+
+
+def build_png(width, height, payload_size):
+    """Build a PNG with a valid header and incompressible pixel data"""
+
+    def chunk(chunk_type, data):
+        return (
+            struct.pack(">I", len(data))
+            + chunk_type
+            + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data))
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", os.urandom(payload_size))
+        + chunk(b"IEND", b"")
+    )
+
+
+def build_document(path, size_mb, images, paragraphs):
+    """Write an image-heavy .docx package of roughly size_mb megabytes"""
+    doc = Document()
+    image_size = size_mb * 1024 * 1024 // images
+
+    for index in range(images):
+        doc.add_paragraph(f"Figure {index + 1}")
+        doc.add_picture(io.BytesIO(build_png(800, 600, image_size)))
+        for line in range(paragraphs // images):
+            doc.add_paragraph(f"Paragraph {line} describing figure {index + 1}.")
+
+    doc.save(path)
+
+
+def read_with_python_docx(path):
+    """Previous read_document pipeline"""
+    with open(path, "rb") as f:
+        content = f.read()
+    doc = Document(io.BytesIO(content))
+    return "\n".join(para.text for para in doc.paragraphs if para.text)
+
+
+def read_streaming(path):
+    """Streaming read_document pipeline"""
+    document_file = new_spooled_file()
+    with open(path, "rb") as f:
+        shutil.copyfileobj(f, document_file, COPY_CHUNK_SIZE)
+    document_file.seek(0)
+    try:
+        return extract_docx_text(document_file)
+    finally:
+        document_file.close()
+
+
+def write_with_python_docx(path):
+    """Previous write_document pipeline"""
+    with open(path, "rb") as f:
+        content = f.read()
+    doc = Document(io.BytesIO(content))
+    doc.add_paragraph("Appended by benchmark")
+    updated_bytes = io.BytesIO()
+    doc.save(updated_bytes)
+    return len(updated_bytes.getvalue())
+
+
+def write_streaming(path):
+    """Streaming write_document pipeline"""
+    document_file = new_spooled_file()
+    updated_file = new_spooled_file()
+    with open(path, "rb") as f:
+        shutil.copyfileobj(f, document_file, COPY_CHUNK_SIZE)
+    document_file.seek(0)
+    try:
+        append_paragraph_to_docx(document_file, "Appended by benchmark", updated_file)
+        return updated_file.seek(0, os.SEEK_END)
+    finally:
+        document_file.close()
+        updated_file.close()
+
+
+def measure(func, path, runs):
+    """Return the best wall time and the peak traced memory of func(path)"""
+    timings = []
+    peak = 0
+    for _ in range(runs):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func(path)
+        timings.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark docx processing in the Word server."
+    )
+    parser.add_argument(
+        "--size-mb", type=int, default=50, help="Approximate document size in MB"
+    )
+    parser.add_argument(
+        "--images", type=int, default=25, help="Number of embedded images"
+    )
+    parser.add_argument(
+        "--paragraphs", type=int, default=2000, help="Number of text paragraphs"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Runs per pipeline")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "benchmark.docx")
+        build_document(path, args.size_mb, args.images, args.paragraphs)
+        logger.info(
+            f"Built {os.path.getsize(path) / 1024 / 1024:.1f} MB document with {args.images} images"
+        )
+
+        if read_with_python_docx(path) != read_streaming(path):
+            logger.error("Streaming text extraction differs from python-docx")
+            return 1
+
+        pipelines = [
+            ("read_document", "python-docx", read_with_python_docx),
+            ("read_document", "streaming", read_streaming),
+            ("write_document", "python-docx", write_with_python_docx),
+            ("write_document", "streaming", write_streaming),
+        ]
+
+        print(
+            f"{'tool':<16}{'pipeline':<14}{'best time (s)':>15}{'peak heap (MB)':>17}"
+        )
+        for tool, pipeline, func in pipelines:
+            elapsed, peak = measure(func, path, args.runs)
+            print(
+                f"{tool:<16}{pipeline:<14}{elapsed:>15.3f}{peak / 1024 / 1024:>17.1f}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
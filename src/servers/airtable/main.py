@@ -33,6 +33,8 @@ from src.utils.airtable.util import (
     authenticate_and_save_credentials,
     get_credentials,
 )
+from src.utils.rate_limit.util import RateLimitError, create_aiohttp_trace_config
+from src.utils.cache.util import cached_tool_calls
 
 
 SERVICE_NAME = Path(__file__).parent.name
@@ -50,8 +52,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(SERVICE_NAME)
 
+# Read-only tools whose responses are cached, with their TTL in seconds
+CACHED_TOOL_TTLS = {
+    "list_bases": 300,
+    "list_tables": 300,
+    "base_schema": 300,
+}
+
+# Write tools and the cached tools whose responses they make stale
+SCHEMA_TOOLS = ["list_bases", "list_tables", "base_schema"]
+CACHE_INVALIDATIONS = {
+    "create_table": SCHEMA_TOOLS,
+    "update_table": SCHEMA_TOOLS,
+    "create_field": SCHEMA_TOOLS,
+    "update_field": SCHEMA_TOOLS,
+    "create_base": SCHEMA_TOOLS,
+    "delete_base": SCHEMA_TOOLS,
+}
+
 T = TypeVar("T")
 
+RETRYABLE_ERRORS = (
+    RateLimitError,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+)
+
 
 async def with_exponential_backoff(
     func: Callable[[], T],
@@ -63,6 +89,9 @@ async def with_exponential_backoff(
     """
     Execute a function with exponential backoff retry logic
 
+    Only rate limit (429) responses and transient connection errors are
+    retried. Other errors, such as invalid requests, are raised immediately.
+
     Args:
         func: Async function to execute
         max_retries: Maximum number of retries
@@ -76,7 +105,7 @@ async def with_exponential_backoff(
     for attempt in range(max_retries + 1):
         try:
             return await func()
-        except Exception as e:
+        except RETRYABLE_ERRORS as e:
             last_exception = e
             if attempt == max_retries:
                 raise last_exception
@@ -108,7 +137,11 @@ def process_airtable_token_response(token_response: Dict[str, Any]) -> Dict[str,
 async def create_airtable_session(user_id, api_key=None):
     """Create a new aiohttp session for Airtable API requests"""
     access_token = await get_credentials(user_id, SERVICE_NAME, api_key=api_key)
-    session = aiohttp.ClientSession(headers={"Authorization": f"Bearer {access_token}"})
+    # Requests share one rate limit bucket per token across all sessions
+    session = aiohttp.ClientSession(
+        headers={"Authorization": f"Bearer {access_token}"},
+        trace_configs=[create_aiohttp_trace_config(SERVICE_NAME, access_token)],
+    )
     return session
 
 
@@ -785,6 +818,7 @@ def create_server(user_id, api_key=None):
         ]
 
     @server.call_tool()
+    @cached_tool_calls(server, SERVICE_NAME, CACHED_TOOL_TTLS, CACHE_INVALIDATIONS)
     async def handle_call_tool(
         name: str, arguments: Dict[str, Any] | None
     ) -> List[TextContent | ImageContent | EmbeddedResource]:
@@ -1,9 +1,11 @@
 import os
 import sys
+import asyncio
+import base64
 import logging
 import json
+from contextlib import aclosing
 from pathlib import Path
-import datetime
 from typing import Optional, Iterable
 
 # Add both project root and src directory to Python path
@@ -19,11 +21,22 @@ from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 
-from github import Github
-from github.GithubObject import GithubObject
-
 from src.auth.factory import create_auth_client
+from src.utils.github.api import (
+    GitHubAPIError,
+    MAX_ITEMS,
+    clamp_max_items,
+    github_graphql,
+    github_json,
+    github_request,
+    iterate_items,
+    list_items,
+    repo_path,
+)
+from src.utils.github.trees import list_files
 from src.utils.github.util import authenticate_and_save_credentials
+from src.utils.cache.util import cached_tool_calls
+from src.utils.pagination.util import paginate
 
 SERVICE_NAME = Path(__file__).parent.name
 SCOPES = [
@@ -39,6 +52,90 @@ logging.basicConfig(
 )
 logger = logging.getLogger(SERVICE_NAME)
 
+# Read-only tools whose responses are cached, with their TTL in seconds
+CACHED_TOOL_TTLS = {
+    "list_repository_languages": 3600,
+    "get_commit": 3600,
+    "get_stargazers_count": 300,
+    "list_stargazers": 300,
+    "list_branches": 120,
+    "get_contents": 60,
+    "get_issue": 60,
+    "get_pull_request": 60,
+}
+
+# Write tools and the cached tools whose responses they make stale
+CACHE_INVALIDATIONS = {
+    "star_repository": ["get_stargazers_count", "list_stargazers"],
+    "create_branch": ["list_branches"],
+    "add_file_to_repository": [
+        "get_contents",
+        "list_branches",
+        "list_repository_languages",
+    ],
+    "update_issue": ["get_issue"],
+    "add_comment_to_issue": ["get_issue"],
+}
+
+# Fields of the organization and user resources
+ORGANIZATION_RESOURCE_KEYS = (
+    "login",
+    "name",
+    "avatar_url",
+    "html_url",
+    "description",
+    "email",
+    "public_repos",
+)
+USER_RESOURCE_KEYS = (
+    "login",
+    "name",
+    "avatar_url",
+    "html_url",
+    "bio",
+    "location",
+    "email",
+    "public_repos",
+    "followers",
+    "following",
+)
+
+STARGAZER_COUNT_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { stargazerCount }
+}
+"""
+
+MILESTONES_QUERY = """
+query($owner: String!, $name: String!, $title: String!) {
+  repository(owner: $owner, name: $name) {
+    milestones(query: $title, first: 20, states: [OPEN, CLOSED]) {
+      nodes { number title }
+    }
+  }
+}
+"""
+
+VIEWER_QUERY = """
+query {
+  viewer {
+    login
+    organizations(first: 100) { nodes { login name } }
+  }
+}
+"""
+
+OWNER_REPOSITORIES_QUERY = """
+query($login: String!, $after: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $after, orderBy: {field: NAME, direction: ASC}) {
+      nodes { name description }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
 
 async def get_credentials(user_id, api_key=None):
     """
@@ -73,19 +170,44 @@ async def get_credentials(user_id, api_key=None):
     handle_missing()
 
 
-async def create_github_client(user_id, api_key=None):
+async def resolve_milestone(token, owner, repo_name, milestone):
     """
-    Creates an authorized GitHub client instance.
+    Get the milestone filter of the issues API from a milestone number or title.
 
-    Args:
-        user_id (str): The user identifier.
-        api_key (Optional[str]): Optional API key.
-
-    Returns:
-        Github: An authenticated GitHub client object.
+    Titles are looked up with a single GraphQL query instead of listing
+    every milestone of the repository.
     """
-    token = await get_credentials(user_id, api_key)
-    return Github(token)
+    if milestone in ("*", "none") or milestone.isdigit():
+        return milestone
+    data = await github_graphql(
+        token,
+        MILESTONES_QUERY,
+        {"owner": owner, "name": repo_name, "title": milestone},
+    )
+    for node in data["repository"]["milestones"]["nodes"]:
+        if node["title"] == milestone:
+            return str(node["number"])
+    raise ValueError(f"Milestone not found: {milestone}")
+
+
+async def iterate_owner_repositories(token, login):
+    """Iterate over the names and descriptions of a user's or organization's repositories"""
+
+    async def fetch_page(after):
+        data = await github_graphql(
+            token, OWNER_REPOSITORIES_QUERY, {"login": login, "after": after}
+        )
+        if not data["repositoryOwner"]:
+            raise ValueError(f"GitHub user or organization not found: {login}")
+        repositories = data["repositoryOwner"]["repositories"]
+        page_info = repositories["pageInfo"]
+        return repositories["nodes"], (
+            page_info["endCursor"] if page_info["hasNextPage"] else None
+        )
+
+    async with aclosing(paginate(fetch_page, max_items=MAX_ITEMS)) as repos:
+        async for repo in repos:
+            yield repo
 
 
 def create_server(user_id, api_key=None):
@@ -110,7 +232,7 @@ def create_server(user_id, api_key=None):
         """List GitHub accounts and repositories"""
         logger.info(f"Listing resources for user: {user_id}, parent: {parent_uri}")
 
-        github = await create_github_client(server.user_id, server.api_key)
+        token = await get_credentials(server.user_id, server.api_key)
         resources = []
 
         try:
@@ -121,16 +243,15 @@ def create_server(user_id, api_key=None):
                 org_name = str(parent_uri).replace("github://organization/", "")
 
                 try:
-                    organization = github.get_organization(org_name)
-                    repos = organization.get_repos()
-                    for repo in repos:
+                    # Works for personal accounts and organizations alike
+                    async for repo in iterate_owner_repositories(token, org_name):
                         resources.append(
                             Resource(
-                                uri=f"github://organization/{org_name}/repository/{repo.name}",
+                                uri=f"github://organization/{org_name}/repository/{repo['name']}",
                                 mimeType="application/json",
-                                name=repo.name,
-                                description=repo.description
-                                or f"Repository: {repo.name}",
+                                name=repo["name"],
+                                description=repo["description"]
+                                or f"Repository: {repo['name']}",
                                 parentUri=parent_uri,
                             )
                         )
@@ -139,27 +260,27 @@ def create_server(user_id, api_key=None):
 
                 return resources
 
-            user = github.get_user()
+            # The account and its organizations in one request
+            user = (await github_graphql(token, VIEWER_QUERY))["viewer"]
 
             # Add personal account
             resources.append(
                 Resource(
-                    uri=f"github://organization/{user.login}",
+                    uri=f"github://organization/{user['login']}",
                     mimeType="application/json",
-                    name=f"{user.login}",
+                    name=f"{user['login']}",
                     description=f"Personal GitHub account",
                     hasChildren=True,
                 )
             )
 
             # Add organizations
-            orgs = user.get_orgs()
-            for org in orgs:
+            for org in user["organizations"]["nodes"]:
                 resources.append(
                     Resource(
-                        uri=f"github://organization/{org.login}",
+                        uri=f"github://organization/{org['login']}",
                         mimeType="application/json",
-                        name=org.name or org.login,
+                        name=org["name"] or org["login"],
                         description=f"GitHub organization",
                         hasChildren=True,
                     )
@@ -175,7 +296,7 @@ def create_server(user_id, api_key=None):
         """Read GitHub resources"""
         logger.info(f"Reading resource: {uri} for user: {user_id}")
 
-        github = await create_github_client(server.user_id, server.api_key)
+        token = await get_credentials(server.user_id, server.api_key)
 
         uri_str = str(uri)
         if not uri_str.startswith("github://"):
@@ -190,33 +311,15 @@ def create_server(user_id, api_key=None):
                 org_name = parts[1]
                 try:
                     # Try to get as organization first
-                    org = github.get_organization(org_name)
-                    result = {
-                        "type": "organization",
-                        "login": org.login,
-                        "name": org.name,
-                        "avatar_url": org.avatar_url,
-                        "html_url": org.html_url,
-                        "description": org.description,
-                        "email": org.email,
-                        "public_repos": org.public_repos,
-                    }
-                except Exception:
+                    org = await github_json(token, "GET", f"/orgs/{org_name}")
+                    result = {"type": "organization"}
+                    keys = ORGANIZATION_RESOURCE_KEYS
+                except GitHubAPIError:
                     # Fall back to user
-                    user = github.get_user(org_name)
-                    result = {
-                        "type": "user",
-                        "login": user.login,
-                        "name": user.name,
-                        "avatar_url": user.avatar_url,
-                        "html_url": user.html_url,
-                        "bio": user.bio,
-                        "location": user.location,
-                        "email": user.email,
-                        "public_repos": user.public_repos,
-                        "followers": user.followers,
-                        "following": user.following,
-                    }
+                    org = await github_json(token, "GET", f"/users/{org_name}")
+                    result = {"type": "user"}
+                    keys = USER_RESOURCE_KEYS
+                result.update({key: org.get(key) for key in keys})
 
                 return [
                     ReadResourceContents(
@@ -233,36 +336,34 @@ def create_server(user_id, api_key=None):
                 org_name = parts[1]
                 repo_name = parts[3]
 
-                try:
-                    # Try to get as organization first
-                    org = github.get_organization(org_name)
-                    repo = org.get_repo(repo_name)
-                except Exception:
-                    # Fall back to user
-                    user = github.get_user(org_name)
-                    repo = user.get_repo(repo_name)
-
-                result = github_object_to_json(repo)
-
-                try:
-                    result["readme"] = (
-                        repo.get_readme().decoded_content.decode()
-                        if repo.get_readme()
-                        else None
-                    )
-                except Exception:
-                    result["readme"] = None
+                repo = repo_path(org_name, repo_name)
+
+                # The repository and its details are fetched concurrently
+                result, readme, languages, contributors = await asyncio.gather(
+                    github_json(token, "GET", repo),
+                    github_request(
+                        token,
+                        "GET",
+                        f"{repo}/readme",
+                        headers={"Accept": "application/vnd.github.raw+json"},
+                    ),
+                    github_json(token, "GET", f"{repo}/languages"),
+                    github_json(
+                        token, "GET", f"{repo}/contributors", params={"per_page": 10}
+                    ),
+                )
 
-                result["languages"] = repo.get_languages()
-                result["topics"] = repo.get_topics()
+                result["readme"] = readme.text if readme.status_code == 200 else None
+                result["languages"] = languages
+                result["topics"] = result.get("topics", [])
                 result["contributors"] = [
                     {
-                        "login": c.login,
-                        "contributions": c.contributions,
-                        "avatar_url": c.avatar_url,
-                        "html_url": c.html_url,
+                        "login": c["login"],
+                        "contributions": c["contributions"],
+                        "avatar_url": c["avatar_url"],
+                        "html_url": c["html_url"],
                     }
-                    for c in repo.get_contributors()[:10]
+                    for c in contributors or []
                 ]
 
                 return [
@@ -370,7 +471,7 @@ def create_server(user_id, api_key=None):
                         },
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of results to return. Default: all results.",
+                            "description": "Maximum number of results to return. Default: 100, max: 1000.",
                         },
                         "sort": {
                             "type": "string",
@@ -407,7 +508,7 @@ def create_server(user_id, api_key=None):
                         },
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of results to return. Default: all results.",
+                            "description": "Maximum number of results to return. Default: 100, max: 1000.",
                         },
                         "type": {
                             "type": "string",
@@ -449,7 +550,7 @@ def create_server(user_id, api_key=None):
                         },
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of results to return. Default: all results.",
+                            "description": "Maximum number of results to return. Default: 100, max: 1000.",
                         },
                     },
                     "required": ["org_name"],
@@ -491,6 +592,10 @@ def create_server(user_id, api_key=None):
                             "type": "boolean",
                             "description": "Get directory contents recursively",
                         },
+                        "include_content": {
+                            "type": "boolean",
+                            "description": "With recursive, also return the base64 content of each file (up to 100 files of at most 1 MB)",
+                        },
                     },
                     "required": ["owner", "repo_name", "path"],
                 },
@@ -613,7 +718,7 @@ def create_server(user_id, api_key=None):
                         },
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of commits to return. Default: all commits.",
+                            "description": "Maximum number of commits to return. Default: 100, max: 1000.",
                         },
                         "path": {
                             "type": "string",
@@ -705,7 +810,7 @@ def create_server(user_id, api_key=None):
                         },
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of stargazers to return. Default: all stargazers.",
+                            "description": "Maximum number of stargazers to return. Default: 100, max: 1000.",
                         },
                     },
                     "required": ["owner", "repo_name"],
@@ -753,7 +858,7 @@ def create_server(user_id, api_key=None):
                     "properties": {
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of repos to return. Default: all repos.",
+                            "description": "Maximum number of repos to return. Default: 100, max: 1000.",
                         },
                     },
                 },
@@ -784,7 +889,7 @@ def create_server(user_id, api_key=None):
                         },
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of issues to return. Default: all issues.",
+                            "description": "Maximum number of issues to return. Default: 100, max: 1000.",
                         },
                         "state": {
                             "type": "string",
@@ -1006,7 +1111,7 @@ def create_server(user_id, api_key=None):
                         },
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of branches to return. Default: all branches.",
+                            "description": "Maximum number of branches to return. Default: 100, max: 1000.",
                         },
                     },
                     "required": ["repo_name", "owner"],
@@ -1072,7 +1177,7 @@ def create_server(user_id, api_key=None):
                         },
                         "max_limit": {
                             "type": "integer",
-                            "description": "Maximum number of pull requests to return. Default: all PRs.",
+                            "description": "Maximum number of pull requests to return. Default: 100, max: 1000.",
                         },
                         "state": {
                             "type": "string",
@@ -1235,6 +1340,7 @@ def create_server(user_id, api_key=None):
         ]
 
     @server.call_tool()
+    @cached_tool_calls(server, SERVICE_NAME, CACHED_TOOL_TTLS, CACHE_INVALIDATIONS)
     async def handle_call_tool(name: str, arguments: dict | None):
         """
         Dispatches a tool call to the corresponding GitHub API method.
@@ -1251,368 +1357,328 @@ def create_server(user_id, api_key=None):
         """
         logger.info(f"User {user_id} calling tool: {name} with args: {arguments}")
 
-        github = await create_github_client(server.user_id, server.api_key)
+        token = await get_credentials(server.user_id, server.api_key)
 
         if arguments is None:
             arguments = {}
 
         try:
+            # Listing tools return at most max_limit items (DEFAULT_MAX_ITEMS when
+            # not given) and stop paginating once they have them
+            max_items = clamp_max_items(arguments.get("max_limit"))
+
             # Repository Management
             if name == "create_repository":
-                optional_params = {}
-                if "description" in arguments:
-                    optional_params["description"] = arguments["description"]
-                if "private" in arguments:
-                    optional_params["private"] = arguments["private"]
+                data = {"name": arguments["name"]}
+                for key in (
+                    "description",
+                    "private",
+                    "gitignore_template",
+                    "license_template",
+                    "homepage",
+                    "has_issues",
+                    "has_projects",
+                    "has_wiki",
+                    "has_downloads",
+                ):
+                    if key in arguments:
+                        data[key] = arguments[key]
                 if "autoInit" in arguments:
-                    optional_params["auto_init"] = arguments["autoInit"]
-                # Add new parameters
-                if "gitignore_template" in arguments:
-                    optional_params["gitignore_template"] = arguments[
-                        "gitignore_template"
-                    ]
-                if "license_template" in arguments:
-                    optional_params["license_template"] = arguments["license_template"]
-                if "homepage" in arguments:
-                    optional_params["homepage"] = arguments["homepage"]
-                if "has_issues" in arguments:
-                    optional_params["has_issues"] = arguments["has_issues"]
-                if "has_projects" in arguments:
-                    optional_params["has_projects"] = arguments["has_projects"]
-                if "has_wiki" in arguments:
-                    optional_params["has_wiki"] = arguments["has_wiki"]
-                if "has_downloads" in arguments:
-                    optional_params["has_downloads"] = arguments["has_downloads"]
-                if "topics" in arguments:
-                    optional_params["topics"] = arguments["topics"].split(",")
+                    data["auto_init"] = arguments["autoInit"]
 
-                user = github.get_user()
-                repo = user.create_repo(arguments["name"], **optional_params)
-                result = github_object_to_json(repo)
+                result = await github_json(token, "POST", "/user/repos", json=data)
+                if "topics" in arguments:
+                    topics = await github_json(
+                        token,
+                        "PUT",
+                        f"{repo_path(result['full_name'])}/topics",
+                        json={"names": arguments["topics"].split(",")},
+                    )
+                    result["topics"] = topics["names"]
 
             elif name == "search_repositories":
                 # Add sorting parameters if provided
-                kwargs = {"query": arguments["query"]}
+                params = {"q": arguments["query"]}
                 if "sort" in arguments:
-                    kwargs["sort"] = arguments["sort"]
+                    params["sort"] = arguments["sort"]
                 if "order" in arguments:
-                    kwargs["order"] = arguments["order"]
+                    params["order"] = arguments["order"]
 
-                repos = github.search_repositories(**kwargs)
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(repos[:max_limit]))
-                else:
-                    result = github_object_to_json(list(repos))
+                result = await list_items(
+                    token, "/search/repositories", params, max_items, "items"
+                )
 
             elif name == "list_public_user_repositories":
-                user = github.get_user(arguments["username"])
-
                 # Add repository filtering parameters
-                kwargs = {}
-                if "type" in arguments:
-                    kwargs["type"] = arguments["type"]
-                if "sort" in arguments:
-                    kwargs["sort"] = arguments["sort"]
-                if "direction" in arguments:
-                    kwargs["direction"] = arguments["direction"]
-
-                repos = user.get_repos(**kwargs)
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(repos[:max_limit]))
-                else:
-                    result = github_object_to_json(list(repos))
+                params = {
+                    key: arguments[key]
+                    for key in ("type", "sort", "direction")
+                    if key in arguments
+                }
+                result = await list_items(
+                    token, f"/users/{arguments['username']}/repos", params, max_items
+                )
 
             elif name == "list_organization_repositories":
-                org = github.get_organization(arguments["org_name"])
-                repos = org.get_repos()
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(repos[:max_limit]))
-                else:
-                    result = github_object_to_json(list(repos))
+                result = await list_items(
+                    token, f"/orgs/{arguments['org_name']}/repos", None, max_items
+                )
 
             # Repository Contents & Commits
             elif name == "get_contents":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
-                # Handle recursive parameter if present
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                ref = arguments.get("branch")
                 if arguments.get("recursive", False):
-                    contents = repo.get_contents(
-                        arguments["path"], ref=arguments["branch"], recursive=True
+                    result = await list_files(
+                        token,
+                        repo,
+                        arguments["path"],
+                        ref,
+                        arguments.get("include_content", False),
                     )
                 else:
-                    contents = repo.get_contents(
-                        arguments["path"], ref=arguments["branch"]
+                    result = await github_json(
+                        token,
+                        "GET",
+                        f"{repo}/contents/{arguments['path'].strip('/')}",
+                        params={"ref": ref} if ref else None,
                     )
-                result = github_object_to_json(contents)
 
             elif name == "list_repository_languages":
                 # Handle both "owner/repo" format and separate owner & repo_name parameters
-                if "/" in arguments["repo_name"]:
-                    repo = github.get_repo(arguments["repo_name"])
+                if "/" not in arguments["repo_name"] and "owner" in arguments:
+                    repo = repo_path(arguments["owner"], arguments["repo_name"])
                 else:
-                    # Check if owner is provided separately
-                    if "owner" in arguments:
-                        repo = github.get_repo(
-                            f"{arguments['owner']}/{arguments['repo_name']}"
-                        )
-                    else:
-                        # If no owner provided, this will likely fail, but follow the original code behavior
-                        repo = github.get_repo(arguments["repo_name"])
-                result = repo.get_languages()
+                    # If no owner provided, this will likely fail, but follow the original code behavior
+                    repo = repo_path(arguments["repo_name"])
+                result = await github_json(token, "GET", f"{repo}/languages")
 
             elif name == "add_file_to_repository":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
 
                 # Set up optional parameters for file creation
-                kwargs = {
-                    "path": arguments["path"],
+                data = {
                     "message": arguments["commit_message"],
-                    "content": arguments["content"],
+                    "content": base64.b64encode(
+                        arguments["content"].encode("utf-8")
+                    ).decode("ascii"),
                     "branch": arguments["branch"],
                 }
 
                 # Add optional parameters if provided
                 if "sha" in arguments:
-                    kwargs["sha"] = arguments["sha"]
+                    data["sha"] = arguments["sha"]
 
                 # Add committer info if provided
                 if "committer_name" in arguments and "committer_email" in arguments:
-                    committer = {
+                    data["committer"] = {
                         "name": arguments["committer_name"],
                         "email": arguments["committer_email"],
                     }
-                    kwargs["committer"] = committer
 
-                response = repo.create_file(**kwargs)
-                result = github_object_to_json(response)
+                result = await github_json(
+                    token,
+                    "PUT",
+                    f"{repo}/contents/{arguments['path'].strip('/')}",
+                    json=data,
+                )
 
             elif name == "get_commit":
-                repo = github.get_repo(
-                    arguments["owner"] + "/" + arguments["repo_name"]
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                result = await github_json(
+                    token, "GET", f"{repo}/commits/{arguments['commit_sha']}"
                 )
-                commit = repo.get_commit(arguments["commit_sha"])
-                result = github_object_to_json(commit)
 
             elif name == "list_commits":
-                repo = github.get_repo(
-                    arguments["owner"] + "/" + arguments["repo_name"]
-                )
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
 
                 # Set up optional parameters for filtering commits
-                kwargs = {"sha": arguments["branch"]}
+                params = {"sha": arguments["branch"]}
                 if "path" in arguments:
-                    kwargs["path"] = arguments["path"]
+                    params["path"] = arguments["path"]
                 if "author" in arguments:
-                    kwargs["author"] = arguments["author"]
+                    params["author"] = arguments["author"]
 
-                commits = repo.get_commits(**kwargs)
-
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(commits[:max_limit]))
-                else:
-                    result = github_object_to_json(list(commits))
+                result = await list_items(token, f"{repo}/commits", params, max_items)
 
             # Star & Engagement
             elif name == "star_repository":
-                user = github.get_user()
-                repo = github.get_repo(arguments["repo_name"])
-                response = user.add_to_starred(repo)
-                result = {"success": True if response is None else response}
+                await github_json(
+                    token,
+                    "PUT",
+                    f"/user/starred/{arguments['repo_name'].strip('/')}",
+                )
+                result = {"success": True}
 
             elif name == "list_stargazers":
-                repo = github.get_repo(
-                    arguments["owner"] + "/" + arguments["repo_name"]
-                )
-                stargazers = repo.get_stargazers()
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(stargazers[:max_limit]))
-                else:
-                    result = github_object_to_json(list(stargazers))
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                result = await list_items(token, f"{repo}/stargazers", None, max_items)
 
             elif name == "get_stargazers_count":
-                repo = github.get_repo(
-                    arguments["owner"] + "/" + arguments["repo_name"]
+                data = await github_graphql(
+                    token,
+                    STARGAZER_COUNT_QUERY,
+                    {"owner": arguments["owner"], "name": arguments["repo_name"]},
                 )
-                result = repo.stargazers_count
+                result = data["repository"]["stargazerCount"]
 
             elif name == "list_starred_repos_by_user":
-                user = github.get_user()
-                starred_repos = user.get_starred()
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(starred_repos[:max_limit]))
-                else:
-                    result = github_object_to_json(list(starred_repos))
+                result = await list_items(token, "/user/starred", None, max_items)
 
             # Issues & Pull Requests
             elif name == "list_issues":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
 
                 # Set up optional parameters for filtering issues
-                kwargs = {}
-                if "state" in arguments:
-                    kwargs["state"] = arguments["state"]
-                if "labels" in arguments:
-                    kwargs["labels"] = arguments["labels"].split(",")
-                if "assignee" in arguments:
-                    kwargs["assignee"] = arguments["assignee"]
-                if "creator" in arguments:
-                    kwargs["creator"] = arguments["creator"]
-                if "mentioned" in arguments:
-                    kwargs["mentioned"] = arguments["mentioned"]
+                params = {
+                    key: arguments[key]
+                    for key in (
+                        "state",
+                        "labels",
+                        "assignee",
+                        "creator",
+                        "mentioned",
+                        "since",
+                        "sort",
+                        "direction",
+                    )
+                    if key in arguments
+                }
                 if "milestone" in arguments:
-                    if arguments["milestone"] == "*":
-                        kwargs["milestone"] = "*"
-                    else:
-                        try:
-                            milestone_id = int(arguments["milestone"])
-                            kwargs["milestone"] = repo.get_milestone(milestone_id)
-                        except ValueError:
-                            # If not an integer, assume it's a milestone title
-                            milestones = repo.get_milestones()
-                            for milestone in milestones:
-                                if milestone.title == arguments["milestone"]:
-                                    kwargs["milestone"] = milestone
-                                    break
-                if "since" in arguments:
-                    kwargs["since"] = arguments["since"]
-                if "sort" in arguments:
-                    kwargs["sort"] = arguments["sort"]
-                if "direction" in arguments:
-                    kwargs["direction"] = arguments["direction"]
-
-                issues = repo.get_issues(**kwargs)
+                    params["milestone"] = await resolve_milestone(
+                        token,
+                        arguments["owner"],
+                        arguments["repo_name"],
+                        str(arguments["milestone"]),
+                    )
 
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(issues[:max_limit]))
-                else:
-                    result = github_object_to_json(list(issues))
+                result = await list_items(token, f"{repo}/issues", params, max_items)
 
             elif name == "get_issue":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
-                issue = repo.get_issue(int(arguments["issue_number"]))
-                result = github_object_to_json(issue)
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                result = await github_json(
+                    token, "GET", f"{repo}/issues/{int(arguments['issue_number'])}"
+                )
 
             elif name == "create_issue":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
 
                 # Basic parameters
-                kwargs = {
+                data = {
                     "title": arguments["title"],
                     "body": arguments["body"],
                 }
 
                 # Optional parameters
                 if "labels" in arguments:
-                    kwargs["labels"] = arguments["labels"].split(",")
+                    data["labels"] = arguments["labels"].split(",")
                 if "assignees" in arguments:
-                    kwargs["assignees"] = arguments["assignees"].split(",")
+                    data["assignees"] = arguments["assignees"].split(",")
                 if "milestone" in arguments:
-                    kwargs["milestone"] = repo.get_milestone(arguments["milestone"])
+                    data["milestone"] = int(arguments["milestone"])
 
-                issue = repo.create_issue(**kwargs)
-                result = github_object_to_json(issue)
+                result = await github_json(token, "POST", f"{repo}/issues", json=data)
 
             elif name == "update_issue":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
-                issue = repo.get_issue(int(arguments["issue_number"]))
-                issue.edit(title=arguments["title"], body=arguments["body"])
-                result = github_object_to_json(issue)
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                result = await github_json(
+                    token,
+                    "PATCH",
+                    f"{repo}/issues/{int(arguments['issue_number'])}",
+                    json={"title": arguments["title"], "body": arguments["body"]},
+                )
 
             elif name == "add_comment_to_issue":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
-                issue = repo.get_issue(int(arguments["issue_number"]))
-                comment = issue.create_comment(arguments["comment"])
-                result = github_object_to_json(comment)
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                result = await github_json(
+                    token,
+                    "POST",
+                    f"{repo}/issues/{int(arguments['issue_number'])}/comments",
+                    json={"body": arguments["comment"]},
+                )
 
             elif name == "list_branches":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
-                branches = repo.get_branches()
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(branches[:max_limit]))
-                else:
-                    result = github_object_to_json(list(branches))
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                result = await list_items(token, f"{repo}/branches", None, max_items)
 
             elif name == "create_branch":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
-                base_ref = repo.get_git_ref(f"heads/{arguments['start_point']}")
-                base_sha = base_ref.object.sha
-                ref = repo.create_git_ref(
-                    f"refs/heads/{arguments['branch_name']}", sha=base_sha
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                base_ref = await github_json(
+                    token, "GET", f"{repo}/git/ref/heads/{arguments['start_point']}"
+                )
+                result = await github_json(
+                    token,
+                    "POST",
+                    f"{repo}/git/refs",
+                    json={
+                        "ref": f"refs/heads/{arguments['branch_name']}",
+                        "sha": base_ref["object"]["sha"],
+                    },
                 )
-                result = github_object_to_json(ref)
 
             elif name == "list_pull_requests":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
 
                 # Set up optional parameters for filtering PRs
-                kwargs = {}
-                if "state" in arguments:
-                    kwargs["state"] = arguments["state"]
-                if "head" in arguments:
-                    kwargs["head"] = arguments["head"]
-                if "base" in arguments:
-                    kwargs["base"] = arguments["base"]
-                if "sort" in arguments:
-                    kwargs["sort"] = arguments["sort"]
-                if "direction" in arguments:
-                    kwargs["direction"] = arguments["direction"]
-                if "draft" in arguments:
-                    # PyGithub 1.55+ supports 'draft' param
-                    kwargs["draft"] = arguments["draft"]
-                if "since" in arguments:
-                    # For requests that support 'since' parameter
-                    kwargs["since"] = arguments["since"]
-
-                pull_requests = repo.get_pulls(**kwargs)
-
-                if "max_limit" in arguments:
-                    max_limit = int(arguments["max_limit"])
-                    result = github_object_to_json(list(pull_requests[:max_limit]))
-                else:
-                    result = github_object_to_json(list(pull_requests))
+                params = {
+                    key: arguments[key]
+                    for key in ("state", "head", "base", "sort", "direction")
+                    if key in arguments
+                }
+                pulls = iterate_items(token, f"{repo}/pulls", params, MAX_ITEMS)
+
+                # The API has no draft or since filters, so they are applied
+                # while paginating until max_items pull requests match
+                result = []
+                async with aclosing(pulls):
+                    async for pull in pulls:
+                        if "draft" in arguments and pull["draft"] != arguments["draft"]:
+                            continue
+                        if (
+                            "since" in arguments
+                            and pull["updated_at"] < arguments["since"]
+                        ):
+                            continue
+                        result.append(pull)
+                        if len(result) >= max_items:
+                            break
 
             elif name == "get_pull_request":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
-                pull_request = repo.get_pull(int(arguments["pull_request_number"]))
-                result = github_object_to_json(pull_request)
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
+                result = await github_json(
+                    token,
+                    "GET",
+                    f"{repo}/pulls/{int(arguments['pull_request_number'])}",
+                )
 
             elif name == "create_pull_request":
-                repo = github.get_repo(f"{arguments['owner']}/{arguments['repo_name']}")
+                repo = repo_path(arguments["owner"], arguments["repo_name"])
 
                 # Basic parameters
-                kwargs = {
-                    "title": arguments["title"],
-                    "body": arguments["body"],
+                data = {
                     "base": arguments["base"],
                     "head": arguments["head"],
                 }
 
+                # Issue parameter (convert issue to PR), which replaces title and body
+                if "issue" in arguments:
+                    data["issue"] = int(arguments["issue"])
+                else:
+                    data["title"] = arguments["title"]
+                    data["body"] = arguments["body"]
+
                 # Optional parameters
                 if "draft" in arguments:
-                    kwargs["draft"] = arguments["draft"]
+                    data["draft"] = arguments["draft"]
                 if "maintainer_can_modify" in arguments:
-                    kwargs["maintainer_can_modify"] = arguments["maintainer_can_modify"]
+                    data["maintainer_can_modify"] = arguments["maintainer_can_modify"]
 
-                # Issue parameter (convert issue to PR)
-                if "issue" in arguments:
-                    kwargs["issue"] = arguments["issue"]
-
-                pull_request = repo.create_pull(**kwargs)
-                result = github_object_to_json(pull_request)
+                result = await github_json(token, "POST", f"{repo}/pulls", json=data)
 
             elif name == "fork_repository":
-                user = github.get_user()
-                repo_name = arguments["repo_name"]
-                repo = github.get_repo(repo_name)
-                forked_repo = user.create_fork(repo)
-                result = github_object_to_json(forked_repo)
+                result = await github_json(
+                    token, "POST", f"{repo_path(arguments['repo_name'])}/forks"
+                )
 
             else:
                 raise ValueError(f"Unknown tool: {name}")
@@ -1630,7 +1696,7 @@ def create_server(user_id, api_key=None):
 
         except Exception as e:
             logger.error(f"Error calling GitHub API: {e}")
-            return [types.TextContent(type="text", text=str(e))]
+            return [types.TextContent(type="text", text=f"Error: {e}")]
 
     return server
 
@@ -1658,43 +1724,6 @@ def get_initialization_options(server_instance: Server) -> InitializationOptions
     )
 
 
-def github_object_to_json(obj):
-    """
-    Convert a GitHub object to a serializable dictionary.
-    """
-    if isinstance(obj, (str, int, float, bool, type(None))):
-        return obj
-    elif isinstance(obj, datetime.datetime):
-        return obj.isoformat()
-    elif isinstance(obj, list) or isinstance(obj, tuple):
-        return [github_object_to_json(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: github_object_to_json(v) for k, v in obj.items()}
-    elif hasattr(obj, "_rawData") and obj._rawData:
-        return obj._rawData
-    elif isinstance(obj, GithubObject):
-        result = {}
-        for attr in dir(obj):
-            if not attr.startswith("_") and attr not in (
-                "get_",
-                "create_",
-                "update_",
-                "delete_",
-            ):
-                try:
-                    value = getattr(obj, attr)
-                    if not callable(value):
-                        result[attr] = github_object_to_json(value)
-                except Exception:
-                    pass
-        return result
-    else:
-        try:
-            return vars(obj)
-        except:
-            return str(obj)
-
-
 if __name__ == "__main__":
     if sys.argv[1].lower() == "auth":
         user_id = "local"
@@ -27,6 +27,7 @@ sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, "src"))
 
 from src.auth.factory import create_auth_client
+from src.utils.cache.util import cached_tool_calls
 
 SERVICE_NAME = Path(__file__).parent.name
 
@@ -36,6 +37,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(SERVICE_NAME)
 
+# Read-only tools whose responses are cached, with their TTL in seconds
+CACHED_TOOL_TTLS = {
+    "address_to_coordinates": 86400,
+    "coordinates_to_address": 86400,
+    "get_elevation": 86400,
+    "get_place_details": 3600,
+    "get_place_reviews": 3600,
+    "search_places": 600,
+}
+
 
 def authenticate_and_save_gmaps_key(user_id):
     """Authenticate with Google Maps and save API key"""
@@ -457,6 +468,7 @@ def create_server(user_id, api_key=None):
         ]
 
     @server.call_tool()
+    @cached_tool_calls(server, SERVICE_NAME, CACHED_TOOL_TTLS)
     async def handle_call_tool(
         name: str, arguments: dict | None
     ) -> List[TextContent | ImageContent | EmbeddedResource]:
@@ -7,8 +7,6 @@ import sys
 from pathlib import Path
 import json
 import logging
-import requests
-from datetime import datetime
 
 # Add both project root and src directory to Python path
 project_root = os.path.abspath(
@@ -21,8 +19,28 @@ import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
+from src.utils.cache.util import cached_tool_calls
+from src.utils.hackernews.api import (
+    HackerNewsAPIError,
+    get_item,
+    get_items,
+    get_stories,
+    get_user,
+)
+from src.utils.hackernews.comments import CommentTreeLoader
+from src.utils.streaming.util import records_to_text_contents, report_progress
+
 SERVICE_NAME = Path(__file__).parent.name
-HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
+
+# Story lists of get_stories_by_type
+STORY_ENDPOINTS = {
+    "top": "topstories",
+    "new": "newstories",
+    "best": "beststories",
+    "ask": "askstories",
+    "show": "showstories",
+    "job": "jobstories",
+}
 
 # Configure logging
 logging.basicConfig(
@@ -30,19 +48,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(SERVICE_NAME)
 
-
-def get_item(item_id):
-    """Get a HN item by ID
-    Args:
-        item_id (str): id for respective item associated with the json
-
-    Returns :
-        json: response in json format
-    """
-    response = requests.get(f"{HN_API_BASE}/item/{item_id}.json", timeout=20)
-    if response.status_code == 200:
-        return response.json()
-    return None
+# Read-only tools whose responses are cached, with their TTL in seconds
+CACHED_TOOL_TTLS = {
+    "get_top_stories": 60,
+    "get_latest_posts": 30,
+    "get_stories_by_type": 60,
+    "get_story_details": 60,
+    "get_comments": 60,
+    "get_user": 300,
+}
+
+
+def items_to_contents(metadata, items):
+    """Return the metadata and then each item as a separate TextContent"""
+    return [
+        types.TextContent(
+            type="text", text=json.dumps({"metadata": metadata}, indent=2)
+        )
+    ] + [
+        types.TextContent(type="text", text=json.dumps(item, indent=2))
+        for item in items
+    ]
+
+
+def error_contents(error, status_code=None, message=None):
+    """Return an error response in the server's JSON error format"""
+    body = {"error": error}
+    if status_code is not None:
+        body["status_code"] = status_code
+    body["message"] = message
+    return [types.TextContent(type="text", text=json.dumps(body, indent=2))]
 
 
 def create_server(user_id, api_key=None):
@@ -162,6 +197,41 @@ def create_server(user_id, api_key=None):
                     ],
                 },
             ),
+            types.Tool(
+                name="get_comment_tree",
+                description="Get the full discussion of a story as a flattened comment tree, loaded level by level with limits on depth, size and time. The tree is returned once loading stops",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "story_id": {
+                            "type": "integer",
+                            "description": "Hacker News story (or comment) ID whose replies are loaded",
+                        },
+                        "max_depth": {
+                            "type": "integer",
+                            "description": "Maximum reply depth to load (default: 10, max: 100)",
+                        },
+                        "max_nodes": {
+                            "type": "integer",
+                            "description": "Maximum number of comments to load (default: 300, max: 5000)",
+                        },
+                        "time_budget": {
+                            "type": "number",
+                            "description": "Seconds to spend loading before returning the partial tree (default: 15, max: 60)",
+                        },
+                    },
+                    "required": ["story_id"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Metadata about the loaded tree, followed by one NDJSON chunk per level of compact comments (id, parent, depth, by, time, text, replies).",
+                    "examples": [
+                        '{"metadata": {"type": "comment_tree", "story_id": 12345678, "story_title": "Story Title", "count": 3, "levels": 2, "pending": 0, "stopped_by": null}}',
+                        '{"id": 12345680, "parent": 12345678, "depth": 1, "by": "username", "time": 1600000000, "text": "Comment text here...", "replies": 1}\n{"id": 12345681, "parent": 12345678, "depth": 1, "deleted": true, "replies": 0}\n',
+                    ],
+                },
+            ),
             types.Tool(
                 name="get_user",
                 description="Get information about a Hacker News user",
@@ -214,6 +284,7 @@ def create_server(user_id, api_key=None):
         ]
 
     @server.call_tool()
+    @cached_tool_calls(server, SERVICE_NAME, CACHED_TOOL_TTLS)
     async def handle_call_tool(name: str, arguments: dict | None):
         """
         Dispatches a tool call to the corresponding Hacker News API method.
@@ -236,297 +307,164 @@ def create_server(user_id, api_key=None):
         try:
             if name == "get_top_stories":
                 limit = arguments.get("limit", 10)
-                response = requests.get(f"{HN_API_BASE}/topstories.json", timeout=20)
-
-                if response.status_code == 200:
-                    story_ids = response.json()[:limit]
-
-                    stories = []
-                    for story_id in story_ids:
-                        story = get_item(story_id)
-                        if story:
-                            stories.append(story)
-
-                    # Return each story as a separate TextContent with metadata first
-                    result = [
-                        types.TextContent(
-                            type="text",
-                            text=json.dumps(
-                                {
-                                    "metadata": {
-                                        "type": "stories",
-                                        "count": len(stories),
-                                        "endpoint": "topstories",
-                                    }
-                                },
-                                indent=2,
-                            ),
-                        )
-                    ]
-
-                    # Add each story as a separate item
-                    result.extend(
-                        [
-                            types.TextContent(
-                                type="text", text=json.dumps(story, indent=2)
-                            )
-                            for story in stories
-                        ]
+                try:
+                    stories = await get_stories("topstories", limit)
+                except HackerNewsAPIError as e:
+                    return error_contents(
+                        "Failed to fetch top stories", e.status_code, e.message
                     )
-                    return result
-                else:
-                    error = {
-                        "error": "Failed to fetch top stories",
-                        "status_code": response.status_code,
-                        "message": response.text,
-                    }
-                    return [
-                        types.TextContent(type="text", text=json.dumps(error, indent=2))
-                    ]
+                return items_to_contents(
+                    {
+                        "type": "stories",
+                        "count": len(stories),
+                        "endpoint": "topstories",
+                    },
+                    stories,
+                )
 
             elif name == "get_latest_posts":
                 limit = arguments.get("limit", 10)
-                response = requests.get(f"{HN_API_BASE}/newstories.json", timeout=20)
-
-                if response.status_code == 200:
-                    story_ids = response.json()[:limit]
-
-                    stories = []
-                    for story_id in story_ids:
-                        story = get_item(story_id)
-                        if story:
-                            stories.append(story)
-
-                    # Return each story as a separate TextContent with metadata first
-                    result = [
-                        types.TextContent(
-                            type="text",
-                            text=json.dumps(
-                                {
-                                    "metadata": {
-                                        "type": "stories",
-                                        "count": len(stories),
-                                        "endpoint": "newstories",
-                                    }
-                                },
-                                indent=2,
-                            ),
-                        )
-                    ]
-
-                    # Add each story as a separate item
-                    result.extend(
-                        [
-                            types.TextContent(
-                                type="text", text=json.dumps(story, indent=2)
-                            )
-                            for story in stories
-                        ]
+                try:
+                    stories = await get_stories("newstories", limit)
+                except HackerNewsAPIError as e:
+                    return error_contents(
+                        "Failed to fetch latest posts", e.status_code, e.message
                     )
-                    return result
-                else:
-                    error = {
-                        "error": "Failed to fetch latest posts",
-                        "status_code": response.status_code,
-                        "message": response.text,
-                    }
-                    return [
-                        types.TextContent(type="text", text=json.dumps(error, indent=2))
-                    ]
+                return items_to_contents(
+                    {
+                        "type": "stories",
+                        "count": len(stories),
+                        "endpoint": "newstories",
+                    },
+                    stories,
+                )
 
             elif name == "get_story_details":
                 story_id = arguments["id"]
-                story = get_item(story_id)
+                story = await get_item(story_id)
 
                 if story:
                     return [
                         types.TextContent(type="text", text=json.dumps(story, indent=2))
                     ]
                 else:
-                    error = {
-                        "error": "Failed to fetch story",
-                        "message": "Story not found",
-                    }
-                    return [
-                        types.TextContent(type="text", text=json.dumps(error, indent=2))
-                    ]
+                    return error_contents(
+                        "Failed to fetch story", message="Story not found"
+                    )
 
             elif name == "get_comments":
                 story_id = arguments["story_id"]
                 limit = arguments.get("limit", 10)
 
-                story = get_item(story_id)
+                story = await get_item(story_id)
+                if not story:
+                    return error_contents(
+                        "Failed to fetch comments", message="Story not found"
+                    )
 
-                if story:
-                    comment_ids = story.get("kids", [])[:limit]
-
-                    if comment_ids:
-                        comments = []
-                        for comment_id in comment_ids:
-                            comment = get_item(comment_id)
-                            if (
-                                comment
-                                and not comment.get("deleted")
-                                and not comment.get("dead")
-                            ):
-                                comments.append(comment)
-
-                        # Return each comment as a separate TextContent with metadata first
-                        result = [
-                            types.TextContent(
-                                type="text",
-                                text=json.dumps(
-                                    {
-                                        "metadata": {
-                                            "type": "comments",
-                                            "count": len(comments),
-                                            "story_id": story_id,
-                                            "story_title": story.get(
-                                                "title", "Unknown"
-                                            ),
-                                        }
-                                    },
-                                    indent=2,
-                                ),
-                            )
-                        ]
-
-                        # Add each comment as a separate item
-                        result.extend(
-                            [
-                                types.TextContent(
-                                    type="text", text=json.dumps(comment, indent=2)
-                                )
-                                for comment in comments
-                            ]
-                        )
-                        return result
-                    else:
-                        error = {
-                            "error": "Failed to fetch comments",
-                            "message": "No comments found",
-                        }
-                        return [
-                            types.TextContent(
-                                type="text", text=json.dumps(error, indent=2)
-                            )
-                        ]
-                else:
-                    error = {
-                        "error": "Failed to fetch comments",
-                        "message": "Story not found",
-                    }
-                    return [
-                        types.TextContent(type="text", text=json.dumps(error, indent=2))
-                    ]
+                comment_ids = story.get("kids", [])[:limit]
+                if not comment_ids:
+                    return error_contents(
+                        "Failed to fetch comments", message="No comments found"
+                    )
+
+                comments = [
+                    comment
+                    for comment in await get_items(comment_ids)
+                    if not comment.get("deleted") and not comment.get("dead")
+                ]
+                return items_to_contents(
+                    {
+                        "type": "comments",
+                        "count": len(comments),
+                        "story_id": story_id,
+                        "story_title": story.get("title", "Unknown"),
+                    },
+                    comments,
+                )
+
+            elif name == "get_comment_tree":
+                story_id = arguments["story_id"]
+                story = await get_item(story_id)
+                if not story:
+                    return error_contents(
+                        "Failed to fetch comments", message="Story not found"
+                    )
+
+                loader = CommentTreeLoader(
+                    story,
+                    arguments.get("max_depth"),
+                    arguments.get("max_nodes"),
+                    arguments.get("time_budget"),
+                )
+                levels = []
+                async for level in loader.levels():
+                    # Clients passing a progressToken get the comment count per level
+                    levels.extend(
+                        records_to_text_contents(level, chunk_rows=len(level) or 1)
+                    )
+                    await report_progress(loader.nodes, loader.max_nodes)
+
+                metadata = {
+                    "type": "comment_tree",
+                    "story_id": story_id,
+                    "story_title": story.get("title", "Unknown"),
+                    "count": loader.nodes,
+                    "levels": loader.depth,
+                    "pending": loader.pending,
+                    "stopped_by": loader.stopped_by,
+                }
+                return [
+                    types.TextContent(
+                        type="text", text=json.dumps({"metadata": metadata}, indent=2)
+                    )
+                ] + levels
 
             elif name == "get_user":
                 username = arguments["username"]
-                response = requests.get(
-                    f"{HN_API_BASE}/user/{username}.json", timeout=20
-                )
+                try:
+                    user = await get_user(username)
+                except HackerNewsAPIError as e:
+                    return error_contents(
+                        "Failed to fetch user", e.status_code, e.message
+                    )
 
-                if response.status_code == 200:
-                    user = response.json()
-                    if user:
-                        # Return raw user data
-                        return [
-                            types.TextContent(
-                                type="text", text=json.dumps(user, indent=2)
-                            )
-                        ]
-                    else:
-                        error = {
-                            "error": "Failed to fetch user",
-                            "message": "User not found",
-                        }
-                        return [
-                            types.TextContent(
-                                type="text", text=json.dumps(error, indent=2)
-                            )
-                        ]
-                else:
-                    error = {
-                        "error": "Failed to fetch user",
-                        "status_code": response.status_code,
-                        "message": response.text,
-                    }
+                if user:
+                    # Return raw user data
                     return [
-                        types.TextContent(type="text", text=json.dumps(error, indent=2))
+                        types.TextContent(type="text", text=json.dumps(user, indent=2))
                     ]
+                else:
+                    return error_contents(
+                        "Failed to fetch user", message="User not found"
+                    )
 
             elif name == "get_stories_by_type":
                 story_type = arguments["type"]
                 limit = arguments.get("limit", 10)
 
-                if story_type == "top":
-                    endpoint = "topstories"
-                elif story_type == "new":
-                    endpoint = "newstories"
-                elif story_type == "best":
-                    endpoint = "beststories"
-                elif story_type == "ask":
-                    endpoint = "askstories"
-                elif story_type == "show":
-                    endpoint = "showstories"
-                elif story_type == "job":
-                    endpoint = "jobstories"
-                else:
-                    error = {
-                        "error": "Invalid story type",
-                        "message": f"Invalid story type '{story_type}'",
-                    }
-                    return [
-                        types.TextContent(type="text", text=json.dumps(error, indent=2))
-                    ]
-
-                response = requests.get(f"{HN_API_BASE}/{endpoint}.json", timeout=20)
-                if response.status_code == 200:
-                    story_ids = response.json()[:limit]
-
-                    stories = []
-                    for story_id in story_ids:
-                        story = get_item(story_id)
-                        if story:
-                            stories.append(story)
-
-                    # Return each story as a separate TextContent with metadata first
-                    result = [
-                        types.TextContent(
-                            type="text",
-                            text=json.dumps(
-                                {
-                                    "metadata": {
-                                        "type": "stories",
-                                        "count": len(stories),
-                                        "story_type": story_type,
-                                        "endpoint": endpoint,
-                                    }
-                                },
-                                indent=2,
-                            ),
-                        )
-                    ]
+                endpoint = STORY_ENDPOINTS.get(story_type)
+                if endpoint is None:
+                    return error_contents(
+                        "Invalid story type",
+                        message=f"Invalid story type '{story_type}'",
+                    )
 
-                    # Add each story as a separate item
-                    result.extend(
-                        [
-                            types.TextContent(
-                                type="text", text=json.dumps(story, indent=2)
-                            )
-                            for story in stories
-                        ]
+                try:
+                    stories = await get_stories(endpoint, limit)
+                except HackerNewsAPIError as e:
+                    return error_contents(
+                        "Failed to fetch stories", e.status_code, e.message
                     )
-                    return result
-                else:
-                    error = {
-                        "error": "Failed to fetch stories",
-                        "status_code": response.status_code,
-                        "message": response.text,
-                    }
-                    return [
-                        types.TextContent(type="text", text=json.dumps(error, indent=2))
-                    ]
+                return items_to_contents(
+                    {
+                        "type": "stories",
+                        "count": len(stories),
+                        "story_type": story_type,
+                        "endpoint": endpoint,
+                    },
+                    stories,
+                )
 
             else:
                 raise ValueError(f"Unknown tool: {name}")
@@ -10,8 +10,14 @@ project_root = os.path.abspath(
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, "src"))
 
+import asyncio
+import csv
+import io
 import logging
 import requests
+import tempfile
+from contextlib import aclosing
+from functools import partial
 from pathlib import Path
 import json
 
@@ -28,6 +34,25 @@ from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
 from src.utils.hubspot.util import authenticate_and_save_credentials, get_credentials
+from src.utils.hubspot.schema import (
+    SchemaFetchError,
+    get_object_schema,
+    get_property_index,
+)
+from src.utils.http.util import get_http_client
+from src.utils.rate_limit.util import (
+    bulk_tool_calls,
+    gather_bounded,
+    governed_request,
+)
+from src.utils.cache.util import cached_tool_calls
+from src.utils.pagination.util import collect, hubspot_next_after, paginate
+from src.utils.streaming.util import (
+    DEFAULT_CHUNK_ROWS,
+    RecordChunkWriter,
+    records_to_text_contents,
+    report_progress,
+)
 
 SERVICE_NAME = Path(__file__).parent.name
 SCOPES = [
@@ -43,6 +68,8 @@ SCOPES = [
     "crm.objects.quotes.read",
     "crm.objects.quotes.write",
     "crm.lists.read",
+    "crm.export",
+    "crm.import",
     "e-commerce",
 ]
 
@@ -52,6 +79,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger(SERVICE_NAME)
 
+HUBSPOT_API_URL = "https://api.hubapi.com"
+# Maximum IDs per batch read request
+BATCH_SIZE = 100
+# Batch requests in flight at once
+BATCH_CONCURRENCY = 4
+# Maximum records per call of the batch write tools
+MAX_BATCH_WRITE_RECORDS = 10000
+# Default and maximum records returned by one stream_objects or export download
+STREAM_DEFAULT_MAX_RECORDS = 10000
+STREAM_MAX_RECORDS = 50000
+# Exports and imports are spooled to disk past this size
+EXPORT_SPOOL_SIZE = 8 * 1024 * 1024
+# Seconds between export/import status polls, and the longest a tool call waits
+TASK_POLL_INTERVAL = 5
+MAX_TASK_WAIT_SECONDS = 300
+# Maximum import errors returned by get_import_status
+IMPORT_MAX_ERRORS = 1000
+# Object types accepted by the exports API and object type IDs of the imports API
+EXPORT_OBJECT_TYPES = {
+    "contacts": "CONTACT",
+    "companies": "COMPANY",
+    "deals": "DEAL",
+    "tickets": "TICKET",
+}
+IMPORT_OBJECT_TYPE_IDS = {
+    "contacts": "0-1",
+    "companies": "0-2",
+    "deals": "0-3",
+    "tickets": "0-5",
+}
+
+# Read-only tools whose responses are cached, with their TTL in seconds
+CACHED_TOOL_TTLS = {
+    "get_call_dispositions": 3600,
+}
+# Tools whose requests queue behind those of interactive tool calls
+BULK_TOOLS = {
+    "batch_create_objects",
+    "batch_update_objects",
+    "batch_upsert_objects",
+    "stream_objects",
+    "start_export",
+    "start_import",
+}
+
 
 async def get_hubspot_access_token(user_id, api_key=None):
     """Create a new HubSpot API client instance for this request by getting fresh credentials"""
@@ -61,23 +133,145 @@ async def get_hubspot_access_token(user_id, api_key=None):
     return credentials
 
 
-async def get_contact_properties(access_token):
-    """Get all available contact properties from HubSpot API"""
-    url = "https://api.hubapi.com/properties/v2/contacts/properties"
+class HubSpotAPIError(Exception):
+    """Raised when a HubSpot API request returns an error status"""
+
+    def __init__(self, status_code, details):
+        self.status_code = status_code
+        self.details = details
+        super().__init__(f"Status {status_code}")
+
+
+async def hubspot_api_request(access_token, method, url, **kwargs):
+    """
+    Send a request to the HubSpot API on the shared connection pool.
+
+    Requests go through the rate limit governor of the access token.
+
+    Args:
+        access_token: HubSpot access token
+        method: HTTP method
+        url: Absolute URL or path relative to HUBSPOT_API_URL
+        **kwargs: Extra httpx request arguments (params, json, ...)
+
+    Returns:
+        httpx.Response: The response
+    """
+    client = get_http_client(SERVICE_NAME, base_url=HUBSPOT_API_URL)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    # Multipart uploads set their own content type with the boundary
+    if "files" not in kwargs:
+        headers["Content-Type"] = "application/json"
+    headers.update(kwargs.pop("headers", None) or {})
+    send = partial(client.request, method, url, headers=headers, **kwargs)
+    return await governed_request(SERVICE_NAME, access_token, send)
 
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-    }
 
+def get_error_details(response):
+    """Get the body of an error response with its status code"""
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        response_data = response.json()
+        response_data["_status_code"] = response.status_code
+    except:
+        response_data = {"_status_code": response.status_code, "result": response.text}
+    return response_data
+
+
+def chunk_ids(ids, size=BATCH_SIZE):
+    """Split IDs into chunks of at most size, dropping duplicates"""
+    ids = list(dict.fromkeys(str(object_id) for object_id in ids))
+    return [ids[i : i + size] for i in range(0, len(ids), size)]
+
+
+async def batch_read_objects(access_token, object_type, object_ids, properties=None):
+    """
+    Read CRM objects by ID with the batch read endpoint.
+
+    IDs are sent BATCH_SIZE per request and the requests run concurrently.
+    IDs that do not exist are left out of the result.
+
+    Args:
+        access_token: HubSpot access token
+        object_type: CRM object type (contacts, companies, engagements, ...)
+        object_ids: IDs of the objects to read
+        properties: Properties to return (HubSpot's defaults when None)
+
+    Returns:
+        list: The objects, in the order of object_ids
+    """
+
+    async def read_chunk(chunk):
+        payload = {"inputs": [{"id": object_id} for object_id in chunk]}
+        if properties:
+            payload["properties"] = properties
+        response = await hubspot_api_request(
+            access_token,
+            "POST",
+            f"/crm/v3/objects/{object_type}/batch/read",
+            json=payload,
+        )
+        # 207 Multi-Status holds the objects that were found next to per-ID errors
+        if response.status_code not in (200, 207):
+            raise HubSpotAPIError(response.status_code, get_error_details(response))
+        return response.json().get("results", [])
+
+    chunks = await gather_bounded(
+        (read_chunk(chunk) for chunk in chunk_ids(object_ids)), BATCH_CONCURRENCY
+    )
+    objects = {obj["id"]: obj for chunk in chunks for obj in chunk}
+    return [objects[str(i)] for i in object_ids if str(i) in objects]
+
+
+async def batch_read_associations(access_token, from_type, to_type, object_ids):
+    """
+    Read the associations of several objects with the v4 batch read endpoint.
+
+    Args:
+        access_token: HubSpot access token
+        from_type: Object type of object_ids
+        to_type: Object type of the associated objects
+        object_ids: IDs of the objects whose associations are read
+
+    Returns:
+        dict: Associated objects by object ID, as lists of
+            {"id": ..., "associationTypes": [...]}
+    """
+
+    async def read_chunk(chunk):
+        response = await hubspot_api_request(
+            access_token,
+            "POST",
+            f"/crm/v4/associations/{from_type}/{to_type}/batch/read",
+            json={"inputs": [{"id": object_id} for object_id in chunk]},
+        )
+        if response.status_code not in (200, 207):
+            raise HubSpotAPIError(response.status_code, get_error_details(response))
+        return response.json().get("results", [])
+
+    chunks = await gather_bounded(
+        (read_chunk(chunk) for chunk in chunk_ids(object_ids)), BATCH_CONCURRENCY
+    )
 
-        # Extract property names
-        properties = response.json()
-        property_names = [prop["name"] for prop in properties]
-        return property_names
+    associations = {str(object_id): [] for object_id in object_ids}
+    for chunk in chunks:
+        for result in chunk:
+            associations[str(result["from"]["id"])] = [
+                {
+                    "id": str(to["toObjectId"]),
+                    "associationTypes": to.get("associationTypes", []),
+                }
+                for to in result.get("to", [])
+            ]
+    return associations
+
+
+async def get_contact_properties(access_token):
+    """Get all available contact properties from the portal's cached property definitions"""
+    try:
+        property_index = await get_property_index(
+            hubspot_api_request, access_token, "contacts"
+        )
+        return property_index.names
     except Exception as e:
         logger.error(f"Error fetching contact properties: {str(e)}")
         # Fallback to basic properties if we can't fetch all
@@ -271,6 +465,7 @@ def create_server(user_id, api_key=None):
         # Define resources config
         resource_configs = {
             "contact": {
+                "object_type": "contacts",
                 "endpoint": f"https://api.hubapi.com/crm/v3/objects/contacts/{resource_id}",
                 "params": {
                     "properties": [
@@ -288,14 +483,10 @@ def create_server(user_id, api_key=None):
                         "jobtitle",
                     ]
                 },
-                "associations": [
-                    {
-                        "type": "companies",
-                        "endpoint": f"https://api.hubapi.com/crm/v3/objects/contacts/{resource_id}/associations/companies",
-                    }
-                ],
+                "associations": [{"type": "companies"}],
             },
             "company": {
+                "object_type": "companies",
                 "endpoint": f"https://api.hubapi.com/crm/v3/objects/companies/{resource_id}",
                 "params": {
                     "properties": [
@@ -311,14 +502,10 @@ def create_server(user_id, api_key=None):
                         "numberofemployees",
                     ]
                 },
-                "associations": [
-                    {
-                        "type": "contacts",
-                        "endpoint": f"https://api.hubapi.com/crm/v3/objects/companies/{resource_id}/associations/contacts",
-                    }
-                ],
+                "associations": [{"type": "contacts"}],
             },
             "deal": {
+                "object_type": "deals",
                 "endpoint": f"https://api.hubapi.com/crm/v3/objects/deals/{resource_id}",
                 "params": {
                     "properties": [
@@ -331,17 +518,12 @@ def create_server(user_id, api_key=None):
                     ]
                 },
                 "associations": [
-                    {
-                        "type": "contacts",
-                        "endpoint": f"https://api.hubapi.com/crm/v3/objects/deals/{resource_id}/associations/contacts",
-                    },
-                    {
-                        "type": "companies",
-                        "endpoint": f"https://api.hubapi.com/crm/v3/objects/deals/{resource_id}/associations/companies",
-                    },
+                    {"type": "contacts"},
+                    {"type": "companies"},
                 ],
             },
             "ticket": {
+                "object_type": "tickets",
                 "endpoint": f"https://api.hubapi.com/crm/v3/objects/tickets/{resource_id}",
                 "params": {
                     "properties": [
@@ -352,14 +534,10 @@ def create_server(user_id, api_key=None):
                         "hs_ticket_category",
                     ]
                 },
-                "associations": [
-                    {
-                        "type": "contacts",
-                        "endpoint": f"https://api.hubapi.com/crm/v3/objects/tickets/{resource_id}/associations/contacts",
-                    }
-                ],
+                "associations": [{"type": "contacts"}],
             },
             "product": {
+                "object_type": "products",
                 "endpoint": f"https://api.hubapi.com/crm/v3/objects/products/{resource_id}",
                 "params": {
                     "properties": [
@@ -374,18 +552,15 @@ def create_server(user_id, api_key=None):
                 "associations": [],
             },
             "line_item": {
+                "object_type": "line_items",
                 "endpoint": f"https://api.hubapi.com/crm/v3/objects/line_items/{resource_id}",
                 "params": {
                     "properties": ["name", "quantity", "price", "amount", "hs_sku"]
                 },
-                "associations": [
-                    {
-                        "type": "deals",
-                        "endpoint": f"https://api.hubapi.com/crm/v3/objects/line_items/{resource_id}/associations/deals",
-                    }
-                ],
+                "associations": [{"type": "deals"}],
             },
             "quote": {
+                "object_type": "quotes",
                 "endpoint": f"https://api.hubapi.com/crm/v3/objects/quotes/{resource_id}",
                 "params": {
                     "properties": [
@@ -395,14 +570,10 @@ def create_server(user_id, api_key=None):
                         "hs_quote_amount",
                     ]
                 },
-                "associations": [
-                    {
-                        "type": "deals",
-                        "endpoint": f"https://api.hubapi.com/crm/v3/objects/quotes/{resource_id}/associations/deals",
-                    }
-                ],
+                "associations": [{"type": "deals"}],
             },
             "engagement": {
+                "object_type": "engagements",
                 "endpoint": f"https://api.hubapi.com/crm/v3/objects/engagements/{resource_id}",
                 "params": {
                     "properties": [
@@ -415,12 +586,7 @@ def create_server(user_id, api_key=None):
                         "hs_task_status",
                     ]
                 },
-                "associations": [
-                    {
-                        "type": "contacts",
-                        "endpoint": f"https://api.hubapi.com/crm/v3/objects/engagements/{resource_id}/associations/contacts",
-                    }
-                ],
+                "associations": [{"type": "contacts"}],
             },
             "list": {"special_handler": read_list_resource},
             "custom_object": {"special_handler": read_custom_object_resource},
@@ -433,35 +599,51 @@ def create_server(user_id, api_key=None):
                 and "special_handler" in resource_configs[resource_type]
             ):
                 return await resource_configs[resource_type]["special_handler"](
-                    resource_id, object_type_id, headers
+                    resource_id, object_type_id, headers, access_token
                 )
 
             # Otherwise process standard resource types
             if resource_type in resource_configs:
                 config = resource_configs[resource_type]
-                response = requests.get(
-                    config["endpoint"], headers=headers, params=config["params"]
+
+                # Read the object and all of its association types concurrently
+                response, *assoc_results = await asyncio.gather(
+                    hubspot_api_request(
+                        access_token,
+                        "GET",
+                        config["endpoint"],
+                        params=config["params"],
+                    ),
+                    *(
+                        batch_read_associations(
+                            access_token,
+                            config["object_type"],
+                            assoc["type"],
+                            [resource_id],
+                        )
+                        for assoc in config["associations"]
+                    ),
+                    return_exceptions=True,
                 )
+                if isinstance(response, Exception):
+                    raise response
 
                 if response.status_code == 200:
                     data = response.json()
 
-                    # Get associations if any are defined
-                    if config["associations"]:
-                        assocs = {}
-
-                        for assoc in config["associations"]:
-                            assoc_response = requests.get(
-                                assoc["endpoint"], headers=headers
+                    assocs = {}
+                    for assoc, assoc_result in zip(
+                        config["associations"], assoc_results
+                    ):
+                        if isinstance(assoc_result, Exception):
+                            logger.warning(
+                                f"Error reading {assoc['type']} associations: {assoc_result}"
                             )
+                            continue
+                        assocs[assoc["type"]] = assoc_result[resource_id]
 
-                            if assoc_response.status_code == 200:
-                                assocs[assoc["type"]] = assoc_response.json().get(
-                                    "results", []
-                                )
-
-                        if assocs:
-                            data["associations"] = assocs
+                    if assocs:
+                        data["associations"] = assocs
 
                     return [
                         ReadResourceContents(
@@ -1632,9 +1814,377 @@ def create_server(user_id, api_key=None):
                 },
                 requiredScopes=["crm.objects.contacts.write"],
             ),
+            Tool(
+                name="batch_create_objects",
+                description="Create many HubSpot CRM records with batch requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type (contacts, companies, deals, tickets, products, line_items or a custom object type ID)",
+                        },
+                        "records": {
+                            "type": "array",
+                            "description": "Records to create (up to 10000), sent to HubSpot 100 per request",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "properties": {
+                                        "type": "object",
+                                        "description": "Property values of the record",
+                                    },
+                                    "associations": {
+                                        "type": "array",
+                                        "description": "Associations of the new record in the batch API format",
+                                        "items": {"type": "object"},
+                                    },
+                                },
+                                "required": ["properties"],
+                            },
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["ndjson", "csv"],
+                            "description": "Format of the written records (default: ndjson)",
+                        },
+                    },
+                    "required": ["object_type", "records"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "A JSON summary with per-record errors, followed by the written records as NDJSON or CSV chunks",
+                    "examples": [
+                        '{"operation":"create","object_type":"contacts","total":250,"succeeded":249,"requests":3,"errors":[{"chunk":1,"error":"Property values were not valid","category":"VALIDATION_ERROR","context":{}}]}',
+                        '{"id":"<ID>","email":"jane@example.com","createdate":"2025-01-01T00:00:00Z"}\n',
+                    ],
+                },
+                requiredScopes=["crm.objects.contacts.write"],
+            ),
+            Tool(
+                name="batch_update_objects",
+                description="Update many HubSpot CRM records with batch requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type (contacts, companies, deals, tickets, products, line_items or a custom object type ID)",
+                        },
+                        "records": {
+                            "type": "array",
+                            "description": "Records to update (up to 10000), sent to HubSpot 100 per request",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "id": {
+                                        "type": "string",
+                                        "description": "Record ID, or the value of id_property when it is set",
+                                    },
+                                    "properties": {
+                                        "type": "object",
+                                        "description": "Property values of the record",
+                                    },
+                                },
+                                "required": ["id", "properties"],
+                            },
+                        },
+                        "id_property": {
+                            "type": "string",
+                            "description": "Unique property identifying the records instead of the record ID (e.g. email)",
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["ndjson", "csv"],
+                            "description": "Format of the written records (default: ndjson)",
+                        },
+                    },
+                    "required": ["object_type", "records"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "A JSON summary with per-record errors, followed by the written records as NDJSON or CSV chunks",
+                    "examples": [
+                        '{"operation":"update","object_type":"contacts","total":250,"succeeded":249,"requests":3,"errors":[{"chunk":1,"error":"Property values were not valid","category":"VALIDATION_ERROR","context":{}}]}',
+                        '{"id":"<ID>","email":"jane@example.com","createdate":"2025-01-01T00:00:00Z"}\n',
+                    ],
+                },
+                requiredScopes=["crm.objects.contacts.write"],
+            ),
+            Tool(
+                name="batch_upsert_objects",
+                description="Create or update many HubSpot CRM records by a unique property with batch requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type (contacts, companies, deals, tickets, products, line_items or a custom object type ID)",
+                        },
+                        "records": {
+                            "type": "array",
+                            "description": "Records to upsert (up to 10000), sent to HubSpot 100 per request",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "id": {
+                                        "type": "string",
+                                        "description": "Value of id_property identifying the record",
+                                    },
+                                    "properties": {
+                                        "type": "object",
+                                        "description": "Property values of the record",
+                                    },
+                                },
+                                "required": ["id", "properties"],
+                            },
+                        },
+                        "id_property": {
+                            "type": "string",
+                            "description": "Unique property matching existing records (e.g. email for contacts)",
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["ndjson", "csv"],
+                            "description": "Format of the written records (default: ndjson)",
+                        },
+                    },
+                    "required": ["object_type", "records", "id_property"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "A JSON summary with per-record errors, followed by the written records as NDJSON or CSV chunks",
+                    "examples": [
+                        '{"operation":"upsert","object_type":"contacts","total":250,"succeeded":249,"requests":3,"errors":[{"chunk":1,"error":"Property values were not valid","category":"VALIDATION_ERROR","context":{}}]}',
+                        '{"id":"<ID>","email":"jane@example.com","createdate":"2025-01-01T00:00:00Z"}\n',
+                    ],
+                },
+                requiredScopes=["crm.objects.contacts.write"],
+            ),
+            Tool(
+                name="stream_objects",
+                description="Read every record of a HubSpot CRM object type as NDJSON or CSV chunks",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type (contacts, companies, deals, tickets, products, line_items or a custom object type ID)",
+                        },
+                        "properties": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Properties to include (HubSpot's defaults when empty)",
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["ndjson", "csv"],
+                            "description": "Format of the records (default: ndjson)",
+                        },
+                        "max_records": {
+                            "type": "integer",
+                            "description": "Maximum records to return (default: 10000, max: 50000). Pass next_after from the summary to continue.",
+                        },
+                        "chunk_size": {
+                            "type": "integer",
+                            "description": "Records per NDJSON/CSV chunk (default: 1000)",
+                        },
+                        "after": {
+                            "type": "string",
+                            "description": "Cursor to continue from (next_after of a previous call)",
+                        },
+                        "archived": {
+                            "type": "boolean",
+                            "description": "Read archived records instead (default: false)",
+                        },
+                    },
+                    "required": ["object_type"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "A JSON summary with the cursor to continue from, followed by the records as NDJSON or CSV chunks",
+                    "examples": [
+                        '{"object_type":"contacts","output_format":"csv","records":10000,"chunks":10,"bytes":1048576,"next_after":"10001"}',
+                        "id,email,firstname\r\n<ID>,jane@example.com,Jane\r\n",
+                    ],
+                },
+                requiredScopes=["crm.objects.contacts.read"],
+            ),
+            Tool(
+                name="start_export",
+                description="Start an asynchronous CSV export of HubSpot CRM records with the exports API",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type (contacts, companies, deals, tickets or an object type ID)",
+                        },
+                        "properties": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Properties to export",
+                        },
+                        "export_name": {
+                            "type": "string",
+                            "description": "Name of the export",
+                        },
+                        "associated_object_types": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Object types whose associated record IDs are included",
+                        },
+                        "language": {
+                            "type": "string",
+                            "description": "Language of the export headers (default: EN)",
+                        },
+                    },
+                    "required": ["object_type", "properties"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of JSON strings containing the export task",
+                    "examples": [
+                        '{"id":"<ID>","links":{"status":"https://api.hubapi.com/crm/v3/exports/export/async/tasks/<ID>/status"}}'
+                    ],
+                },
+                requiredScopes=["crm.export"],
+            ),
+            Tool(
+                name="get_export_status",
+                description="Get the status of a HubSpot export, optionally waiting for it and streaming its rows",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "export_id": {
+                            "type": "string",
+                            "description": "ID of the export task (required)",
+                        },
+                        "wait_seconds": {
+                            "type": "integer",
+                            "description": "Seconds to wait for the export to complete (default: 0, max: 300)",
+                        },
+                        "download": {
+                            "type": "boolean",
+                            "description": "Return the rows of a complete export as NDJSON or CSV chunks",
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["ndjson", "csv"],
+                            "description": "Format of the downloaded rows (default: ndjson)",
+                        },
+                        "max_records": {
+                            "type": "integer",
+                            "description": "Maximum rows to return (default: 10000, max: 50000)",
+                        },
+                        "chunk_size": {
+                            "type": "integer",
+                            "description": "Rows per NDJSON/CSV chunk (default: 1000)",
+                        },
+                    },
+                    "required": ["export_id"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "The export status, followed by its rows as NDJSON or CSV chunks when downloaded",
+                    "examples": [
+                        '{"status":"COMPLETE","result":"https://api-na1.hubspot.com/...","requestedAt":"2025-01-01T00:00:00Z","completedAt":"2025-01-01T00:01:00Z"}'
+                    ],
+                },
+                requiredScopes=["crm.export"],
+            ),
+            Tool(
+                name="start_import",
+                description="Import HubSpot CRM records from rows with the imports API",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_type": {
+                            "type": "string",
+                            "description": "CRM object type (contacts, companies, deals, tickets or an object type ID such as 0-1)",
+                        },
+                        "records": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                            "description": "Rows to import, keyed by property name",
+                        },
+                        "operation": {
+                            "type": "string",
+                            "enum": ["CREATE", "UPDATE", "UPSERT"],
+                            "description": "Import operation (default: UPSERT)",
+                        },
+                        "id_property": {
+                            "type": "string",
+                            "description": "Unique property used to match existing records",
+                        },
+                        "import_name": {
+                            "type": "string",
+                            "description": "Name of the import",
+                        },
+                        "date_format": {
+                            "type": "string",
+                            "enum": [
+                                "MONTH_DAY_YEAR",
+                                "DAY_MONTH_YEAR",
+                                "YEAR_MONTH_DAY",
+                            ],
+                            "description": "Format of date values in the rows",
+                        },
+                    },
+                    "required": ["object_type", "records"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of JSON strings containing the started import",
+                    "examples": [
+                        '{"id":"<ID>","state":"STARTED","importRequestJson":{},"records":5000}'
+                    ],
+                },
+                requiredScopes=["crm.import"],
+            ),
+            Tool(
+                name="get_import_status",
+                description="Get the status of a HubSpot import, optionally waiting for it and listing its errors",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "import_id": {
+                            "type": "string",
+                            "description": "ID of the import (required)",
+                        },
+                        "wait_seconds": {
+                            "type": "integer",
+                            "description": "Seconds to wait for the import to finish (default: 0, max: 300)",
+                        },
+                        "include_errors": {
+                            "type": "boolean",
+                            "description": "Include the row errors of the import (up to 1000)",
+                        },
+                    },
+                    "required": ["import_id"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of JSON strings containing the import status",
+                    "examples": [
+                        '{"id":"<ID>","state":"DONE","metadata":{"counters":{"TOTAL_ROWS":5000,"CREATED_OBJECTS":4990}},"errors":[]}'
+                    ],
+                },
+                requiredScopes=["crm.import"],
+            ),
         ]
 
     @server.call_tool()
+    @cached_tool_calls(server, SERVICE_NAME, CACHED_TOOL_TTLS)
+    @bulk_tool_calls(BULK_TOOLS)
     async def handle_call_tool(
         name: str, arguments: dict | None
     ) -> list[TextContent | ImageContent | EmbeddedResource]:
@@ -1696,6 +2246,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "create_contact": {
+                    "property_object_type": "contacts",
                     "endpoint": "https://api.hubapi.com/crm/v3/objects/contacts",
                     "method": "post",
                     "prepare_request": lambda args, token: {
@@ -1721,6 +2272,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "update_contact": {
+                    "property_object_type": "contacts",
                     "get_endpoint": lambda args: f"https://api.hubapi.com/crm/v3/objects/contacts/{args.get('contact_id')}",
                     "method": "patch",
                     "prepare_request": lambda args, token: {
@@ -1828,6 +2380,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "create_company": {
+                    "property_object_type": "companies",
                     "endpoint": "https://api.hubapi.com/crm/v3/objects/companies",
                     "method": "post",
                     "prepare_request": lambda args, token: {
@@ -1849,6 +2402,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "update_company": {
+                    "property_object_type": "companies",
                     "get_endpoint": lambda args: f"https://api.hubapi.com/crm/v3/objects/companies/{args.get('company_id')}",
                     "method": "patch",
                     "prepare_request": lambda args, token: {
@@ -1925,6 +2479,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "create_deal": {
+                    "property_object_type": "deals",
                     "endpoint": "https://api.hubapi.com/crm/v3/objects/deals",
                     "method": "post",
                     "prepare_request": lambda args, token: {
@@ -1932,6 +2487,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "update_deal": {
+                    "property_object_type": "deals",
                     "get_endpoint": lambda args: f"https://api.hubapi.com/crm/v3/objects/deals/{args.get('deal_id')}",
                     "method": "patch",
                     "prepare_request": lambda args, token: {
@@ -1985,6 +2541,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "create_ticket": {
+                    "property_object_type": "tickets",
                     "endpoint": "https://api.hubapi.com/crm/v3/objects/tickets",
                     "method": "post",
                     "prepare_request": lambda args, token: {
@@ -1992,6 +2549,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "update_ticket": {
+                    "property_object_type": "tickets",
                     "get_endpoint": lambda args: f"https://api.hubapi.com/crm/v3/objects/tickets/{args.get('ticket_id')}",
                     "method": "patch",
                     "prepare_request": lambda args, token: {
@@ -2051,6 +2609,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "create_product": {
+                    "property_object_type": "products",
                     "endpoint": "https://api.hubapi.com/crm/v3/objects/products",
                     "method": "post",
                     "prepare_request": lambda args, token: {
@@ -2058,6 +2617,7 @@ def create_server(user_id, api_key=None):
                     },
                 },
                 "update_product": {
+                    "property_object_type": "products",
                     "get_endpoint": lambda args: f"https://api.hubapi.com/crm/v3/objects/products/{args.get('product_id')}",
                     "method": "patch",
                     "prepare_request": lambda args, token: {
@@ -2152,6 +2712,20 @@ def create_server(user_id, api_key=None):
                         "payload": prepare_gdpr_delete_payload(args)
                     },
                 },
+                "batch_create_objects": {
+                    "custom_handler": partial(batch_write_handler, "create"),
+                },
+                "batch_update_objects": {
+                    "custom_handler": partial(batch_write_handler, "update"),
+                },
+                "batch_upsert_objects": {
+                    "custom_handler": partial(batch_write_handler, "upsert"),
+                },
+                "stream_objects": {"custom_handler": stream_objects_handler},
+                "start_export": {"custom_handler": start_export_handler},
+                "get_export_status": {"custom_handler": get_export_status_handler},
+                "start_import": {"custom_handler": start_import_handler},
+                "get_import_status": {"custom_handler": get_import_status_handler},
             }
 
             # Handle unknown tool
@@ -2181,6 +2755,25 @@ def create_server(user_id, api_key=None):
             if callable(method):
                 method = method(arguments)
 
+            # Map property names given in any case or by label to the portal's internal names
+            if tool_config.get("property_object_type") and isinstance(
+                arguments.get("properties"), dict
+            ):
+                try:
+                    property_index = await get_property_index(
+                        hubspot_api_request,
+                        access_token,
+                        tool_config["property_object_type"],
+                    )
+                    arguments = {
+                        **arguments,
+                        "properties": property_index.canonical_properties(
+                            arguments["properties"]
+                        ),
+                    }
+                except SchemaFetchError as e:
+                    logger.warning(f"Could not load property definitions: {e}")
+
             # Prepare request data
             request_data = {}
             if "prepare_request" in tool_config:
@@ -2191,13 +2784,11 @@ def create_server(user_id, api_key=None):
             params = request_data.get("params")
 
             if method.lower() == "get":
-                response = requests.get(endpoint, headers=headers, params=params)
-            elif method.lower() == "post":
-                response = requests.post(endpoint, headers=headers, json=payload)
-            elif method.lower() == "patch":
-                response = requests.patch(endpoint, headers=headers, json=payload)
+                request_kwargs = {"params": params}
+            elif method.lower() in ("post", "patch"):
+                request_kwargs = {"json": payload}
             elif method.lower() == "delete":
-                response = requests.delete(endpoint, headers=headers)
+                request_kwargs = {}
             else:
                 return [
                     TextContent(
@@ -2208,6 +2799,11 @@ def create_server(user_id, api_key=None):
                     )
                 ]
 
+            # Requests share the portal's rate limit across all sessions of the token
+            response = await hubspot_api_request(
+                access_token, method.upper(), endpoint, **request_kwargs
+            )
+
             # Process the response
             status_code = response.status_code
 
@@ -2345,11 +2941,10 @@ async def get_engagements_handler(args, headers, access_token):
     contact_id = args.get("contact_id")
     url = f"https://api.hubapi.com/crm/v3/objects/contacts/{contact_id}/associations/engagements"
 
-    response = requests.get(url, headers=headers)
+    response = await hubspot_api_request(access_token, "GET", url)
 
     if response.status_code == 200:
         association_data = response.json()
-        results = []
 
         # Extract engagement IDs from associations
         engagement_ids = []
@@ -2360,35 +2955,40 @@ async def get_engagements_handler(args, headers, access_token):
         if len(engagement_ids) >= min(args.get("limit", 10), 50):
             engagement_ids = engagement_ids[: min(args.get("limit", 10), 50)]
 
-        # Get details for each engagement
-        for engagement_id in engagement_ids:
-            engagement_url = (
-                f"https://api.hubapi.com/crm/v3/objects/engagements/{engagement_id}"
+        # Get details of all engagements with batch reads instead of one GET each
+        try:
+            engagements = await batch_read_objects(
+                access_token, "engagements", engagement_ids
             )
-            engagement_response = requests.get(engagement_url, headers=headers)
-
-            if engagement_response.status_code == 200:
-                engagement_data = engagement_response.json()
-                # Filter by engagement type if specified
-                if (
-                    args.get("engagement_type")
-                    and engagement_data.get("properties", {}).get("type", "").upper()
-                    != args.get("engagement_type").upper()
-                ):
-                    continue
+        except HubSpotAPIError as e:
+            return [
+                TextContent(
+                    type="text",
+                    text=json.dumps(
+                        {"error": f"Status {e.status_code}", "details": e.details},
+                        indent=2,
+                    ),
+                )
+            ]
+
+        results = []
+        for engagement_data in engagements:
+            # Filter by engagement type if specified
+            if (
+                args.get("engagement_type")
+                and engagement_data.get("properties", {}).get("type", "").upper()
+                != args.get("engagement_type").upper()
+            ):
+                continue
 
-                results.append(engagement_data)
+            results.append(engagement_data)
 
         # Create a combined response
         combined_response = {"total": len(results), "results": results}
         return [TextContent(type="text", text=json.dumps(combined_response, indent=2))]
 
     # Handle error
-    try:
-        response_data = response.json()
-        response_data["_status_code"] = response.status_code
-    except:
-        response_data = {"_status_code": response.status_code, "result": response.text}
+    response_data = get_error_details(response)
 
     return [
         TextContent(
@@ -2520,7 +3120,7 @@ async def fetch_lists(headers, config):
     return results
 
 
-async def read_list_resource(resource_id, object_type_id, headers):
+async def read_list_resource(resource_id, object_type_id, headers, access_token):
     """Special handler for reading list resources"""
     url = f"https://api.hubapi.com/contacts/v1/lists/{resource_id}"
     list_response = requests.get(url, headers=headers)
@@ -2554,22 +3154,32 @@ async def read_list_resource(resource_id, object_type_id, headers):
     ]
 
 
-async def read_custom_object_resource(resource_id, object_type_id, headers):
+async def read_custom_object_resource(
+    resource_id, object_type_id, headers, access_token
+):
     """Special handler for reading custom object resources"""
-    url = f"https://api.hubapi.com/crm/v3/objects/{object_type_id}/{resource_id}"
+    url = f"/crm/v3/objects/{object_type_id}/{resource_id}"
     params = {"properties": "__all__"}
 
-    response = requests.get(url, headers=headers, params=params)
+    # Read the object while the schema comes from the portal's schema cache
+    response, schema = await asyncio.gather(
+        hubspot_api_request(access_token, "GET", url, params=params),
+        get_object_schema(hubspot_api_request, access_token, object_type_id),
+        return_exceptions=True,
+    )
+    if isinstance(response, BaseException):
+        raise response
 
     if response.status_code == 200:
         data = response.json()
 
         # Get schema info for context
-        schema_url = f"https://api.hubapi.com/crm/v3/schemas/{object_type_id}"
-        schema_response = requests.get(schema_url, headers=headers)
-
-        if schema_response.status_code == 200:
-            data["schema"] = schema_response.json()
+        if isinstance(schema, SchemaFetchError):
+            logger.warning(f"Could not fetch schema of {object_type_id}: {schema}")
+        elif isinstance(schema, BaseException):
+            raise schema
+        else:
+            data["schema"] = schema
 
         return [
             ReadResourceContents(
@@ -2689,3 +3299,448 @@ def build_engagement_payload(args):
     elif "metadata" in args and isinstance(args.get("metadata"), dict):
         payload["metadata"] = args.get("metadata")
     return payload
+
+
+def error_response(error, details=None):
+    """Build the error response of the bulk tool handlers"""
+    body = {"error": error}
+    if details is not None:
+        body["details"] = details
+    return [TextContent(type="text", text=json.dumps(body, indent=2))]
+
+
+def flatten_object(obj):
+    """Flatten a CRM object into a row of its ID and properties"""
+    return {"id": obj.get("id"), **(obj.get("properties") or {})}
+
+
+def prepare_batch_inputs(operation, records, id_property=None):
+    """Build the inputs of a batch create/update/upsert request from tool records"""
+    inputs = []
+    for index, record in enumerate(records):
+        properties = record.get("properties")
+        if not isinstance(properties, dict):
+            raise ValueError(f"Record {index} has no properties object")
+
+        item = {
+            "properties": {
+                key: value if isinstance(value, str) or value is None else str(value)
+                for key, value in properties.items()
+            }
+        }
+        if operation == "create":
+            if record.get("associations"):
+                item["associations"] = record["associations"]
+        else:
+            if not record.get("id"):
+                raise ValueError(f"Record {index} has no id")
+            item["id"] = str(record["id"])
+            if id_property:
+                item["idProperty"] = id_property
+        inputs.append(item)
+    return inputs
+
+
+async def batch_write_handler(operation, args, headers, access_token):
+    """
+    Custom handler for the batch_create/update/upsert_objects tools.
+
+    Records are sent BATCH_SIZE per request with BATCH_CONCURRENCY requests in
+    flight. A failing chunk does not stop the others: its error is reported
+    next to the chunks that succeeded.
+    """
+    object_type = args.get("object_type")
+    records = args.get("records") or []
+    output_format = args.get("output_format", "ndjson")
+
+    if len(records) > MAX_BATCH_WRITE_RECORDS:
+        return error_response(
+            f"At most {MAX_BATCH_WRITE_RECORDS} records can be written per call"
+        )
+    if operation == "upsert" and not args.get("id_property"):
+        return error_response("id_property is required for upserts")
+
+    try:
+        inputs = prepare_batch_inputs(operation, records, args.get("id_property"))
+    except ValueError as e:
+        return error_response(str(e))
+
+    chunks = [inputs[i : i + BATCH_SIZE] for i in range(0, len(inputs), BATCH_SIZE)]
+    written = 0
+
+    async def write_chunk(index, chunk):
+        nonlocal written
+        response = await hubspot_api_request(
+            access_token,
+            "POST",
+            f"/crm/v3/objects/{object_type}/batch/{operation}",
+            json={"inputs": chunk},
+        )
+        written += len(chunk)
+        await report_progress(written, len(inputs))
+
+        # 207 Multi-Status holds the records that were written next to per-record errors
+        if response.status_code not in (200, 201, 207):
+            return [], [
+                {
+                    "chunk": index,
+                    "records": len(chunk),
+                    "error": f"Status {response.status_code}",
+                    "details": get_error_details(response),
+                }
+            ]
+        data = response.json()
+        errors = [
+            {
+                "chunk": index,
+                "error": error.get("message"),
+                "category": error.get("category"),
+                "context": error.get("context"),
+            }
+            for error in data.get("errors", [])
+        ]
+        return data.get("results", []), errors
+
+    chunk_results = await gather_bounded(
+        (write_chunk(index, chunk) for index, chunk in enumerate(chunks)),
+        BATCH_CONCURRENCY,
+    )
+
+    results = [result for chunk, _ in chunk_results for result in chunk]
+    errors = [error for _, chunk_errors in chunk_results for error in chunk_errors]
+    logger.info(
+        f"Batch {operation} of {len(inputs)} {object_type}: "
+        f"{len(results)} written, {len(errors)} errors"
+    )
+
+    summary = {
+        "operation": operation,
+        "object_type": object_type,
+        "total": len(inputs),
+        "succeeded": len(results),
+        "requests": len(chunks),
+        "errors": errors,
+    }
+    try:
+        contents = records_to_text_contents(
+            (flatten_object(result) for result in results), output_format
+        )
+    except ValueError as e:
+        return error_response(str(e))
+    return [TextContent(type="text", text=json.dumps(summary, indent=2))] + contents
+
+
+async def stream_objects_handler(args, headers, access_token):
+    """
+    Custom handler for stream_objects tool.
+
+    Pages of 100 objects are fetched with the next page requested while the
+    current one is serialized, and rows are written straight into NDJSON/CSV
+    chunks. Listings longer than max_records stop at a page boundary and
+    return the cursor to continue from.
+    """
+    object_type = args.get("object_type")
+    properties = args.get("properties") or []
+    max_records = min(
+        args.get("max_records", STREAM_DEFAULT_MAX_RECORDS), STREAM_MAX_RECORDS
+    )
+
+    try:
+        writer = RecordChunkWriter(
+            args.get("output_format", "ndjson"),
+            columns=["id"] + properties if properties else None,
+            chunk_rows=args.get("chunk_size", DEFAULT_CHUNK_ROWS),
+        )
+    except ValueError as e:
+        return error_response(str(e))
+
+    async def fetch_page(after):
+        params = {"limit": 100, "archived": str(args.get("archived", False)).lower()}
+        if properties:
+            params["properties"] = ",".join(properties)
+        if after:
+            params["after"] = after
+        response = await hubspot_api_request(
+            access_token, "GET", f"/crm/v3/objects/{object_type}", params=params
+        )
+        if response.status_code != 200:
+            raise HubSpotAPIError(response.status_code, get_error_details(response))
+        data = response.json()
+        next_after = hubspot_next_after(data)
+        # Yield whole pages so the listing stops on a page boundary with its cursor
+        return [(data.get("results", []), next_after)], next_after
+
+    contents = []
+    next_after = None
+    try:
+        async with aclosing(paginate(fetch_page, args.get("after"))) as pages:
+            async for objects, next_after in pages:
+                for obj in objects:
+                    chunk = writer.write(flatten_object(obj))
+                    if chunk:
+                        contents.append(TextContent(type="text", text=chunk))
+                await report_progress(writer.rows)
+                if writer.rows >= max_records:
+                    break
+    except HubSpotAPIError as e:
+        return error_response(f"Status {e.status_code}", e.details)
+
+    chunk = writer.flush()
+    if chunk:
+        contents.append(TextContent(type="text", text=chunk))
+
+    summary = {
+        "object_type": object_type,
+        "output_format": writer.output_format,
+        "records": writer.rows,
+        "chunks": writer.chunks,
+        "bytes": writer.bytes,
+        "next_after": next_after if writer.rows >= max_records else None,
+    }
+    return [TextContent(type="text", text=json.dumps(summary, indent=2))] + contents
+
+
+async def start_export_handler(args, headers, access_token):
+    """Custom handler for start_export tool"""
+    object_type = args.get("object_type")
+    payload = {
+        "exportType": "VIEW",
+        "format": "CSV",
+        "exportName": args.get("export_name") or f"{object_type} export",
+        "objectType": EXPORT_OBJECT_TYPES.get(object_type.lower(), object_type),
+        "objectProperties": args.get("properties") or [],
+        "language": args.get("language", "EN"),
+    }
+    if args.get("associated_object_types"):
+        payload["associatedObjectType"] = args["associated_object_types"]
+
+    response = await hubspot_api_request(
+        access_token, "POST", "/crm/v3/exports/export/async", json=payload
+    )
+    if response.status_code not in (200, 201, 202):
+        return error_response(
+            f"Status {response.status_code}", get_error_details(response)
+        )
+
+    return [TextContent(type="text", text=json.dumps(response.json(), indent=2))]
+
+
+async def wait_for_task(access_token, url, done_states, wait_seconds):
+    """Poll a task status endpoint until it reaches one of done_states or wait_seconds pass"""
+    deadline = asyncio.get_running_loop().time() + wait_seconds
+    while True:
+        response = await hubspot_api_request(access_token, "GET", url)
+        if response.status_code != 200:
+            raise HubSpotAPIError(response.status_code, get_error_details(response))
+        status = response.json()
+        state = status.get("status") or status.get("state")
+        if state in done_states or asyncio.get_running_loop().time() >= deadline:
+            return status
+        await asyncio.sleep(TASK_POLL_INTERVAL)
+
+
+def read_export_rows(file, writer, max_records):
+    """Serialize up to max_records rows of a downloaded CSV export into chunks"""
+    chunks = []
+    text_file = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        for row in csv.DictReader(text_file):
+            chunk = writer.write(row)
+            if chunk:
+                chunks.append(chunk)
+            if writer.rows >= max_records:
+                break
+    finally:
+        # Leave the spooled file open for its owner
+        text_file.detach()
+    chunk = writer.flush()
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+async def get_export_status_handler(args, headers, access_token):
+    """
+    Custom handler for get_export_status tool.
+
+    When download is set and the export is complete, the CSV is streamed into
+    a spooled temporary file (kept on disk past EXPORT_SPOOL_SIZE) and its
+    rows returned as NDJSON/CSV chunks.
+    """
+    export_id = args.get("export_id")
+    try:
+        status = await wait_for_task(
+            access_token,
+            f"/crm/v3/exports/export/async/tasks/{export_id}/status",
+            ("COMPLETE", "CANCELED"),
+            min(args.get("wait_seconds", 0), MAX_TASK_WAIT_SECONDS),
+        )
+    except HubSpotAPIError as e:
+        return error_response(f"Status {e.status_code}", e.details)
+
+    contents = [TextContent(type="text", text=json.dumps(status, indent=2))]
+    if not args.get("download") or status.get("status") != "COMPLETE":
+        return contents
+
+    try:
+        writer = RecordChunkWriter(
+            args.get("output_format", "ndjson"),
+            chunk_rows=args.get("chunk_size", DEFAULT_CHUNK_ROWS),
+        )
+    except ValueError as e:
+        return error_response(str(e))
+
+    # The export file is served from a signed URL, without the access token
+    client = get_http_client(SERVICE_NAME, base_url=HUBSPOT_API_URL)
+    with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE) as file:
+        async with client.stream("GET", status["result"]) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return error_response(
+                    f"Status {response.status_code} downloading export",
+                    get_error_details(response),
+                )
+            content_type = response.headers.get("content-type", "")
+            if "zip" in content_type:
+                return contents + [
+                    TextContent(
+                        type="text",
+                        text=json.dumps(
+                            {
+                                "error": "Export was delivered as a zip archive; "
+                                "download it from the result URL"
+                            },
+                            indent=2,
+                        ),
+                    )
+                ]
+            async for data in response.aiter_bytes():
+                file.write(data)
+
+        file.seek(0)
+        chunks = await asyncio.to_thread(
+            read_export_rows,
+            file,
+            writer,
+            min(
+                args.get("max_records", STREAM_DEFAULT_MAX_RECORDS), STREAM_MAX_RECORDS
+            ),
+        )
+
+    return contents + [TextContent(type="text", text=chunk) for chunk in chunks]
+
+
+def write_import_file(records, file):
+    """Write import records as CSV, with the union of their keys as columns"""
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    text_file = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    writer = csv.DictWriter(text_file, fieldnames=columns)
+    writer.writeheader()
+    writer.writerows(records)
+    text_file.flush()
+    text_file.detach()
+    file.seek(0)
+    return columns
+
+
+async def start_import_handler(args, headers, access_token):
+    """
+    Custom handler for start_import tool.
+
+    Records are written as CSV into a spooled temporary file and uploaded to
+    the imports API, which processes them asynchronously.
+    """
+    object_type = args.get("object_type")
+    object_type_id = IMPORT_OBJECT_TYPE_IDS.get(object_type.lower(), object_type)
+    records = args.get("records") or []
+    if not records:
+        return error_response("No records to import")
+
+    operation = args.get("operation", "UPSERT").upper()
+    id_property = args.get("id_property")
+    file_name = f"{object_type}-import.csv"
+
+    with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE) as file:
+        columns = await asyncio.to_thread(write_import_file, records, file)
+
+        column_mappings = []
+        for column in columns:
+            mapping = {
+                "columnObjectTypeId": object_type_id,
+                "columnName": column,
+                "propertyName": column,
+            }
+            if column == id_property:
+                mapping["columnType"] = "HUBSPOT_ALTERNATE_ID"
+            column_mappings.append(mapping)
+
+        import_request = {
+            "name": args.get("import_name") or f"{object_type} import",
+            "importOperations": {object_type_id: operation},
+            "files": [
+                {
+                    "fileName": file_name,
+                    "fileFormat": "CSV",
+                    "fileImportPage": {
+                        "hasHeader": True,
+                        "columnMappings": column_mappings,
+                    },
+                }
+            ],
+        }
+        if args.get("date_format"):
+            import_request["dateFormat"] = args["date_format"]
+
+        response = await hubspot_api_request(
+            access_token,
+            "POST",
+            "/crm/v3/imports",
+            data={"importRequest": json.dumps(import_request)},
+            files={"files": (file_name, file, "text/csv")},
+        )
+
+    if response.status_code not in (200, 201, 202):
+        return error_response(
+            f"Status {response.status_code}", get_error_details(response)
+        )
+
+    result = response.json()
+    result["records"] = len(records)
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def get_import_status_handler(args, headers, access_token):
+    """Custom handler for get_import_status tool"""
+    import_id = args.get("import_id")
+    try:
+        status = await wait_for_task(
+            access_token,
+            f"/crm/v3/imports/{import_id}",
+            ("DONE", "FAILED", "CANCELED"),
+            min(args.get("wait_seconds", 0), MAX_TASK_WAIT_SECONDS),
+        )
+
+        if args.get("include_errors"):
+
+            async def fetch_page(after):
+                params = {"limit": 100}
+                if after:
+                    params["after"] = after
+                response = await hubspot_api_request(
+                    access_token,
+                    "GET",
+                    f"/crm/v3/imports/{import_id}/errors",
+                    params=params,
+                )
+                if response.status_code != 200:
+                    raise HubSpotAPIError(
+                        response.status_code, get_error_details(response)
+                    )
+                data = response.json()
+                return data.get("results", []), hubspot_next_after(data)
+
+            status["errors"] = await collect(fetch_page, max_items=IMPORT_MAX_ERRORS)
+    except HubSpotAPIError as e:
+        return error_response(f"Status {e.status_code}", e.details)
+
+    return [TextContent(type="text", text=json.dumps(status, indent=2))]
@@ -12,6 +12,7 @@ import logging
 from pathlib import Path
 import json
 import requests
+from contextlib import aclosing
 from typing import Optional, Iterable
 
 from mcp.types import (
@@ -26,6 +27,22 @@ from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 
+from src.utils.jira.api import (
+    JiraAPIError,
+    get_account_id,
+    get_accessible_resources,
+)
+from src.utils.jira.bulk import (
+    MAX_BULK_ISSUES,
+    MAX_TASK_WAIT_SECONDS,
+    create_issues,
+    get_bulk_task,
+    transition_issues,
+    update_issues,
+)
+from src.utils.jira.search import clamp_max_results, search_issues
+from src.utils.rate_limit.util import bulk_tool_calls
+from src.utils.streaming.util import report_progress
 from src.utils.jira.util import (
     authenticate_and_save_credentials,
     get_credentials,
@@ -45,6 +62,8 @@ SCOPES = [
     "manage:jira-project",
     "manage:jira-configuration",
 ]
+# Tools whose requests queue behind those of interactive tool calls
+BULK_TOOLS = {"create_issues", "update_issues", "transition_issues"}
 
 # Configure logging
 logging.basicConfig(
@@ -93,21 +112,8 @@ async def create_jira_client(
 
         auth_header = f"{token_type} {access_token}"
 
-        # Create basic auth headers for fetching accessible resources
-        basic_headers = {"Authorization": auth_header, "Accept": "application/json"}
-
-        # Fetch accessible Atlassian sites for this token
-        resources_response = requests.get(
-            "https://api.atlassian.com/oauth/token/accessible-resources",
-            headers=basic_headers,
-        )
-
-        if resources_response.status_code != 200:
-            raise ValueError(
-                f"Failed to fetch accessible resources: {resources_response.status_code}"
-            )
-
-        resources = resources_response.json()
+        # Accessible Atlassian sites of this token (cached until the token changes)
+        resources = await get_accessible_resources(f"{user_id}:{api_key}", auth_header)
 
         if not resources:
             raise ValueError("No accessible Atlassian sites found")
@@ -172,6 +178,7 @@ async def create_jira_client(
 
         # Return client configuration
         client = {
+            "auth_header": auth_header,
             "headers": read_headers,
             "write_headers": write_headers,
             "base_url": base_url,
@@ -189,6 +196,34 @@ async def create_jira_client(
         raise
 
 
+async def search_issue_contents(jira_client, jql, arguments, default_max_results):
+    """
+    Run a JQL search and return each issue as a separate TextContent.
+
+    Clients passing a progressToken get a progress notification as each
+    batch of issues arrives.
+    """
+    max_results = clamp_max_results(arguments.get("max_results"), default_max_results)
+    contents = []
+    async with aclosing(
+        search_issues(
+            jira_client["auth_header"],
+            jira_client["base_url"],
+            jql,
+            fields=arguments.get("fields"),
+            expand=arguments.get("expand"),
+            max_results=max_results,
+        )
+    ) as batches:
+        async for issues in batches:
+            contents.extend(
+                TextContent(type="text", text=json.dumps(issue, indent=2))
+                for issue in issues
+            )
+            await report_progress(len(contents), max_results)
+    return contents
+
+
 def create_server(user_id, api_key=None):
     """
     Initialize and configure the JIRA MCP server.
@@ -223,6 +258,41 @@ def create_server(user_id, api_key=None):
             },
         }
 
+        # Fields of one issue in the bulk issue tools
+        bulk_issue_properties = {
+            "project_key": {
+                "type": "string",
+                "description": "Project key (e.g., PRJ)",
+            },
+            "summary": {"type": "string", "description": "Issue summary/title"},
+            "description": {"type": "string", "description": "Issue description"},
+            "issue_type": {"type": "string", "description": "Issue type"},
+            "assignee_account_id": {
+                "type": "string",
+                "description": "Account ID of assignee",
+            },
+            "priority": {
+                "type": "string",
+                "description": "Priority",
+                "enum": ["Highest", "High", "Medium", "Low", "Lowest"],
+            },
+            "parent_key": {
+                "type": "string",
+                "description": "Parent issue key (for sub-tasks)",
+            },
+            "story_points": {"type": "number", "description": "Story points estimate"},
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Issue labels",
+            },
+            "fields": {
+                "type": "object",
+                "additionalProperties": True,
+                "description": "Other Jira fields by field ID (e.g., customfield_10020)",
+            },
+        }
+
         # Project Tools
         project_tools = [
             Tool(
@@ -604,7 +674,17 @@ def create_server(user_id, api_key=None):
                         "jql": {"type": "string", "description": "JQL query string"},
                         "max_results": {
                             "type": "integer",
-                            "description": "Maximum number of results to return",
+                            "description": "Maximum number of results to return (max: 10000)",
+                        },
+                        "fields": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Issue fields to return (default: summary, status, issue type, priority, people, project, parent, labels, description and dates; ['*all'] for every field)",
+                        },
+                        "expand": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Entities to expand (e.g., renderedFields, changelog)",
                         },
                         **site_selection_properties,
                     },
@@ -645,6 +725,146 @@ def create_server(user_id, api_key=None):
                 },
                 requiredScopes=["write:jira-work"],
             ),
+            Tool(
+                name="create_issues",
+                description=f"Create many issues at once (50 per request) and return a result per issue. {site_selection_description}",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "project_key": {
+                            "type": "string",
+                            "description": "Project key of issues that do not set one (e.g., PRJ)",
+                        },
+                        "issue_type": {
+                            "type": "string",
+                            "description": "Issue type of issues that do not set one",
+                            "default": "Task",
+                        },
+                        "issues": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": bulk_issue_properties,
+                                "required": ["summary"],
+                            },
+                            "description": f"Issues to create (max {MAX_BULK_ISSUES})",
+                        },
+                        **site_selection_properties,
+                    },
+                    "required": ["issues"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the first item is a JSON summary and each following item is a JSON string with the result of one issue, in input order",
+                    "examples": [
+                        '{"total": 2, "succeeded": 1, "failed": 1}',
+                        '{"index": 0, "success": true, "id": "10000", "key": "TESTB700-1"}',
+                        '{"index": 1, "success": false, "errors": ["summary: You must specify a summary of the issue."]}',
+                    ],
+                },
+                requiredScopes=["write:jira-work"],
+            ),
+            Tool(
+                name="update_issues",
+                description=f"Modify the fields of many issues at once and return a result per issue. {site_selection_description}",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "issues": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "issue_key": {
+                                        "type": "string",
+                                        "description": "Issue key (e.g., PRJ-123)",
+                                    },
+                                    **bulk_issue_properties,
+                                },
+                                "required": ["issue_key"],
+                            },
+                            "description": f"Issues to update, each with its key and the fields to change (max {MAX_BULK_ISSUES})",
+                        },
+                        **site_selection_properties,
+                    },
+                    "required": ["issues"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the first item is a JSON summary and each following item is a JSON string with the result of one issue, in input order",
+                    "examples": [
+                        '{"total": 2, "succeeded": 2, "failed": 0}',
+                        '{"issue_key": "TESTB700-1", "success": true, "errors": []}',
+                    ],
+                },
+                requiredScopes=["write:jira-work"],
+            ),
+            Tool(
+                name="transition_issues",
+                description=f"Move many issues to a status (e.g., 'In Progress', 'Done') with one bulk operation and return a result per issue. {site_selection_description}",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "issue_keys": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": f"Keys of the issues to move (max {MAX_BULK_ISSUES})",
+                        },
+                        "transition_to": {
+                            "type": "string",
+                            "description": "Target status",
+                        },
+                        "send_notification": {
+                            "type": "boolean",
+                            "description": "Notify watchers of the issues",
+                            "default": True,
+                        },
+                        "wait_seconds": {
+                            "type": "integer",
+                            "description": f"Seconds to wait for the operation to finish (max {MAX_TASK_WAIT_SECONDS}); check unfinished operations with get_bulk_operation",
+                            "default": MAX_TASK_WAIT_SECONDS,
+                        },
+                        **site_selection_properties,
+                    },
+                    "required": ["issue_keys", "transition_to"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the first item is a JSON summary (with the task ID and status of the bulk operation) and each following item is a JSON string with the result of one issue, in input order",
+                    "examples": [
+                        '{"total": 2, "succeeded": 2, "failed": 0, "pending": 0, "task_id": "10641", "task_status": "COMPLETE"}',
+                        '{"issue_key": "TESTB700-1", "success": true, "status": "transitioned", "errors": []}',
+                    ],
+                },
+                requiredScopes=["write:jira-work"],
+            ),
+            Tool(
+                name="get_bulk_operation",
+                description=f"Get the progress and per-issue outcome of a bulk operation started by transition_issues. {site_selection_description}",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "task_id": {
+                            "type": "string",
+                            "description": "Task ID returned by transition_issues",
+                        },
+                        **site_selection_properties,
+                    },
+                    "required": ["task_id"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Status of the bulk operation task",
+                    "examples": [
+                        '{"taskId": "10641", "status": "COMPLETE", "progressPercent": 100, "processedAccessibleIssues": [10000], "failedAccessibleIssues": {}, "invalidOrInaccessibleIssueCount": 0, "totalIssueCount": 1}'
+                    ],
+                },
+                requiredScopes=["write:jira-work"],
+            ),
         ]
 
         # User-specific Tools
@@ -679,7 +899,17 @@ def create_server(user_id, api_key=None):
                         },
                         "max_results": {
                             "type": "integer",
-                            "description": "Maximum number of results to return",
+                            "description": "Maximum number of results to return (max: 10000)",
+                        },
+                        "fields": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Issue fields to return (default: summary, status, issue type, priority, people, project, parent, labels, description and dates; ['*all'] for every field)",
+                        },
+                        "expand": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Entities to expand (e.g., renderedFields, changelog)",
                         },
                         **site_selection_properties,
                     },
@@ -703,7 +933,17 @@ def create_server(user_id, api_key=None):
                     "properties": {
                         "max_results": {
                             "type": "integer",
-                            "description": "Maximum number of results to return",
+                            "description": "Maximum number of results to return (max: 10000)",
+                        },
+                        "fields": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Issue fields to return (default: summary, status, issue type, priority, people, project, parent, labels, description and dates; ['*all'] for every field)",
+                        },
+                        "expand": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Entities to expand (e.g., renderedFields, changelog)",
                         },
                         **site_selection_properties,
                     },
@@ -753,6 +993,7 @@ def create_server(user_id, api_key=None):
         return project_tools + issue_tools + user_tools
 
     @server.call_tool()
+    @bulk_tool_calls(BULK_TOOLS)
     async def handle_call_tool(
         name: str, arguments: dict | None
     ) -> list[TextContent | ImageContent | EmbeddedResource]:
@@ -784,6 +1025,7 @@ def create_server(user_id, api_key=None):
 
         headers = jira_client["headers"]
         base_url = jira_client["base_url"]
+        user_key = f"{server.user_id}:{server.api_key}"
         has_multiple_sites = jira_client["has_multiple_sites"]
 
         # For all tools, validate that site info is provided if needed
@@ -834,45 +1076,26 @@ def create_server(user_id, api_key=None):
                     response.raise_for_status()
 
             elif name == "get_my_issues":
-                max_results = api_args.get("max_results", 50)
                 status_filter = (
                     f" AND status = '{api_args['status']}'"
                     if "status" in api_args
                     else ""
                 )
 
-                # Get my account ID first
-                myself_response = requests.get(
-                    f"{base_url}/rest/api/3/myself", headers=headers
+                account_id = await get_account_id(
+                    user_key, jira_client["auth_header"], base_url
                 )
-                myself_response.raise_for_status()
-                myself = myself_response.json()
-                account_id = myself.get("accountId")
 
                 jql = f"assignee = '{account_id}'{status_filter} ORDER BY updated DESC"
-                params = {"jql": jql, "maxResults": max_results}
-
-                response = requests.get(
-                    f"{base_url}/rest/api/3/search", headers=headers, params=params
-                )
+                return await search_issue_contents(jira_client, jql, api_args, 50)
 
             elif name == "get_my_recent_activity":
-                max_results = api_args.get("max_results", 20)
-
-                # Get my account ID first
-                myself_response = requests.get(
-                    f"{base_url}/rest/api/3/myself", headers=headers
+                account_id = await get_account_id(
+                    user_key, jira_client["auth_header"], base_url
                 )
-                myself_response.raise_for_status()
-                myself = myself_response.json()
-                account_id = myself.get("accountId")
 
                 jql = f"assignee was '{account_id}' OR reporter = '{account_id}' OR comment ~ '{account_id}' ORDER BY updated DESC"
-                params = {"jql": jql, "maxResults": max_results}
-
-                response = requests.get(
-                    f"{base_url}/rest/api/3/search", headers=headers, params=params
-                )
+                return await search_issue_contents(jira_client, jql, api_args, 20)
 
             elif name == "get_my_permissions":
                 project_key = api_args.get("project_key")
@@ -954,13 +1177,7 @@ def create_server(user_id, api_key=None):
             # Issue management tools
             elif name == "list_issues":
                 jql = api_args.get("jql", "")
-                max_results = api_args.get("max_results", 50)
-
-                params = {"jql": jql, "maxResults": max_results}
-
-                response = requests.get(
-                    f"{base_url}/rest/api/3/search", headers=headers, params=params
-                )
+                return await search_issue_contents(jira_client, jql, api_args, 50)
 
             elif name == "create_issue":
                 project_key = api_args.get("project_key")
@@ -1207,6 +1424,68 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
+            elif name in ("create_issues", "update_issues", "transition_issues"):
+                items = api_args.get(
+                    "issue_keys" if name == "transition_issues" else "issues"
+                )
+                if not items:
+                    raise ValueError("No issues given")
+                if len(items) > MAX_BULK_ISSUES:
+                    raise ValueError(
+                        f"At most {MAX_BULK_ISSUES} issues can be processed per call"
+                    )
+
+                summary = {}
+                if name == "create_issues":
+                    results = await create_issues(
+                        jira_client["auth_header"],
+                        base_url,
+                        items,
+                        project_key=api_args.get("project_key"),
+                        issue_type=api_args.get("issue_type", "Task"),
+                    )
+                elif name == "update_issues":
+                    results = await update_issues(
+                        jira_client["auth_header"], base_url, items
+                    )
+                else:
+                    task, results = await transition_issues(
+                        jira_client["auth_header"],
+                        base_url,
+                        items,
+                        api_args.get("transition_to", ""),
+                        send_notification=api_args.get("send_notification", True),
+                        wait_seconds=api_args.get(
+                            "wait_seconds", MAX_TASK_WAIT_SECONDS
+                        ),
+                    )
+                    summary["pending"] = sum(
+                        1 for result in results if result.get("status") == "pending"
+                    )
+                    if task:
+                        summary["task_id"] = task.get("taskId")
+                        summary["task_status"] = task.get("status")
+
+                succeeded = sum(1 for result in results if result.get("success"))
+                summary = {
+                    "total": len(results),
+                    "succeeded": succeeded,
+                    "failed": len(results) - succeeded - summary.get("pending", 0),
+                    **summary,
+                }
+                return [
+                    TextContent(type="text", text=json.dumps(summary, indent=2))
+                ] + [
+                    TextContent(type="text", text=json.dumps(result, indent=2))
+                    for result in results
+                ]
+
+            elif name == "get_bulk_operation":
+                task = await get_bulk_task(
+                    jira_client["auth_header"], base_url, api_args.get("task_id")
+                )
+                return [TextContent(type="text", text=json.dumps(task, indent=2))]
+
             elif name == "comment_on_issue":
                 issue_key = api_args.get("issue_key")
                 comment_data = format_comment_body(api_args.get("body", ""))
@@ -1233,14 +1512,10 @@ def create_server(user_id, api_key=None):
                     # If lead_account_id is not provided, get the current user's account ID
                     if "lead_account_id" not in api_args:
                         try:
-                            myself_response = requests.get(
-                                f"{base_url}/rest/api/3/myself", headers=headers
+                            api_args["lead_account_id"] = await get_account_id(
+                                user_key, jira_client["auth_header"], base_url
                             )
-                            myself_response.raise_for_status()
-                            api_args["lead_account_id"] = myself_response.json().get(
-                                "accountId"
-                            )
-                        except requests.exceptions.RequestException:
+                        except JiraAPIError:
                             error_response = {
                                 "error": "Error accessing Jira site. Please verify your permissions."
                             }
@@ -1326,6 +1601,9 @@ def create_server(user_id, api_key=None):
             # Return the result as a single JSON object
             return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
+        except JiraAPIError as e:
+            error_message = {"error": f"JIRA API error: {str(e)}", "details": e.details}
+            return [TextContent(type="text", text=json.dumps(error_message, indent=2))]
         except requests.exceptions.RequestException as e:
             error_message = {"error": f"JIRA API error: {str(e)}"}
 
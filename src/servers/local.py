@@ -19,11 +19,18 @@ async def run_stdio_server(server, get_initialization_options):
     """Run the server using stdin/stdout streams"""
     logger.info("Starting stdio server")
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            get_initialization_options(),
-        )
+        try:
+            await server.run(
+                read_stream,
+                write_stream,
+                get_initialization_options(),
+            )
+        finally:
+            # Imported here since the project root is only on the path once the server is loaded
+            from src.utils.http.util import run_shutdown_hooks
+
+            # Send requests still buffered by the server (e.g. queued events)
+            await run_shutdown_hooks()
 
 
 async def load_server(server_name):
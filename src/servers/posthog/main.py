@@ -5,7 +5,7 @@ This server provides a set of tools for interacting with the PostHog API directl
 import os
 import sys
 import json
-import requests
+import asyncio
 from typing import List
 import logging
 from pathlib import Path
@@ -26,10 +26,20 @@ project_root = os.path.abspath(
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, "src"))
 
+from src.utils.posthog.api import (
+    POSTHOG_API_HOST,
+    POSTHOG_INGEST_HOST,
+    get_projects,
+    posthog_request,
+)
+from src.utils.posthog.capture import (
+    MAX_CAPTURE_EVENTS,
+    build_event,
+    get_event_buffer,
+)
 from src.utils.posthog.util import (
     get_posthog_credentials,
     authenticate_and_save_posthog_key,
-    get_project_details,
 )
 
 SERVICE_NAME = Path(__file__).parent.name
@@ -218,6 +228,54 @@ def create_server(user_id, api_key=None):
                     "required": ["distinct_id", "event"],
                 },
             ),
+            Tool(
+                name="capture_events",
+                description="Capture many events at once. Events are queued and sent to PostHog in batches; use '$identify' events with a '$set' property to identify many users",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "events": {
+                            "type": "array",
+                            "description": f"Events to capture (max {MAX_CAPTURE_EVENTS})",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "distinct_id": {
+                                        "type": "string",
+                                        "description": "Unique identifier for the user",
+                                    },
+                                    "event": {
+                                        "type": "string",
+                                        "description": "Name of the event to capture",
+                                    },
+                                    "properties": {
+                                        "type": "object",
+                                        "description": "Additional properties for the event",
+                                    },
+                                    "timestamp": {
+                                        "type": "string",
+                                        "description": "Optional: ISO 8601 time of the event (default: now)",
+                                    },
+                                },
+                                "required": ["distinct_id", "event"],
+                            },
+                        },
+                        "wait": {
+                            "type": "boolean",
+                            "description": "Wait until the events are sent and report failures (default: true). When false, return once the events are queued",
+                        },
+                        "project_id": {
+                            "type": "integer",
+                            "description": "Optional: Project ID if multiple projects exist",
+                        },
+                        "project_api_token": {
+                            "type": "string",
+                            "description": "Optional: Project API token if multiple projects exist",
+                        },
+                    },
+                    "required": ["events"],
+                },
+            ),
             Tool(
                 name="identify_user",
                 description="Create or update a user profile with properties",
@@ -1328,20 +1386,34 @@ def create_server(user_id, api_key=None):
 
         # Get project details
         try:
-            projects = get_project_details(api_key)
+            # Projects of the key's organization (cached per API key)
+            projects = await get_projects(api_key)
             if len(projects) > 1:
                 # If multiple projects exist and no project_id provided, return error
-                if not arguments.get("project_id") or not arguments.get(
-                    "project_api_token"
-                ):
+                if not arguments.get("project_id"):
                     return [
                         TextContent(
                             type="text",
-                            text="Multiple projects found. Please provide project_id and project_api_token in the request.",
+                            text="Multiple projects found. Please provide project_id in the request.",
                         )
                     ]
                 project_id = arguments["project_id"]
-                project_api_token = arguments["project_api_token"]
+                # The project API token is known from the cached projects
+                project_api_token = arguments.get("project_api_token") or next(
+                    (
+                        project["api_token"]
+                        for project in projects
+                        if str(project["id"]) == str(project_id)
+                    ),
+                    None,
+                )
+                if not project_api_token:
+                    return [
+                        TextContent(
+                            type="text",
+                            text=f"Project {project_id} not found. Please provide project_api_token in the request.",
+                        )
+                    ]
             else:
                 # If only one project exists, use its details
                 project_id = projects[0]["id"]
@@ -1362,8 +1434,8 @@ def create_server(user_id, api_key=None):
         }
 
         # Set up API endpoints
-        host = "https://us.i.posthog.com"
-        private_host = "https://us.posthog.com/api/projects/"
+        host = POSTHOG_INGEST_HOST
+        private_host = f"{POSTHOG_API_HOST}/api/projects/"
         decide = "/decide/"
         event = "/i/v0/e/"
 
@@ -1388,8 +1460,12 @@ def create_server(user_id, api_key=None):
                     "properties": properties,
                 }
 
-                response = requests.post(
-                    f"{host}/capture/", json=payload, headers=project_headers
+                response = await posthog_request(
+                    project_api_token,
+                    "POST",
+                    f"{host}/capture/",
+                    json=payload,
+                    headers=project_headers,
                 )
 
                 if response.status_code == 200:
@@ -1404,6 +1480,58 @@ def create_server(user_id, api_key=None):
                         "message": f"Failed to capture event: {response.text}",
                     }
 
+            elif name == "capture_events":
+                events = arguments.get("events") or []
+                wait = arguments.get("wait", True)
+
+                invalid = [
+                    index
+                    for index, item in enumerate(events)
+                    if not item.get("distinct_id") or not item.get("event")
+                ]
+                if not events or invalid:
+                    return [
+                        TextContent(
+                            type="text",
+                            text=f"Error: Missing required parameters (events without distinct_id or event: {invalid})",
+                        )
+                    ]
+                if len(events) > MAX_CAPTURE_EVENTS:
+                    return [
+                        TextContent(
+                            type="text",
+                            text=f"Error: At most {MAX_CAPTURE_EVENTS} events can be captured per call",
+                        )
+                    ]
+
+                # Queued events are sent in batches by the project's buffer
+                sent = await get_event_buffer(project_api_token).put(
+                    [
+                        build_event(
+                            item["event"],
+                            item["distinct_id"],
+                            item.get("properties"),
+                            item.get("timestamp"),
+                        )
+                        for item in events
+                    ],
+                    flush=wait,
+                )
+
+                if not wait:
+                    result = {
+                        "status": "success",
+                        "message": f"{len(events)} events queued",
+                    }
+                else:
+                    errors = [error for error in await asyncio.gather(*sent) if error]
+                    result = {
+                        "status": "error" if errors else "success",
+                        "message": f"{len(events) - len(errors)} of {len(events)} events captured",
+                    }
+                    if errors:
+                        result["errors"] = sorted(set(errors))
+
             elif name == "identify_user":
                 distinct_id = arguments.get("distinct_id")
                 properties = arguments.get("properties", {})
@@ -1424,8 +1552,12 @@ def create_server(user_id, api_key=None):
                     "event": "$identify",
                 }
 
-                response = requests.post(
-                    f"{host}{event}", json=payload, headers=project_headers
+                response = await posthog_request(
+                    project_api_token,
+                    "POST",
+                    f"{host}{event}",
+                    json=payload,
+                    headers=project_headers,
                 )
 
                 if response.status_code == 200:
@@ -1461,8 +1593,12 @@ def create_server(user_id, api_key=None):
                     "groups": {},
                 }
 
-                response = requests.post(
-                    f"{host}{decide}", json=payload, headers=project_headers
+                response = await posthog_request(
+                    project_api_token,
+                    "POST",
+                    f"{host}{decide}",
+                    json=payload,
+                    headers=project_headers,
                 )
 
                 if response.status_code == 200:
@@ -1503,8 +1639,12 @@ def create_server(user_id, api_key=None):
                     "groups": {},
                 }
 
-                response = requests.post(
-                    f"{host}{decide}", json=payload, headers=project_headers
+                response = await posthog_request(
+                    project_api_token,
+                    "POST",
+                    f"{host}{decide}",
+                    json=payload,
+                    headers=project_headers,
                 )
 
                 if response.status_code == 200:
@@ -1544,8 +1684,12 @@ def create_server(user_id, api_key=None):
                     "groups": {},
                 }
 
-                response = requests.post(
-                    f"{host}{decide}", json=payload, headers=project_headers
+                response = await posthog_request(
+                    project_api_token,
+                    "POST",
+                    f"{host}{decide}",
+                    json=payload,
+                    headers=project_headers,
                 )
 
                 if response.status_code == 200:
@@ -1587,8 +1731,12 @@ def create_server(user_id, api_key=None):
                     },
                 }
 
-                response = requests.post(
-                    f"{host}{event}", json=payload, headers=project_headers
+                response = await posthog_request(
+                    project_api_token,
+                    "POST",
+                    f"{host}{event}",
+                    json=payload,
+                    headers=project_headers,
                 )
 
                 if response.status_code == 200:
@@ -1629,8 +1777,12 @@ def create_server(user_id, api_key=None):
                     "properties": group_props,
                 }
 
-                response = requests.post(
-                    f"{host}/capture/", json=payload, headers=project_headers
+                response = await posthog_request(
+                    project_api_token,
+                    "POST",
+                    f"{host}/capture/",
+                    json=payload,
+                    headers=project_headers,
                 )
 
                 if response.status_code == 200:
@@ -1647,8 +1799,11 @@ def create_server(user_id, api_key=None):
 
             elif name == "list_actions":
                 # List all actions
-                response = requests.get(
-                    f"{private_host}{project_id}/actions/", headers=private_host_headers
+                response = await posthog_request(
+                    api_key,
+                    "GET",
+                    f"{private_host}{project_id}/actions/",
+                    headers=private_host_headers,
                 )
 
                 if response.status_code == 200:
@@ -1676,7 +1831,9 @@ def create_server(user_id, api_key=None):
 
                 payload = {"name": name, "description": description, "steps": steps}
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/actions/",
                     headers=private_host_headers,
                     json=payload,
@@ -1705,7 +1862,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/actions/{action_id}/",
                     headers=private_host_headers,
                 )
@@ -1741,7 +1900,9 @@ def create_server(user_id, api_key=None):
                 if steps is not None:
                     payload["steps"] = steps
 
-                response = requests.patch(
+                response = await posthog_request(
+                    api_key,
+                    "PATCH",
                     f"{private_host}{project_id}/actions/{action_id}/",
                     headers=private_host_headers,
                     json=payload,
@@ -1760,7 +1921,9 @@ def create_server(user_id, api_key=None):
                     }
 
             elif name == "list_annotations":
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/annotations/",
                     headers=private_host_headers,
                 )
@@ -1798,7 +1961,9 @@ def create_server(user_id, api_key=None):
                 if dashboard_id and scope == "dashboard":
                     payload["dashboard_id"] = dashboard_id
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/annotations/",
                     headers=private_host_headers,
                     json=payload,
@@ -1827,7 +1992,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/annotations/{annotation_id}/",
                     headers=private_host_headers,
                 )
@@ -1866,7 +2033,9 @@ def create_server(user_id, api_key=None):
                 if dashboard_id is not None:
                     payload["dashboard_id"] = dashboard_id
 
-                response = requests.patch(
+                response = await posthog_request(
+                    api_key,
+                    "PATCH",
                     f"{private_host}{project_id}/annotations/{annotation_id}/",
                     headers=private_host_headers,
                     json=payload,
@@ -1885,8 +2054,11 @@ def create_server(user_id, api_key=None):
                     }
 
             elif name == "list_cohorts":
-                response = requests.get(
-                    f"{private_host}{project_id}/cohorts/", headers=private_host_headers
+                response = await posthog_request(
+                    api_key,
+                    "GET",
+                    f"{private_host}{project_id}/cohorts/",
+                    headers=private_host_headers,
                 )
 
                 if response.status_code == 200:
@@ -1918,7 +2090,9 @@ def create_server(user_id, api_key=None):
                     "is_static": is_static,
                 }
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/cohorts/",
                     headers=private_host_headers,
                     json=payload,
@@ -1947,7 +2121,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/cohorts/{cohort_id}/",
                     headers=private_host_headers,
                 )
@@ -1986,7 +2162,9 @@ def create_server(user_id, api_key=None):
                 if is_static is not None:
                     payload["is_static"] = is_static
 
-                response = requests.patch(
+                response = await posthog_request(
+                    api_key,
+                    "PATCH",
                     f"{private_host}{project_id}/cohorts/{cohort_id}/",
                     headers=private_host_headers,
                     json=payload,
@@ -2015,7 +2193,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.patch(
+                response = await posthog_request(
+                    api_key,
+                    "PATCH",
                     f"{private_host}{project_id}/cohorts/{cohort_id}/",
                     headers=private_host_headers,
                     json={"deleted": True},
@@ -2030,7 +2210,9 @@ def create_server(user_id, api_key=None):
                     result = {"status": "error", "message": "Failed to delete cohort"}
 
             elif name == "list_dashboards":
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/dashboards/",
                     headers=private_host_headers,
                 )
@@ -2057,7 +2239,9 @@ def create_server(user_id, api_key=None):
 
                 payload = {"name": name, "description": description, "filters": filters}
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/dashboards/",
                     headers=private_host_headers,
                     json=payload,
@@ -2086,7 +2270,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/dashboards/{dashboard_id}/",
                     headers=private_host_headers,
                 )
@@ -2121,7 +2307,9 @@ def create_server(user_id, api_key=None):
                 if filters is not None:
                     payload["filters"] = filters
 
-                response = requests.patch(
+                response = await posthog_request(
+                    api_key,
+                    "PATCH",
                     f"{private_host}{project_id}/dashboards/{dashboard_id}/",
                     headers=private_host_headers,
                     json=payload,
@@ -2150,7 +2338,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.patch(
+                response = await posthog_request(
+                    api_key,
+                    "PATCH",
                     f"{private_host}{project_id}/dashboards/{dashboard_id}/",
                     headers=private_host_headers,
                     json={"deleted": True},
@@ -2178,7 +2368,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/dashboards/{dashboard_id}/collaborators/",
                     headers=private_host_headers,
                 )
@@ -2207,7 +2399,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/dashboards/{dashboard_id}/collaborators/",
                     headers=private_host_headers,
                     json={"user_uuid": user_uuid, "level": level},
@@ -2235,7 +2429,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/dashboards/{dashboard_id}/sharing/",
                     headers=private_host_headers,
                 )
@@ -2258,7 +2454,9 @@ def create_server(user_id, api_key=None):
                 if properties:
                     params["properties"] = properties
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/persons/",
                     headers=private_host_headers,
                     params=params,
@@ -2283,7 +2481,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/persons/{person_id}/",
                     headers=private_host_headers,
                 )
@@ -2301,7 +2501,9 @@ def create_server(user_id, api_key=None):
                     }
 
             elif name == "list_experiments":
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/experiments/",
                     headers=private_host_headers,
                 )
@@ -2339,7 +2541,9 @@ def create_server(user_id, api_key=None):
                     "filters": filters,
                 }
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/experiments/",
                     headers=private_host_headers,
                     json=payload,
@@ -2368,7 +2572,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/experiments/{experiment_id}/",
                     headers=private_host_headers,
                 )
@@ -2405,7 +2611,9 @@ def create_server(user_id, api_key=None):
                     "filters": filters,
                 }
 
-                response = requests.patch(
+                response = await posthog_request(
+                    api_key,
+                    "PATCH",
                     f"{private_host}{project_id}/experiments/{experiment_id}/",
                     headers=private_host_headers,
                     json=payload,
@@ -2424,7 +2632,9 @@ def create_server(user_id, api_key=None):
                     }
 
             elif name == "check_experiments_requiring_flag":
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/experiments/requires_flag_implementation/",
                     headers=private_host_headers,
                 )
@@ -2438,7 +2648,9 @@ def create_server(user_id, api_key=None):
                     }
 
             elif name == "list_insights":
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/insights/",
                     headers=private_host_headers,
                 )
@@ -2466,7 +2678,9 @@ def create_server(user_id, api_key=None):
 
                 payload = {"name": name, "filters": filters, "description": description}
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/insights/",
                     headers=private_host_headers,
                     json=payload,
@@ -2495,7 +2709,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/insights/{insight_id}/sharing/",
                     headers=private_host_headers,
                 )
@@ -2524,7 +2740,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/insights/{insight_id}/",
                     headers=private_host_headers,
                 )
@@ -2559,7 +2777,9 @@ def create_server(user_id, api_key=None):
                 if description is not None:
                     payload["description"] = description
 
-                response = requests.patch(
+                response = await posthog_request(
+                    api_key,
+                    "PATCH",
                     f"{private_host}{project_id}/insights/{insight_id}/",
                     headers=private_host_headers,
                     json=payload,
@@ -2588,7 +2808,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/insights/{insight_id}/activity/",
                     headers=private_host_headers,
                 )
@@ -2612,7 +2834,9 @@ def create_server(user_id, api_key=None):
                         )
                     ]
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/insights/{insight_id}/viewed/",
                     headers=private_host_headers,
                 )
@@ -2628,7 +2852,9 @@ def create_server(user_id, api_key=None):
                     }
 
             elif name == "get_insights_activity":
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/insights/activity/",
                     headers=private_host_headers,
                 )
@@ -2642,7 +2868,9 @@ def create_server(user_id, api_key=None):
                     }
 
             elif name == "get_trend_insights":
-                response = requests.get(
+                response = await posthog_request(
+                    api_key,
+                    "GET",
                     f"{private_host}{project_id}/insights/trend/",
                     headers=private_host_headers,
                 )
@@ -2669,7 +2897,9 @@ def create_server(user_id, api_key=None):
 
                 payload = {"name": name, "filters": filters}
 
-                response = requests.post(
+                response = await posthog_request(
+                    api_key,
+                    "POST",
                     f"{private_host}{project_id}/insights/trend/",
                     headers=private_host_headers,
                     json=payload,
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import sys
 import uvicorn
 import argparse
 import importlib.util
@@ -242,9 +244,25 @@ def create_starlette_app():
 
     routes.append(Route("/health_check", endpoint=health_check))
 
+    async def close_shared_clients():
+        """Close the HTTP and database connection pools shared by server sessions"""
+        # Imported here since the project root is only on the path once servers are loaded
+        from src.utils.http.util import close_http_clients, run_shutdown_hooks
+
+        # Buffered requests (e.g. queued events) are sent before the HTTP clients are closed
+        await run_shutdown_hooks()
+
+        await close_http_clients()
+
+        # Only servers that use Snowflake load its connector and pools
+        snowflake_pool = sys.modules.get("src.utils.snowflake.pool")
+        if snowflake_pool:
+            await asyncio.to_thread(snowflake_pool.close_pools)
+
     app = Starlette(
         debug=True,
         routes=routes,
+        on_shutdown=[close_shared_clients],
     )
 
     return app
@@ -3,7 +3,6 @@ import os
 from pathlib import Path
 import logging
 import sys
-from simple_salesforce import Salesforce
 
 project_root = os.path.abspath(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -15,7 +14,24 @@ import mcp.types as types
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 from src.utils.salesforce.util import authenticate_and_save_credentials, get_credentials
-
+from src.utils.salesforce.api import get_salesforce_client
+from src.utils.salesforce.bulk import (
+    INGEST_OPERATIONS,
+    MAX_COLLECTION_RECORDS,
+    MAX_INGEST_RECORDS,
+    create_ingest_job,
+    create_query_job,
+    get_ingest_results,
+    save_records,
+    stream_query_results,
+    wait_for_job,
+)
+from src.utils.salesforce.metadata import (
+    check_fields,
+    describe_sobject,
+    validate_soql,
+)
+from src.utils.rate_limit.util import bulk_tool_calls
 
 SERVICE_NAME = Path(__file__).parent.name
 
@@ -23,6 +39,14 @@ SCOPES = [  # Required scopes for Salesforce integration
     "api",
     "refresh_token",
 ]
+# Tools whose requests queue behind those of interactive tool calls
+BULK_TOOLS = {
+    "bulk_query",
+    "get_bulk_query_results",
+    "bulk_ingest",
+    "create_records",
+    "update_records",
+}
 
 
 # Configure logging
@@ -678,9 +702,252 @@ def create_server(user_id, api_key=None):
                 },
                 requiredScopes=["api"],
             ),
+            types.Tool(
+                name="bulk_query",
+                description="Runs a SOQL query as a Bulk API 2.0 job for large result sets and returns the first rows as CSV or NDJSON chunks. Continue with get_bulk_query_results using the returned next_locator",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "The SOQL query to execute (relationship subqueries are not supported by Bulk API 2.0)",
+                        },
+                        "include_deleted": {
+                            "type": "boolean",
+                            "description": "Include deleted and archived records (queryAll)",
+                            "default": False,
+                        },
+                        "wait_seconds": {
+                            "type": "integer",
+                            "description": "Seconds to wait for the job to complete before returning its status (max 120)",
+                            "default": 60,
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["csv", "ndjson"],
+                            "description": "Format of the returned rows",
+                            "default": "csv",
+                        },
+                        "max_rows": {
+                            "type": "integer",
+                            "description": "Maximum rows to return (default 10000, max 50000)",
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Approximate maximum size of the returned rows in bytes (default 4MB, max 16MB)",
+                        },
+                    },
+                    "required": ["query"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the first item is a JSON summary (job_id, state, rows, next_locator) and the following items are CSV or NDJSON chunks of rows",
+                    "examples": [
+                        '{"job_id": "<JOB_ID>", "state": "JobComplete", "total_rows": 25000, "columns": ["Id", "Name"], "rows": 10000, "next_locator": "MTAwMDA"}',
+                        "Id,Name\n<ID>,Acme\n<ID>,Globex\n",
+                    ],
+                },
+                requiredScopes=["api"],
+            ),
+            types.Tool(
+                name="get_bulk_query_results",
+                description="Returns the status of a Bulk API 2.0 query job and, once complete, the next rows of its result as CSV or NDJSON chunks",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "job_id": {
+                            "type": "string",
+                            "description": "ID of the query job returned by bulk_query",
+                        },
+                        "locator": {
+                            "type": "string",
+                            "description": "next_locator of the previous call, to continue the result",
+                        },
+                        "wait_seconds": {
+                            "type": "integer",
+                            "description": "Seconds to wait for the job to complete (max 120)",
+                            "default": 0,
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["csv", "ndjson"],
+                            "description": "Format of the returned rows",
+                            "default": "csv",
+                        },
+                        "max_rows": {
+                            "type": "integer",
+                            "description": "Maximum rows to return (default 10000, max 50000)",
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Approximate maximum size of the returned rows in bytes (default 4MB, max 16MB)",
+                        },
+                    },
+                    "required": ["job_id"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the first item is a JSON summary (job_id, state, rows, next_locator) and the following items are CSV or NDJSON chunks of rows",
+                    "examples": [
+                        '{"job_id": "<JOB_ID>", "state": "JobComplete", "total_rows": 25000, "locator": "MTAwMDA", "rows": 10000, "next_locator": "MjAwMDA"}',
+                    ],
+                },
+                requiredScopes=["api"],
+            ),
+            types.Tool(
+                name="bulk_ingest",
+                description="Inserts, updates, upserts or deletes many records with a Bulk API 2.0 ingest job. Check the job with get_bulk_ingest_status",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_name": {
+                            "type": "string",
+                            "description": "The API name of the Salesforce object (e.g., 'Account', 'Contact')",
+                        },
+                        "operation": {
+                            "type": "string",
+                            "enum": list(INGEST_OPERATIONS),
+                            "description": "Operation applied to every record",
+                        },
+                        "records": {
+                            "type": "array",
+                            "items": {"type": "object", "additionalProperties": True},
+                            "description": f"Records as field/value pairs (Id is required for update and delete, null clears a field; max {MAX_INGEST_RECORDS})",
+                        },
+                        "external_id_field": {
+                            "type": "string",
+                            "description": "External ID field used to match records (required for upsert)",
+                        },
+                        "wait_seconds": {
+                            "type": "integer",
+                            "description": "Seconds to wait for the job to complete (max 120)",
+                            "default": 0,
+                        },
+                    },
+                    "required": ["object_name", "operation", "records"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the single item is a JSON string with the ingest job status",
+                    "examples": [
+                        '{"id": "<JOB_ID>", "object": "Account", "operation": "insert", "state": "UploadComplete"}'
+                    ],
+                },
+                requiredScopes=["api", "refresh_token"],
+            ),
+            types.Tool(
+                name="get_bulk_ingest_status",
+                description="Returns the status of a Bulk API 2.0 ingest job with its processed and failed record counts, and optionally the failed records with their errors",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "job_id": {
+                            "type": "string",
+                            "description": "ID of the ingest job returned by bulk_ingest",
+                        },
+                        "wait_seconds": {
+                            "type": "integer",
+                            "description": "Seconds to wait for the job to complete (max 120)",
+                            "default": 0,
+                        },
+                        "include_failed_records": {
+                            "type": "boolean",
+                            "description": "Include the failed records with their sf__Error",
+                            "default": False,
+                        },
+                        "max_failed_records": {
+                            "type": "integer",
+                            "description": "Maximum failed records to include",
+                            "default": 100,
+                        },
+                    },
+                    "required": ["job_id"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the single item is a JSON string with the job status and failed records",
+                    "examples": [
+                        '{"id": "<JOB_ID>", "state": "JobComplete", "numberRecordsProcessed": 500, "numberRecordsFailed": 1, "failed_records": [{"sf__Id": "", "sf__Error": "REQUIRED_FIELD_MISSING:Required fields are missing: [Name]:Name --", "Industry": "Technology"}]}'
+                    ],
+                },
+                requiredScopes=["api"],
+            ),
+            types.Tool(
+                name="create_records",
+                description="Creates multiple records of one object with sObject Collections (200 records per request) and returns a result per record",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_name": {
+                            "type": "string",
+                            "description": "The API name of the Salesforce object (e.g., 'Account', 'Contact')",
+                        },
+                        "records": {
+                            "type": "array",
+                            "items": {"type": "object", "additionalProperties": True},
+                            "description": f"Records to create as field/value pairs (max {MAX_COLLECTION_RECORDS})",
+                        },
+                        "all_or_none": {
+                            "type": "boolean",
+                            "description": "Roll back every record of a 200-record request when one of them fails",
+                            "default": False,
+                        },
+                    },
+                    "required": ["object_name", "records"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the first item is a JSON summary and each following item is a JSON string with the result of one record, in input order",
+                    "examples": [
+                        '{"total": 2, "succeeded": 2, "failed": 0}',
+                        '{"id": "<ID>", "success": true, "errors": []}',
+                    ],
+                },
+                requiredScopes=["api", "refresh_token"],
+            ),
+            types.Tool(
+                name="update_records",
+                description="Updates multiple records of one object with sObject Collections (200 records per request) and returns a result per record",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "object_name": {
+                            "type": "string",
+                            "description": "The API name of the Salesforce object (e.g., 'Account', 'Contact')",
+                        },
+                        "records": {
+                            "type": "array",
+                            "items": {"type": "object", "additionalProperties": True},
+                            "description": f"Records to update, each with its Id and the fields to change (max {MAX_COLLECTION_RECORDS})",
+                        },
+                        "all_or_none": {
+                            "type": "boolean",
+                            "description": "Roll back every record of a 200-record request when one of them fails",
+                            "default": False,
+                        },
+                    },
+                    "required": ["object_name", "records"],
+                },
+                outputSchema={
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array where the first item is a JSON summary and each following item is a JSON string with the result of one record, in input order",
+                    "examples": [
+                        '{"total": 2, "succeeded": 1, "failed": 1}',
+                        '{"id": "<ID>", "success": false, "errors": [{"statusCode": "ENTITY_IS_DELETED", "message": "entity is deleted", "fields": []}]}',
+                    ],
+                },
+                requiredScopes=["api", "refresh_token"],
+            ),
         ]
 
     @server.call_tool()
+    @bulk_tool_calls(BULK_TOOLS)
     async def handle_call_tool(name: str, arguments: dict | None):
         """
         Dispatches a tool call to the corresponding Salesforce API method.
@@ -698,8 +965,9 @@ def create_server(user_id, api_key=None):
         logger.info(f"User {user_id} calling tool: {name} with args: {arguments}")
 
         token = await get_salesforce_token(server.user_id, server.api_key)
-        salesforce_client = Salesforce(
-            instance_url=token["instance_url"], session_id=token["access_token"]
+        # The session is reused across calls until the token is refreshed
+        salesforce_client = get_salesforce_client(
+            f"{server.user_id}:{server.api_key}", token
         )
         if arguments is None:
             arguments = {}
@@ -710,6 +978,7 @@ def create_server(user_id, api_key=None):
                 if not query:
                     raise ValueError("Missing 'query' argument")
 
+                await validate_soql(token, query)
                 results = salesforce_client.query_all(query)
                 records = results.get("records", [])
                 return [
@@ -738,9 +1007,8 @@ def create_server(user_id, api_key=None):
                 if not object_name:
                     raise ValueError("Missing 'object_name' argument")
 
-                # Get object description
-                sf_object = getattr(salesforce_client, object_name)
-                describe_result = sf_object.describe()
+                # Get object description from the org's metadata cache
+                describe_result = (await describe_sobject(token, object_name)).data
 
                 return [
                     types.TextContent(
@@ -754,8 +1022,14 @@ def create_server(user_id, api_key=None):
                 if not object_name or not record_id:
                     raise ValueError("Missing 'object_name' or 'record_id' argument")
 
+                fields = arguments.get("fields")
+                params = None
+                if fields:
+                    await check_fields(token, object_name, fields)
+                    params = {"fields": ",".join(fields)}
+
                 sf_object = getattr(salesforce_client, object_name)
-                results = sf_object.get(record_id)
+                results = sf_object.get(record_id, params=params)
                 return [
                     types.TextContent(
                         type="text",
@@ -768,6 +1042,7 @@ def create_server(user_id, api_key=None):
                 if not object_name or not data:
                     raise ValueError("Missing 'object_name' or 'data' argument")
 
+                await check_fields(token, object_name, data)
                 sf_object = getattr(salesforce_client, object_name)
                 results = sf_object.create(data)
                 return [
@@ -785,6 +1060,7 @@ def create_server(user_id, api_key=None):
                         "Missing 'object_name', 'record_id', or 'data' argument"
                     )
 
+                await check_fields(token, object_name, data)
                 sf_object = getattr(salesforce_client, object_name)
                 results = sf_object.update(record_id, data)
                 # Status code needs to be wrapped in a JSON object
@@ -973,18 +1249,18 @@ def create_server(user_id, api_key=None):
                         "Missing required arguments for creating child records"
                     )
 
+                await check_fields(
+                    token,
+                    child_object_name,
+                    [parent_field_name] + record_fields(records),
+                )
+
                 # Set the parent ID in each child record
                 for record in records:
                     record[parent_field_name] = parent_id
 
-                # Get the child object from Salesforce
-                sf_object = getattr(salesforce_client, child_object_name)
-
-                # Create the records
-                results = []
-                for record in records:
-                    result = sf_object.create(record)
-                    results.append(result)
+                # Create the records with sObject Collections, 200 per request
+                results = await save_records(token, "POST", child_object_name, records)
 
                 return [
                     types.TextContent(
@@ -1183,9 +1459,15 @@ def create_server(user_id, api_key=None):
                     )
 
                 # Build the query - Salesforce doesn't support "SELECT *"
+                index = await check_fields(
+                    token, child_object_name, [parent_field_name] + (fields or [])
+                )
                 if not fields:
-                    # Default to some standard fields instead of *
+                    # Default to some standard fields instead of *, skipping
+                    # those the object does not have (e.g. Name)
                     fields = ["Id", "Name", "CreatedDate"]
+                    if index:
+                        fields = [f for f in fields if index.canonical_name(f)]
 
                 fields_str = ",".join(fields)
                 query = f"SELECT {fields_str} FROM {child_object_name} WHERE {parent_field_name} = '{parent_id}'"
@@ -1270,6 +1552,121 @@ def create_server(user_id, api_key=None):
                     ]
                 )
 
+            elif name == "bulk_query":
+                query = arguments.get("query")
+                if not query:
+                    raise ValueError("Missing 'query' argument")
+
+                await validate_soql(token, query)
+                job = await create_query_job(
+                    token, query, arguments.get("include_deleted", False)
+                )
+                job = await wait_for_job(
+                    token, "query", job["id"], arguments.get("wait_seconds", 60)
+                )
+                return await bulk_query_results(token, job, None, arguments)
+
+            elif name == "get_bulk_query_results":
+                job_id = arguments.get("job_id")
+                if not job_id:
+                    raise ValueError("Missing 'job_id' argument")
+
+                job = await wait_for_job(
+                    token, "query", job_id, arguments.get("wait_seconds", 0)
+                )
+                return await bulk_query_results(
+                    token, job, arguments.get("locator"), arguments
+                )
+
+            elif name == "bulk_ingest":
+                object_name = arguments.get("object_name")
+                operation = arguments.get("operation")
+                records = arguments.get("records")
+                external_id_field = arguments.get("external_id_field")
+                if not object_name or not operation or not records:
+                    raise ValueError(
+                        "Missing 'object_name', 'operation', or 'records' argument"
+                    )
+                if operation not in INGEST_OPERATIONS:
+                    raise ValueError(
+                        f"Unsupported operation '{operation}' "
+                        f"(expected one of {', '.join(INGEST_OPERATIONS)})"
+                    )
+                if operation == "upsert" and not external_id_field:
+                    raise ValueError("'external_id_field' is required for upsert")
+                if len(records) > MAX_INGEST_RECORDS:
+                    raise ValueError(
+                        f"At most {MAX_INGEST_RECORDS} records can be ingested per call"
+                    )
+
+                await check_fields(token, object_name, record_fields(records))
+                job = await create_ingest_job(
+                    token, object_name, operation, records, external_id_field
+                )
+                if arguments.get("wait_seconds"):
+                    job = await wait_for_job(
+                        token, "ingest", job["id"], arguments["wait_seconds"]
+                    )
+                return [types.TextContent(type="text", text=json.dumps(job, indent=2))]
+
+            elif name == "get_bulk_ingest_status":
+                job_id = arguments.get("job_id")
+                if not job_id:
+                    raise ValueError("Missing 'job_id' argument")
+
+                job = await wait_for_job(
+                    token, "ingest", job_id, arguments.get("wait_seconds", 0)
+                )
+                if (
+                    arguments.get("include_failed_records")
+                    and job.get("state") == "JobComplete"
+                    and job.get("numberRecordsFailed")
+                ):
+                    failed, truncated = await get_ingest_results(
+                        token,
+                        job_id,
+                        "failedResults",
+                        arguments.get("max_failed_records", 100),
+                    )
+                    job["failed_records"] = failed
+                    job["failed_records_truncated"] = truncated
+                return [types.TextContent(type="text", text=json.dumps(job, indent=2))]
+
+            elif name in ("create_records", "update_records"):
+                object_name = arguments.get("object_name")
+                records = arguments.get("records")
+                if not object_name or not records:
+                    raise ValueError("Missing 'object_name' or 'records' argument")
+                if len(records) > MAX_COLLECTION_RECORDS:
+                    raise ValueError(
+                        f"At most {MAX_COLLECTION_RECORDS} records can be saved per call"
+                    )
+                if name == "update_records" and not all(
+                    record.get("Id") for record in records
+                ):
+                    raise ValueError("Every record to update needs an 'Id'")
+                await check_fields(token, object_name, record_fields(records))
+
+                results = await save_records(
+                    token,
+                    "POST" if name == "create_records" else "PATCH",
+                    object_name,
+                    records,
+                    arguments.get("all_or_none", False),
+                )
+                succeeded = sum(1 for result in results if result.get("success"))
+                summary = {
+                    "total": len(results),
+                    "succeeded": succeeded,
+                    "failed": len(results) - succeeded,
+                }
+                return [
+                    types.TextContent(type="text", text=json.dumps(summary, indent=2))
+                ] + [
+                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    for result in results
+                ]
+
         except Exception as e:
             logger.error(
                 f"Error calling Salesforce API: {e} on line {e.__traceback__.tb_lineno}"
@@ -1280,9 +1677,39 @@ def create_server(user_id, api_key=None):
                 )
             ]
 
+    async def bulk_query_results(token, job, locator, arguments):
+        """Stream the next rows of a completed query job, or return its status"""
+        summary = {
+            "job_id": job["id"],
+            "state": job.get("state"),
+            "total_rows": job.get("numberRecordsProcessed"),
+        }
+        if job.get("state") != "JobComplete":
+            if job.get("errorMessage"):
+                summary["error"] = job["errorMessage"]
+            return [types.TextContent(type="text", text=json.dumps(summary, indent=2))]
+
+        results, chunks = await stream_query_results(
+            token,
+            job["id"],
+            locator,
+            arguments.get("output_format", "csv"),
+            arguments.get("max_rows"),
+            arguments.get("max_bytes"),
+        )
+        summary.update(results)
+        return [types.TextContent(type="text", text=json.dumps(summary))] + [
+            types.TextContent(type="text", text=chunk) for chunk in chunks
+        ]
+
     return server
 
 
+def record_fields(records):
+    """Field names used by any of the records"""
+    return list(dict.fromkeys(key for record in records for key in record))
+
+
 server = create_server
 
 
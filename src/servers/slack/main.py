@@ -8,11 +8,16 @@ project_root = os.path.abspath(
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, "src"))
 
+import asyncio
+import inspect
 import logging
 import json
+import weakref
 from datetime import datetime
 from pathlib import Path
 
+import aiohttp
+
 from mcp.types import (
     AnyUrl,
     Resource,
@@ -26,9 +31,21 @@ from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
 from src.utils.slack.util import authenticate_and_save_credentials, get_credentials
+from src.utils.slack.directory import (
+    find_channel_id,
+    find_user_id,
+    find_user_id_by_email,
+    lookup_users,
+)
+from src.utils.pagination.util import collect, slack_next_cursor
+from src.utils.http.util import register_shutdown_hook
+from src.utils.rate_limit.util import gather_bounded
 
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_async_handlers import (
+    AsyncRateLimitErrorRetryHandler,
+)
+from slack_sdk.web.async_client import AsyncWebClient
 
 
 SERVICE_NAME = Path(__file__).parent.name
@@ -58,103 +75,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(SERVICE_NAME)
 
+# Connections kept open to the Slack API by the shared session
+SLACK_MAX_CONNECTIONS = 50
+# Per-item requests (presence, users missing from the directory) in flight at once
+SLACK_FAN_OUT_CONCURRENCY = 8
 
-async def create_slack_client(user_id, api_key=None):
-    """Create a new Slack client instance for this request"""
-    token = await get_credentials(user_id, SERVICE_NAME, api_key=api_key)
-    return WebClient(token=token)
-
-
-async def enrich_message_with_user_info(slack_client, message):
-    """Add user info to the message"""
-    user_id = message.get("user", "Unknown")
+# One aiohttp session per event loop, shared by every Slack client
+_slack_sessions = weakref.WeakKeyDictionary()
 
-    if user_id != "Unknown":
-        try:
-            user_info = slack_client.users_info(user=user_id)
-            if user_info["ok"]:
-                user_data = user_info["user"]
-                message["user_name"] = user_data.get("real_name") or user_data.get(
-                    "name", "Unknown"
-                )
-                message["user_profile"] = user_data.get("profile", {})
-        except SlackApiError:
-            message["user_name"] = "Unknown"
 
-    return message
-
-
-async def get_channel_id(slack_client, server, channel_name):
-    """Helper function to get channel ID from channel name with pagination support"""
-    # Create a channel name to ID map if it doesn't exist
-    if not hasattr(server, "channel_name_to_id_map"):
-        server.channel_name_to_id_map = {}
-
-    # Check if we already have this channel in our map
-    if channel_name in server.channel_name_to_id_map:
-        return server.channel_name_to_id_map[channel_name]
-
-    # Look up channel ID with pagination
-    cursor = None
-    while True:
-        pagination_params = {
-            "types": "public_channel,private_channel",
-            "limit": 200,
-        }
-        if cursor:
-            pagination_params["cursor"] = cursor
-
-        response = slack_client.conversations_list(**pagination_params)
-
-        # Update our channel map with all channels in this batch
-        for ch in response["channels"]:
-            server.channel_name_to_id_map[ch["name"]] = ch["id"]
-            if ch["name"] == channel_name:
-                return ch["id"]
-
-        # Check if there are more channels to fetch
-        cursor = response.get("response_metadata", {}).get("next_cursor")
-        if not cursor:
-            break
-
-    return None
+def get_slack_session():
+    """Get the aiohttp session shared by all Slack clients on the running event loop"""
+    loop = asyncio.get_running_loop()
+    session = _slack_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=SLACK_MAX_CONNECTIONS, ttl_dns_cache=300
+            )
+        )
+        _slack_sessions[loop] = session
+    return session
 
 
-async def get_user_id(slack_client, server, user_name):
-    """Helper function to get user ID from username with pagination support"""
-    # Create a user name to ID map if it doesn't exist
-    if not hasattr(server, "user_name_to_id_map"):
-        server.user_name_to_id_map = {}
+async def close_slack_session():
+    """Close the Slack aiohttp session of the running event loop"""
+    session = _slack_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
 
-    # Check if we already have this user in our map
-    if user_name in server.user_name_to_id_map:
-        return server.user_name_to_id_map[user_name]
 
-    # Look up user ID with pagination
-    cursor = None
-    while True:
-        pagination_params = {"limit": 200}
-        if cursor:
-            pagination_params["cursor"] = cursor
+register_shutdown_hook(close_slack_session)
 
-        response = slack_client.users_list(**pagination_params)
 
-        # Update our user map with all users in this batch
-        for user in response["members"]:
-            if user.get("name"):
-                server.user_name_to_id_map[user.get("name")] = user["id"]
-            if user.get("real_name"):
-                server.user_name_to_id_map[user.get("real_name")] = user["id"]
+async def create_slack_client(user_id, api_key=None):
+    """Create a new Slack client instance for this request"""
+    token = await get_credentials(user_id, SERVICE_NAME, api_key=api_key)
+    return AsyncWebClient(
+        token=token,
+        session=get_slack_session(),
+        retry_handlers=[AsyncRateLimitErrorRetryHandler(max_retry_count=2)],
+    )
 
-            if user.get("name") == user_name or user.get("real_name") == user_name:
-                return user["id"]
 
-        # Check if there are more users to fetch
-        cursor = response.get("response_metadata", {}).get("next_cursor")
-        if not cursor:
-            break
+async def resolve_awaitables(value):
+    """
+    Await a tool config result.
 
-    return None
+    Awaitables are awaited, and awaitable values of a dict are awaited
+    concurrently, so independent lookups and API calls run in parallel.
+    """
+    if inspect.isawaitable(value):
+        return await value
+    if isinstance(value, dict):
+        keys = [key for key, item in value.items() if inspect.isawaitable(item)]
+        results = await asyncio.gather(*(value[key] for key in keys))
+        return {**value, **dict(zip(keys, results))}
+    return value
 
 
 def create_server(user_id, api_key=None):
@@ -179,7 +156,7 @@ def create_server(user_id, api_key=None):
             resources = []
 
             # Get list of channels
-            response = slack_client.conversations_list(
+            response = await slack_client.conversations_list(
                 types="public_channel,private_channel", limit=100, cursor=cursor or None
             )
 
@@ -224,19 +201,13 @@ def create_server(user_id, api_key=None):
 
         try:
             if resource_type == "channel":
-                response = slack_client.conversations_history(
+                response = await slack_client.conversations_history(
                     channel=resource_id, limit=50
                 )
 
-                messages = response.get("messages", [])
-                messages.reverse()
-
-                enriched_messages = []
-                for message in messages:
-                    enriched_message = await enrich_message_with_user_info(
-                        slack_client, message
-                    )
-                    enriched_messages.append(enriched_message)
+                enriched_messages = await enrich_messages(
+                    slack_client, response.get("messages", [])
+                )
 
                 return [
                     ReadResourceContents(
@@ -733,7 +704,12 @@ def create_server(user_id, api_key=None):
                         "channel": {
                             "type": "string",
                             "description": "Slack channel ID or name (with # for names)",
-                        }
+                        },
+                        "include_presence": {
+                            "type": "boolean",
+                            "description": "Whether to fetch each user's presence (one extra API call per member)",
+                            "default": True,
+                        },
                     },
                     "required": ["channel"],
                 },
@@ -787,7 +763,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
@@ -795,12 +771,9 @@ def create_server(user_id, api_key=None):
                     "oldest": args.get("start_timestamp"),
                     "latest": args.get("end_timestamp"),
                 },
-                "postprocess": lambda response: [
-                    TextContent(type="text", text=json.dumps(message, indent=2))
-                    for message in enrich_messages_sync(
-                        slack_client, response.get("messages", [])
-                    )
-                ],
+                "postprocess": lambda response: enriched_message_contents(
+                    slack_client, response.get("messages", [])
+                ),
             },
             "send_message": {
                 "handler": lambda args: slack_client.chat_postMessage(
@@ -810,7 +783,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": get_channel_or_user_id(
-                        slack_client, server, args["channel"]
+                        slack_client, args["channel"]
                     ),
                     "text": args["text"],
                     "thread_ts": args.get("thread_ts"),
@@ -842,7 +815,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
@@ -884,19 +857,16 @@ def create_server(user_id, api_key=None):
                 },
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
                     "thread_ts": args["thread_ts"],
                     "limit": args.get("limit", 20),
                 },
-                "postprocess": lambda response: [
-                    TextContent(type="text", text=json.dumps(message, indent=2))
-                    for message in enrich_messages_sync(
-                        slack_client, response["replies"].get("messages", [])
-                    )
-                ],
+                "postprocess": lambda response: enriched_message_contents(
+                    slack_client, response["replies"].get("messages", [])
+                ),
             },
             "list_pinned_items": {
                 "handler": lambda args: slack_client.pins_list(
@@ -904,21 +874,14 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     )
                 },
-                "postprocess": lambda response: [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(
-                            enrich_message_with_user_info_sync(slack_client, item),
-                            indent=2,
-                        ),
-                    )
-                    for item in response.get("items", [])
-                ],
+                "postprocess": lambda response: pinned_item_contents(
+                    slack_client, response.get("items", [])
+                ),
             },
             "add_user_to_channel": {
                 "handler": lambda args: slack_client.conversations_invite(
@@ -926,12 +889,12 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
                     "resolved_user": (
-                        get_user_id_sync(slack_client, server, args["user"])
+                        get_user_id(slack_client, args["user"])
                         if "@" in args["user"] or not args["user"].startswith("U")
                         else args["user"]
                     ),
@@ -945,7 +908,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
@@ -964,7 +927,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
@@ -977,7 +940,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
@@ -990,7 +953,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
@@ -1003,7 +966,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_user": (
-                        get_user_id_sync(slack_client, server, args["user"])
+                        get_user_id(slack_client, args["user"])
                         if "@" in args["user"] or not args["user"].startswith("U")
                         else args["user"]
                     )
@@ -1015,12 +978,12 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args.get("channel", "").startswith("#")
                         else args.get("channel") or args.get("channel_id")
                     ),
                     "resolved_user": (
-                        get_user_id_sync(slack_client, server, args["user"])
+                        get_user_id(slack_client, args["user"])
                         if args.get("user", "").startswith("U") is False
                         else args.get("user") or args.get("user_id")
                     ),
@@ -1049,7 +1012,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
@@ -1062,7 +1025,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     ),
@@ -1075,7 +1038,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     )
@@ -1087,7 +1050,7 @@ def create_server(user_id, api_key=None):
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
                     )
@@ -1095,14 +1058,17 @@ def create_server(user_id, api_key=None):
             },
             "list_users_in_channel": {
                 "handler": lambda args: get_users_in_channel(
-                    slack_client, args["resolved_channel"]
+                    slack_client,
+                    args["resolved_channel"],
+                    args.get("include_presence", True),
                 ),
                 "preprocess": lambda args: {
                     "resolved_channel": (
-                        get_channel_id_sync(slack_client, server, args["channel"])
+                        get_channel_id(slack_client, args["channel"])
                         if args["channel"].startswith("#")
                         else args["channel"]
-                    )
+                    ),
+                    "include_presence": args.get("include_presence", True),
                 },
                 "postprocess": lambda response: (
                     [
@@ -1126,11 +1092,11 @@ def create_server(user_id, api_key=None):
             if name in tool_config:
                 config = tool_config[name]
 
-                args = config["preprocess"](arguments)
-                response = config["handler"](args)
+                args = await resolve_awaitables(config["preprocess"](arguments))
+                response = await resolve_awaitables(config["handler"](args))
 
                 if "postprocess" in config:
-                    return config["postprocess"](response)
+                    return await resolve_awaitables(config["postprocess"](response))
                 return raw_response_processor(response)
             else:
                 error_response = {"error": f"Unknown tool: {name}"}
@@ -1174,93 +1140,43 @@ if __name__ == "__main__":
 
 
 # Helper functions for the refactored approach
-def get_channel_id_sync(slack_client, server, channel):
-    """Synchronous wrapper to get channel ID from channel name"""
+async def get_channel_id(slack_client, channel):
+    """Resolve a channel name (with #) to its ID using the workspace directory"""
     if not channel.startswith("#"):
         return channel
 
-    channel_name = channel[1:]
-
-    if not hasattr(server, "channel_name_to_id_map"):
-        server.channel_name_to_id_map = {}
-
-    if channel_name in server.channel_name_to_id_map:
-        return server.channel_name_to_id_map[channel_name]
-
-    cursor = None
-    while True:
-        pagination_params = {
-            "types": "public_channel,private_channel",
-            "limit": 200,
-        }
-        if cursor:
-            pagination_params["cursor"] = cursor
+    channel_id = await find_channel_id(slack_client, channel[1:])
+    if channel_id is None:
+        raise ValueError(f"Channel {channel} not found")
+    return channel_id
 
-        response = slack_client.conversations_list(**pagination_params)
 
-        for ch in response["channels"]:
-            server.channel_name_to_id_map[ch["name"]] = ch["id"]
-            if ch["name"] == channel_name:
-                return ch["id"]
-
-        cursor = response.get("response_metadata", {}).get("next_cursor")
-        if not cursor:
-            break
-
-    raise ValueError(f"Channel {channel} not found")
-
-
-def get_user_id_sync(slack_client, server, user):
-    """Synchronous wrapper to get user ID from username or email"""
+async def get_user_id(slack_client, user):
+    """Resolve a username, real name or email to a user ID using the workspace directory"""
     if "@" in user:
-        response = slack_client.users_lookupByEmail(email=user)
-        if response["ok"]:
-            return response["user"]["id"]
-        else:
+        user_id = await find_user_id_by_email(slack_client, user)
+        if user_id is None:
             raise ValueError(f"User with email {user} not found")
+        return user_id
 
     if user.startswith("U"):
         return user
 
-    if not hasattr(server, "user_name_to_id_map"):
-        server.user_name_to_id_map = {}
-
-    if user in server.user_name_to_id_map:
-        return server.user_name_to_id_map[user]
+    user_id = await find_user_id(slack_client, user)
+    if user_id is None:
+        raise ValueError(f"User {user} not found")
+    return user_id
 
-    cursor = None
-    while True:
-        pagination_params = {"limit": 200}
-        if cursor:
-            pagination_params["cursor"] = cursor
-
-        response = slack_client.users_list(**pagination_params)
-
-        for u in response["members"]:
-            if u.get("name"):
-                server.user_name_to_id_map[u.get("name")] = u["id"]
-            if u.get("real_name"):
-                server.user_name_to_id_map[u.get("real_name")] = u["id"]
-
-            if u.get("name") == user or u.get("real_name") == user:
-                return u["id"]
-
-        cursor = response.get("response_metadata", {}).get("next_cursor")
-        if not cursor:
-            break
 
-    raise ValueError(f"User {user} not found")
-
-
-def get_channel_or_user_id(slack_client, server, channel_or_user):
+async def get_channel_or_user_id(slack_client, channel_or_user):
     """Resolve channel or user references to IDs"""
     if channel_or_user.startswith("#"):
-        return get_channel_id_sync(slack_client, server, channel_or_user)
+        return await get_channel_id(slack_client, channel_or_user)
     elif channel_or_user.startswith("@"):
         user_name = channel_or_user[1:]
-        user_id = get_user_id_sync(slack_client, server, user_name)
+        user_id = await get_user_id(slack_client, user_name)
 
-        dm_response = slack_client.conversations_open(users=user_id)
+        dm_response = await slack_client.conversations_open(users=user_id)
         return dm_response["channel"]["id"]
     else:
         return channel_or_user
@@ -1303,74 +1219,89 @@ def format_emoji(emoji):
     return emoji
 
 
-def enrich_message_with_user_info_sync(slack_client, message):
-    """Synchronous version of enrich_message_with_user_info"""
-    user_id = message.get("user", "Unknown")
+def add_user_info(message, user_data):
+    """Add user info to the message"""
+    if message.get("user", "Unknown") == "Unknown":
+        return message
 
-    if user_id != "Unknown":
-        try:
-            user_info = slack_client.users_info(user=user_id)
-            if user_info["ok"]:
-                user_data = user_info["user"]
-                message["user_name"] = user_data.get("real_name") or user_data.get(
-                    "name", "Unknown"
-                )
-                message["user_profile"] = user_data.get("profile", {})
-        except SlackApiError:
-            message["user_name"] = "Unknown"
+    if user_data:
+        message["user_name"] = user_data.get("real_name") or user_data.get(
+            "name", "Unknown"
+        )
+        message["user_profile"] = user_data.get("profile", {})
+    else:
+        message["user_name"] = "Unknown"
 
     return message
 
 
-def enrich_pinned_items(slack_client, items):
+async def enrich_pinned_items(slack_client, items):
     """Enrich pinned items with user info"""
-    for item in items:
-        if item.get("type") == "message":
-            message = item.get("message", {})
-            item["message"] = enrich_message_with_user_info_sync(slack_client, message)
+    messages = [
+        item.get("message", {}) for item in items if item.get("type") == "message"
+    ]
+    users = await lookup_users(
+        slack_client, [message["user"] for message in messages if "user" in message]
+    )
+    for message in messages:
+        add_user_info(message, users.get(message.get("user")))
     return items
 
 
-def enrich_messages_sync(slack_client, messages):
+async def enrich_messages(slack_client, messages):
     """Enrich and reverse a list of messages"""
     # Reverse to get chronological order
     messages_copy = messages.copy()
     messages_copy.reverse()
 
-    # Enrich messages with user information
-    enriched_messages = []
-    for message in messages_copy:
-        enriched_message = enrich_message_with_user_info_sync(slack_client, message)
-        enriched_messages.append(enriched_message)
+    # Users come from the workspace directory, missing ones are fetched concurrently
+    users = await lookup_users(
+        slack_client,
+        [message["user"] for message in messages_copy if "user" in message],
+    )
+
+    return [
+        add_user_info(message, users.get(message.get("user")))
+        for message in messages_copy
+    ]
+
 
-    return enriched_messages
+async def enriched_message_contents(slack_client, messages):
+    """Enrich messages and format each as a TextContent"""
+    return [
+        TextContent(type="text", text=json.dumps(message, indent=2))
+        for message in await enrich_messages(slack_client, messages)
+    ]
 
 
-def get_users_in_channel(slack_client, channel_id):
+async def pinned_item_contents(slack_client, items):
+    """Enrich pinned items and format each as a TextContent"""
+    return [
+        TextContent(type="text", text=json.dumps(item, indent=2))
+        for item in await enrich_pinned_items(slack_client, items)
+    ]
+
+
+async def get_users_in_channel(slack_client, channel_id, include_presence=True):
     """Get list of users in a channel with pagination support"""
-    users = []
-    cursor = None
 
-    while True:
-        if cursor:
-            response = slack_client.conversations_members(
-                channel=channel_id, cursor=cursor
-            )
-        else:
-            response = slack_client.conversations_members(channel=channel_id)
+    async def fetch_members_page(cursor):
+        response = await slack_client.conversations_members(
+            channel=channel_id, cursor=cursor
+        )
+        if not response["ok"]:
+            return [], None
+        return response["members"], slack_next_cursor(response)
 
-        if response["ok"]:
-            users.extend(response["members"])
+    user_ids = await collect(fetch_members_page)
 
-        cursor = response.get("response_metadata", {}).get("next_cursor")
-        if not cursor:
-            break
+    # Member details come from the workspace directory instead of users.info per member
+    users = await lookup_users(slack_client, user_ids)
 
     detailed_users = []
-    for user_id in users:
-        user_info = slack_client.users_info(user=user_id)
-        if user_info["ok"]:
-            user_data = user_info["user"]
+    for user_id in user_ids:
+        user_data = users.get(user_id)
+        if user_data:
             # Extract relevant user details
             detailed_user = {
                 "id": user_data.get("id"),
@@ -1384,14 +1315,24 @@ def get_users_in_channel(slack_client, channel_id):
                 "updated": user_data.get("updated"),
                 "presence": None,  # Will be populated if requested
             }
+            detailed_users.append(detailed_user)
 
-            # Optionally get presence info
+    # Presence is not part of users.list and costs one call per member
+    if include_presence:
+
+        async def get_presence(detailed_user):
             try:
-                presence_info = slack_client.users_getPresence(user=user_id)
+                presence_info = await slack_client.users_getPresence(
+                    user=detailed_user["id"]
+                )
                 if presence_info["ok"]:
                     detailed_user["presence"] = presence_info.get("presence")
-            except:
+            except SlackApiError:
                 pass  # Ignore presence errors
 
-            detailed_users.append(detailed_user)
+        await gather_bounded(
+            (get_presence(detailed_user) for detailed_user in detailed_users),
+            SLACK_FAN_OUT_CONCURRENCY,
+        )
+
     return detailed_users
@@ -1,9 +1,10 @@
+import asyncio
 import os
 import sys
 from pathlib import Path
 import json
 import logging
-import snowflake.connector
+from snowflake.connector.errors import ProgrammingError
 
 from mcp.types import TextContent, Tool
 from mcp.server import NotificationOptions, Server
@@ -20,6 +21,13 @@ from src.utils.snowflake.util import (
     get_snowflake_credentials,
     authenticate_and_save_snowflake_credentials,
 )
+from src.utils.snowflake.pool import (
+    discard_on_release,
+    leaves_session_reusable,
+    pooled_connection,
+    run_in_thread,
+)
+from src.utils.snowflake.results import format_results, stream_results
 
 SERVICE_NAME = Path(__file__).parent.name
 
@@ -29,6 +37,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(SERVICE_NAME)
 
+# Seconds between status checks while get_query_status waits, and the longest it waits
+QUERY_POLL_INTERVAL = 2
+MAX_QUERY_WAIT_SECONDS = 60
+
 
 def create_server(user_id, api_key=None):
     server = Server("snowflake-server")
@@ -114,16 +126,111 @@ def create_server(user_id, api_key=None):
             ),
             Tool(
                 name="execute_query",
-                description="Execute a SQL query",
+                description="Execute a SQL query. Results are returned as CSV or JSON lines, capped by max_rows and max_bytes; pass the query_id and next_offset of a capped result to continue reading it without re-running the query.",
                 inputSchema={
                     "type": "object",
                     "properties": {
                         "database_name": {"type": "string"},
+                        "warehouse_name": {"type": "string"},
+                        "query": {
+                            "type": "string",
+                            "description": "SQL to run (required unless query_id is given)",
+                        },
+                        "query_id": {
+                            "type": "string",
+                            "description": "ID of a previous query whose result to continue reading",
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Row of the result to start from (next_offset of the previous call)",
+                            "default": 0,
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["csv", "ndjson"],
+                            "description": "CSV or JSON lines",
+                            "default": "csv",
+                        },
+                        "max_rows": {
+                            "type": "integer",
+                            "description": "Maximum rows to return (max 100000)",
+                            "default": 1000,
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Approximate maximum size of the returned rows in bytes (max 16 MB)",
+                            "default": 1048576,
+                        },
+                    },
+                    "required": ["database_name"],
+                },
+            ),
+            Tool(
+                name="submit_query",
+                description="Submit a SQL query to run asynchronously and return its query ID without waiting for it to finish",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "database_name": {"type": "string"},
+                        "warehouse_name": {"type": "string"},
                         "query": {"type": "string"},
                     },
                     "required": ["database_name", "query"],
                 },
             ),
+            Tool(
+                name="get_query_status",
+                description="Get the status of a submitted query, optionally waiting for it to finish",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query_id": {"type": "string"},
+                        "wait_seconds": {
+                            "type": "integer",
+                            "description": "Seconds to wait for the query to finish (max 60)",
+                            "default": 0,
+                        },
+                    },
+                    "required": ["query_id"],
+                },
+            ),
+            Tool(
+                name="get_query_results",
+                description="Get a page of the results of a finished query as CSV or JSON lines. Pass next_offset from the previous page to continue.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query_id": {"type": "string"},
+                        "offset": {"type": "integer", "default": 0},
+                        "output_format": {
+                            "type": "string",
+                            "enum": ["csv", "ndjson"],
+                            "description": "CSV or JSON lines",
+                            "default": "csv",
+                        },
+                        "max_rows": {
+                            "type": "integer",
+                            "description": "Maximum rows to return (max 100000)",
+                            "default": 1000,
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Approximate maximum size of the returned rows in bytes (max 16 MB)",
+                            "default": 1048576,
+                        },
+                    },
+                    "required": ["query_id"],
+                },
+            ),
+            Tool(
+                name="cancel_query",
+                description="Cancel a running query",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"query_id": {"type": "string"}},
+                    "required": ["query_id"],
+                },
+            ),
         ]
 
     @server.call_tool()
@@ -131,22 +238,68 @@ def create_server(user_id, api_key=None):
         logger.info(f"Tool call: {name} with args: {arguments}")
         credentials = get_snowflake_credentials(server.user_id, server.api_key)
 
-        conn = snowflake.connector.connect(
-            user=credentials["username"],
-            password=credentials["password"],
-            account=credentials["account"],
-            client_session_keep_alive=True,
+        if arguments is None:
+            arguments = {}
+
+        try:
+            if name == "get_query_status" and arguments.get("wait_seconds"):
+                return await wait_for_query(credentials, arguments)
+
+            # Connections come from the user's pool and the blocking connector
+            # calls run in its thread pool, off the event loop
+            return await run_in_thread(run_tool, credentials, name, arguments)
+
+        except Exception as e:
+            logger.error(
+                f"Error executing tool {name}: {str(e)} {e.__traceback__.tb_lineno}"
+            )
+            return [TextContent(type="text", text=str(e))]
+
+    return server
+
+
+async def wait_for_query(credentials, arguments):
+    """Poll a query's status until it finishes or wait_seconds pass, off the event loop"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + min(arguments["wait_seconds"], MAX_QUERY_WAIT_SECONDS)
+    while True:
+        status = await run_in_thread(
+            get_query_status, credentials, arguments["query_id"]
         )
-        cursor = conn.cursor()
+        if not status["running"] or loop.time() >= deadline:
+            return [TextContent(type="text", text=json.dumps(status))]
+        await asyncio.sleep(QUERY_POLL_INTERVAL)
+
 
+def query_status(conn, query_id):
+    """Status of a query with its error message when it failed"""
+    status = conn.get_query_status(query_id)
+    result = {
+        "query_id": query_id,
+        "status": status.name,
+        "running": conn.is_still_running(status),
+    }
+    if conn.is_an_error(status):
         try:
-            if arguments is None:
-                arguments = {}
+            conn.get_query_status_throw_if_error(query_id)
+        except ProgrammingError as e:
+            result["error"] = e.msg
+    return result
 
-            db = arguments.get("database_name")
-            if db:
-                cursor.execute(f"USE DATABASE {db}")
 
+def get_query_status(credentials, query_id):
+    """Get the status of a query on a pooled connection of the user (blocking)"""
+    with pooled_connection(credentials) as conn:
+        return query_status(conn, query_id)
+
+
+def run_tool(credentials, name, arguments):
+    """Run a tool on a pooled connection of the user (blocking)"""
+    # Pooled connections are already using the warehouse and database
+    with pooled_connection(
+        credentials, arguments.get("warehouse_name"), arguments.get("database_name")
+    ) as conn:
+        with conn.cursor() as cursor:
             if name == "create_database":
                 cursor.execute(f"CREATE DATABASE {arguments['db_name']}")
                 return [TextContent(type="text", text="Database created successfully")]
@@ -186,23 +339,73 @@ def create_server(user_id, api_key=None):
                 return [TextContent(type="text", text="Warehouse created successfully")]
 
             elif name == "execute_query":
-                cursor.execute(arguments["query"])
-                return [TextContent(type="text", text=str(cursor.fetchall()))]
+                if arguments.get("query_id"):
+                    # Continue a previous result instead of running the query again
+                    cursor.get_results_from_sfqid(arguments["query_id"])
+                elif arguments.get("query"):
+                    # Session state the pool cannot restore must not reach other calls
+                    if not leaves_session_reusable(arguments["query"]):
+                        discard_on_release(conn)
+                    cursor.execute(arguments["query"])
+                else:
+                    raise ValueError("Either query or query_id is required")
 
-            else:
-                raise ValueError(f"Unknown tool: {name}")
+                summary, chunks = stream_results(
+                    cursor,
+                    output_format=arguments.get("output_format", "csv"),
+                    max_rows=arguments.get("max_rows"),
+                    max_bytes=arguments.get("max_bytes"),
+                    offset=arguments.get("offset", 0),
+                )
+                return [
+                    TextContent(type="text", text=text)
+                    for text in format_results(summary, chunks)
+                ]
 
-        except Exception as e:
-            logger.error(
-                f"Error executing tool {name}: {str(e)} {e.__traceback__.tb_lineno}"
-            )
-            return [TextContent(type="text", text=str(e))]
+            elif name == "submit_query":
+                # The query keeps running in Snowflake after the connection is released
+                if not leaves_session_reusable(
+                    arguments["query"], context_tracked=False
+                ):
+                    discard_on_release(conn)
+                cursor.execute_async(arguments["query"])
+                return [
+                    TextContent(
+                        type="text", text=json.dumps(query_status(conn, cursor.sfqid))
+                    )
+                ]
 
-        finally:
-            cursor.close()
-            conn.close()
+            elif name == "get_query_status":
+                status = query_status(conn, arguments["query_id"])
+                return [TextContent(type="text", text=json.dumps(status))]
 
-    return server
+            elif name == "get_query_results":
+                # Fetching the results of a running query would block until it finishes
+                status = query_status(conn, arguments["query_id"])
+                if status["running"] or "error" in status:
+                    return [TextContent(type="text", text=json.dumps(status))]
+
+                cursor.get_results_from_sfqid(arguments["query_id"])
+                summary, chunks = stream_results(
+                    cursor,
+                    output_format=arguments.get("output_format", "csv"),
+                    max_rows=arguments.get("max_rows"),
+                    max_bytes=arguments.get("max_bytes"),
+                    offset=arguments.get("offset", 0),
+                )
+                return [
+                    TextContent(type="text", text=text)
+                    for text in format_results(summary, chunks)
+                ]
+
+            elif name == "cancel_query":
+                cursor.execute(
+                    "SELECT SYSTEM$CANCEL_QUERY(%s)", (arguments["query_id"],)
+                )
+                return [TextContent(type="text", text=str(cursor.fetchone()[0]))]
+
+            else:
+                raise ValueError(f"Unknown tool: {name}")
 
 
 server = create_server
@@ -3,6 +3,7 @@ import logging
 import json
 import os
 import requests
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Any, Iterable
 
@@ -20,6 +21,7 @@ from src.utils.microsoft.util import (
     get_credentials,
     authenticate_and_save_credentials,
 )
+from src.utils.pagination.util import collect, graph_next_link
 from mcp.types import (
     AnyUrl,
     Resource,
@@ -60,6 +62,11 @@ GRAPH_TEAMS_URL = GRAPH_BASE_URL + "teams/"
 GRAPH_GROUPS_URL = GRAPH_BASE_URL + "groups/"
 GRAPH_CHATS_URL = GRAPH_BASE_URL + "chats/"
 
+# Message versions remembered per cursor to de-duplicate polled messages
+MESSAGE_CURSOR_SEEN_LIMIT = 1000
+# Members returned by get_team_members when top is not given
+DEFAULT_TEAM_MEMBERS = 50
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
@@ -100,6 +107,230 @@ async def create_teams_client(access_token: str) -> Any:
     }
 
 
+def graph_page_fetcher(teams_client: dict, url: str, params: Optional[dict] = None):
+    """
+    Build a page fetcher that follows Graph @odata.nextLink pages.
+
+    Args:
+        teams_client: Client returned by create_teams_client
+        url: URL of the first page
+        params: Query parameters of the first page
+
+    Returns:
+        Callable: Page fetcher for the pagination utilities
+    """
+
+    def fetch_page(next_link):
+        # nextLink already carries every query parameter
+        response = requests.get(
+            next_link or url,
+            headers=teams_client["headers"],
+            params=None if next_link else params,
+            timeout=30,
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"{response.status_code} - {response.text}")
+
+        result = response.json()
+        return result.get("value", []), graph_next_link(result)
+
+    return fetch_page
+
+
+def get_message_cursor(server: Server, cursor_key: str) -> dict:
+    """
+    Get (or create) the message cursor for a channel or chat.
+
+    Cursors live on the server instance, so each session keeps its own read
+    position and it survives reconnections of that session.
+
+    Args:
+        server: The MCP server instance for the current session
+        cursor_key: Unique key for the channel or chat being polled
+
+    Returns:
+        dict: The cursor holding the delta link, the last modified watermark
+            and the message versions already returned
+    """
+    if not hasattr(server, "message_cursors"):
+        server.message_cursors = {}
+
+    if cursor_key not in server.message_cursors:
+        server.message_cursors[cursor_key] = {
+            "delta_link": None,
+            "last_modified": None,
+            "seen": OrderedDict(),
+        }
+
+    return server.message_cursors[cursor_key]
+
+
+def dedupe_messages(cursor: dict, messages: list) -> list:
+    """
+    Drop message versions that were already returned for this cursor.
+
+    A message is identified by its ID and lastModifiedDateTime, so edits and
+    deletions of an already seen message are still reported.
+
+    Args:
+        cursor: The cursor returned by get_message_cursor
+        messages: Messages returned by Graph
+
+    Returns:
+        list: Only the messages that are new to this cursor
+    """
+    seen = cursor["seen"]
+    new_messages = []
+
+    for message in messages:
+        message_id = message.get("id")
+        version = message.get("lastModifiedDateTime") or message.get("createdDateTime")
+        if not message_id or seen.get(message_id) == version:
+            continue
+
+        seen[message_id] = version
+        seen.move_to_end(message_id)
+        new_messages.append(message)
+
+    while len(seen) > MESSAGE_CURSOR_SEEN_LIMIT:
+        seen.popitem(last=False)
+
+    return new_messages
+
+
+def fetch_channel_messages_delta(
+    teams_client: dict,
+    cursor: dict,
+    team_id: str,
+    channel_id: str,
+    since: Optional[str] = None,
+    top: Optional[int] = None,
+) -> list:
+    """
+    Fetch channel messages created or changed since the cursor's last poll.
+
+    Uses the Graph channel messages delta endpoint. Pages are followed through
+    @odata.nextLink until Graph returns an @odata.deltaLink, which is stored on
+    the cursor so the next poll only returns changes made after this one.
+
+    Args:
+        teams_client: Client returned by create_teams_client
+        cursor: The cursor returned by get_message_cursor
+        team_id: The ID of the team
+        channel_id: The ID of the channel
+        since: Optional ISO 8601 timestamp limiting the initial sync
+        top: Optional page size for the initial sync
+
+    Returns:
+        list: Messages changed since the previous poll
+    """
+    if cursor["delta_link"]:
+        url = cursor["delta_link"]
+        params = None
+    else:
+        url = f"{GRAPH_TEAMS_URL}{team_id}/channels/{channel_id}/messages/delta"
+        params = {}
+        if since:
+            params["$filter"] = f"lastModifiedDateTime gt {since}"
+        if top:
+            params["$top"] = top
+
+    messages = []
+    while url:
+        response = requests.get(
+            url, headers=teams_client["headers"], params=params, timeout=30
+        )
+
+        # Expired delta tokens have to be resynced from scratch
+        if response.status_code == 410 and cursor["delta_link"]:
+            logger.info(f"Delta link expired for channel {channel_id}, resyncing")
+            cursor["delta_link"] = None
+            return fetch_channel_messages_delta(
+                teams_client, cursor, team_id, channel_id, since, top
+            )
+
+        if response.status_code != 200:
+            raise ValueError(
+                f"Error retrieving channel message changes: {response.status_code} - {response.text}"
+            )
+
+        result = response.json()
+        messages.extend(result.get("value", []))
+
+        if "@odata.deltaLink" in result:
+            cursor["delta_link"] = result["@odata.deltaLink"]
+
+        # nextLink and deltaLink already carry every query parameter
+        url = result.get("@odata.nextLink")
+        params = None
+
+    return messages
+
+
+def fetch_chat_messages_since(
+    teams_client: dict,
+    cursor: dict,
+    chat_id: str,
+    since: Optional[str] = None,
+    top: Optional[int] = None,
+) -> list:
+    """
+    Fetch chat messages created or changed since the cursor's last poll.
+
+    Chats have no delegated delta endpoint, so the cursor keeps the newest
+    lastModifiedDateTime it has seen and only messages modified after it are
+    requested. Without a watermark only the latest page is read, which sets
+    the starting point for the next poll.
+
+    Args:
+        teams_client: Client returned by create_teams_client
+        cursor: The cursor returned by get_message_cursor
+        chat_id: The ID of the chat
+        since: Optional ISO 8601 timestamp used when the cursor is empty
+        top: Optional page size (Graph allows at most 50)
+
+    Returns:
+        list: Messages changed since the previous poll, oldest first
+    """
+    watermark = cursor["last_modified"] or since
+
+    url = f"{GRAPH_CHATS_URL}{chat_id}/messages"
+    params = {
+        "$orderby": "lastModifiedDateTime desc",
+        "$top": min(top or 50, 50),
+    }
+    if watermark:
+        params["$filter"] = f"lastModifiedDateTime gt {watermark}"
+
+    messages = []
+    while url:
+        response = requests.get(
+            url, headers=teams_client["headers"], params=params, timeout=30
+        )
+
+        if response.status_code != 200:
+            raise ValueError(
+                f"Error retrieving chat message changes: {response.status_code} - {response.text}"
+            )
+
+        result = response.json()
+        messages.extend(result.get("value", []))
+
+        url = result.get("@odata.nextLink") if watermark else None
+        params = None
+
+    for message in messages:
+        last_modified = message.get("lastModifiedDateTime")
+        if last_modified and (
+            not cursor["last_modified"] or last_modified > cursor["last_modified"]
+        ):
+            cursor["last_modified"] = last_modified
+
+    messages.reverse()
+    return messages
+
+
 def create_server(user_id: str, api_key: Optional[str] = None) -> Server:
     """
     Create a new Microsoft Teams MCP server instance.
@@ -296,6 +527,10 @@ def create_server(user_id: str, api_key: Optional[str] = None) -> Server:
                             "type": "string",
                             "description": "Comma-separated list of properties to include in the response",
                         },
+                        "max_items": {
+                            "type": "integer",
+                            "description": "Maximum number of teams to return. When set, following pages are fetched automatically instead of returning a nextLink",
+                        },
                     },
                 },
             ),
@@ -427,6 +662,62 @@ def create_server(user_id: str, api_key: Optional[str] = None) -> Server:
                     "required": ["team_id", "channel_id"],
                 },
             ),
+            types.Tool(
+                name="get_new_team_channel_messages",
+                description="Get only the channel messages created or changed since the last call for this channel in the current session",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "team_id": {
+                            "type": "string",
+                            "description": "The ID of the team",
+                        },
+                        "channel_id": {
+                            "type": "string",
+                            "description": "The ID of the channel",
+                        },
+                        "since": {
+                            "type": "string",
+                            "description": "ISO 8601 timestamp limiting the first read when no cursor exists yet (e.g., '2025-04-20T10:00:00Z')",
+                        },
+                        "top": {
+                            "type": "integer",
+                            "description": "Page size used for the first read",
+                        },
+                        "reset": {
+                            "type": "boolean",
+                            "description": "Discard the stored cursor and start reading from scratch (default: false)",
+                        },
+                    },
+                    "required": ["team_id", "channel_id"],
+                },
+            ),
+            types.Tool(
+                name="get_new_chat_messages",
+                description="Get only the chat messages created or changed since the last call for this chat in the current session",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "chat_id": {
+                            "type": "string",
+                            "description": "The ID of the chat",
+                        },
+                        "since": {
+                            "type": "string",
+                            "description": "ISO 8601 timestamp limiting the first read when no cursor exists yet (e.g., '2025-04-20T10:00:00Z')",
+                        },
+                        "top": {
+                            "type": "integer",
+                            "description": "Page size, at most 50 (default: 50)",
+                        },
+                        "reset": {
+                            "type": "boolean",
+                            "description": "Discard the stored cursor and start reading from scratch (default: false)",
+                        },
+                    },
+                    "required": ["chat_id"],
+                },
+            ),
             types.Tool(
                 name="send_team_channel_message",
                 description="Send a message to a channel",
@@ -686,6 +977,27 @@ def create_server(user_id: str, api_key: Optional[str] = None) -> Server:
                 if select:
                     params["$select"] = select
 
+                # Follow nextLink pages when the caller asked for a number of teams
+                max_items = arguments.get("max_items")
+                if max_items:
+                    try:
+                        teams = await collect(
+                            graph_page_fetcher(teams_client, url, params),
+                            max_items=max_items,
+                        )
+                    except ValueError as e:
+                        error_message = f"Error retrieving teams: {e}"
+                        logger.error(error_message)
+                        return [types.TextContent(type="text", text=error_message)]
+
+                    formatted_result = {"totalTeams": len(teams), "teams": teams}
+                    return [
+                        types.TextContent(
+                            type="text",
+                            text=f"Successfully retrieved {len(teams)} teams:\n{json.dumps(formatted_result, indent=2)}",
+                        )
+                    ]
+
                 # Make the API request to get teams
                 response = requests.get(
                     url, headers=teams_client["headers"], params=params, timeout=30
@@ -1044,6 +1356,64 @@ def create_server(user_id: str, api_key: Optional[str] = None) -> Server:
                     logger.error(error_message)
                     return [types.TextContent(type="text", text=error_message)]
 
+            elif name in ["get_new_team_channel_messages", "get_new_chat_messages"]:
+                # Extract parameters
+                team_id = arguments.get("team_id")
+                channel_id = arguments.get("channel_id")
+                chat_id = arguments.get("chat_id")
+                since = arguments.get("since")
+                top = arguments.get("top")
+
+                # Validate required parameters
+                if name == "get_new_team_channel_messages":
+                    if not team_id or not channel_id:
+                        return [
+                            types.TextContent(
+                                type="text",
+                                text="Error: team_id and channel_id are required",
+                            )
+                        ]
+                    cursor_key = f"channel:{team_id}:{channel_id}"
+                elif not chat_id:
+                    return [
+                        types.TextContent(
+                            type="text", text="Error: chat_id is required"
+                        )
+                    ]
+                else:
+                    cursor_key = f"chat:{chat_id}"
+
+                if arguments.get("reset") and hasattr(server, "message_cursors"):
+                    server.message_cursors.pop(cursor_key, None)
+
+                cursor = get_message_cursor(server, cursor_key)
+                is_first_read = not (cursor["delta_link"] or cursor["last_modified"])
+
+                if name == "get_new_team_channel_messages":
+                    messages = fetch_channel_messages_delta(
+                        teams_client, cursor, team_id, channel_id, since, top
+                    )
+                else:
+                    messages = fetch_chat_messages_since(
+                        teams_client, cursor, chat_id, since, top
+                    )
+
+                new_messages = dedupe_messages(cursor, messages)
+                message_count = len(new_messages)
+
+                formatted_result = {
+                    "newMessages": message_count,
+                    "firstRead": is_first_read,
+                    "messages": new_messages,
+                }
+
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Successfully retrieved {message_count} new messages:\n{json.dumps(formatted_result, indent=2)}",
+                    )
+                ]
+
             elif name == "send_team_channel_message":
                 # Extract parameters
                 team_id = arguments.get("team_id")
@@ -1163,7 +1533,7 @@ def create_server(user_id: str, api_key: Optional[str] = None) -> Server:
             elif name == "get_team_members":
                 # Extract parameters
                 team_id = arguments.get("team_id")
-                top = arguments.get("top", 50)
+                top = arguments.get("top") or DEFAULT_TEAM_MEMBERS
 
                 # Validate required parameters
                 if not team_id:
@@ -1179,37 +1549,34 @@ def create_server(user_id: str, api_key: Optional[str] = None) -> Server:
                 # Prepare query parameters
                 params = {}
 
-                if top:
-                    params["$top"] = top
+                params["$top"] = top
 
-                # Make the API request to get team members
-                response = requests.get(
-                    url, headers=teams_client["headers"], params=params, timeout=30
-                )
+                # Follow nextLink pages until top members are collected
+                try:
+                    members = await collect(
+                        graph_page_fetcher(teams_client, url, params),
+                        max_items=top,
+                    )
+                except ValueError as e:
+                    error_message = f"Error retrieving team members: {e}"
+                    logger.error(error_message)
+                    return [types.TextContent(type="text", text=error_message)]
 
-                # Check if the request was successful
-                if response.status_code == 200:
-                    result = response.json()
-                    members = result.get("value", [])
-                    member_count = len(members)
+                member_count = len(members)
 
-                    # Format the response for readability
-                    formatted_result = {
-                        "totalMembers": member_count,
-                        "teamId": team_id,
-                        "members": members,
-                    }
+                # Format the response for readability
+                formatted_result = {
+                    "totalMembers": member_count,
+                    "teamId": team_id,
+                    "members": members,
+                }
 
-                    return [
-                        types.TextContent(
-                            type="text",
-                            text=f"Successfully retrieved {member_count} members from team:\n{json.dumps(formatted_result, indent=2)}",
-                        )
-                    ]
-                else:
-                    error_message = f"Error retrieving team members: {response.status_code} - {response.text}"
-                    logger.error(error_message)
-                    return [types.TextContent(type="text", text=error_message)]
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Successfully retrieved {member_count} members from team:\n{json.dumps(formatted_result, indent=2)}",
+                    )
+                ]
 
             elif name == "add_team_member":
                 # Extract parameters
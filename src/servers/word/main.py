@@ -3,6 +3,7 @@ import sys
 import logging
 import json
 import io
+import zipfile
 from pathlib import Path
 from typing import Optional, Iterable
 
@@ -28,9 +29,18 @@ from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
 from src.utils.microsoft.util import authenticate_and_save_credentials, get_credentials
+from src.utils.microsoft.docx_stream import (
+    COPY_CHUNK_SIZE,
+    append_paragraph_to_docx,
+    extract_docx_text,
+    new_spooled_file,
+)
 
 SERVICE_NAME = Path(__file__).parent.name
 MICROSOFT_GRAPH_API_URL = "https://graph.microsoft.com/v1.0"
+DOCX_MIME_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
 SCOPES = [
     "Files.ReadWrite",
     "Sites.ReadWrite.All",
@@ -128,6 +138,72 @@ async def make_graph_api_request(
         raise ValueError(f"Error communicating with Microsoft Graph API: {str(e)}")
 
 
+async def download_document_content(file_id, access_token):
+    """Stream the content of a drive item into a spooled temporary file"""
+    url = f"{MICROSOFT_GRAPH_API_URL}/me/drive/items/{file_id}/content"
+    headers = {"Authorization": f"Bearer {access_token}"}
+    document_file = new_spooled_file()
+
+    try:
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            async with client.stream(
+                "GET", url, headers=headers, timeout=60.0
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(COPY_CHUNK_SIZE):
+                    document_file.write(chunk)
+
+    except httpx.HTTPStatusError as e:
+        document_file.close()
+        raise ValueError(f"Microsoft Graph API error: {e.response.status_code}")
+
+    except httpx.RequestError as e:
+        document_file.close()
+        raise ValueError(f"Failed to connect to Microsoft Graph API: {str(e)}")
+
+    document_file.seek(0)
+    return document_file
+
+
+async def upload_document_content(endpoint, document_file, access_token, params=None):
+    """Stream a .docx file to a drive item content endpoint"""
+    url = f"{MICROSOFT_GRAPH_API_URL}/{endpoint}"
+    size = document_file.seek(0, os.SEEK_END)
+    document_file.seek(0)
+
+    async def read_chunks():
+        while chunk := document_file.read(COPY_CHUNK_SIZE):
+            yield chunk
+
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": DOCX_MIME_TYPE,
+        "Content-Length": str(size),
+    }
+
+    try:
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            response = await client.put(
+                url, content=read_chunks(), headers=headers, params=params, timeout=60.0
+            )
+            response.raise_for_status()
+            return response.json()
+
+    except httpx.HTTPStatusError as e:
+        error_message = f"Microsoft Graph API error: {e.response.status_code}"
+        try:
+            error_details = e.response.json().get("error", {})
+            if error_details:
+                error_message = f"{error_details.get('code', 'Error')}: {error_details.get('message', 'Unknown error')}"
+        except Exception:
+            pass
+
+        raise ValueError(error_message)
+
+    except httpx.RequestError as e:
+        raise ValueError(f"Failed to connect to Microsoft Graph API: {str(e)}")
+
+
 async def is_sharepoint_storage(access_token):
     """Detect if we're using SharePoint or OneDrive storage"""
     drive_info = await make_graph_api_request(
@@ -453,16 +529,6 @@ def create_server(user_id, api_key=None):
         else:
             return f"me/drive/root:/{file_name}:/content"
 
-    async def get_document_as_bytes(response):
-        """Convert document stream to bytes"""
-        doc_bytes = io.BytesIO()
-        if hasattr(response, "content"):
-            doc_bytes.write(response.content)
-        elif hasattr(response, "read"):
-            doc_bytes.write(await response.read())
-        doc_bytes.seek(0)
-        return doc_bytes
-
     @server.call_tool()
     async def handle_call_tool(
         name: str, arguments: dict | None
@@ -575,36 +641,20 @@ def create_server(user_id, api_key=None):
                     "get", doc_info_endpoint, access_token=access_token
                 )
 
-                # Get document content
-                content_endpoint = f"me/drive/items/{file_id}/content"
-                response = await make_graph_api_request(
-                    "get", content_endpoint, access_token=access_token, stream=True
-                )
+                # Stream document content to a spooled file
+                document_file = await download_document_content(file_id, access_token)
 
-                # Extract document content using python-docx
-                document_text = ""
+                # Extract text from word/document.xml only, media is never read
                 try:
-                    doc_bytes = await get_document_as_bytes(response)
-
-                    # Parse with python-docx
-                    doc = Document(doc_bytes)
-
-                    # Extract text from paragraphs
-                    paragraphs = []
-                    for para in doc.paragraphs:
-                        if para.text:
-                            paragraphs.append(para.text)
-                    document_text = "\n".join(paragraphs)
+                    document_text = extract_docx_text(document_file)
                 except Exception:
                     # Fallback to raw text if docx parsing fails
-                    if hasattr(response, "text") and callable(
-                        getattr(response, "text")
-                    ):
-                        document_text = await response.text()
-                    elif hasattr(response, "content"):
-                        document_text = response.content.decode(
-                            "utf-8", errors="replace"
-                        )
+                    document_file.seek(0)
+                    document_text = document_file.read().decode(
+                        "utf-8", errors="replace"
+                    )
+                finally:
+                    document_file.close()
 
                 formatted_result = {
                     "file_id": doc_info.get("id"),
@@ -630,52 +680,45 @@ def create_server(user_id, api_key=None):
                     "get", doc_info_endpoint, access_token=access_token
                 )
 
-                # Get current document content
+                # Stream current document content to a spooled file
                 content_endpoint = f"me/drive/items/{file_id}/content"
-                response = await make_graph_api_request(
-                    "get", content_endpoint, access_token=access_token, stream=True
-                )
-
-                doc_bytes = await get_document_as_bytes(response)
+                document_file = await download_document_content(file_id, access_token)
+                updated_file = new_spooled_file()
 
                 try:
-                    # Try to load as a Word document
-                    doc = Document(doc_bytes)
-                    # Add new content
-                    doc.add_paragraph(content)
-                except Exception:
-                    # If loading as a docx fails, create a new document
-                    doc = Document()
-
-                    # Try to get current content as text
-                    current_content = ""
-                    if hasattr(response, "text") and callable(
-                        getattr(response, "text")
-                    ):
-                        current_content = await response.text()
-                    elif hasattr(response, "content"):
-                        current_content = response.content.decode(
+                    if zipfile.is_zipfile(document_file):
+                        # Rewrite word/document.xml, copy all other parts as-is.
+                        # Errors are raised so a valid package is never replaced.
+                        document_file.seek(0)
+                        append_paragraph_to_docx(document_file, content, updated_file)
+                    else:
+                        # The file is not a docx package, create a new document
+                        doc = Document()
+
+                        # Use current content as text
+                        document_file.seek(0)
+                        current_content = document_file.read().decode(
                             "utf-8", errors="replace"
                         )
 
-                    if current_content:
-                        doc.add_paragraph(current_content)
-                    doc.add_paragraph(content)
+                        if current_content:
+                            doc.add_paragraph(current_content)
+                        doc.add_paragraph(content)
 
-                # Save updated document
-                updated_bytes = io.BytesIO()
-                doc.save(updated_bytes)
-                updated_bytes.seek(0)
+                        updated_file.seek(0)
+                        updated_file.truncate()
+                        doc.save(updated_file)
 
-                # Update the document
-                result = await make_graph_api_request(
-                    "put",
-                    content_endpoint,
-                    data=updated_bytes.getvalue(),
-                    content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    access_token=access_token,
-                    params={"@microsoft.graph.conflictBehavior": "replace"},
-                )
+                    # Update the document
+                    result = await upload_document_content(
+                        content_endpoint,
+                        updated_file,
+                        access_token,
+                        params={"@microsoft.graph.conflictBehavior": "replace"},
+                    )
+                finally:
+                    document_file.close()
+                    updated_file.close()
 
                 formatted_result = {
                     "file_id": result.get("id", file_id),
@@ -0,0 +1,343 @@
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from mcp.types import EmbeddedResource, ImageContent, TextContent
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of responses kept in memory by the shared cache
+TOOL_CACHE_MAX_ENTRIES = int(os.environ.get("GUMCP_TOOL_CACHE_MAX_ENTRIES", "2048"))
+# Directory of the optional on-disk tier (disabled when unset)
+TOOL_CACHE_DIR = os.environ.get("GUMCP_TOOL_CACHE_DIR")
+
+CONTENT_TYPES = {
+    "text": TextContent,
+    "image": ImageContent,
+    "resource": EmbeddedResource,
+}
+
+tool_cache_requests_total = Counter(
+    "gumcp_tool_cache_requests_total",
+    "Tool response cache lookups by result",
+    ["server", "result"],
+)
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def normalize_arguments(arguments: Optional[Dict[str, Any]]) -> str:
+    """
+    Serialize tool arguments so equivalent calls produce the same key.
+
+    Keys are sorted and arguments set to None are dropped, since handlers
+    treat them the same as missing arguments.
+    """
+    arguments = {k: v for k, v in (arguments or {}).items() if v is not None}
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def hash_value(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]
+
+
+def serialize_contents(contents: Iterable[Any]) -> List[Dict[str, Any]]:
+    return [content.model_dump(mode="json") for content in contents]
+
+
+def deserialize_contents(data: List[Dict[str, Any]]) -> List[Any]:
+    return [CONTENT_TYPES[item["type"]](**item) for item in data]
+
+
+def is_error_response(contents: Iterable[Any]) -> bool:
+    """
+    Whether a tool response reports an error.
+
+    Tool handlers return errors as text rather than raising, so responses
+    starting with "Error" or holding a top-level "error" key are not cached.
+    """
+    for content in contents:
+        text = getattr(content, "text", None)
+        if text is None:
+            continue
+        if text.lstrip().lower().startswith("error"):
+            return True
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            continue
+        if isinstance(parsed, dict) and parsed.get("error"):
+            return True
+    return False
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls made with the same key into one call.
+
+    The call runs in its own task and every caller awaits it through
+    asyncio.shield, so a caller that is cancelled (e.g. a client abandoning
+    its request) does not cancel the call for the others. The call is only
+    cancelled once no caller is waiting for it anymore.
+    """
+
+    def __init__(self):
+        # key -> (task, number of callers waiting for it)
+        self._calls: Dict[Hashable, List[Any]] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run call for key, or wait for the run already in flight"""
+        entry = self._calls.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(call())
+            entry = self._calls[key] = [task, 0]
+
+            def forget(_: asyncio.Future) -> None:
+                if self._calls.get(key) is entry:
+                    del self._calls[key]
+
+            task.add_done_callback(forget)
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                task.cancel()
+
+
+class ToolResponseCache:
+    """
+    Cache of tool responses shared by every session of the process.
+
+    Responses live in an in-memory LRU and, when a directory is configured,
+    in an on-disk tier that survives restarts. Concurrent identical calls
+    are collapsed into a single upstream call.
+    """
+
+    def __init__(
+        self, max_entries: int = TOOL_CACHE_MAX_ENTRIES, cache_dir: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[Dict[str, Any]]]]" = (
+            OrderedDict()
+        )
+        self._in_flight = SingleFlight()
+
+    def _disk_path(self, key: CacheKey) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        server_name, user_key, tool_name, arguments_key = key
+        return (
+            self.cache_dir
+            / server_name
+            / user_key
+            / tool_name
+            / f"{arguments_key}.json"
+        )
+
+    def get(self, key: CacheKey) -> Optional[List[Dict[str, Any]]]:
+        """Get a fresh cached response, checking memory first and then disk"""
+        now = time.time()
+
+        entry = self._entries.get(key)
+        if entry:
+            expires_at, data = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                return data
+            del self._entries[key]
+
+        path = self._disk_path(key)
+        if path and path.exists():
+            try:
+                with open(path, "r") as f:
+                    stored = json.load(f)
+                if stored["expires_at"] > now:
+                    self._store_in_memory(key, stored["expires_at"], stored["content"])
+                    return stored["content"]
+                path.unlink(missing_ok=True)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable tool cache file {path}: {e}")
+
+        return None
+
+    def _store_in_memory(
+        self, key: CacheKey, expires_at: float, data: List[Dict[str, Any]]
+    ) -> None:
+        self._entries[key] = (expires_at, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set(self, key: CacheKey, data: List[Dict[str, Any]], ttl: float) -> None:
+        """Store a response in memory and, when enabled, on disk"""
+        expires_at = time.time() + ttl
+        self._store_in_memory(key, expires_at, data)
+
+        path = self._disk_path(key)
+        if path:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump({"expires_at": expires_at, "content": data}, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not write tool cache file {path}: {e}")
+
+    def invalidate(
+        self,
+        server_name: str,
+        user_key: Optional[str] = None,
+        tool_names: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Drop cached responses of a server.
+
+        Args:
+            server_name: Server whose responses are dropped
+            user_key: Only drop responses of this user (all users when None)
+            tool_names: Only drop responses of these tools (all tools when None)
+        """
+        tool_names = set(tool_names) if tool_names is not None else None
+
+        def matches(key: CacheKey) -> bool:
+            return (
+                key[0] == server_name
+                and (user_key is None or key[1] == user_key)
+                and (tool_names is None or key[2] in tool_names)
+            )
+
+        for key in [key for key in self._entries if matches(key)]:
+            del self._entries[key]
+
+        if self.cache_dir:
+            # Files are laid out as <server>/<user>/<tool>/<arguments>.json
+            pattern = f"{user_key or '*'}/*/*.json"
+            for path in (self.cache_dir / server_name).glob(pattern):
+                if tool_names is None or path.parent.name in tool_names:
+                    path.unlink(missing_ok=True)
+
+    async def get_or_call(
+        self, key: CacheKey, ttl: float, call: Callable[[], Awaitable[List[Any]]]
+    ) -> List[Any]:
+        """
+        Return the cached response for key or produce it with call.
+
+        Identical calls made while one is in flight wait for its result
+        instead of reaching the upstream API again.
+        """
+        server_name = key[0]
+
+        data = self.get(key)
+        if data is not None:
+            tool_cache_requests_total.labels(server=server_name, result="hit").inc()
+            return deserialize_contents(data)
+
+        if key in self._in_flight:
+            tool_cache_requests_total.labels(server=server_name, result="shared").inc()
+        else:
+            tool_cache_requests_total.labels(server=server_name, result="miss").inc()
+
+        async def call_and_store() -> List[Dict[str, Any]]:
+            result = await call()
+            data = serialize_contents(result)
+            if not is_error_response(result):
+                self.set(key, data, ttl)
+            return data
+
+        return deserialize_contents(await self._in_flight.do(key, call_and_store))
+
+
+# Cache shared by all servers and sessions of the process
+tool_response_cache = ToolResponseCache(cache_dir=TOOL_CACHE_DIR)
+
+
+def get_user_key(server: Any) -> str:
+    """Key of the user a server instance acts for (user ID and API key)"""
+    return hash_value(
+        f"{getattr(server, 'user_id', '')}:{getattr(server, 'api_key', '') or ''}"
+    )
+
+
+def cached_tool_calls(
+    server: Any,
+    server_name: str,
+    ttls: Dict[str, float],
+    invalidations: Optional[Dict[str, Iterable[str]]] = None,
+    cache: Optional[ToolResponseCache] = None,
+):
+    """
+    Decorate a call_tool handler with the shared tool response cache.
+
+    Use it below @server.call_tool():
+
+        @server.call_tool()
+        @cached_tool_calls(server, SERVICE_NAME, CACHED_TOOL_TTLS, CACHE_INVALIDATIONS)
+        async def handle_call_tool(name, arguments): ...
+
+    Responses are keyed by (server, user, tool, normalized arguments), so
+    users never see each other's results.
+
+    Args:
+        server: The MCP server instance (provides user_id and api_key)
+        server_name: Name of the server, used in keys and metrics
+        ttls: Read-only tools that opt in, mapped to their TTL in seconds
+        invalidations: Write tools mapped to the cached tools they make stale.
+            After a write tool runs, the user's responses of those tools are dropped.
+        cache: Cache to use (the process-wide cache by default)
+    """
+    invalidations = invalidations or {}
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(name: str, arguments: dict | None):
+            tool_cache = cache or tool_response_cache
+            user_key = get_user_key(server)
+
+            if name in ttls:
+                key = (
+                    server_name,
+                    user_key,
+                    name,
+                    hash_value(normalize_arguments(arguments)),
+                )
+                return await tool_cache.get_or_call(
+                    key, ttls[name], lambda: handler(name, arguments)
+                )
+
+            result = await handler(name, arguments)
+
+            if name in invalidations:
+                tool_cache.invalidate(server_name, user_key, invalidations[name])
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,188 @@
+"""
+Async GitHub REST and GraphQL requests for the GitHub server.
+
+Requests go through the shared httpx connection pool, the rate limit
+governor and, for reads, the conditional request (ETag) cache. Writes
+address repositories, issues and refs by path instead of fetching them
+first, and listings are paginated lazily up to an item cap.
+"""
+
+import logging
+from contextlib import aclosing
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from src.utils.github.http_cache import send_conditional
+from src.utils.http.util import get_http_client
+from src.utils.pagination.util import paginate
+from src.utils.rate_limit.util import governed_request
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "github"
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+# Items returned by listing tools without a max_limit, and the most one call returns
+DEFAULT_MAX_ITEMS = 100
+MAX_ITEMS = 1000
+# Largest page size of the REST API
+PER_PAGE = 100
+
+
+class GitHubAPIError(Exception):
+    """Raised when a GitHub API request returns an error"""
+
+    def __init__(self, status_code: int, details: Any):
+        self.status_code = status_code
+        self.details = details
+        message = details.get("message") if isinstance(details, dict) else details
+        super().__init__(f"{status_code} {message}")
+
+
+def repo_path(owner: str, repo_name: Optional[str] = None) -> str:
+    """
+    REST path of a repository, from an owner and name or an "owner/name" string.
+
+    Used in place of fetching the repository when only its URL is needed.
+    """
+    full_name = f"{owner}/{repo_name}" if repo_name else owner
+    return f"/repos/{full_name.strip('/')}"
+
+
+def clamp_max_items(max_limit: Any = None) -> int:
+    """Item cap of a listing: max_limit when given, capped at MAX_ITEMS"""
+    if max_limit is None:
+        return DEFAULT_MAX_ITEMS
+    return max(1, min(int(max_limit), MAX_ITEMS))
+
+
+async def github_request(
+    token: str, method: str, path: str, **kwargs: Any
+) -> httpx.Response:
+    """
+    Send a request to the GitHub API on the shared connection pool.
+
+    GET requests are revalidated against the conditional request cache, so
+    unchanged responses come back as a free 304 with the cached body.
+
+    Args:
+        token: GitHub access token
+        method: HTTP method
+        path: API path (e.g. /repos/octocat/hello-world) or an absolute URL
+        **kwargs: Extra httpx request arguments (params, json, headers, ...)
+
+    Returns:
+        httpx.Response: The response
+    """
+    client = get_http_client(SERVICE_NAME)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": GITHUB_API_VERSION,
+    }
+    headers.update(kwargs.pop("headers", None) or {})
+    url = path if path.startswith("https://") else f"{GITHUB_API_URL}{path}"
+    request = client.build_request(method, url, headers=headers, **kwargs)
+
+    async def send(request):
+        return await governed_request(
+            SERVICE_NAME, token, partial(client.send, request)
+        )
+
+    if method.upper() == "GET":
+        return await send_conditional(token, request, send)
+    return await send(request)
+
+
+def get_error_details(response: httpx.Response) -> Any:
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+async def github_json(token: str, method: str, path: str, **kwargs: Any) -> Any:
+    """
+    Send a REST request and return its JSON body (None for empty responses).
+
+    Raises:
+        GitHubAPIError: When the response has an error status
+    """
+    response = await github_request(token, method, path, **kwargs)
+    if response.status_code >= 400:
+        raise GitHubAPIError(response.status_code, get_error_details(response))
+    if not response.content:
+        return None
+    return response.json()
+
+
+async def github_graphql(
+    token: str, query: str, variables: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run a GraphQL query, fetching exactly the fields a tool needs in one request.
+
+    Raises:
+        GitHubAPIError: When the request fails or the response holds errors
+    """
+    result = await github_json(
+        token, "POST", "/graphql", json={"query": query, "variables": variables or {}}
+    )
+    if result.get("errors"):
+        raise GitHubAPIError(200, {"message": result["errors"][0].get("message")})
+    return result["data"]
+
+
+async def iterate_items(
+    token: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    items_key: Optional[str] = None,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over the items of a paginated REST listing.
+
+    Pages follow the Link header and are sized to the item cap, so no page
+    beyond max_items is requested.
+
+    Args:
+        token: GitHub access token
+        path: API path of the listing
+        params: Query parameters of the first page
+        max_items: Maximum items to yield
+        items_key: Key holding the items (e.g. "items" for search results)
+
+    Yields:
+        Items of every page, in order
+    """
+    first_params = {**(params or {}), "per_page": min(PER_PAGE, max_items)}
+
+    async def fetch_page(url):
+        # The next link carries the query parameters of the first request
+        page_params = None if url else first_params
+        response = await github_request(token, "GET", url or path, params=page_params)
+        if response.status_code >= 400:
+            raise GitHubAPIError(response.status_code, get_error_details(response))
+        data = response.json()
+        items = data.get(items_key, []) if items_key else data
+        return items, response.links.get("next", {}).get("url")
+
+    async with aclosing(paginate(fetch_page, max_items=max_items)) as items:
+        async for item in items:
+            yield item
+
+
+async def list_items(
+    token: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_items: int = DEFAULT_MAX_ITEMS,
+    items_key: Optional[str] = None,
+) -> List[Any]:
+    """Collect up to max_items items of a paginated REST listing"""
+    return [
+        item async for item in iterate_items(token, path, params, max_items, items_key)
+    ]
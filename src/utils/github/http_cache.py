@@ -0,0 +1,222 @@
+"""
+Conditional request cache for GitHub API reads.
+
+GET responses carrying an ETag or Last-Modified header are kept per token
+and revalidated with If-None-Match / If-Modified-Since. GitHub does not
+count 304 responses against the rate limit, so repeated reads of the same
+repository cost almost no quota and return the cached body.
+"""
+
+import base64
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from prometheus_client import Counter
+
+from src.utils.cache.util import hash_value
+
+logger = logging.getLogger(__name__)
+
+# Total size of the response bodies kept in memory
+GITHUB_HTTP_CACHE_MAX_BYTES = int(
+    os.environ.get("GUMCP_GITHUB_HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+# Directory of the optional on-disk tier (disabled when unset)
+GITHUB_HTTP_CACHE_DIR = os.environ.get("GUMCP_GITHUB_HTTP_CACHE_DIR")
+# Response headers kept with a cached body (Link drives pagination)
+CACHED_HEADERS = ("content-type", "link", "etag", "last-modified")
+
+github_http_cache_requests_total = Counter(
+    "gumcp_github_http_cache_requests_total",
+    "GitHub GET requests by cache result (hit: 304 answered from the cache)",
+    ["result"],
+)
+
+# Hashes of the token and of the URL with its Accept header
+CacheKey = Tuple[str, str]
+
+
+class CachedResponse:
+    """Body and validators of a cached 200 response"""
+
+    def __init__(self, headers: Dict[str, str], body: bytes):
+        self.headers = headers
+        self.body = body
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers revalidating this response"""
+        headers = {}
+        if "etag" in self.headers:
+            headers["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers=self.headers, content=self.body, request=request
+        )
+
+
+class ConditionalRequestCache:
+    """
+    Per-token cache of GitHub GET responses, bounded by the size of the bodies.
+
+    Entries live in an in-memory LRU and, when a directory is configured,
+    in an on-disk tier that survives restarts.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = GITHUB_HTTP_CACHE_MAX_BYTES,
+        cache_dir: Optional[str] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.size = 0
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(token: str, request: httpx.Request) -> CacheKey:
+        """Key of a request: the token, the full URL and the requested media type"""
+        accept = request.headers.get("Accept", "")
+        return hash_value(token), hash_value(f"{request.url}|{accept}")
+
+    def _disk_path(self, key: CacheKey) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / key[0] / f"{key[1]}.json"
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Get a cached response, checking memory first and then disk"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                return entry
+
+        path = self._disk_path(key)
+        if path and path.exists():
+            try:
+                with open(path, "r") as f:
+                    stored = json.load(f)
+                entry = CachedResponse(
+                    stored["headers"], base64.b64decode(stored["body"])
+                )
+                self._store_in_memory(key, entry)
+                return entry
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable GitHub cache file {path}: {e}")
+        return None
+
+    def _store_in_memory(self, key: CacheKey, entry: CachedResponse) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous:
+                self.size -= previous.size
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def set(self, key: CacheKey, response: httpx.Response) -> None:
+        """Store a 200 response that carries a validator"""
+        headers = {
+            name: response.headers[name]
+            for name in CACHED_HEADERS
+            if name in response.headers
+        }
+        if "etag" not in headers and "last-modified" not in headers:
+            return
+        entry = CachedResponse(headers, response.content)
+        if entry.size > self.max_bytes:
+            return
+        self._store_in_memory(key, entry)
+
+        path = self._disk_path(key)
+        if path:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(
+                        {
+                            "headers": headers,
+                            "body": base64.b64encode(entry.body).decode("ascii"),
+                        },
+                        f,
+                    )
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not write GitHub cache file {path}: {e}")
+
+    def discard(self, key: CacheKey) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry:
+                self.size -= entry.size
+        path = self._disk_path(key)
+        if path:
+            path.unlink(missing_ok=True)
+
+
+# Cache shared by all sessions of the process
+github_http_cache = ConditionalRequestCache(cache_dir=GITHUB_HTTP_CACHE_DIR)
+
+
+async def send_conditional(
+    token: str,
+    request: httpx.Request,
+    send: Any,
+    cache: Optional[ConditionalRequestCache] = None,
+) -> httpx.Response:
+    """
+    Send a GET request, revalidating a cached copy of its response.
+
+    A 304 is answered with the cached body as a 200 response, so callers
+    cannot tell it apart from a fresh one. Requests that already carry
+    conditional headers are sent as they are.
+
+    Args:
+        token: GitHub access token the response is cached for
+        request: The built GET request
+        send: Coroutine function sending a request and returning its response
+        cache: Cache to use (the process-wide cache by default)
+
+    Returns:
+        httpx.Response: The response, or the cached response after a 304
+    """
+    cache = cache or github_http_cache
+    if "If-None-Match" in request.headers or "If-Modified-Since" in request.headers:
+        return await send(request)
+
+    key = cache.get_key(token, request)
+    cached = cache.get(key)
+    if cached:
+        request.headers.update(cached.validators())
+
+    response = await send(request)
+
+    if response.status_code == 304 and cached:
+        github_http_cache_requests_total.labels(result="hit").inc()
+        return cached.to_response(request)
+    if response.status_code == 200:
+        github_http_cache_requests_total.labels(
+            result="modified" if cached else "miss"
+        ).inc()
+        cache.set(key, response)
+    elif cached and response.status_code in (404, 410):
+        cache.discard(key)
+    return response
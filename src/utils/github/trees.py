@@ -0,0 +1,214 @@
+"""
+Recursive repository listings from the Git trees API.
+
+A directory is listed with a single git/trees/{sha}?recursive=1 request
+instead of one contents request per subdirectory. Commits and trees are
+immutable, so listings are cached by tree SHA and the only request of a
+repeated listing resolves the ref to its commit (a free 304 once the ETag
+cache holds it). File contents, when asked for, are fetched as blobs
+concurrently.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.github.api import (
+    GitHubAPIError,
+    get_error_details,
+    github_json,
+    github_request,
+)
+from src.utils.rate_limit.util import gather_bounded
+
+logger = logging.getLogger(__name__)
+
+# Listings kept by tree SHA, and commits whose root tree is known
+TREE_CACHE_MAX_ENTRIES = 128
+COMMIT_CACHE_MAX_ENTRIES = 1024
+# Blobs fetched at the same time when file contents are requested
+BLOB_CONCURRENCY = 8
+# Files whose contents one call returns, and the largest file included
+MAX_CONTENT_FILES = 100
+MAX_CONTENT_FILE_SIZE = 1024 * 1024
+# Tree entry modes of symlinks and submodules (other blobs are files)
+SYMLINK_MODE = "120000"
+SUBMODULE_MODE = "160000"
+
+# Tree entries by (repository, tree SHA, recursive)
+_trees: "OrderedDict[Tuple[str, str, bool], Dict[str, Any]]" = OrderedDict()
+# Root tree SHA by (repository, commit SHA)
+_commit_trees: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+
+def cache_put(cache: OrderedDict, key: Any, value: Any, max_entries: int) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+async def resolve_commit(token: str, repo: str, ref: Optional[str] = None) -> str:
+    """Get the SHA of the commit a branch, tag or SHA points to (HEAD by default)"""
+    response = await github_request(
+        token,
+        "GET",
+        f"{repo}/commits/{ref or 'HEAD'}",
+        headers={"Accept": "application/vnd.github.sha"},
+    )
+    if response.status_code >= 400:
+        raise GitHubAPIError(response.status_code, get_error_details(response))
+    return response.text.strip()
+
+
+async def get_tree(
+    token: str, repo: str, tree_ish: str, recursive: bool = True
+) -> Dict[str, Any]:
+    """
+    Get a tree (sha, tree entries, truncated) by tree SHA or commit SHA.
+
+    Listings of a commit are cached under the SHA of its root tree.
+    """
+    tree_sha = _commit_trees.get((repo, tree_ish), tree_ish)
+    key = (repo, tree_sha, recursive)
+    tree = _trees.get(key)
+    if tree is not None:
+        _trees.move_to_end(key)
+        return tree
+
+    tree = await github_json(
+        token,
+        "GET",
+        f"{repo}/git/trees/{tree_ish}",
+        params={"recursive": 1} if recursive else None,
+    )
+    if tree["sha"] != tree_ish:
+        cache_put(
+            _commit_trees, (repo, tree_ish), tree["sha"], COMMIT_CACHE_MAX_ENTRIES
+        )
+    cache_put(_trees, (repo, tree["sha"], recursive), tree, TREE_CACHE_MAX_ENTRIES)
+    return tree
+
+
+async def get_subtree_sha(token: str, repo: str, commit_sha: str, path: str) -> str:
+    """Find the tree SHA of a directory by listing its parents one level at a time"""
+    tree_sha = commit_sha
+    for segment in path.split("/"):
+        tree = await get_tree(token, repo, tree_sha, recursive=False)
+        entry = next(
+            (
+                entry
+                for entry in tree["tree"]
+                if entry["path"] == segment and entry["type"] == "tree"
+            ),
+            None,
+        )
+        if entry is None:
+            raise GitHubAPIError(404, {"message": f"Directory not found: {path}"})
+        tree_sha = entry["sha"]
+    return tree_sha
+
+
+def entry_type(entry: Dict[str, Any]) -> str:
+    """Type of a tree entry as the contents API names it"""
+    if entry["mode"] == SUBMODULE_MODE:
+        return "submodule"
+    if entry["mode"] == SYMLINK_MODE:
+        return "symlink"
+    return "file"
+
+
+async def list_files(
+    token: str,
+    repo: str,
+    path: str = "",
+    ref: Optional[str] = None,
+    include_content: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    List every file under a directory of a repository.
+
+    The root tree of the commit is listed recursively in one request and
+    filtered by path. Repositories too large for one listing (GitHub
+    truncates it) are listed from the directory's own tree instead.
+
+    Args:
+        token: GitHub access token
+        repo: REST path of the repository (see repo_path)
+        path: Directory to list (the repository root when empty)
+        ref: Branch, tag or commit (the default branch when None)
+        include_content: Add the base64 content of up to MAX_CONTENT_FILES
+            files of at most MAX_CONTENT_FILE_SIZE bytes
+
+    Returns:
+        List: Files (name, path, sha, size, type, mode) in tree order
+    """
+    path = path.strip("/")
+    commit_sha = await resolve_commit(token, repo, ref)
+
+    tree = await get_tree(token, repo, commit_sha)
+    entries = tree["tree"]
+    prefix = ""
+    if path and tree.get("truncated"):
+        # The entries of the directory's own tree are relative to it
+        tree = await get_tree(
+            token, repo, await get_subtree_sha(token, repo, commit_sha, path)
+        )
+        entries = tree["tree"]
+        prefix = f"{path}/"
+    elif path:
+        # A path to a file lists the file itself
+        entries = [
+            entry
+            for entry in entries
+            if entry["path"].startswith(f"{path}/") or entry["path"] == path
+        ]
+        if not entries:
+            raise GitHubAPIError(404, {"message": f"Path not found: {path}"})
+
+    if tree.get("truncated"):
+        logger.warning(
+            f"Tree listing of {repo}/{path} was truncated by GitHub, "
+            f"returning {len(entries)} entries"
+        )
+
+    files = [
+        {
+            "name": entry["path"].rsplit("/", 1)[-1],
+            "path": f"{prefix}{entry['path']}",
+            "sha": entry["sha"],
+            "size": entry.get("size"),
+            "type": entry_type(entry),
+            "mode": entry["mode"],
+        }
+        for entry in entries
+        if entry["type"] in ("blob", "commit")
+    ]
+
+    if include_content:
+        await add_contents(token, repo, files)
+    return files
+
+
+async def add_contents(token: str, repo: str, files: List[Dict[str, Any]]) -> None:
+    """Fetch the blobs of files concurrently, adding their base64 content"""
+    wanted = [
+        file
+        for file in files
+        if file["type"] == "file" and (file["size"] or 0) <= MAX_CONTENT_FILE_SIZE
+    ][:MAX_CONTENT_FILES]
+    if len(wanted) < sum(file["type"] == "file" for file in files):
+        logger.info(
+            f"Returning contents of {len(wanted)} of {len(files)} files of {repo}"
+        )
+
+    blobs = await gather_bounded(
+        (
+            github_json(token, "GET", f"{repo}/git/blobs/{file['sha']}")
+            for file in wanted
+        ),
+        BLOB_CONCURRENCY,
+    )
+    for file, blob in zip(wanted, blobs):
+        file["content"] = blob["content"]
+        file["encoding"] = blob["encoding"]
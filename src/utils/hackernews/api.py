@@ -0,0 +1,162 @@
+"""
+Hacker News Firebase API access for the Hacker News server.
+
+Items are fetched concurrently on the shared httpx connection pool and kept
+in a process-wide cache, since the data is public and the same stories and
+comments are requested by every user. Items stop changing once their
+thread is archived, so old items are cached far longer than recent ones.
+Story ID lists (topstories, newstories, ...) are cached for a few seconds.
+Concurrent requests for the same item or list share one fetch.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.cache.util import SingleFlight
+from src.utils.http.util import get_http_client
+from src.utils.rate_limit.util import gather_bounded
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "hackernews"
+HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
+# Items fetched at the same time
+ITEM_CONCURRENCY = 16
+# Maximum items kept across all users
+ITEM_CACHE_MAX_ENTRIES = 20000
+# Seconds a recent item is cached, and an item of an archived thread
+ITEM_TTL = 60
+ARCHIVED_ITEM_TTL = 24 * 3600
+# Threads stop accepting votes and comments after two weeks
+ARCHIVE_AGE = 14 * 24 * 3600
+# Seconds a story ID list is cached
+STORY_LIST_TTL = 30
+
+
+class HackerNewsAPIError(Exception):
+    """Raised when a Hacker News API request returns an error status"""
+
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        self.message = message
+        super().__init__(f"Status {status_code}: {message}")
+
+
+class ResponseCache:
+    """
+    LRU of API responses with a TTL per entry.
+
+    Callers asking for a key that is being fetched wait for that fetch
+    instead of sending another request.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight = SingleFlight()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Get (found, value) of a fresh entry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Callable[[Any], float],
+    ) -> Any:
+        """Return the cached value of key or fetch it, caching it for ttl(value)"""
+        found, value = self.get(key)
+        if found:
+            return value
+
+        async def fetch_and_store() -> Any:
+            value = await fetch()
+            self.set(key, value, ttl(value))
+            return value
+
+        return await self._in_flight.do(key, fetch_and_store)
+
+
+# Items and story lists shared by every session of the process
+item_cache = ResponseCache(ITEM_CACHE_MAX_ENTRIES)
+story_list_cache = ResponseCache(64)
+
+
+async def hn_request(path: str) -> Any:
+    """
+    GET a Hacker News API path (e.g. item/8863) and return its JSON body.
+
+    Raises:
+        HackerNewsAPIError: When the response has an error status
+    """
+    client = get_http_client(SERVICE_NAME)
+    response = await client.get(f"{HN_API_BASE}/{path}.json")
+    if response.status_code != 200:
+        raise HackerNewsAPIError(response.status_code, response.text)
+    return response.json()
+
+
+def item_ttl(item: Optional[Dict[str, Any]]) -> float:
+    """Seconds to cache an item: longer once its thread is archived"""
+    if item and time.time() - item.get("time", time.time()) > ARCHIVE_AGE:
+        return ARCHIVED_ITEM_TTL
+    return ITEM_TTL
+
+
+async def get_item(item_id: Any) -> Optional[Dict[str, Any]]:
+    """Get a story, comment, job or poll by ID (None when it does not exist)"""
+    try:
+        return await item_cache.get_or_fetch(
+            str(item_id), lambda: hn_request(f"item/{item_id}"), item_ttl
+        )
+    except HackerNewsAPIError as e:
+        # Errors are not cached, so the item is fetched again next time
+        logger.warning(f"Could not fetch Hacker News item {item_id}: {e}")
+        return None
+
+
+async def get_items(item_ids: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Get items concurrently, ITEM_CONCURRENCY at a time.
+
+    Returns:
+        List: The items that exist, in the order of item_ids
+    """
+    items = await gather_bounded(
+        (get_item(item_id) for item_id in item_ids), ITEM_CONCURRENCY
+    )
+    return [item for item in items if item]
+
+
+async def get_story_ids(endpoint: str) -> List[int]:
+    """Get the IDs of a story list (topstories, newstories, beststories, ...)"""
+    return await story_list_cache.get_or_fetch(
+        endpoint, lambda: hn_request(endpoint), lambda _: STORY_LIST_TTL
+    )
+
+
+async def get_stories(endpoint: str, limit: int) -> List[Dict[str, Any]]:
+    """Get the first limit stories of a story list"""
+    return await get_items((await get_story_ids(endpoint))[:limit])
+
+
+async def get_user(username: str) -> Optional[Dict[str, Any]]:
+    """Get a user's profile (None when the user does not exist)"""
+    return await hn_request(f"user/{username}")
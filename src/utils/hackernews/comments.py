@@ -0,0 +1,133 @@
+"""
+Breadth-first loading of Hacker News comment trees.
+
+A thread is expanded one level at a time: every comment of a level is
+fetched concurrently before the next level starts, instead of following
+kids one item at a time. Loading stops at a maximum depth, node count or
+time budget. Comments are yielded as compact flattened nodes with their
+parent and depth, a level at a time, so callers can report progress as
+each level completes.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src.utils.hackernews.api import ITEM_CONCURRENCY, get_item
+
+logger = logging.getLogger(__name__)
+
+# Defaults and upper bounds of the loader's limits
+DEFAULT_MAX_DEPTH = 10
+MAX_DEPTH = 100
+DEFAULT_MAX_NODES = 300
+MAX_NODES = 5000
+DEFAULT_TIME_BUDGET = 15
+MAX_TIME_BUDGET = 60
+
+
+def compact_comment(item: Dict[str, Any], depth: int) -> Dict[str, Any]:
+    """Flattened node of a comment: only the fields needed to read the thread"""
+    node = {"id": item["id"], "parent": item.get("parent"), "depth": depth}
+    if item.get("deleted") or item.get("dead"):
+        # Kept so replies still have a parent; their kids are loaded as usual
+        node["deleted"] = True
+    else:
+        node["by"] = item.get("by")
+        node["time"] = item.get("time")
+        node["text"] = item.get("text")
+    node["replies"] = len(item.get("kids", []))
+    return node
+
+
+class CommentTreeLoader:
+    """
+    Load the comments under an item level by level.
+
+    After iterating levels(), nodes, depth, pending and stopped_by describe
+    what was loaded and why loading stopped (None when the whole tree was
+    loaded).
+    """
+
+    def __init__(
+        self,
+        root: Dict[str, Any],
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        time_budget: Optional[float] = None,
+    ):
+        self.root = root
+        self.max_depth = min(max_depth or DEFAULT_MAX_DEPTH, MAX_DEPTH)
+        self.max_nodes = min(max_nodes or DEFAULT_MAX_NODES, MAX_NODES)
+        self.time_budget = min(time_budget or DEFAULT_TIME_BUDGET, MAX_TIME_BUDGET)
+        self.nodes = 0
+        self.depth = 0
+        # Comments known to exist but not loaded
+        self.pending = 0
+        self.stopped_by: Optional[str] = None
+
+    async def fetch_level(
+        self, item_ids: List[int], deadline: float
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch the items of a level concurrently until the deadline.
+
+        Fetches still running at the deadline are left to finish, so the
+        item cache holds them next time.
+
+        Returns:
+            Tuple of the items loaded (in order) and whether all fetches finished
+        """
+        semaphore = asyncio.Semaphore(ITEM_CONCURRENCY)
+
+        async def fetch(item_id):
+            async with semaphore:
+                return await get_item(item_id)
+
+        tasks = [asyncio.create_task(fetch(item_id)) for item_id in item_ids]
+        timeout = max(0, deadline - time.monotonic())
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        items = [
+            task.result() for task in tasks if task in done and not task.exception()
+        ]
+        return [item for item in items if item], not pending
+
+    async def levels(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the flattened comments of each level below the root"""
+        deadline = time.monotonic() + self.time_budget
+        kids = list(self.root.get("kids", []))
+
+        while kids:
+            if self.depth >= self.max_depth:
+                self.stopped_by = "max_depth"
+                break
+            if self.nodes >= self.max_nodes:
+                self.stopped_by = "max_nodes"
+                break
+            if time.monotonic() >= deadline:
+                self.stopped_by = "time_budget"
+                break
+
+            remaining = self.max_nodes - self.nodes
+            level_ids = kids[:remaining]
+            loaded, complete = await self.fetch_level(level_ids, deadline)
+            if not complete:
+                self.stopped_by = "time_budget"
+            elif len(kids) > remaining:
+                self.stopped_by = "max_nodes"
+
+            self.depth += 1
+            self.nodes += len(loaded)
+            self.pending += len(kids) - len(loaded)
+            yield [compact_comment(item, self.depth) for item in loaded]
+
+            kids = [kid for item in loaded for kid in item.get("kids", [])]
+            if self.stopped_by:
+                break
+
+        self.pending += len(kids)
+        logger.info(
+            f"Loaded {self.nodes} comments of item {self.root.get('id')} "
+            f"in {self.depth} levels (stopped by {self.stopped_by or 'end of tree'})"
+        )
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import weakref
+from typing import Any, Awaitable, Callable, List
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool of each shared client
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_TIMEOUT = 30.0
+
+# Shared clients by event loop and name. Clients are bound to the loop they
+# were created on, so each loop gets its own pool.
+_clients = weakref.WeakKeyDictionary()
+
+# Coroutine functions run when a server shuts down, before the shared clients
+# are closed (e.g. to send requests still buffered by a server)
+_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+
+def get_http_client(name: str, **client_kwargs: Any) -> httpx.AsyncClient:
+    """
+    Get a pooled httpx client shared by every session on the running event loop.
+
+    Reusing one client keeps TCP/TLS connections to a provider alive between
+    tool calls instead of opening a new connection per request. Clients are
+    keyed by name, so each provider gets its own pool and settings; the
+    keyword arguments only apply when the client is first created.
+
+    Args:
+        name: Name of the pool, usually the server's SERVICE_NAME
+        **client_kwargs: Extra httpx.AsyncClient arguments (base_url, headers, ...)
+
+    Returns:
+        httpx.AsyncClient: The shared client
+    """
+    loop = asyncio.get_running_loop()
+    clients = _clients.setdefault(loop, {})
+
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        client_kwargs.setdefault(
+            "limits",
+            httpx.Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        client_kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        client = httpx.AsyncClient(**client_kwargs)
+        clients[name] = client
+        logger.debug(f"Created shared HTTP client {name}")
+
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the shared clients of the running event loop"""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+def register_shutdown_hook(hook: Callable[[], Awaitable[None]]) -> None:
+    """Register a coroutine function to run with run_shutdown_hooks"""
+    if hook not in _shutdown_hooks:
+        _shutdown_hooks.append(hook)
+
+
+async def run_shutdown_hooks() -> None:
+    """Run the registered shutdown hooks on the running event loop"""
+    for hook in list(_shutdown_hooks):
+        try:
+            await hook()
+        except Exception as e:
+            logger.error(f"Shutdown hook {hook.__qualname__} failed: {str(e)}")
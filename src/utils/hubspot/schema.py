@@ -0,0 +1,214 @@
+"""
+Portal schema cache for the HubSpot server.
+
+Property definitions and custom object schemas of a portal are cached with
+a TTL and shared by every session connected to that portal (keyed by the
+portal ID), since they rarely change. Expired entries are revalidated with
+If-None-Match / If-Modified-Since, so an unchanged schema costs a 304
+instead of the full listing.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.utils.rate_limit.util import get_credential_key
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a cached schema is revalidated
+SCHEMA_TTL = 3600
+# Maximum schemas kept across all portals
+SCHEMA_CACHE_MAX_ENTRIES = 512
+
+# Sends a HubSpot API request: (access_token, method, url, **kwargs) -> httpx.Response
+ApiRequest = Callable[..., Awaitable[Any]]
+
+
+class SchemaFetchError(Exception):
+    """Raised when a schema cannot be fetched and no cached copy exists"""
+
+    def __init__(self, status_code, details):
+        self.status_code = status_code
+        self.details = details
+        super().__init__(f"Status {status_code}")
+
+
+class PropertyIndex:
+    """Property definitions of one object type with name lookup tables"""
+
+    def __init__(self, properties: List[Dict[str, Any]]):
+        self.properties = {prop["name"]: prop for prop in properties}
+        self.names = list(self.properties)
+        self.names_by_lower = {name.lower(): name for name in self.names}
+        self.names_by_label = {
+            prop["label"].lower(): prop["name"]
+            for prop in properties
+            if prop.get("label")
+        }
+
+    def canonical_name(self, name: str) -> str:
+        """
+        Get the internal name of a property given its name in any case or its label.
+
+        Unknown names are returned unchanged, so HubSpot reports them.
+        """
+        if name in self.properties:
+            return name
+        lowered = name.lower()
+        return self.names_by_lower.get(lowered) or self.names_by_label.get(
+            lowered, name
+        )
+
+    def canonical_properties(self, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Rename the keys of property values to the portal's internal names"""
+        return {self.canonical_name(key): value for key, value in properties.items()}
+
+
+class SchemaEntry:
+    """A cached schema response with its validators"""
+
+    def __init__(self):
+        self.data: Any = None
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.fetched_at: Optional[float] = None
+        self.property_index: Optional[PropertyIndex] = None
+        self.lock = asyncio.Lock()
+
+    def stale(self) -> bool:
+        return (
+            self.fetched_at is None or time.monotonic() - self.fetched_at > SCHEMA_TTL
+        )
+
+
+# Schemas by (portal ID, path), shared by every session of the portal
+_schemas: "OrderedDict[Tuple[str, str], SchemaEntry]" = OrderedDict()
+# Portal of each access token, keyed by the token's hash
+_portal_ids: Dict[str, str] = {}
+
+
+async def get_portal_id(api_request: ApiRequest, access_token: str) -> str:
+    """
+    Get the portal (hub) ID of an access token, calling the account API once per token.
+
+    Tokens whose portal cannot be looked up get a cache of their own.
+    """
+    token_key = get_credential_key(access_token)
+    if token_key not in _portal_ids:
+        response = await api_request(access_token, "GET", "/account-info/v3/details")
+        if response.status_code == 200:
+            _portal_ids[token_key] = str(response.json()["portalId"])
+        else:
+            logger.warning(
+                f"Could not look up HubSpot portal (status {response.status_code}), "
+                "caching schemas per token"
+            )
+            _portal_ids[token_key] = f"token:{token_key}"
+    return _portal_ids[token_key]
+
+
+def get_schema_entry(portal_id: str, path: str) -> SchemaEntry:
+    key = (portal_id, path)
+    entry = _schemas.get(key)
+    if entry is None:
+        entry = _schemas[key] = SchemaEntry()
+        while len(_schemas) > SCHEMA_CACHE_MAX_ENTRIES:
+            _schemas.popitem(last=False)
+    _schemas.move_to_end(key)
+    return entry
+
+
+async def revalidate(
+    api_request: ApiRequest, access_token: str, path: str, entry: SchemaEntry
+) -> None:
+    """Fetch a schema, sending the validators of the cached copy"""
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+
+    response = await api_request(access_token, "GET", path, headers=headers)
+
+    if response.status_code == 304 and entry.data is not None:
+        entry.fetched_at = time.monotonic()
+        return
+
+    if response.status_code != 200:
+        try:
+            details = response.json()
+        except ValueError:
+            details = response.text
+        if entry.data is not None:
+            # A stale schema is still better than failing the tool call
+            logger.warning(
+                f"Could not revalidate HubSpot schema {path} "
+                f"(status {response.status_code}), serving cached copy"
+            )
+            entry.fetched_at = time.monotonic()
+            return
+        raise SchemaFetchError(response.status_code, details)
+
+    entry.data = response.json()
+    entry.etag = response.headers.get("etag")
+    entry.last_modified = response.headers.get("last-modified")
+    entry.fetched_at = time.monotonic()
+    entry.property_index = None
+
+
+async def get_schema(
+    api_request: ApiRequest, access_token: str, path: str, force: bool = False
+) -> SchemaEntry:
+    """
+    Get a fresh cached schema of the token's portal.
+
+    Concurrent callers share a single fetch of the schema.
+
+    Args:
+        api_request: Function sending HubSpot API requests
+        access_token: HubSpot access token of any user of the portal
+        path: API path of the schema (e.g. /crm/v3/properties/contacts)
+        force: Revalidate the schema even if it has not expired
+
+    Returns:
+        SchemaEntry: The shared cache entry holding the schema
+    """
+    portal_id = await get_portal_id(api_request, access_token)
+    entry = get_schema_entry(portal_id, path)
+    if not force and not entry.stale():
+        return entry
+
+    requested_at = time.monotonic()
+    async with entry.lock:
+        # Another caller may have revalidated the schema while this one waited
+        if entry.fetched_at is None or entry.fetched_at < (
+            requested_at if force else time.monotonic() - SCHEMA_TTL
+        ):
+            logger.info(f"Fetching HubSpot schema {path} of portal {portal_id}")
+            await revalidate(api_request, access_token, path, entry)
+    return entry
+
+
+async def get_property_index(
+    api_request: ApiRequest, access_token: str, object_type: str
+) -> PropertyIndex:
+    """Get the property definitions of an object type with their lookup tables"""
+    entry = await get_schema(
+        api_request, access_token, f"/crm/v3/properties/{object_type}"
+    )
+    if entry.property_index is None:
+        entry.property_index = PropertyIndex(entry.data.get("results", []))
+    return entry.property_index
+
+
+async def get_object_schema(
+    api_request: ApiRequest, access_token: str, object_type_id: str
+) -> Dict[str, Any]:
+    """Get the schema of a custom object type"""
+    entry = await get_schema(
+        api_request, access_token, f"/crm/v3/schemas/{object_type_id}"
+    )
+    return entry.data
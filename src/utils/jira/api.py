@@ -0,0 +1,164 @@
+"""
+Jira Cloud REST API access for the Jira server.
+
+Requests go through the shared httpx connection pool. The Atlassian sites a
+token can access and the current user's accountId on each site are cached
+per user, so tool calls do not resolve them again with a request each.
+Cached values belong to the access token they were fetched with and are
+dropped as soon as the user's token is refreshed.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from src.utils.http.util import get_http_client
+from src.utils.rate_limit.util import get_credential_key, governed_request
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "jira"
+ACCESSIBLE_RESOURCES_URL = "https://api.atlassian.com/oauth/token/accessible-resources"
+# Seconds before the sites of a token are fetched again (new sites may be granted)
+SITE_CACHE_TTL = 3600
+# Maximum users whose sites are kept
+SITE_CACHE_MAX_ENTRIES = 1024
+
+
+class JiraAPIError(Exception):
+    """Raised when a Jira API request returns an error status"""
+
+    def __init__(self, status_code: int, details: Any):
+        self.status_code = status_code
+        self.details = details
+        super().__init__(f"Status {status_code}: {details}")
+
+
+async def jira_request(
+    auth_header: str, method: str, url: str, **kwargs: Any
+) -> httpx.Response:
+    """
+    Send a request to the Jira or Atlassian API on the shared connection pool.
+
+    Args:
+        auth_header: Authorization header value (e.g. "Bearer <token>")
+        method: HTTP method
+        url: Absolute URL of the request
+        **kwargs: Extra httpx request arguments (params, json, headers, ...)
+
+    Returns:
+        httpx.Response: The response
+    """
+    client = get_http_client(SERVICE_NAME)
+    headers = {"Authorization": auth_header, "Accept": "application/json"}
+    headers.update(kwargs.pop("headers", None) or {})
+    send = partial(client.request, method, url, headers=headers, **kwargs)
+    return await governed_request(SERVICE_NAME, auth_header, send)
+
+
+def get_error_details(response: httpx.Response) -> Any:
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+async def jira_json(auth_header: str, method: str, url: str, **kwargs: Any) -> Any:
+    """
+    Send a request and return its JSON body (None for empty responses).
+
+    Raises:
+        JiraAPIError: When the response has an error status
+    """
+    response = await jira_request(auth_header, method, url, **kwargs)
+    if response.status_code >= 400:
+        raise JiraAPIError(response.status_code, get_error_details(response))
+    if not response.content:
+        return None
+    return response.json()
+
+
+class SiteCacheEntry:
+    """Sites and accountIds resolved with one access token"""
+
+    def __init__(self, token_key: str):
+        self.token_key = token_key
+        self.resources: Optional[List[Dict[str, Any]]] = None
+        self.fetched_at: Optional[float] = None
+        # accountId of the token's user by site base URL
+        self.account_ids: Dict[str, str] = {}
+        self.lock = asyncio.Lock()
+
+    def stale(self) -> bool:
+        return (
+            self.fetched_at is None
+            or time.monotonic() - self.fetched_at > SITE_CACHE_TTL
+        )
+
+
+# Sites of each user, with the token they were resolved with
+_site_cache: "OrderedDict[str, SiteCacheEntry]" = OrderedDict()
+
+
+def get_site_entry(user_key: str, auth_header: str) -> SiteCacheEntry:
+    """Get the user's cache entry, replacing it when the token has changed"""
+    key = get_credential_key(user_key)
+    token_key = get_credential_key(auth_header)
+    entry = _site_cache.get(key)
+    if entry is None or entry.token_key != token_key:
+        if entry is not None:
+            logger.info("Jira token changed, dropping cached sites and account ID")
+        entry = _site_cache[key] = SiteCacheEntry(token_key)
+        while len(_site_cache) > SITE_CACHE_MAX_ENTRIES:
+            _site_cache.popitem(last=False)
+    _site_cache.move_to_end(key)
+    return entry
+
+
+async def get_accessible_resources(
+    user_key: str, auth_header: str
+) -> List[Dict[str, Any]]:
+    """
+    Get the Atlassian sites the user's token can access.
+
+    Args:
+        user_key: Identifies the user (e.g. user ID and API key)
+        auth_header: Authorization header value of the user's token
+
+    Returns:
+        List: Sites (id, name, url, scopes, avatarUrl)
+
+    Raises:
+        ValueError: When the sites cannot be fetched
+    """
+    entry = get_site_entry(user_key, auth_header)
+    async with entry.lock:
+        if entry.stale():
+            response = await jira_request(auth_header, "GET", ACCESSIBLE_RESOURCES_URL)
+            if response.status_code != 200:
+                raise ValueError(
+                    f"Failed to fetch accessible resources: {response.status_code}"
+                )
+            entry.resources = response.json()
+            entry.fetched_at = time.monotonic()
+    return entry.resources
+
+
+async def get_account_id(user_key: str, auth_header: str, base_url: str) -> str:
+    """
+    Get the accountId of the token's user on a site (from /rest/api/3/myself).
+
+    Raises:
+        JiraAPIError: When the user cannot be fetched
+    """
+    entry = get_site_entry(user_key, auth_header)
+    account_id = entry.account_ids.get(base_url)
+    if account_id is None:
+        myself = await jira_json(auth_header, "GET", f"{base_url}/rest/api/3/myself")
+        account_id = entry.account_ids[base_url] = myself.get("accountId")
+    return account_id
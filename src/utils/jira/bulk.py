@@ -0,0 +1,379 @@
+"""
+Bulk issue operations for the Jira server.
+
+Issues are created with /rest/api/3/issue/bulk, CREATE_CHUNK_SIZE per
+request with several requests in flight. Transitions go through the bulk
+transition API, which moves every issue sharing a transition in one
+asynchronous task that is then polled. Edits are sent as one request per
+issue, UPDATE_CONCURRENCY at a time, since each issue can get different
+field values. Every operation returns one result per issue in input order,
+so a failing issue does not hide the outcome of the others.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.jira.api import JiraAPIError, jira_json
+from src.utils.jira.search import BULK_FETCH_SIZE, SEARCH_CONCURRENCY, bulk_fetch
+from src.utils.jira.util import format_issue_fields
+from src.utils.rate_limit.util import gather_bounded
+from src.utils.streaming.util import report_progress
+
+logger = logging.getLogger(__name__)
+
+# Issues accepted by one bulk tool call (the bulk operation API limit)
+MAX_BULK_ISSUES = 1000
+# /issue/bulk takes 50 issues per request
+CREATE_CHUNK_SIZE = 50
+CREATE_CONCURRENCY = 4
+# Issue edits in flight
+UPDATE_CONCURRENCY = 8
+# Seconds between bulk task status checks, and the longest a tool call waits
+TASK_POLL_INTERVAL = 1
+MAX_TASK_WAIT_SECONDS = 60
+TASK_FINAL_STATES = ("COMPLETE", "FAILED", "CANCELLED", "DEAD")
+
+
+def error_messages(details: Any) -> List[str]:
+    """Flatten a Jira error body ({errorMessages, errors}) into messages"""
+    if not isinstance(details, dict):
+        return [str(details)]
+    messages = list(details.get("errorMessages") or [])
+    messages.extend(
+        f"{field}: {message}"
+        for field, message in (details.get("errors") or {}).items()
+    )
+    return messages or [str(details)]
+
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+async def create_issues(
+    auth_header: str,
+    base_url: str,
+    issues: List[Dict[str, Any]],
+    project_key: Optional[str] = None,
+    issue_type: str = "Task",
+) -> List[Dict[str, Any]]:
+    """
+    Create issues with /rest/api/3/issue/bulk.
+
+    Args:
+        auth_header: Authorization header value of the user's token
+        base_url: Base URL of the Jira site
+        issues: Issue arguments as taken by create_issue (summary, ...)
+        project_key: Project of issues that do not name one
+        issue_type: Issue type of issues that do not name one
+
+    Returns:
+        List: One result ({index, success, id, key} or {index, success,
+        errors}) per issue, in input order
+    """
+    updates = [
+        {
+            "fields": format_issue_fields(
+                {"project_key": project_key, "issue_type": issue_type, **issue}
+            )
+        }
+        for issue in issues
+    ]
+    chunks = chunked(updates, CREATE_CHUNK_SIZE)
+    created = 0
+
+    async def create_chunk(offset, chunk):
+        nonlocal created
+        try:
+            result = await jira_json(
+                auth_header,
+                "POST",
+                f"{base_url}/rest/api/3/issue/bulk",
+                json={"issueUpdates": chunk},
+            )
+        except JiraAPIError as e:
+            # A request where every issue fails is a 400 listing the failed
+            # elements; any other error body applies to the whole chunk
+            if not (
+                isinstance(e.details, dict)
+                and isinstance(e.details.get("errors"), list)
+            ):
+                return [
+                    {
+                        "index": offset + i,
+                        "success": False,
+                        "errors": error_messages(e.details),
+                    }
+                    for i in range(len(chunk))
+                ]
+            result = {"issues": [], "errors": e.details["errors"]}
+
+        failed = {
+            error.get("failedElementNumber"): error_messages(error.get("elementErrors"))
+            for error in result.get("errors") or []
+        }
+        # Created issues are listed in order, skipping the failed ones
+        created_issues = iter(result.get("issues") or [])
+        results = []
+        for i in range(len(chunk)):
+            if i in failed:
+                results.append(
+                    {"index": offset + i, "success": False, "errors": failed[i]}
+                )
+                continue
+            issue = next(created_issues, {})
+            if not issue.get("id"):
+                results.append(
+                    {
+                        "index": offset + i,
+                        "success": False,
+                        "errors": ["Issue was not created"],
+                    }
+                )
+                continue
+            results.append(
+                {
+                    "index": offset + i,
+                    "success": True,
+                    "id": issue.get("id"),
+                    "key": issue.get("key"),
+                }
+            )
+        created += len(chunk)
+        await report_progress(created, len(updates))
+        return results
+
+    chunk_results = await gather_bounded(
+        (create_chunk(i * CREATE_CHUNK_SIZE, chunk) for i, chunk in enumerate(chunks)),
+        CREATE_CONCURRENCY,
+    )
+    return [result for results in chunk_results for result in results]
+
+
+async def update_issues(
+    auth_header: str, base_url: str, issues: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Edit issues concurrently, UPDATE_CONCURRENCY at a time.
+
+    Args:
+        auth_header: Authorization header value of the user's token
+        base_url: Base URL of the Jira site
+        issues: Issue arguments as taken by update_issue (issue_key, ...)
+
+    Returns:
+        List: One result ({issue_key, success, errors}) per issue, in input order
+    """
+    updated = 0
+
+    async def update(issue):
+        nonlocal updated
+        issue_key = issue.get("issue_key")
+        try:
+            await jira_json(
+                auth_header,
+                "PUT",
+                f"{base_url}/rest/api/3/issue/{issue_key}",
+                json={"fields": format_issue_fields(issue)},
+            )
+            result = {"issue_key": issue_key, "success": True, "errors": []}
+        except JiraAPIError as e:
+            result = {
+                "issue_key": issue_key,
+                "success": False,
+                "errors": error_messages(e.details),
+            }
+        updated += 1
+        await report_progress(updated, len(issues))
+        return result
+
+    return await gather_bounded((update(issue) for issue in issues), UPDATE_CONCURRENCY)
+
+
+async def resolve_issues(
+    auth_header: str, base_url: str, issue_keys: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Get the ID and status of issues by key (issues not found are left out)"""
+    batches = await gather_bounded(
+        (
+            bulk_fetch(auth_header, base_url, batch, ["status"], None)
+            for batch in chunked(issue_keys, BULK_FETCH_SIZE)
+        ),
+        SEARCH_CONCURRENCY,
+    )
+    return {issue["key"].upper(): issue for batch in batches for issue in batch}
+
+
+async def get_available_transitions(
+    auth_header: str, base_url: str, issue_keys: List[str]
+) -> List[Dict[str, Any]]:
+    """Get the transitions of issues, grouped by the issues sharing a workflow"""
+    result = await jira_json(
+        auth_header,
+        "GET",
+        f"{base_url}/rest/api/3/bulk/issues/transition",
+        params={"issueIdsOrKeys": ",".join(issue_keys)},
+    )
+    return result.get("availableTransitions", [])
+
+
+async def get_bulk_task(
+    auth_header: str, base_url: str, task_id: str
+) -> Dict[str, Any]:
+    """Get the progress and per-issue outcome of a bulk operation task"""
+    return await jira_json(
+        auth_header, "GET", f"{base_url}/rest/api/3/bulk/queue/{task_id}"
+    )
+
+
+async def wait_for_task(
+    auth_header: str, base_url: str, task_id: str, wait_seconds: float
+) -> Dict[str, Any]:
+    """Poll a bulk operation task until it ends or wait_seconds pass"""
+    deadline = time.monotonic() + min(wait_seconds, MAX_TASK_WAIT_SECONDS)
+    while True:
+        task = await get_bulk_task(auth_header, base_url, task_id)
+        await report_progress(task.get("progressPercent", 0), 100)
+        if task.get("status") in TASK_FINAL_STATES or time.monotonic() >= deadline:
+            return task
+        await asyncio.sleep(TASK_POLL_INTERVAL)
+
+
+def match_transitions(
+    available: List[Dict[str, Any]], target: str
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """
+    Pick the transition to the target status for each issue.
+
+    Returns:
+        Tuple of issue keys by transition ID, and the statuses reachable by
+        issues that have no transition to the target
+    """
+    target = target.lower()
+    by_transition: Dict[str, List[str]] = {}
+    unmatched: Dict[str, List[str]] = {}
+    for group in available:
+        transitions = [
+            t for t in group.get("transitions", []) if t.get("isAvailable", True)
+        ]
+        match = next(
+            (
+                t
+                for t in transitions
+                if target
+                in (
+                    (t.get("to") or {}).get("statusName", "").lower(),
+                    (t.get("transitionName") or "").lower(),
+                )
+            ),
+            None,
+        )
+        for issue_key in group.get("issues", []):
+            if match:
+                by_transition.setdefault(str(match["transitionId"]), []).append(
+                    issue_key.upper()
+                )
+            else:
+                unmatched[issue_key.upper()] = [
+                    (t.get("to") or {}).get("statusName") for t in transitions
+                ]
+    return by_transition, unmatched
+
+
+async def transition_issues(
+    auth_header: str,
+    base_url: str,
+    issue_keys: List[str],
+    transition_to: str,
+    send_notification: bool = True,
+    wait_seconds: float = MAX_TASK_WAIT_SECONDS,
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Move issues to a status with one bulk transition task.
+
+    Issues already in the status are left as they are. The issues of each
+    workflow are moved with that workflow's transition to the status.
+
+    Args:
+        auth_header: Authorization header value of the user's token
+        base_url: Base URL of the Jira site
+        issue_keys: Keys of the issues to move (at most MAX_BULK_ISSUES)
+        transition_to: Name of the target status (or of the transition)
+        send_notification: Email watchers about the change
+        wait_seconds: Longest time to wait for the task to finish
+
+    Returns:
+        Tuple of the task (None when no issue needed a transition) and one
+        result ({issue_key, success, status, errors}) per issue, in input
+        order. Issues of an unfinished task have status "pending".
+    """
+    keys = [key.upper() for key in issue_keys]
+    found = await resolve_issues(auth_header, base_url, keys)
+    results = {
+        key: {"issue_key": key, "success": False, "errors": ["Issue not found"]}
+        for key in keys
+        if key not in found
+    }
+    for key, issue in found.items():
+        status = issue.get("fields", {}).get("status", {}).get("name", "")
+        if status.lower() == transition_to.lower():
+            results[key] = {
+                "issue_key": key,
+                "success": True,
+                "status": "unchanged",
+                "errors": [],
+            }
+
+    to_move = [key for key in found if key not in results]
+    task = None
+    if to_move:
+        available = await get_available_transitions(auth_header, base_url, to_move)
+        by_transition, unmatched = match_transitions(available, transition_to)
+        matched = {key for group in by_transition.values() for key in group}
+        for key in to_move:
+            if key not in matched:
+                results[key] = {
+                    "issue_key": key,
+                    "success": False,
+                    "errors": [f"No transition to '{transition_to}'"],
+                    "available_statuses": unmatched.get(key, []),
+                }
+
+    if to_move and by_transition:
+        submitted = await jira_json(
+            auth_header,
+            "POST",
+            f"{base_url}/rest/api/3/bulk/issues/transition",
+            json={
+                "bulkTransitionInputs": [
+                    {"selectedIssueIdsOrKeys": group, "transitionId": transition_id}
+                    for transition_id, group in by_transition.items()
+                ],
+                "sendBulkNotification": send_notification,
+            },
+        )
+        task = await wait_for_task(
+            auth_header, base_url, submitted["taskId"], wait_seconds
+        )
+        failed = {
+            str(issue_id): errors
+            for issue_id, errors in (task.get("failedAccessibleIssues") or {}).items()
+        }
+        processed = {
+            str(issue_id) for issue_id in task.get("processedAccessibleIssues") or []
+        }
+        for key in matched:
+            issue_id = str(found[key]["id"])
+            if issue_id in failed:
+                result = {"success": False, "errors": failed[issue_id]}
+            elif issue_id in processed:
+                result = {"success": True, "status": "transitioned", "errors": []}
+            elif task.get("status") in TASK_FINAL_STATES:
+                result = {"success": False, "errors": ["Issue was not transitioned"]}
+            else:
+                result = {"success": False, "status": "pending", "errors": []}
+            results[key] = {"issue_key": key, **result}
+
+    return task, [results[key] for key in keys]
@@ -0,0 +1,170 @@
+"""
+JQL search for the Jira server.
+
+Searches go through the enhanced search endpoint (/rest/api/3/search/jql)
+and only request the fields a tool needs instead of every navigable field.
+Small searches take one request. Larger ones first page through the
+matching issue IDs, which is cheap because no fields are returned, and
+then fetch the fields of BULK_FETCH_SIZE issues per request with several
+requests in flight. Issues are yielded in JQL order as each batch arrives.
+"""
+
+import asyncio
+import logging
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.utils.jira.api import jira_json
+from src.utils.pagination.util import paginate
+
+logger = logging.getLogger(__name__)
+
+# Default and maximum issues returned by one search
+DEFAULT_MAX_RESULTS = 50
+MAX_RESULTS = 10000
+# Issues requested per search page, and per page of an ID-only search
+SEARCH_PAGE_SIZE = 100
+ID_PAGE_SIZE = 5000
+# Issues per bulkfetch request, and bulkfetch requests in flight
+BULK_FETCH_SIZE = 100
+SEARCH_CONCURRENCY = 4
+# Fields returned when a search does not name any
+DEFAULT_SEARCH_FIELDS = [
+    "summary",
+    "status",
+    "issuetype",
+    "priority",
+    "assignee",
+    "reporter",
+    "creator",
+    "project",
+    "parent",
+    "labels",
+    "description",
+    "created",
+    "updated",
+]
+
+
+def clamp_max_results(
+    max_results: Any = None, default: int = DEFAULT_MAX_RESULTS
+) -> int:
+    """Issue cap of a search: max_results when given, capped at MAX_RESULTS"""
+    if max_results is None:
+        return default
+    return max(1, min(int(max_results), MAX_RESULTS))
+
+
+async def search_page(
+    auth_header: str,
+    base_url: str,
+    jql: str,
+    fields: List[str],
+    expand: Optional[List[str]],
+    max_results: int,
+    next_page_token: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Fetch one page of the enhanced JQL search"""
+    body = {"jql": jql, "fields": fields, "maxResults": max_results}
+    if expand:
+        body["expand"] = ",".join(expand)
+    if next_page_token:
+        body["nextPageToken"] = next_page_token
+    return await jira_json(
+        auth_header, "POST", f"{base_url}/rest/api/3/search/jql", json=body
+    )
+
+
+async def search_issue_ids(
+    auth_header: str, base_url: str, jql: str, max_results: int
+) -> List[str]:
+    """Get the IDs of up to max_results issues matching a JQL query, in order"""
+
+    async def fetch_page(token):
+        page = await search_page(
+            auth_header, base_url, jql, ["id"], None, ID_PAGE_SIZE, token
+        )
+        return [issue["id"] for issue in page.get("issues", [])], page.get(
+            "nextPageToken"
+        )
+
+    async with aclosing(paginate(fetch_page, max_items=max_results)) as ids:
+        return [issue_id async for issue_id in ids]
+
+
+async def bulk_fetch(
+    auth_header: str,
+    base_url: str,
+    issue_ids: List[str],
+    fields: List[str],
+    expand: Optional[List[str]],
+) -> List[Dict[str, Any]]:
+    """Fetch the fields of a batch of issues in one request, in input order"""
+    body = {"issueIdsOrKeys": issue_ids, "fields": fields}
+    if expand:
+        body["expand"] = expand
+    result = await jira_json(
+        auth_header, "POST", f"{base_url}/rest/api/3/issue/bulkfetch", json=body
+    )
+    for error in result.get("issueErrors", []):
+        logger.warning(f"Could not fetch Jira issue in search: {error}")
+    issues = {}
+    for issue in result.get("issues", []):
+        issues[issue["id"]] = issues[issue["key"].upper()] = issue
+    return [
+        issues[str(issue_id).upper()]
+        for issue_id in issue_ids
+        if str(issue_id).upper() in issues
+    ]
+
+
+async def search_issues(
+    auth_header: str,
+    base_url: str,
+    jql: str,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Search issues with JQL, yielding batches of issues in result order.
+
+    Args:
+        auth_header: Authorization header value of the user's token
+        base_url: Base URL of the Jira site
+        jql: JQL query
+        fields: Fields to return (DEFAULT_SEARCH_FIELDS when None, "*all" for all)
+        expand: Entities to expand (e.g. renderedFields, changelog)
+        max_results: Maximum issues to return (capped at MAX_RESULTS)
+
+    Yields:
+        Lists of issues (id, key, self, fields), in JQL order
+    """
+    fields = list(fields or DEFAULT_SEARCH_FIELDS)
+    max_results = clamp_max_results(max_results)
+
+    if max_results <= SEARCH_PAGE_SIZE:
+        page = await search_page(
+            auth_header, base_url, jql, fields, expand, max_results
+        )
+        yield page.get("issues", [])[:max_results]
+        return
+
+    issue_ids = await search_issue_ids(auth_header, base_url, jql, max_results)
+    semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+
+    async def fetch_batch(batch):
+        async with semaphore:
+            return await bulk_fetch(auth_header, base_url, batch, fields, expand)
+
+    tasks = [
+        asyncio.create_task(fetch_batch(issue_ids[i : i + BULK_FETCH_SIZE]))
+        for i in range(0, len(issue_ids), BULK_FETCH_SIZE)
+    ]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+    logger.info(f"Searched {len(issue_ids)} Jira issues in {len(tasks)} batches")
@@ -118,6 +118,32 @@ def format_comment_body(body: str) -> Dict[str, Any]:
     }
 
 
+def format_issue_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Format the issue fields of a create/update payload from tool arguments."""
+    fields = {}
+    if data.get("project_key"):
+        fields["project"] = {"key": data["project_key"]}
+    if data.get("issue_type"):
+        fields["issuetype"] = {"name": data["issue_type"]}
+    if "summary" in data:
+        fields["summary"] = data["summary"]
+    if "description" in data:
+        fields["description"] = format_issue_description(data["description"])
+    if "assignee_account_id" in data:
+        fields["assignee"] = {"accountId": data["assignee_account_id"]}
+    if "priority" in data:
+        fields["priority"] = {"name": data["priority"]}
+    if "parent_key" in data:
+        fields["parent"] = {"key": data["parent_key"]}
+    if "story_points" in data:
+        fields["customfield_10016"] = data["story_points"]
+    if "labels" in data:
+        fields["labels"] = data["labels"]
+    # Raw Jira fields (e.g. custom fields) take precedence
+    fields.update(data.get("fields") or {})
+    return fields
+
+
 def format_project_payload(data: Dict[str, Any]) -> Dict[str, Any]:
     """Format project creation/update payload for JIRA API."""
     payload = {
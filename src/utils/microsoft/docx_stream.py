@@ -0,0 +1,280 @@
+"""
+Streaming helpers for Word (.docx) packages.
+
+A .docx file is a zip package in which only word/document.xml holds the body
+text. These helpers parse that single part and copy every other part (media,
+styles, fonts, ...) through in fixed-size chunks, so a document is never
+loaded into a python-docx Document or held in memory as a whole.
+"""
+
+import re
+import shutil
+import tempfile
+import zipfile
+from typing import IO, Tuple
+from xml.etree.ElementTree import Element, iterparse
+from xml.sax.saxutils import escape
+
+DOCUMENT_PART = "word/document.xml"
+MEDIA_PREFIX = "word/media/"
+
+# Packages smaller than this stay in memory, larger ones spill to disk
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024
+
+W_NAMESPACE_URI = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W_NAMESPACE = f"{{{W_NAMESPACE_URI}}}"
+# Namespace declarations binding a prefix (or the default namespace) to W_NAMESPACE_URI
+W_NAMESPACE_DECLARATION = re.compile(
+    rb"xmlns(?::([A-Za-z_][\w.-]*))?\s*=\s*[\"']"
+    + re.escape(W_NAMESPACE_URI.encode())
+    + rb"[\"']"
+)
+# Start, end and empty-element tags (name and quoted attributes); comments,
+# processing instructions and declarations do not match
+XML_TAG = re.compile(
+    rb"<(/?)([A-Za-z_][\w.:-]*)(?:\s+[^\s=/>]+\s*=\s*(?:\"[^\"]*\"|'[^']*'))*\s*(/?)>"
+)
+BODY_TAG = f"{W_NAMESPACE}body"
+PARAGRAPH_TAG = f"{W_NAMESPACE}p"
+HYPERLINK_TAG = f"{W_NAMESPACE}hyperlink"
+RUN_TAG = f"{W_NAMESPACE}r"
+TEXT_TAG = f"{W_NAMESPACE}t"
+TAB_TAGS = (f"{W_NAMESPACE}tab", f"{W_NAMESPACE}ptab")
+BREAK_TAG = f"{W_NAMESPACE}br"
+CARRIAGE_RETURN_TAG = f"{W_NAMESPACE}cr"
+NO_BREAK_HYPHEN_TAG = f"{W_NAMESPACE}noBreakHyphen"
+BREAK_TYPE_ATTRIBUTE = f"{W_NAMESPACE}type"
+
+
+def new_spooled_file() -> IO[bytes]:
+    """Create a temporary file that moves to disk once it outgrows SPOOL_MAX_MEMORY"""
+    return tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+
+
+def get_paragraph_text(paragraph: Element) -> str:
+    """
+    Get the text of a w:p element the same way python-docx's Paragraph.text does.
+
+    Args:
+        paragraph: The w:p element
+
+    Returns:
+        str: Text of the runs and hyperlinks directly inside the paragraph
+    """
+    parts = []
+
+    for child in paragraph:
+        if child.tag == RUN_TAG:
+            runs = [child]
+        elif child.tag == HYPERLINK_TAG:
+            runs = [run for run in child if run.tag == RUN_TAG]
+        else:
+            continue
+
+        for run in runs:
+            for item in run:
+                if item.tag == TEXT_TAG:
+                    parts.append(item.text or "")
+                elif item.tag in TAB_TAGS:
+                    parts.append("\t")
+                elif item.tag == CARRIAGE_RETURN_TAG:
+                    parts.append("\n")
+                elif item.tag == BREAK_TAG and item.get(BREAK_TYPE_ATTRIBUTE) in (
+                    None,
+                    "textWrapping",
+                ):
+                    parts.append("\n")
+                elif item.tag == NO_BREAK_HYPHEN_TAG:
+                    parts.append("-")
+
+    return "".join(parts)
+
+
+def extract_docx_text(docx_file: IO[bytes]) -> str:
+    """
+    Extract the text of the top-level body paragraphs of a .docx package.
+
+    word/document.xml is read with an incremental parser and every body
+    child is cleared once handled, so memory stays flat for long documents.
+    No other part of the package is read.
+
+    Args:
+        docx_file: Seekable binary file holding the .docx package
+
+    Returns:
+        str: Non-empty paragraphs joined by newlines
+    """
+    paragraphs = []
+
+    with zipfile.ZipFile(docx_file) as package:
+        with package.open(DOCUMENT_PART) as document_xml:
+            tag_stack = []
+            for event, element in iterparse(document_xml, events=("start", "end")):
+                if event == "start":
+                    tag_stack.append(element.tag)
+                    continue
+
+                tag_stack.pop()
+
+                # Only handle direct children of w:body (document > body > child)
+                if len(tag_stack) != 2 or tag_stack[-1] != BODY_TAG:
+                    continue
+
+                if element.tag == PARAGRAPH_TAG:
+                    text = get_paragraph_text(element)
+                    if text:
+                        paragraphs.append(text)
+
+                element.clear()
+
+    return "\n".join(paragraphs)
+
+
+def build_paragraph_xml(content: str, prefix: str = "w:") -> bytes:
+    """
+    Build a w:p element holding content, with newlines turned into w:br breaks.
+
+    prefix is the one bound to the WordprocessingML namespace in the document
+    the paragraph goes into ("w:" in documents written by Word, "" when it is
+    the default namespace).
+    """
+    text_elements = f"<{prefix}br/>".join(
+        f'<{prefix}t xml:space="preserve">{escape(line)}</{prefix}t>'
+        for line in content.split("\n")
+    )
+    return f"<{prefix}p><{prefix}r>{text_elements}</{prefix}r></{prefix}p>".encode(
+        "utf-8"
+    )
+
+
+def get_body_prefix(document_xml: bytes) -> str:
+    """
+    Get the prefix the body element of word/document.xml is written with.
+
+    Raises:
+        ValueError: When no body element of the WordprocessingML namespace is found
+    """
+    for match in W_NAMESPACE_DECLARATION.finditer(document_xml):
+        prefix = match.group(1)
+        prefix = f"{prefix.decode()}:" if prefix else ""
+        if f"</{prefix}body>".encode() in document_xml:
+            return prefix
+    raise ValueError(f"{DOCUMENT_PART} has no w:body element")
+
+
+def find_body_end(document_xml: bytes, prefix: bytes) -> Tuple[int, int, bytes]:
+    """
+    Locate the end of the body and its last direct child in word/document.xml.
+
+    Tags are walked with a depth counter from the body start tag, so elements
+    nested in body children (e.g. the w:sectPr inside the w:sectPrChange of a
+    tracked section change, or the one ending a paragraph) are not mistaken
+    for body-level ones.
+
+    Returns:
+        Tuple of the offsets of the body end tag and of the last direct child
+        start tag (-1 when the body is empty), and the last child's tag name
+
+    Raises:
+        ValueError: When the body element is not found or not closed
+    """
+    body_tag = prefix + b"body"
+    depth = None
+    last_child, last_child_tag = -1, b""
+    for match in XML_TAG.finditer(document_xml):
+        closing, name, self_closing = match.group(1, 2, 3)
+        if depth is None:
+            if name == body_tag and not closing:
+                depth = 0
+            continue
+        if closing:
+            if depth == 0:
+                return match.start(), last_child, last_child_tag
+            depth -= 1
+            continue
+        if depth == 0:
+            last_child, last_child_tag = match.start(), name
+        if not self_closing:
+            depth += 1
+    raise ValueError(f"{DOCUMENT_PART} has no complete w:body element")
+
+
+def insert_paragraph_xml(document_xml: bytes, content: str) -> bytes:
+    """
+    Insert a paragraph at the end of the body of word/document.xml.
+
+    The paragraph goes before the body-level w:sectPr when there is one, which
+    is where python-docx's add_paragraph puts it as well. Tags are written with
+    whichever prefix the document binds to the WordprocessingML namespace.
+
+    Args:
+        document_xml: Raw word/document.xml
+        content: Text of the new paragraph
+
+    Returns:
+        bytes: The updated word/document.xml
+    """
+    prefix = get_body_prefix(document_xml).encode()
+    body_end, last_child, last_child_tag = find_body_end(document_xml, prefix)
+
+    insert_at = body_end
+    if last_child_tag == prefix + b"sectPr":
+        insert_at = last_child
+
+    return (
+        document_xml[:insert_at]
+        + build_paragraph_xml(content, prefix.decode())
+        + document_xml[insert_at:]
+    )
+
+
+def copy_zip_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """
+    Create a fresh ZipInfo with the name, timestamp and attributes of an entry.
+
+    Media parts (images, video) are already compressed, so they are stored
+    as-is instead of being deflated again.
+    """
+    new_info = zipfile.ZipInfo(info.filename, info.date_time)
+    if info.filename.startswith(MEDIA_PREFIX):
+        new_info.compress_type = zipfile.ZIP_STORED
+    else:
+        new_info.compress_type = info.compress_type
+    new_info.external_attr = info.external_attr
+    new_info.create_system = info.create_system
+    new_info.file_size = info.file_size
+    return new_info
+
+
+def append_paragraph_to_docx(
+    source_file: IO[bytes], content: str, target_file: IO[bytes]
+) -> None:
+    """
+    Write a copy of a .docx package with a paragraph appended to its body.
+
+    Only word/document.xml is modified. All other entries, including media,
+    are streamed from source to target in COPY_CHUNK_SIZE chunks in their
+    original order.
+
+    Args:
+        source_file: Seekable binary file holding the original package
+        content: Text of the paragraph to append
+        target_file: Seekable binary file the updated package is written to
+    """
+    with zipfile.ZipFile(source_file) as source, zipfile.ZipFile(
+        target_file, "w"
+    ) as target:
+        if DOCUMENT_PART not in source.namelist():
+            raise ValueError(f"Package has no {DOCUMENT_PART} part")
+
+        for info in source.infolist():
+            if info.filename == DOCUMENT_PART:
+                document_xml = insert_paragraph_xml(source.read(info), content)
+                target.writestr(copy_zip_info(info), document_xml)
+                continue
+
+            with source.open(info) as source_part, target.open(
+                copy_zip_info(info), "w"
+            ) as target_part:
+                shutil.copyfileobj(source_part, target_part, COPY_CHUNK_SIZE)
@@ -0,0 +1,137 @@
+import asyncio
+import inspect
+import logging
+from contextlib import aclosing
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+# A page is the list of items it holds and the cursor of the next page (None on the last page)
+Page = Tuple[List[Any], Optional[Any]]
+FetchPage = Callable[[Optional[Any]], Union[Page, Awaitable[Page]]]
+
+
+async def fetch_page_async(fetch_page: FetchPage, cursor: Optional[Any]) -> Page:
+    """
+    Fetch one page, running blocking fetchers in a worker thread.
+
+    Args:
+        fetch_page: Coroutine function or plain function taking a cursor
+        cursor: Cursor of the page to fetch (None for the first page)
+
+    Returns:
+        Page: Items of the page and the cursor of the next page
+    """
+    if inspect.iscoroutinefunction(fetch_page):
+        return await fetch_page(cursor)
+    return await asyncio.to_thread(fetch_page, cursor)
+
+
+async def paginate(
+    fetch_page: FetchPage,
+    cursor: Optional[Any] = None,
+    max_items: Optional[int] = None,
+    prefetch: bool = True,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over the items of a cursor-paginated listing.
+
+    While the items of page N are being consumed, page N+1 is already being
+    fetched. Once max_items items have been yielded, no further page is
+    requested and any in-flight prefetch is cancelled.
+
+    Use with contextlib.aclosing (or the collect helper) when the loop may
+    stop early, so the prefetch is cancelled immediately.
+
+    Args:
+        fetch_page: Function taking a cursor and returning (items, next_cursor).
+            Blocking functions (e.g. SDK calls) are run in a worker thread.
+        cursor: Cursor of the first page (None to start from the beginning)
+        max_items: Maximum number of items to yield (None for no limit)
+        prefetch: Whether to fetch the next page while the current one is consumed
+
+    Yields:
+        Items of every page, in order
+    """
+    if max_items is not None and max_items <= 0:
+        return
+
+    yielded = 0
+    pending = asyncio.ensure_future(fetch_page_async(fetch_page, cursor))
+
+    try:
+        while pending is not None:
+            items, next_cursor = await pending
+            pending = None
+
+            remaining = None if max_items is None else max_items - yielded
+            needs_next_page = bool(next_cursor) and (
+                remaining is None or len(items) < remaining
+            )
+
+            if needs_next_page and prefetch:
+                pending = asyncio.ensure_future(
+                    fetch_page_async(fetch_page, next_cursor)
+                )
+
+            for item in items:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+
+            if needs_next_page and not prefetch:
+                pending = asyncio.ensure_future(
+                    fetch_page_async(fetch_page, next_cursor)
+                )
+
+    finally:
+        if pending is not None:
+            if pending.done():
+                # Retrieve the result so a failed prefetch is not reported as unhandled
+                if not pending.cancelled() and pending.exception():
+                    logger.debug(f"Discarded failed prefetch: {pending.exception()}")
+            else:
+                pending.cancel()
+
+
+async def collect(
+    fetch_page: FetchPage,
+    cursor: Optional[Any] = None,
+    max_items: Optional[int] = None,
+    prefetch: bool = True,
+) -> List[Any]:
+    """
+    Collect the items of a cursor-paginated listing into a list.
+
+    Takes the same arguments as paginate.
+
+    Returns:
+        List[Any]: Up to max_items items
+    """
+    async with aclosing(paginate(fetch_page, cursor, max_items, prefetch)) as items:
+        return [item async for item in items]
+
+
+def graph_next_link(result: dict) -> Optional[str]:
+    """Cursor of the next page of a Microsoft Graph response"""
+    return result.get("@odata.nextLink")
+
+
+def slack_next_cursor(response: Any) -> Optional[str]:
+    """Cursor of the next page of a Slack Web API response"""
+    return response.get("response_metadata", {}).get("next_cursor") or None
+
+
+def hubspot_next_after(result: dict) -> Optional[str]:
+    """Cursor of the next page of a HubSpot CRM v3 response"""
+    return result.get("paging", {}).get("next", {}).get("after")
@@ -0,0 +1,114 @@
+"""
+PostHog API access for the PostHog server.
+
+Requests go through the shared httpx connection pool. The projects of the
+organization an API key belongs to (with their IDs and project API tokens)
+are cached per key, so tool calls do not look them up again with a request
+each. A different key gets its own entry, and entries are refetched after
+PROJECT_CACHE_TTL.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from src.utils.http.util import get_http_client
+from src.utils.rate_limit.util import get_credential_key, governed_request
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "posthog"
+# Private API (personal API key) and ingestion API (project API token)
+POSTHOG_API_HOST = "https://us.posthog.com"
+POSTHOG_INGEST_HOST = "https://us.i.posthog.com"
+# Seconds before the projects of a key are fetched again (projects may be added)
+PROJECT_CACHE_TTL = 600
+# Maximum API keys whose projects are kept
+PROJECT_CACHE_MAX_ENTRIES = 1024
+
+
+async def posthog_request(
+    credential: Optional[str], method: str, url: str, **kwargs: Any
+) -> httpx.Response:
+    """
+    Send a request to the PostHog API on the shared connection pool.
+
+    Args:
+        credential: API key or project API token the request is made with
+        method: HTTP method
+        url: Absolute URL of the request
+        **kwargs: Extra httpx request arguments (params, json, headers, ...)
+
+    Returns:
+        httpx.Response: The response
+    """
+    client = get_http_client(SERVICE_NAME)
+    send = partial(client.request, method, url, **kwargs)
+    return await governed_request(SERVICE_NAME, credential, send)
+
+
+class ProjectCacheEntry:
+    """Projects of the organization of one API key"""
+
+    def __init__(self):
+        self.projects: Optional[List[Dict[str, Any]]] = None
+        self.fetched_at: Optional[float] = None
+        self.lock = asyncio.Lock()
+
+    def stale(self) -> bool:
+        return (
+            self.fetched_at is None
+            or time.monotonic() - self.fetched_at > PROJECT_CACHE_TTL
+        )
+
+
+# Projects by API key
+_project_cache: "OrderedDict[str, ProjectCacheEntry]" = OrderedDict()
+
+
+def get_project_entry(api_key: str) -> ProjectCacheEntry:
+    key = get_credential_key(api_key)
+    entry = _project_cache.get(key)
+    if entry is None:
+        entry = _project_cache[key] = ProjectCacheEntry()
+        while len(_project_cache) > PROJECT_CACHE_MAX_ENTRIES:
+            _project_cache.popitem(last=False)
+    _project_cache.move_to_end(key)
+    return entry
+
+
+async def get_projects(api_key: str) -> List[Dict[str, Any]]:
+    """
+    Get the projects (teams) of the API key's current organization.
+
+    Args:
+        api_key: Personal API key
+
+    Returns:
+        List: Projects (id, name, api_token, ...)
+
+    Raises:
+        ValueError: When the organization cannot be fetched
+    """
+    entry = get_project_entry(api_key)
+    async with entry.lock:
+        if entry.stale():
+            try:
+                response = await posthog_request(
+                    api_key,
+                    "GET",
+                    f"{POSTHOG_API_HOST}/api/organizations/@current/",
+                    headers={"Authorization": f"Bearer {api_key}"},
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to get project details: {str(e)}")
+                raise ValueError(f"Failed to get project details: {str(e)}")
+            entry.projects = response.json()["teams"]
+            entry.fetched_at = time.monotonic()
+    return entry.projects
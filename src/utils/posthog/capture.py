@@ -0,0 +1,230 @@
+"""
+Buffered event capture for the PostHog server.
+
+Events are queued in-process per project API token and sent to the /batch/
+endpoint, BATCH_SIZE events per request, instead of one /capture/ request
+per event. A batch is sent once it is full or FLUSH_INTERVAL after its
+first event was queued, with up to SEND_CONCURRENCY batches in flight.
+The queue holds at most MAX_QUEUE_SIZE events: callers queuing more wait
+until batches have been sent. Queued events are flushed by a shutdown hook
+when the server shuts down.
+"""
+
+import asyncio
+import logging
+import uuid
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+from prometheus_client import Counter
+
+from src.utils.http.util import register_shutdown_hook
+from src.utils.posthog.api import POSTHOG_INGEST_HOST, posthog_request
+from src.utils.rate_limit.util import (
+    PRIORITY_BULK,
+    get_credential_key,
+    request_priority,
+)
+
+logger = logging.getLogger(__name__)
+
+# Events per /batch/ request, and batches in flight per project
+BATCH_SIZE = 100
+SEND_CONCURRENCY = 4
+# Seconds an event waits in the queue for its batch to fill
+FLUSH_INTERVAL = 1.0
+# Events queued per project before callers wait (backpressure)
+MAX_QUEUE_SIZE = 10000
+# Events accepted by one capture_events call
+MAX_CAPTURE_EVENTS = 5000
+# Attempts of a batch failing with a server or network error
+MAX_SEND_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+
+posthog_captured_events_total = Counter(
+    "gumcp_posthog_captured_events_total",
+    "Events sent to PostHog in batches by result",
+    ["result"],
+)
+
+# Queue marker making the worker send its batch without waiting
+_FLUSH = object()
+
+
+class CapturedEvent:
+    """A queued event and the future resolved once its batch is sent"""
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.payload = payload
+        self.result: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+def build_event(
+    event: str,
+    distinct_id: str,
+    properties: Optional[Dict[str, Any]] = None,
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build a /batch/ event.
+
+    The timestamp is set when the event is queued so it does not shift while
+    the event waits for its batch, and the uuid lets PostHog deduplicate
+    events of a retried batch.
+    """
+    return {
+        "event": event,
+        "distinct_id": distinct_id,
+        "properties": properties or {},
+        "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+        "uuid": str(uuid.uuid4()),
+    }
+
+
+class EventBuffer:
+    """Queue of the events of one project, sent by a background worker"""
+
+    def __init__(self, project_api_token: str, host: Optional[str] = None):
+        self.project_api_token = project_api_token
+        self.url = f"{host or POSTHOG_INGEST_HOST}/batch/"
+        self.queue: asyncio.Queue = asyncio.Queue(MAX_QUEUE_SIZE)
+        self.semaphore = asyncio.Semaphore(SEND_CONCURRENCY)
+        # Batches being sent (referenced so the tasks are not collected)
+        self.sends: set = set()
+        self.worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(self.run())
+
+    async def put(
+        self, payloads: List[Dict[str, Any]], flush: bool = False
+    ) -> List[asyncio.Future]:
+        """
+        Queue events, waiting while the queue is full.
+
+        Args:
+            payloads: Events built with build_event
+            flush: Send the events' last batch without waiting FLUSH_INTERVAL
+
+        Returns:
+            List: A future per event, resolved with None once it is sent or
+            with the error message when its batch failed
+        """
+        self.start()
+        results = []
+        for payload in payloads:
+            captured = CapturedEvent(payload)
+            await self.queue.put(captured)
+            results.append(captured.result)
+        if flush:
+            await self.queue.put(_FLUSH)
+        return results
+
+    async def flush(self) -> None:
+        """Send every queued event now and wait until they are sent"""
+        if self.worker is None:
+            return
+        await self.queue.put(_FLUSH)
+        # Events are marked done once their batch has been sent
+        await self.queue.join()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+
+    async def next_batch(self) -> List[CapturedEvent]:
+        """Wait for a full batch, the flush interval or a flush marker"""
+        loop = asyncio.get_running_loop()
+        batch = []
+        item = await self.queue.get()
+        deadline = loop.time() + FLUSH_INTERVAL
+        while item is not _FLUSH:
+            batch.append(item)
+            if len(batch) >= BATCH_SIZE:
+                break
+            try:
+                item = await asyncio.wait_for(
+                    self.queue.get(), max(0, deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                break
+        else:
+            self.queue.task_done()
+        return batch
+
+    async def run(self) -> None:
+        while True:
+            batch = await self.next_batch()
+            if not batch:
+                continue
+            await self.semaphore.acquire()
+            task = asyncio.create_task(self.send(batch))
+            self.sends.add(task)
+            task.add_done_callback(self.sends.discard)
+
+    async def send(self, batch: List[CapturedEvent]) -> None:
+        """Send a batch, retrying server and network errors"""
+        error = "Events were not sent"
+        try:
+            body = {
+                "api_key": self.project_api_token,
+                "batch": [captured.payload for captured in batch],
+            }
+            for attempt in range(MAX_SEND_ATTEMPTS):
+                if attempt:
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+                try:
+                    # Batches queue behind the requests of interactive tool calls
+                    with request_priority(PRIORITY_BULK):
+                        response = await posthog_request(
+                            self.project_api_token, "POST", self.url, json=body
+                        )
+                except httpx.HTTPError as e:
+                    error = f"Failed to send events: {str(e)}"
+                    continue
+                if response.status_code == 200:
+                    error = None
+                    break
+                error = f"Failed to send events: {response.status_code} {response.text}"
+                if response.status_code < 500:
+                    break
+        finally:
+            if error:
+                logger.error(f"{error} ({len(batch)} events dropped)")
+            posthog_captured_events_total.labels(
+                result="failed" if error else "sent"
+            ).inc(len(batch))
+            for captured in batch:
+                if not captured.result.done():
+                    captured.result.set_result(error)
+                self.queue.task_done()
+            self.semaphore.release()
+
+
+# Buffers by event loop and project API token. Queues and tasks are bound to
+# the loop they were created on, so each loop gets its own buffers.
+_buffers = weakref.WeakKeyDictionary()
+
+
+def get_event_buffer(project_api_token: str) -> EventBuffer:
+    """Get the event buffer of a project, shared by every session on the loop"""
+    buffers = _buffers.setdefault(asyncio.get_running_loop(), {})
+    key = get_credential_key(project_api_token)
+    if key not in buffers:
+        buffers[key] = EventBuffer(project_api_token)
+    return buffers[key]
+
+
+async def close_event_buffers() -> None:
+    """Send the queued events of the running event loop and stop the workers"""
+    buffers = _buffers.pop(asyncio.get_running_loop(), {})
+    for buffer in buffers.values():
+        await buffer.close()
+
+
+register_shutdown_hook(close_event_buffers)
@@ -1,26 +1,10 @@
 import os
 import logging
-import requests
 from src.auth.factory import create_auth_client
 
 logger = logging.getLogger(__name__)
 
 
-def get_project_details(api_key: str):
-    """Get all projects and their details"""
-    headers = {"Authorization": f"Bearer {api_key}"}
-    try:
-        org_response = requests.get(
-            "https://us.posthog.com/api/organizations/@current/", headers=headers
-        )
-        org_response.raise_for_status()
-        org_data = org_response.json()
-        return org_data["teams"]
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to get project details: {str(e)}")
-        raise ValueError(f"Failed to get project details: {str(e)}")
-
-
 def authenticate_and_save_posthog_key(user_id: str, service_name: str):
     """Authenticate with PostHog and save API key"""
     logger.info("Starting PostHog authentication for user %s...", user_id)
@@ -0,0 +1,489 @@
+import asyncio
+import functools
+import hashlib
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import aiohttp
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Lower values are served first: bulk work (see bulk_tool_calls) queues
+# behind the requests of interactive tool calls
+PRIORITY_DEFAULT = 5
+PRIORITY_BULK = 10
+
+# Documented or observed quotas: (requests, per seconds). Buckets start full and
+# are corrected by the rate limit headers each provider returns.
+PROVIDER_LIMITS: Dict[str, Tuple[int, float]] = {
+    "airtable": (5, 1),
+    "github": (5000, 3600),
+    "hubspot": (100, 10),
+}
+
+# Seconds to back off after a 429 that carries no Retry-After header
+DEFAULT_RETRY_AFTER: Dict[str, float] = {
+    "airtable": 30,
+}
+FALLBACK_RETRY_AFTER = 1.0
+
+# Default number of requests a fan-out keeps in flight at once
+DEFAULT_CONCURRENCY = 8
+
+# Priority of the governed requests sent by the current task
+_request_priority: ContextVar[int] = ContextVar(
+    "request_priority", default=PRIORITY_DEFAULT
+)
+
+rate_limit_wait_seconds = Histogram(
+    "gumcp_rate_limit_wait_seconds",
+    "Time requests spent queued by the rate limit governor",
+    ["provider"],
+)
+rate_limit_throttled_total = Counter(
+    "gumcp_rate_limit_throttled_total",
+    "Number of 429 responses received from upstream providers",
+    ["provider"],
+)
+rate_limit_queued = Gauge(
+    "gumcp_rate_limit_queued",
+    "Number of requests waiting for a rate limit token",
+    ["provider"],
+)
+
+
+class RateLimitError(Exception):
+    """Raised when an upstream provider rejects a request with HTTP 429"""
+
+    def __init__(self, provider: str, retry_after: Optional[float] = None):
+        self.provider = provider
+        self.retry_after = retry_after
+        super().__init__(
+            f"{provider} rate limit exceeded"
+            + (f", retry after {retry_after:.1f}s" if retry_after else "")
+        )
+
+
+class TokenBucket:
+    """
+    Token bucket for one (provider, credential) pair.
+
+    Requests wait in a priority queue and only the head of the queue may take
+    a token, so bulk work cannot starve interactive calls. Rate limit headers
+    and Retry-After values from responses pause the bucket until the
+    provider's window resets.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        capacity: Optional[int] = None,
+        per_seconds: Optional[float] = None,
+    ):
+        self.provider = provider
+        self.capacity = capacity
+        self.refill_rate = capacity / per_seconds if capacity else None
+        self.tokens = float(capacity) if capacity else None
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._loop = None
+        self._condition = None
+        self._waiters = []
+        self._sequence = itertools.count()
+
+    def _refill(self, now: float) -> None:
+        if self.capacity is not None:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate
+            )
+        self.updated_at = now
+
+    def _delay(self, now: float) -> float:
+        """Seconds until a token can be taken"""
+        delay = max(0.0, self.blocked_until - now)
+        if self.capacity is not None and self.tokens < 1:
+            delay = max(delay, (1 - self.tokens) / self.refill_rate)
+        return delay
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Conditions belong to one event loop; start a fresh queue on a new loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._waiters = []
+        return self._condition
+
+    async def acquire(self, priority: int = PRIORITY_DEFAULT) -> float:
+        """
+        Wait for a token.
+
+        Args:
+            priority: Queue priority, lower values are served first
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        condition = self._get_condition()
+        entry = (priority, next(self._sequence))
+        started = time.monotonic()
+
+        async with condition:
+            heapq.heappush(self._waiters, entry)
+            rate_limit_queued.labels(provider=self.provider).inc()
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+
+                    # Only the head of the queue may take a token
+                    delay = self._delay(now) if self._waiters[0] == entry else None
+                    if delay is not None and delay <= 0:
+                        break
+
+                    try:
+                        await asyncio.wait_for(condition.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                rate_limit_queued.labels(provider=self.provider).dec()
+                condition.notify_all()
+
+            if self.tokens is not None:
+                self.tokens -= 1
+
+        waited = time.monotonic() - started
+        rate_limit_wait_seconds.labels(provider=self.provider).observe(waited)
+        return waited
+
+    def update(self, status_code: int, headers: Optional[Mapping[str, Any]]) -> None:
+        """
+        Apply the rate limit information of a response.
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers
+        """
+        headers = {str(k).lower(): v for k, v in (headers or {}).items()}
+        now = time.monotonic()
+        self._refill(now)
+
+        remaining, reset_after = parse_rate_limit_headers(headers)
+        if remaining is not None and self.tokens is not None:
+            self.tokens = min(self.tokens, float(remaining))
+        if remaining == 0 and reset_after:
+            self.blocked_until = max(self.blocked_until, now + reset_after)
+
+        if status_code == 429:
+            rate_limit_throttled_total.labels(provider=self.provider).inc()
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            if retry_after is None:
+                retry_after = reset_after or DEFAULT_RETRY_AFTER.get(
+                    self.provider, FALLBACK_RETRY_AFTER
+                )
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            if self.tokens is not None:
+                self.tokens = min(self.tokens, 0.0)
+            logger.warning(
+                f"{self.provider} rate limited, pausing requests for {retry_after:.1f}s"
+            )
+
+    def retry_after(self) -> float:
+        """Seconds until the bucket is unblocked"""
+        return max(0.0, self.blocked_until - time.monotonic())
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, Any],
+) -> Tuple[Optional[int], Optional[float]]:
+    """
+    Read remaining quota and time to reset from lower-cased response headers.
+
+    Understands X-RateLimit-* (GitHub and others, reset as epoch seconds),
+    RateLimit-* (IETF draft, reset as delta seconds) and the
+    X-HubSpot-RateLimit-* headers.
+
+    Returns:
+        Tuple: Remaining requests and seconds until the window resets
+    """
+    for prefix in ("x-ratelimit-", "ratelimit-", "x-hubspot-ratelimit-"):
+        remaining = headers.get(f"{prefix}remaining")
+        if remaining is None:
+            continue
+
+        try:
+            remaining = int(float(remaining))
+        except ValueError:
+            return None, None
+
+        reset_after = None
+        if f"{prefix}reset" in headers:
+            try:
+                reset = float(headers[f"{prefix}reset"])
+                # Large values are epoch timestamps, small ones are deltas
+                reset_after = reset - time.time() if reset > 1e9 else reset
+            except ValueError:
+                pass
+        elif f"{prefix}interval-milliseconds" in headers:
+            try:
+                reset_after = float(headers[f"{prefix}interval-milliseconds"]) / 1000
+            except ValueError:
+                pass
+
+        if reset_after is not None:
+            reset_after = max(0.0, reset_after)
+        return remaining, reset_after
+
+    return None, None
+
+
+# Buckets are shared by every session of the process
+_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+
+
+def get_credential_key(credential: Optional[str]) -> str:
+    """Hash a credential so tokens are never kept as dictionary keys"""
+    return hashlib.sha256((credential or "").encode("utf-8")).hexdigest()[:16]
+
+
+def get_bucket(provider: str, credential: Optional[str]) -> TokenBucket:
+    """
+    Get the token bucket of a provider and credential.
+
+    Args:
+        provider: Provider name, a key of PROVIDER_LIMITS for known quotas
+        credential: Token or API key the requests are made with
+
+    Returns:
+        TokenBucket: Bucket shared by all sessions using that credential
+    """
+    key = (provider, get_credential_key(credential))
+    if key not in _buckets:
+        capacity, per_seconds = PROVIDER_LIMITS.get(provider, (None, None))
+        _buckets[key] = TokenBucket(provider, capacity, per_seconds)
+    return _buckets[key]
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Queue the governed requests sent inside the block with a priority"""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def get_request_priority(priority: Optional[int] = None) -> int:
+    """The given priority, or the one set by request_priority"""
+    return _request_priority.get() if priority is None else priority
+
+
+def bulk_tool_calls(tool_names: Iterable[str]):
+    """
+    Decorate a call_tool handler so bulk tools queue behind interactive calls.
+
+    Use it below @server.call_tool():
+
+        @server.call_tool()
+        @bulk_tool_calls(BULK_TOOLS)
+        async def handle_call_tool(name, arguments): ...
+
+    Governed requests sent while one of the named tools runs wait at
+    PRIORITY_BULK, so a long batch or export does not hold up the requests
+    of other tool calls sharing the credential.
+
+    Args:
+        tool_names: Tools that send many requests (batch, bulk, stream, export)
+    """
+    tool_names = frozenset(tool_names)
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(name: str, arguments: dict | None):
+            if name not in tool_names:
+                return await handler(name, arguments)
+            with request_priority(PRIORITY_BULK):
+                return await handler(name, arguments)
+
+        return wrapper
+
+    return decorator
+
+
+async def acquire(
+    provider: str, credential: Optional[str], priority: Optional[int] = None
+) -> float:
+    """Wait for a token of a provider and credential, returning the seconds waited"""
+    return await get_bucket(provider, credential).acquire(
+        get_request_priority(priority)
+    )
+
+
+def record_response(
+    provider: str,
+    credential: Optional[str],
+    status_code: int,
+    headers: Optional[Mapping[str, Any]],
+) -> None:
+    """Feed the status and rate limit headers of a response to its bucket"""
+    get_bucket(provider, credential).update(status_code, headers)
+
+
+def get_status_code(response: Any) -> int:
+    """Status code of a requests, httpx or aiohttp response"""
+    status_code = getattr(response, "status_code", None)
+    if status_code is None:
+        status_code = getattr(response, "status", 0)
+    return status_code
+
+
+async def governed_request(
+    provider: str,
+    credential: Optional[str],
+    send: Callable[[], Union[Any, Awaitable[Any]]],
+    priority: Optional[int] = None,
+    max_retries: int = 2,
+) -> Any:
+    """
+    Send a request through the rate limit governor.
+
+    Waits for a token, sends the request, feeds the response headers back to
+    the bucket and retries 429 responses once the provider's Retry-After has
+    passed. Blocking senders (e.g. requests) run in a worker thread.
+
+    Args:
+        provider: Provider name
+        credential: Token or API key the request is made with
+        send: Function sending the request and returning the response
+        priority: Queue priority, lower values are served first (the one set
+            by request_priority when None)
+        max_retries: Number of times a 429 response is retried
+
+    Returns:
+        The response of the last attempt
+    """
+    bucket = get_bucket(provider, credential)
+    priority = get_request_priority(priority)
+
+    for attempt in range(max_retries + 1):
+        await bucket.acquire(priority)
+
+        if inspect.iscoroutinefunction(send):
+            response = await send()
+        else:
+            response = await asyncio.to_thread(send)
+
+        status_code = get_status_code(response)
+        bucket.update(status_code, getattr(response, "headers", None))
+
+        if status_code != 429 or attempt == max_retries:
+            return response
+
+        logger.info(
+            f"Retrying {provider} request after 429 (attempt {attempt + 1}/{max_retries})"
+        )
+
+    return response
+
+
+def create_aiohttp_trace_config(
+    provider: str, credential: Optional[str], priority: Optional[int] = None
+) -> aiohttp.TraceConfig:
+    """
+    Create an aiohttp trace config that governs every request of a session.
+
+    Each request waits for a token before it is sent and its response headers
+    are fed back to the bucket. 429 responses are released and raised as
+    RateLimitError so callers can retry them.
+
+    Args:
+        provider: Provider name
+        credential: Token or API key the session is authenticated with
+        priority: Queue priority, lower values are served first (the one set
+            by request_priority for the request when None)
+
+    Returns:
+        aiohttp.TraceConfig: Pass in ClientSession(trace_configs=[...])
+    """
+    bucket = get_bucket(provider, credential)
+
+    async def on_request_start(session, context, params):
+        await bucket.acquire(get_request_priority(priority))
+
+    async def on_request_end(session, context, params):
+        bucket.update(params.response.status, params.response.headers)
+        if params.response.status == 429:
+            params.response.release()
+            raise RateLimitError(provider, bucket.retry_after())
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[Any]],
+    limit: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Run awaitables concurrently with at most limit of them in flight.
+
+    Used for per-item fan-out (one request per message, member, ID, ...) so
+    a long list does not open hundreds of connections at once.
+
+    Args:
+        aws: Awaitables to run
+        limit: Maximum number of awaitables running at the same time
+        return_exceptions: Return exceptions as results instead of raising the first one
+
+    Returns:
+        List: Results in the order of aws
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
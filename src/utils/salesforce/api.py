@@ -0,0 +1,137 @@
+"""
+Salesforce REST API access for the Salesforce server.
+
+Async requests go through the shared httpx connection pool and the rate
+limit governor instead of simple_salesforce's blocking requests session.
+The simple_salesforce sessions still used by the other tools are kept per
+user, so their connections are reused across tool calls.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from simple_salesforce import Salesforce
+
+from src.utils.http.util import get_http_client
+from src.utils.rate_limit.util import get_credential_key, governed_request
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "salesforce"
+# REST API version of the requests (simple_salesforce's default)
+SALESFORCE_API_VERSION = "59.0"
+# Maximum simple_salesforce sessions kept (one per user)
+MAX_SESSIONS = 256
+
+
+class SalesforceAPIError(Exception):
+    """Raised when a Salesforce API request returns an error status"""
+
+    def __init__(self, status_code: int, details: Any):
+        self.status_code = status_code
+        self.details = details
+        super().__init__(f"Status {status_code}: {details}")
+
+
+def api_url(token: Dict[str, Any], path: str) -> str:
+    """Absolute URL of a REST API path (e.g. jobs/query) of the token's org"""
+    if path.startswith("https://"):
+        return path
+    instance_url = token["instance_url"].rstrip("/")
+    return f"{instance_url}/services/data/v{SALESFORCE_API_VERSION}/{path.lstrip('/')}"
+
+
+async def salesforce_api_request(
+    token: Dict[str, Any], method: str, path: str, stream: bool = False, **kwargs: Any
+) -> httpx.Response:
+    """
+    Send a request to the Salesforce REST API on the shared connection pool.
+
+    Args:
+        token: Salesforce credentials (access_token and instance_url)
+        method: HTTP method
+        path: REST API path relative to /services/data/vXX.X/, or an absolute URL
+        stream: Return before the body is read; the caller must close the response
+        **kwargs: Extra httpx request arguments (params, json, content, headers, ...)
+
+    Returns:
+        httpx.Response: The response
+    """
+    client = get_http_client(SERVICE_NAME)
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+    headers.update(kwargs.pop("headers", None) or {})
+    request = client.build_request(
+        method, api_url(token, path), headers=headers, **kwargs
+    )
+    send = partial(client.send, request, stream=stream)
+    return await governed_request(SERVICE_NAME, token["access_token"], send)
+
+
+def get_error_details(response: httpx.Response) -> Any:
+    """Get the body of an error response (Salesforce returns a list of errors)"""
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+async def salesforce_json(
+    token: Dict[str, Any], method: str, path: str, **kwargs: Any
+) -> Optional[Any]:
+    """
+    Send a REST API request and return its JSON body.
+
+    Raises:
+        SalesforceAPIError: When the response has an error status
+    """
+    response = await salesforce_api_request(token, method, path, **kwargs)
+    if response.status_code >= 400:
+        raise SalesforceAPIError(response.status_code, get_error_details(response))
+    if not response.content:
+        return None
+    return response.json()
+
+
+# simple_salesforce sessions by user, with the token they were created with
+_sessions: "OrderedDict[str, Tuple[str, str, Salesforce]]" = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def get_salesforce_client(user_key: str, token: Dict[str, Any]) -> Salesforce:
+    """
+    Get the user's simple_salesforce session, reusing it across tool calls.
+
+    The session (and its pooled HTTP connections) is replaced when the
+    user's token is refreshed or the instance URL changes.
+
+    Args:
+        user_key: Identifies the user (e.g. user ID and API key)
+        token: Salesforce credentials (access_token and instance_url)
+
+    Returns:
+        Salesforce: The authenticated session
+    """
+    key = get_credential_key(user_key)
+    access_token, instance_url = token["access_token"], token["instance_url"]
+    with _sessions_lock:
+        cached = _sessions.get(key)
+        if cached and cached[:2] == (access_token, instance_url):
+            _sessions.move_to_end(key)
+            return cached[2]
+
+        client = Salesforce(
+            instance_url=instance_url,
+            session_id=access_token,
+            version=SALESFORCE_API_VERSION,
+        )
+        _sessions[key] = (access_token, instance_url, client)
+        _sessions.move_to_end(key)
+        while len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+    if cached:
+        cached[2].session.close()
+    return client
@@ -0,0 +1,406 @@
+"""
+Bulk API 2.0 jobs and sObject Collections for the Salesforce server.
+
+Bulk query results are downloaded one page at a time and parsed as the CSV
+arrives, so a large result is written straight into compact CSV or NDJSON
+chunks instead of being held as a list of records. A capped result can be
+continued from the Sforce-Locator of the last page read.
+
+Multi-record creates and updates go through sObject Collections, which
+take up to 200 records per request.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from src.utils.rate_limit.util import gather_bounded
+from src.utils.salesforce.api import (
+    SalesforceAPIError,
+    get_error_details,
+    salesforce_api_request,
+    salesforce_json,
+)
+from src.utils.streaming.util import (
+    DEFAULT_CHUNK_ROWS,
+    RecordChunkWriter,
+    report_progress,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default and maximum rows returned by one results call
+DEFAULT_MAX_ROWS = 10000
+MAX_ROWS = 50000
+# Default and maximum size of the rows returned by one results call
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+MAX_BYTES = 16 * 1024 * 1024
+# Records requested per results page (maxRecords), and by the first page,
+# which measures the row size before larger pages are sized to the byte cap
+RESULT_PAGE_SIZE = 10000
+PROBE_PAGE_SIZE = 200
+# Seconds between job status checks, and the longest a tool call waits
+JOB_POLL_INTERVAL = 2
+MAX_JOB_WAIT_SECONDS = 120
+JOB_FINAL_STATES = ("JobComplete", "Failed", "Aborted")
+# Records accepted by one bulk_ingest call (the CSV is uploaded in one batch)
+MAX_INGEST_RECORDS = 100000
+INGEST_OPERATIONS = ("insert", "update", "upsert", "delete", "hardDelete")
+# Bulk API 2.0 sets fields to null with #N/A
+CSV_NULL = "#N/A"
+# sObject Collections accept 200 records per request
+COLLECTION_SIZE = 200
+COLLECTION_CONCURRENCY = 4
+MAX_COLLECTION_RECORDS = 10000
+
+
+async def iter_csv_records(response: httpx.Response) -> AsyncIterator[Dict[str, str]]:
+    """
+    Parse a streamed CSV response into records as the body arrives.
+
+    Only the current network chunk and the record being parsed are held;
+    quoted fields spanning several lines are joined before parsing.
+    """
+    columns = None
+    buffer = ""
+    pending = ""
+    quotes = 0
+
+    async def lines():
+        nonlocal buffer
+        async for text in response.aiter_text():
+            buffer += text
+            *complete, buffer = buffer.split("\n")
+            for line in complete:
+                yield line + "\n"
+        if buffer:
+            yield buffer
+
+    async for line in lines():
+        pending += line
+        quotes += line.count('"')
+        if quotes % 2:
+            # The line break is inside a quoted field
+            continue
+        row = next(csv.reader([pending]), None)
+        pending = ""
+        quotes = 0
+        if not row:
+            continue
+        if columns is None:
+            columns = row
+            continue
+        yield dict(zip(columns, row))
+
+
+async def create_query_job(
+    token: Dict[str, Any], query: str, include_deleted: bool = False
+) -> Dict[str, Any]:
+    """Create a Bulk API 2.0 query job"""
+    return await salesforce_json(
+        token,
+        "POST",
+        "jobs/query",
+        json={
+            "operation": "queryAll" if include_deleted else "query",
+            "query": query,
+            "contentType": "CSV",
+            "columnDelimiter": "COMMA",
+            "lineEnding": "LF",
+        },
+    )
+
+
+async def get_job(token: Dict[str, Any], job_type: str, job_id: str) -> Dict[str, Any]:
+    """Get the status of a query or ingest job (job_type is "query" or "ingest")"""
+    return await salesforce_json(token, "GET", f"jobs/{job_type}/{job_id}")
+
+
+async def wait_for_job(
+    token: Dict[str, Any], job_type: str, job_id: str, wait_seconds: float
+) -> Dict[str, Any]:
+    """Poll a job until it reaches a final state or wait_seconds pass"""
+    deadline = time.monotonic() + min(wait_seconds, MAX_JOB_WAIT_SECONDS)
+    while True:
+        job = await get_job(token, job_type, job_id)
+        if job.get("state") in JOB_FINAL_STATES or time.monotonic() >= deadline:
+            return job
+        await asyncio.sleep(JOB_POLL_INTERVAL)
+
+
+async def stream_query_results(
+    token: Dict[str, Any],
+    job_id: str,
+    locator: Optional[str] = None,
+    output_format: str = "csv",
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Download the results of a completed query job into CSV or NDJSON chunks.
+
+    Results are requested a page at a time. A small first page measures the
+    row size, and later pages are sized so both the row cap and the byte cap
+    fall on a page boundary, so the returned locator always continues
+    exactly after the last row.
+
+    Args:
+        token: Salesforce credentials
+        job_id: ID of a query job in the JobComplete state
+        locator: Sforce-Locator to continue from (None for the first page)
+        output_format: "csv" or "ndjson"
+        max_rows: Maximum rows to return (capped at MAX_ROWS)
+        max_bytes: Approximate maximum size of the returned rows (capped at MAX_BYTES)
+        chunk_rows: Rows per chunk
+
+    Returns:
+        Tuple of a summary (job ID, counts and the locator to continue from
+        when rows remain) and the text chunks
+    """
+    max_rows = min(max_rows or DEFAULT_MAX_ROWS, MAX_ROWS)
+    max_bytes = min(max_bytes or DEFAULT_MAX_BYTES, MAX_BYTES)
+
+    writer = RecordChunkWriter(output_format, chunk_rows=chunk_rows)
+    chunks = []
+    columns = None
+    next_locator = locator
+    pages = 0
+
+    while writer.rows < max_rows and writer.size < max_bytes:
+        page_size = min(RESULT_PAGE_SIZE, max_rows - writer.rows)
+        if not writer.rows:
+            page_size = min(page_size, PROBE_PAGE_SIZE)
+        else:
+            # Size the page to what is left of the byte cap
+            row_bytes = writer.size / writer.rows
+            page_size = min(
+                page_size, max(1, int((max_bytes - writer.size) / row_bytes))
+            )
+
+        params = {"maxRecords": page_size}
+        if next_locator:
+            params["locator"] = next_locator
+
+        response = await salesforce_api_request(
+            token,
+            "GET",
+            f"jobs/query/{job_id}/results",
+            stream=True,
+            params=params,
+            headers={"Accept": "text/csv"},
+        )
+        try:
+            if response.status_code >= 400:
+                await response.aread()
+                raise SalesforceAPIError(
+                    response.status_code, get_error_details(response)
+                )
+            async for record in iter_csv_records(response):
+                columns = columns or list(record)
+                chunk = writer.write(record)
+                if chunk:
+                    chunks.append(chunk)
+                    await report_progress(writer.rows, max_rows)
+        finally:
+            await response.aclose()
+
+        pages += 1
+        next_locator = response.headers.get("Sforce-Locator")
+        if not next_locator or next_locator == "null":
+            next_locator = None
+            break
+
+    chunk = writer.flush()
+    if chunk:
+        chunks.append(chunk)
+
+    summary = {
+        "job_id": job_id,
+        "columns": columns,
+        "locator": locator,
+        "rows": writer.rows,
+        "bytes": writer.bytes,
+        "pages": pages,
+        "output_format": output_format,
+        "next_locator": next_locator,
+    }
+    logger.info(
+        f"Streamed {writer.rows} rows ({writer.bytes} bytes) of bulk query {job_id}"
+    )
+    return summary, chunks
+
+
+def records_to_csv(records: List[Dict[str, Any]]) -> bytes:
+    """Encode records as a Bulk API 2.0 CSV upload (None clears a field)"""
+    columns = list(dict.fromkeys(key for record in records for key in record))
+
+    def encode(value):
+        if value is None:
+            return CSV_NULL
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n")
+    writer.writeheader()
+    for record in records:
+        writer.writerow({key: encode(value) for key, value in record.items()})
+    return buffer.getvalue().encode("utf-8")
+
+
+async def create_ingest_job(
+    token: Dict[str, Any],
+    object_name: str,
+    operation: str,
+    records: List[Dict[str, Any]],
+    external_id_field: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Create an ingest job, upload the records and queue the job for processing.
+
+    Args:
+        token: Salesforce credentials
+        object_name: API name of the sObject
+        operation: One of INGEST_OPERATIONS
+        records: Records to write (with Id for update/delete)
+        external_id_field: External ID field matching records of an upsert
+
+    Returns:
+        Dict: The job after it was marked UploadComplete
+    """
+    body = {
+        "object": object_name,
+        "operation": operation,
+        "contentType": "CSV",
+        "columnDelimiter": "COMMA",
+        "lineEnding": "LF",
+    }
+    if external_id_field:
+        body["externalIdFieldName"] = external_id_field
+
+    job = await salesforce_json(token, "POST", "jobs/ingest", json=body)
+    job_id = job["id"]
+    try:
+        response = await salesforce_api_request(
+            token,
+            "PUT",
+            f"jobs/ingest/{job_id}/batches",
+            content=records_to_csv(records),
+            headers={"Content-Type": "text/csv"},
+        )
+        if response.status_code >= 400:
+            raise SalesforceAPIError(response.status_code, get_error_details(response))
+        return await salesforce_json(
+            token, "PATCH", f"jobs/ingest/{job_id}", json={"state": "UploadComplete"}
+        )
+    except Exception:
+        # Do not leave an open job behind (it would count against the org's limits)
+        try:
+            await salesforce_json(
+                token, "PATCH", f"jobs/ingest/{job_id}", json={"state": "Aborted"}
+            )
+        except Exception as e:
+            logger.warning(f"Could not abort ingest job {job_id}: {e}")
+        raise
+
+
+async def get_ingest_results(
+    token: Dict[str, Any], job_id: str, kind: str, max_rows: int
+) -> Tuple[List[Dict[str, str]], bool]:
+    """
+    Read up to max_rows records of an ingest job's failedResults,
+    successfulResults or unprocessedrecords.
+
+    Returns:
+        Tuple of the records and whether more records were left unread
+    """
+    response = await salesforce_api_request(
+        token,
+        "GET",
+        f"jobs/ingest/{job_id}/{kind}",
+        stream=True,
+        headers={"Accept": "text/csv"},
+    )
+    records = []
+    try:
+        if response.status_code >= 400:
+            await response.aread()
+            raise SalesforceAPIError(response.status_code, get_error_details(response))
+        async for record in iter_csv_records(response):
+            if len(records) >= max_rows:
+                return records, True
+            records.append(record)
+    finally:
+        await response.aclose()
+    return records, False
+
+
+async def save_records(
+    token: Dict[str, Any],
+    method: str,
+    object_name: str,
+    records: List[Dict[str, Any]],
+    all_or_none: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Create (POST) or update (PATCH) records with sObject Collections.
+
+    Records are sent COLLECTION_SIZE per request with COLLECTION_CONCURRENCY
+    requests in flight. A failing request does not stop the others: its
+    records get the error as their result. all_or_none applies to each
+    request of COLLECTION_SIZE records.
+
+    Args:
+        token: Salesforce credentials
+        method: "POST" to create or "PATCH" to update (records need an Id)
+        object_name: API name of the sObject
+        records: Field values of each record
+        all_or_none: Roll back a request's records when one of them fails
+
+    Returns:
+        List: One result ({id, success, errors}) per record, in input order
+    """
+    payload = [{"attributes": {"type": object_name}, **record} for record in records]
+    chunks = [
+        payload[i : i + COLLECTION_SIZE]
+        for i in range(0, len(payload), COLLECTION_SIZE)
+    ]
+    saved = 0
+
+    async def save_chunk(chunk):
+        nonlocal saved
+        try:
+            results = await salesforce_json(
+                token,
+                method,
+                "composite/sobjects",
+                json={"allOrNone": all_or_none, "records": chunk},
+            )
+        except SalesforceAPIError as e:
+            errors = (
+                e.details
+                if isinstance(e.details, list)
+                else [{"statusCode": str(e.status_code), "message": str(e.details)}]
+            )
+            results = [
+                {"id": record.get("Id"), "success": False, "errors": errors}
+                for record in chunk
+            ]
+        saved += len(chunk)
+        await report_progress(saved, len(payload))
+        return results
+
+    chunk_results = await gather_bounded(
+        (save_chunk(chunk) for chunk in chunks), COLLECTION_CONCURRENCY
+    )
+    return [result for results in chunk_results for result in results]
@@ -0,0 +1,378 @@
+"""
+Org metadata cache for the Salesforce server.
+
+The global describe (the org's sObjects) and per-sObject describes are
+cached per org and user, since what a describe lists depends on the user's
+profile, and shared by every session of that user, with field name and type
+indexes built once per describe. Expired entries keep being served while
+they are revalidated in the background with If-Modified-Since, so an
+unchanged describe costs a 304 and field lookups and SOQL validation do not
+wait on the network once an object has been described. An object or field
+missing from a cached describe (e.g. created since it was fetched) makes the
+describe revalidate before the name is rejected.
+"""
+
+import asyncio
+import difflib
+import logging
+import re
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.salesforce.api import (
+    SalesforceAPIError,
+    get_error_details,
+    salesforce_api_request,
+)
+from src.utils.rate_limit.util import get_credential_key
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a cached describe is revalidated
+METADATA_TTL = 3600
+# Maximum describes kept across all orgs and users
+METADATA_CACHE_MAX_ENTRIES = 1024
+# Minimum seconds between revalidations triggered by names missing from a
+# describe; misses within it are left for Salesforce to report
+MISS_REFRESH_INTERVAL = 30
+
+# Plain SELECT ... FROM <object> queries; anything else is not validated
+SELECT_PATTERN = re.compile(
+    r"^\s*SELECT\s+(?P<fields>.+?)\s+FROM\s+(?P<object>\w+)"
+    r"(?:\s+(?:AS\s+)?(?P<alias>\w+))?",
+    re.IGNORECASE | re.DOTALL,
+)
+# Words that can follow the object of a query instead of an alias
+SOQL_CLAUSES = {
+    "where",
+    "with",
+    "group",
+    "order",
+    "limit",
+    "offset",
+    "for",
+    "using",
+    "update",
+}
+FIELD_PATH_PATTERN = re.compile(r"\w+(\.\w+)*")
+
+
+def suggest(name: str, candidates: Iterable[str]) -> str:
+    """Hint listing the closest matches of an unknown name"""
+    matches = difflib.get_close_matches(name, list(candidates), n=3, cutoff=0.6)
+    return f" (did you mean {', '.join(matches)}?)" if matches else ""
+
+
+class ObjectIndex:
+    """sObjects of an org from its global describe, by lowercase name"""
+
+    def __init__(self, describe: Dict[str, Any]):
+        self.objects = {obj["name"]: obj for obj in describe.get("sobjects", [])}
+        self.names_by_lower = {name.lower(): name for name in self.objects}
+
+    def canonical_name(self, name: str) -> str:
+        """
+        Get the API name of an sObject given its name in any case.
+
+        Raises:
+            ValueError: When the org has no such sObject
+        """
+        canonical = self.names_by_lower.get(name.lower())
+        if canonical is None:
+            raise ValueError(
+                f"Unknown Salesforce object '{name}'{suggest(name, self.objects)}"
+            )
+        return canonical
+
+
+class FieldIndex:
+    """Fields of one sObject from its describe, with name and type lookups"""
+
+    def __init__(self, describe: Dict[str, Any]):
+        self.name = describe.get("name")
+        self.fields = {field["name"]: field for field in describe.get("fields", [])}
+        self.names = list(self.fields)
+        self.names_by_lower = {name.lower(): name for name in self.names}
+        self.types = {name: field.get("type") for name, field in self.fields.items()}
+        # Parent relationships (e.g. Account of Contact.AccountId) for dotted paths
+        self.relationships = {
+            field["relationshipName"].lower(): field
+            for field in self.fields.values()
+            if field.get("relationshipName")
+        }
+
+    def canonical_name(self, name: str) -> Optional[str]:
+        """API name of a field given its name in any case (None when unknown)"""
+        return self.names_by_lower.get(name.lower())
+
+    def field_type(self, name: str) -> Optional[str]:
+        """Type of a field (string, reference, picklist, ...) or None when unknown"""
+        canonical = self.canonical_name(name)
+        return self.types.get(canonical) if canonical else None
+
+    def unknown_fields(self, names: Iterable[str]) -> List[str]:
+        """
+        Names that are neither fields nor relationship paths of the object.
+
+        Only the first segment of a dotted path (e.g. Account.Name) is checked,
+        since the rest belongs to another object.
+        """
+        unknown = []
+        for name in names:
+            head, _, rest = name.partition(".")
+            if rest:
+                if head.lower() not in self.relationships:
+                    unknown.append(name)
+            elif self.canonical_name(name) is None:
+                unknown.append(name)
+        return unknown
+
+    def validate_fields(self, names: Iterable[str]) -> None:
+        """
+        Raises:
+            ValueError: When some of the names are not fields of the object
+        """
+        unknown = self.unknown_fields(names)
+        if unknown:
+            hints = "; ".join(f"{name}{suggest(name, self.names)}" for name in unknown)
+            raise ValueError(f"Unknown field(s) of {self.name}: {hints}")
+
+
+class MetadataEntry:
+    """A cached describe response with its lookup index"""
+
+    def __init__(self):
+        self.data: Any = None
+        self.last_modified: Optional[str] = None
+        self.fetched_at: Optional[float] = None
+        self.index: Any = None
+        self.lock = asyncio.Lock()
+        self.refresh_task: Optional[asyncio.Task] = None
+
+    def stale(self) -> bool:
+        return (
+            self.fetched_at is None or time.monotonic() - self.fetched_at > METADATA_TTL
+        )
+
+    def can_refresh(self) -> bool:
+        return (
+            self.fetched_at is None
+            or time.monotonic() - self.fetched_at > MISS_REFRESH_INTERVAL
+        )
+
+
+# Describes by (org and user, path), shared by every session of the user
+_metadata: "OrderedDict[Tuple[str, str], MetadataEntry]" = OrderedDict()
+
+
+def get_org_key(token: Dict[str, Any]) -> str:
+    """
+    Identify the org and user of a token without a request.
+
+    The identity URL of the token response ends in /id/<org ID>/<user ID>;
+    tokens without one are keyed by their instance URL and access token.
+    """
+    parts = (token.get("id") or "").rstrip("/").split("/")
+    if len(parts) >= 3 and parts[-3] == "id":
+        return f"{parts[-2]}/{parts[-1]}"
+    instance_url = token["instance_url"].rstrip("/").lower()
+    return f"{instance_url}/{get_credential_key(token.get('access_token'))}"
+
+
+def get_metadata_entry(org_key: str, path: str) -> MetadataEntry:
+    key = (org_key, path)
+    entry = _metadata.get(key)
+    if entry is None:
+        entry = _metadata[key] = MetadataEntry()
+        while len(_metadata) > METADATA_CACHE_MAX_ENTRIES:
+            _metadata.popitem(last=False)
+    _metadata.move_to_end(key)
+    return entry
+
+
+async def revalidate(token: Dict[str, Any], path: str, entry: MetadataEntry) -> None:
+    """Fetch a describe, sending If-Modified-Since when a copy is cached"""
+    headers = {}
+    if entry.data is not None and entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+
+    requested_at = formatdate(usegmt=True)
+    response = await salesforce_api_request(token, "GET", path, headers=headers)
+
+    if response.status_code == 304 and entry.data is not None:
+        entry.fetched_at = time.monotonic()
+        return
+
+    if response.status_code != 200:
+        if entry.data is not None:
+            # A stale describe is still better than failing the tool call
+            logger.warning(
+                f"Could not revalidate Salesforce describe {path} "
+                f"(status {response.status_code}), serving cached copy"
+            )
+            entry.fetched_at = time.monotonic()
+            return
+        raise SalesforceAPIError(response.status_code, get_error_details(response))
+
+    entry.data = response.json()
+    entry.last_modified = response.headers.get("Last-Modified") or requested_at
+    entry.fetched_at = time.monotonic()
+    entry.index = None
+
+
+async def refresh(
+    token: Dict[str, Any], path: str, entry: MetadataEntry, force: bool = False
+) -> None:
+    """Revalidate an expired (or forced) entry unless another caller already did"""
+    requested_at = time.monotonic()
+    async with entry.lock:
+        if entry.stale() or (force and entry.fetched_at < requested_at):
+            logger.info(f"Fetching Salesforce describe {path} of {get_org_key(token)}")
+            await revalidate(token, path, entry)
+
+
+async def refresh_in_background(
+    token: Dict[str, Any], path: str, entry: MetadataEntry
+) -> None:
+    try:
+        await refresh(token, path, entry)
+    except Exception as e:
+        logger.warning(f"Background revalidation of {path} failed: {e}")
+    finally:
+        entry.refresh_task = None
+
+
+async def get_metadata(
+    token: Dict[str, Any], path: str, force: bool = False
+) -> MetadataEntry:
+    """
+    Get a cached describe of the token's org and user.
+
+    The first caller fetches the describe and concurrent callers share that
+    fetch. Expired entries are returned right away while a background task
+    revalidates them.
+
+    Args:
+        token: Salesforce credentials (access_token, instance_url)
+        path: REST API path of the describe (e.g. sobjects/Account/describe)
+        force: Revalidate the describe before returning it
+
+    Returns:
+        MetadataEntry: The shared cache entry holding the describe
+    """
+    entry = get_metadata_entry(get_org_key(token), path)
+    if entry.data is None or force:
+        await refresh(token, path, entry, force)
+    elif entry.stale() and entry.refresh_task is None:
+        entry.refresh_task = asyncio.create_task(
+            refresh_in_background(dict(token), path, entry)
+        )
+    return entry
+
+
+def object_index(entry: MetadataEntry) -> ObjectIndex:
+    if entry.index is None:
+        entry.index = ObjectIndex(entry.data)
+    return entry.index
+
+
+def field_index(entry: MetadataEntry) -> FieldIndex:
+    if entry.index is None:
+        entry.index = FieldIndex(entry.data)
+    return entry.index
+
+
+async def get_object_index(token: Dict[str, Any]) -> ObjectIndex:
+    """Get the org's sObjects from the cached global describe"""
+    return object_index(await get_metadata(token, "sobjects/"))
+
+
+async def describe_sobject(
+    token: Dict[str, Any], object_name: str, force: bool = False
+) -> MetadataEntry:
+    """
+    Get the cached describe of an sObject.
+
+    An object missing from the cached global describe makes it revalidate
+    first; if that was done less than MISS_REFRESH_INTERVAL ago, the
+    object's describe is requested as named and Salesforce reports an
+    unknown object.
+
+    Raises:
+        ValueError: When the org has no such sObject
+    """
+    entry = await get_metadata(token, "sobjects/")
+    index = object_index(entry)
+    if object_name.lower() not in index.names_by_lower:
+        if entry.can_refresh():
+            index = object_index(await get_metadata(token, "sobjects/", force=True))
+        elif re.fullmatch(r"\w+", object_name):
+            return await get_metadata(token, f"sobjects/{object_name}/describe", force)
+    object_name = index.canonical_name(object_name)
+    return await get_metadata(token, f"sobjects/{object_name}/describe", force)
+
+
+async def get_field_index(token: Dict[str, Any], object_name: str) -> FieldIndex:
+    """Get the field lookups of an sObject from its cached describe"""
+    return field_index(await describe_sobject(token, object_name))
+
+
+async def check_fields(
+    token: Dict[str, Any], object_name: str, names: Iterable[str]
+) -> Optional[FieldIndex]:
+    """
+    Check field names against the cached describe before a request is sent.
+
+    Unknown names make the describe revalidate before they are rejected,
+    so fields created since it was cached are found. The check is skipped
+    (returning None) when the describe cannot be fetched, or when unknown
+    names remain and it was revalidated less than MISS_REFRESH_INTERVAL
+    ago, leaving Salesforce to report problems as before.
+
+    Raises:
+        ValueError: When the object or some of the fields do not exist
+    """
+    names = list(names)
+    try:
+        entry = await describe_sobject(token, object_name)
+        if field_index(entry).unknown_fields(names):
+            if not entry.can_refresh():
+                logger.info(f"Leaving field validation of {object_name} to Salesforce")
+                return None
+            entry = await describe_sobject(token, object_name, force=True)
+    except SalesforceAPIError as e:
+        logger.warning(f"Skipping field validation of {object_name}: {e}")
+        return None
+    index = field_index(entry)
+    index.validate_fields(names)
+    return index
+
+
+async def validate_soql(token: Dict[str, Any], query: str) -> None:
+    """
+    Check the object and selected fields of a plain SELECT ... FROM query.
+
+    Queries with subqueries, functions, aliases or TYPEOF are passed through
+    unchecked.
+
+    Raises:
+        ValueError: When the object or a selected field does not exist
+    """
+    match = SELECT_PATTERN.match(query)
+    if not match or "(" in match["fields"]:
+        return
+    fields = [field.strip() for field in match["fields"].split(",")]
+    if not all(FIELD_PATH_PATTERN.fullmatch(field) for field in fields):
+        return
+
+    alias = match["alias"]
+    if alias and alias.lower() not in SOQL_CLAUSES:
+        # SELECT a.Name FROM Account a
+        prefix = f"{alias.lower()}."
+        fields = [
+            field[len(prefix) :] if field.lower().startswith(prefix) else field
+            for field in fields
+        ]
+    await check_fields(token, match["object"], fields)
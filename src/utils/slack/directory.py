@@ -0,0 +1,396 @@
+"""
+Workspace directory cache for the Slack server.
+
+Users and public channels of a workspace are loaded in bulk from users.list
+and conversations.list and shared by every session connected to that
+workspace (keyed by team_id), so resolving names and enriching messages does
+not cost one Web API call per message or member. What depends on the token
+(the private channels it is a member of, and user emails, which need the
+users:read.email scope) is kept in a directory of that token only.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.utils.pagination.util import collect, slack_next_cursor
+from src.utils.rate_limit.util import gather_bounded, get_credential_key
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a loaded user or channel listing is refreshed
+DIRECTORY_TTL = 600
+# Minimum seconds between refreshes triggered by lookups that miss
+MISS_REFRESH_INTERVAL = 30
+# Page size of users.list and conversations.list (Slack recommends at most 200)
+DIRECTORY_PAGE_SIZE = 200
+# Maximum users.info calls in flight for users missing from the listing
+USER_LOOKUP_CONCURRENCY = 8
+
+
+def without_email(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a Slack user object without the profile email"""
+    profile = user.get("profile")
+    if not profile or "email" not in profile:
+        return user
+    return {
+        **user,
+        "profile": {key: value for key, value in profile.items() if key != "email"},
+    }
+
+
+class Directory:
+    """Channel listing with name lookup and the load times of the listings"""
+
+    def __init__(self):
+        self.channels: Dict[str, Dict[str, Any]] = {}
+        self.channel_ids_by_name: Dict[str, str] = {}
+        self.users_loaded_at: Optional[float] = None
+        self.channels_loaded_at: Optional[float] = None
+        self.lock = asyncio.Lock()
+
+    def users_stale(self) -> bool:
+        return (
+            self.users_loaded_at is None
+            or time.monotonic() - self.users_loaded_at > DIRECTORY_TTL
+        )
+
+    def channels_stale(self) -> bool:
+        return (
+            self.channels_loaded_at is None
+            or time.monotonic() - self.channels_loaded_at > DIRECTORY_TTL
+        )
+
+    def can_refresh_users(self) -> bool:
+        return (
+            self.users_loaded_at is None
+            or time.monotonic() - self.users_loaded_at > MISS_REFRESH_INTERVAL
+        )
+
+    def can_refresh_channels(self) -> bool:
+        return (
+            self.channels_loaded_at is None
+            or time.monotonic() - self.channels_loaded_at > MISS_REFRESH_INTERVAL
+        )
+
+    def add_channel(self, channel: Dict[str, Any]) -> None:
+        self.channels[channel["id"]] = channel
+        if channel.get("name"):
+            self.channel_ids_by_name[channel["name"]] = channel["id"]
+
+    def set_channels(self, channels: List[Dict[str, Any]]) -> None:
+        """Replace the channel listing with a complete conversations.list result"""
+        self.channels = {}
+        self.channel_ids_by_name = {}
+        for channel in channels:
+            self.add_channel(channel)
+        self.channels_loaded_at = time.monotonic()
+
+
+class WorkspaceDirectory(Directory):
+    """Users (without emails) and public channels of one Slack workspace"""
+
+    def __init__(self, team_id: str):
+        super().__init__()
+        self.team_id = team_id
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.user_ids_by_name: Dict[str, str] = {}
+
+    def add_user(self, user: Dict[str, Any]) -> None:
+        self.users[user["id"]] = without_email(user)
+        if user.get("name"):
+            self.user_ids_by_name[user["name"]] = user["id"]
+        if user.get("real_name"):
+            self.user_ids_by_name[user["real_name"]] = user["id"]
+
+    def set_users(self, users: List[Dict[str, Any]]) -> None:
+        """Replace the user listing with a complete users.list result"""
+        self.users = {}
+        self.user_ids_by_name = {}
+        for user in users:
+            self.add_user(user)
+        self.users_loaded_at = time.monotonic()
+
+
+class TokenDirectory(Directory):
+    """Private channels and user emails visible to one token"""
+
+    def __init__(self, team_id: str):
+        super().__init__()
+        self.team_id = team_id
+        self.emails: Dict[str, str] = {}
+        self.user_ids_by_email: Dict[str, str] = {}
+
+    def add_user(self, user: Dict[str, Any]) -> None:
+        email = user.get("profile", {}).get("email")
+        if email:
+            self.emails[user["id"]] = email
+            self.user_ids_by_email[email.lower()] = user["id"]
+
+    def set_users(self, users: List[Dict[str, Any]]) -> None:
+        """Replace the emails with those of a complete users.list result"""
+        self.emails = {}
+        self.user_ids_by_email = {}
+        for user in users:
+            self.add_user(user)
+        self.users_loaded_at = time.monotonic()
+
+    def with_email(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a shared user object with the email this token can see"""
+        email = self.emails.get(user["id"])
+        if not email:
+            return user
+        return {**user, "profile": {**user.get("profile", {}), "email": email}}
+
+
+# Directories are shared by every session connected to the same workspace
+_directories: Dict[str, WorkspaceDirectory] = {}
+# Directories of each token, keyed by the token's hash
+_token_directories: Dict[str, TokenDirectory] = {}
+# Workspace of each token, keyed by the token's hash
+_team_ids: Dict[str, str] = {}
+
+
+async def get_team_id(slack_client: AsyncWebClient) -> str:
+    """Get the workspace (team_id) of a client's token, calling auth.test once per token"""
+    token_key = get_credential_key(slack_client.token)
+    if token_key not in _team_ids:
+        _team_ids[token_key] = (await slack_client.auth_test())["team_id"]
+    return _team_ids[token_key]
+
+
+async def get_workspace_directory(slack_client: AsyncWebClient) -> WorkspaceDirectory:
+    """Get the shared directory of a client's workspace, without loading it"""
+    team_id = await get_team_id(slack_client)
+    if team_id not in _directories:
+        _directories[team_id] = WorkspaceDirectory(team_id)
+    return _directories[team_id]
+
+
+async def get_directories(
+    slack_client: AsyncWebClient,
+) -> Tuple[WorkspaceDirectory, TokenDirectory]:
+    """Get the shared directory of a client's workspace and its token's directory"""
+    directory = await get_workspace_directory(slack_client)
+    token_key = get_credential_key(slack_client.token)
+    if token_key not in _token_directories:
+        _token_directories[token_key] = TokenDirectory(directory.team_id)
+    return directory, _token_directories[token_key]
+
+
+async def fetch_all_pages(method, key: str, **params) -> List[Dict[str, Any]]:
+    """Collect every item of a cursor-paginated Slack Web API listing"""
+
+    async def fetch_page(cursor):
+        response = await method(limit=DIRECTORY_PAGE_SIZE, cursor=cursor, **params)
+        return response[key], slack_next_cursor(response)
+
+    return await collect(fetch_page)
+
+
+def needs_load(loaded_at: Optional[float], requested_at: float, force: bool) -> bool:
+    """Whether a listing is still to be loaded once the directory lock is held"""
+    # Another caller may have loaded the listing while this one waited
+    return loaded_at is None or loaded_at < (
+        requested_at if force else time.monotonic() - DIRECTORY_TTL
+    )
+
+
+async def load_users(
+    slack_client: AsyncWebClient, force: bool = False
+) -> Tuple[WorkspaceDirectory, TokenDirectory]:
+    """
+    Get directories whose user listing and emails are loaded and fresh.
+
+    Emails depend on the token's scopes, so the listing is loaded once per
+    token; each load also refreshes the users shared by the workspace.
+    Concurrent callers with the same token share a single load.
+
+    Args:
+        slack_client: Client of the user
+        force: Reload the listing even if it has not expired
+
+    Returns:
+        Tuple of the shared directory of the workspace and the token's directory
+    """
+    directory, token_directory = await get_directories(slack_client)
+    if not force and not token_directory.users_stale():
+        return directory, token_directory
+
+    requested_at = time.monotonic()
+    async with token_directory.lock:
+        if needs_load(token_directory.users_loaded_at, requested_at, force):
+            logger.info(f"Loading user directory of Slack team {directory.team_id}")
+            users = await fetch_all_pages(slack_client.users_list, "members")
+            directory.set_users(users)
+            token_directory.set_users(users)
+    return directory, token_directory
+
+
+async def load_channels(
+    slack_client: AsyncWebClient, force: bool = False
+) -> Tuple[WorkspaceDirectory, TokenDirectory]:
+    """
+    Get directories whose channel listings are loaded and fresh.
+
+    Public channels are listed once for the workspace, and the private
+    channels the token is a member of once for the token. Concurrent callers
+    share a single load of each listing.
+
+    Args:
+        slack_client: Client of the user
+        force: Reload the listings even if they have not expired
+
+    Returns:
+        Tuple of the shared directory of the workspace and the token's directory
+    """
+    directory, token_directory = await get_directories(slack_client)
+    requested_at = time.monotonic()
+
+    if force or directory.channels_stale():
+        async with directory.lock:
+            if needs_load(directory.channels_loaded_at, requested_at, force):
+                logger.info(
+                    f"Loading channel directory of Slack team {directory.team_id}"
+                )
+                directory.set_channels(
+                    await fetch_all_pages(
+                        slack_client.conversations_list,
+                        "channels",
+                        types="public_channel",
+                    )
+                )
+
+    if force or token_directory.channels_stale():
+        async with token_directory.lock:
+            if needs_load(token_directory.channels_loaded_at, requested_at, force):
+                token_directory.set_channels(
+                    await fetch_all_pages(
+                        slack_client.conversations_list,
+                        "channels",
+                        types="private_channel",
+                    )
+                )
+    return directory, token_directory
+
+
+async def lookup_user(
+    slack_client: AsyncWebClient, user_id: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Get a user of the workspace by ID.
+
+    Users missing from the listing (e.g. ones who joined since it was loaded)
+    are fetched with users.info and added to it.
+
+    Returns:
+        Optional[Dict]: The Slack user object, or None if it does not exist
+    """
+    directory, token_directory = await load_users(slack_client)
+    user = directory.users.get(user_id)
+    if user is not None:
+        return token_directory.with_email(user)
+
+    try:
+        response = await slack_client.users_info(user=user_id)
+    except SlackApiError as e:
+        logger.warning(f"Could not look up Slack user {user_id}: {e}")
+        return None
+
+    if not response["ok"]:
+        return None
+    directory.add_user(response["user"])
+    token_directory.add_user(response["user"])
+    return response["user"]
+
+
+async def lookup_users(
+    slack_client: AsyncWebClient, user_ids: Iterable[str]
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Get several users of the workspace by ID.
+
+    Users missing from the listing are fetched with users.info concurrently,
+    at most USER_LOOKUP_CONCURRENCY at a time.
+
+    Returns:
+        Dict: Slack user object (or None) by user ID
+    """
+    user_ids = set(user_ids)
+    directory, token_directory = await load_users(slack_client)
+
+    missing = [user_id for user_id in user_ids if user_id not in directory.users]
+    if missing:
+        await gather_bounded(
+            (lookup_user(slack_client, user_id) for user_id in missing),
+            USER_LOOKUP_CONCURRENCY,
+        )
+
+    return {
+        user_id: (
+            token_directory.with_email(directory.users[user_id])
+            if user_id in directory.users
+            else None
+        )
+        for user_id in user_ids
+    }
+
+
+async def find_user_id(slack_client: AsyncWebClient, user_name: str) -> Optional[str]:
+    """Get the ID of a user by name or real name, refreshing the listing on a miss"""
+    directory, token_directory = await load_users(slack_client)
+    if (
+        user_name not in directory.user_ids_by_name
+        and token_directory.can_refresh_users()
+    ):
+        directory, _ = await load_users(slack_client, force=True)
+    return directory.user_ids_by_name.get(user_name)
+
+
+async def find_user_id_by_email(
+    slack_client: AsyncWebClient, email: str
+) -> Optional[str]:
+    """
+    Get the ID of a user by email.
+
+    Emails are only in the listing when the token has users:read.email, so
+    misses fall back to users.lookupByEmail.
+    """
+    directory, token_directory = await load_users(slack_client)
+    user_id = token_directory.user_ids_by_email.get(email.lower())
+    if user_id:
+        return user_id
+
+    try:
+        response = await slack_client.users_lookupByEmail(email=email)
+    except SlackApiError:
+        return None
+
+    if not response["ok"]:
+        return None
+    directory.add_user(response["user"])
+    token_directory.add_user(response["user"])
+    return response["user"]["id"]
+
+
+async def find_channel_id(
+    slack_client: AsyncWebClient, channel_name: str
+) -> Optional[str]:
+    """Get the ID of a public or private channel by name, refreshing the listings on a miss"""
+
+    def find(directory, token_directory):
+        return token_directory.channel_ids_by_name.get(
+            channel_name
+        ) or directory.channel_ids_by_name.get(channel_name)
+
+    directory, token_directory = await load_channels(slack_client)
+    channel_id = find(directory, token_directory)
+    if channel_id is None and (
+        directory.can_refresh_channels() or token_directory.can_refresh_channels()
+    ):
+        channel_id = find(*await load_channels(slack_client, force=True))
+    return channel_id
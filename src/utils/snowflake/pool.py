@@ -0,0 +1,407 @@
+"""
+Connection pool for the Snowflake server.
+
+Logging in to Snowflake takes seconds, so connections are kept open and
+reused across tool calls and sessions. Each (user, account, warehouse,
+database) gets its own pool with a maximum size; connections idle for too
+long are closed, and connections that sat idle are health checked before
+being handed out.
+
+A reused connection gets back the role, warehouse, database and schema it
+had when it was set up, so USE statements of one tool call do not leak into
+the next. Session state that cannot be undone (ALTER SESSION, variables,
+transactions, ...) is avoided by discarding connections that ran user SQL
+other than queries, DML and USE statements.
+
+The connector is blocking, so pooled work runs in a dedicated thread pool
+instead of on the event loop.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import snowflake.connector
+from prometheus_client import Counter, Gauge
+from snowflake.connector.errors import Error as SnowflakeError, ProgrammingError
+
+from src.utils.rate_limit.util import get_credential_key
+
+logger = logging.getLogger(__name__)
+
+# Maximum connections per (user, account, warehouse, database)
+POOL_MAX_SIZE = int(os.environ.get("GUMCP_SNOWFLAKE_POOL_MAX_SIZE", "4"))
+# Seconds an unused connection is kept open
+POOL_IDLE_TIMEOUT = int(os.environ.get("GUMCP_SNOWFLAKE_POOL_IDLE_TIMEOUT", "900"))
+# Connections idle for longer than this are checked with SELECT 1 before reuse
+HEALTH_CHECK_INTERVAL = 60
+# Seconds to wait for a connection when the pool is at its maximum size
+ACQUIRE_TIMEOUT = 120
+# Threads running connector calls for all pools
+QUERY_WORKERS = int(os.environ.get("GUMCP_SNOWFLAKE_QUERY_WORKERS", "32"))
+# Session context restored on reused connections, in the order it is set
+SESSION_CONTEXT = ("role", "warehouse", "database", "schema")
+# User SQL after which a connection can be reused: queries, DML and USE
+# statements (but not USE SECONDARY ROLES), once comments are skipped
+LEADING_COMMENTS = re.compile(r"(?:\s+|--[^\n]*|//[^\n]*|/\*.*?\*/|\()*", re.DOTALL)
+REUSABLE_STATEMENT = re.compile(
+    r"(?:SELECT|WITH|SHOW|DESC|DESCRIBE|EXPLAIN|LIST|LS|INSERT|UPDATE|DELETE|MERGE)\b"
+    r"|USE\s+(?!SECONDARY\b)\w",
+    re.IGNORECASE,
+)
+
+snowflake_connections_total = Counter(
+    "gumcp_snowflake_connections_total",
+    "Snowflake connections handed out by the pool, by whether they were reused",
+    ["result"],
+)
+snowflake_open_connections = Gauge(
+    "gumcp_snowflake_open_connections",
+    "Snowflake connections currently open in the pools",
+)
+
+PoolKey = Tuple[str, str, Optional[str], Optional[str]]
+SessionContext = Tuple[Optional[str], ...]
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection frees up within ACQUIRE_TIMEOUT"""
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def leaves_session_reusable(query: str, context_tracked: bool = True) -> bool:
+    """
+    Whether a connection can be handed out again after running user SQL.
+
+    Args:
+        query: The SQL the connection ran
+        context_tracked: False when the connector does not see the statement
+            finish (execute_async), so a USE statement could not be undone
+    """
+    statement = query[LEADING_COMMENTS.match(query).end() :]
+    # Several statements (when the account allows them) are not inspected
+    if ";" in statement.strip().rstrip(";"):
+        return False
+    match = REUSABLE_STATEMENT.match(statement)
+    return bool(match) and (
+        context_tracked or not match.group().upper().startswith("USE")
+    )
+
+
+class SnowflakeConnectionPool:
+    """
+    Pool of open connections of one user to one account, warehouse and database.
+
+    All methods block, so call them from worker threads (see run_in_thread).
+    """
+
+    def __init__(
+        self,
+        connect_kwargs: Dict[str, Any],
+        database: Optional[str] = None,
+        max_size: int = POOL_MAX_SIZE,
+        idle_timeout: float = POOL_IDLE_TIMEOUT,
+    ):
+        self.connect_kwargs = connect_kwargs
+        self.database = database
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        # Idle connections with the time they were released, most recent last
+        self._idle: List[Tuple[Any, float]] = []
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        # Session context of each open connection once it was set up
+        self._contexts: Dict[Any, SessionContext] = {}
+
+    def _connect(self):
+        logger.info(
+            f"Opening Snowflake connection to {self.connect_kwargs['account']} "
+            f"as {self.connect_kwargs['user']}"
+        )
+        conn = snowflake.connector.connect(
+            client_session_keep_alive=True, **self.connect_kwargs
+        )
+        snowflake_open_connections.inc()
+        if self.database:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(f"USE DATABASE {self.database}")
+            except BaseException:
+                self._close(conn)
+                raise
+        self._contexts[conn] = self._get_context(conn)
+        return conn
+
+    @staticmethod
+    def _get_context(conn) -> SessionContext:
+        return tuple(getattr(conn, name) for name in SESSION_CONTEXT)
+
+    def _restore_context(self, conn) -> bool:
+        """Undo USE statements run on a connection since it was set up"""
+        context = self._contexts.get(conn)
+        if context is None:
+            return False
+        try:
+            with conn.cursor() as cursor:
+                for name, value in zip(SESSION_CONTEXT, context):
+                    # Read each time: USE DATABASE also changes the schema
+                    if getattr(conn, name) == value:
+                        continue
+                    if value is None:
+                        # There is no statement clearing the current object
+                        logger.info(
+                            f"Discarding Snowflake connection with a {name} set"
+                        )
+                        return False
+                    cursor.execute(f"USE {name.upper()} {quote_identifier(value)}")
+            return True
+        except Exception as e:
+            logger.info(
+                f"Discarding Snowflake connection whose context was not restored: {e}"
+            )
+            return False
+
+    def _close(self, conn) -> None:
+        self._contexts.pop(conn, None)
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing Snowflake connection: {e}")
+        snowflake_open_connections.dec()
+
+    @staticmethod
+    def _is_healthy(conn, idle_for: float) -> bool:
+        if conn.is_closed():
+            return False
+        if idle_for < HEALTH_CHECK_INTERVAL:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except Exception as e:
+            logger.info(f"Discarding unhealthy Snowflake connection: {e}")
+            return False
+
+    def acquire(self, timeout: float = ACQUIRE_TIMEOUT):
+        """Get an open connection, reusing an idle one when possible"""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                expired = self._pop_expired_locked()
+                if self._idle:
+                    conn, released_at = self._idle.pop()
+                elif self._size < self.max_size:
+                    conn, released_at = None, None
+                    self._size += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"No Snowflake connection available after {timeout}s"
+                        )
+                    self._condition.wait(remaining)
+                    continue
+
+            # Closing, connecting and health checks happen outside the lock
+            self._close_all(expired)
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except BaseException:
+                    self._discard_slot()
+                    raise
+                snowflake_connections_total.labels(result="created").inc()
+                return conn
+
+            if self._is_healthy(
+                conn, time.monotonic() - released_at
+            ) and self._restore_context(conn):
+                snowflake_connections_total.labels(result="reused").inc()
+                return conn
+
+            self._close(conn)
+            self._discard_slot()
+
+    def release(self, conn, discard: bool = False) -> None:
+        """Return a connection to the pool, or close it when discard is set"""
+        if conn in _discard_on_release:
+            _discard_on_release.discard(conn)
+            discard = True
+        if discard or self._closed or conn.is_closed():
+            self._close(conn)
+            self._discard_slot()
+            return
+        with self._condition:
+            self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+
+    def _discard_slot(self) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _pop_expired_locked(self) -> List[Any]:
+        """Remove the connections idle for longer than idle_timeout from the pool"""
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = [conn for conn, released_at in self._idle if released_at < cutoff]
+        if expired:
+            self._idle = [(c, t) for c, t in self._idle if t >= cutoff]
+            self._size -= len(expired)
+        return expired
+
+    def _close_all(self, connections: List[Any]) -> None:
+        for conn in connections:
+            self._close(conn)
+        if connections:
+            logger.info(f"Closed {len(connections)} idle Snowflake connection(s)")
+
+    def evict_idle(self) -> None:
+        """Close connections that have been idle for longer than idle_timeout"""
+        with self._condition:
+            expired = self._pop_expired_locked()
+        self._close_all(expired)
+
+    def close(self) -> None:
+        """Close every idle connection; connections in use close on release"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._closed = True
+        self._close_all([conn for conn, _ in idle])
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Borrow a connection for the duration of the block.
+
+        SQL errors leave the connection usable; connector errors (network,
+        session expiry, ...) and interruptions discard it so the next caller
+        reconnects.
+        """
+        conn = self.acquire()
+        discard = False
+        try:
+            yield conn
+        except ProgrammingError:
+            raise
+        except Exception as e:
+            discard = isinstance(e, SnowflakeError)
+            raise
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            self.release(conn, discard=discard)
+
+
+# Connections borrowed by callers that changed their session (see discard_on_release)
+_discard_on_release: "weakref.WeakSet[Any]" = weakref.WeakSet()
+# Pools by (user, account, warehouse, database), shared by every session of the process
+_pools: Dict[PoolKey, SnowflakeConnectionPool] = {}
+_pools_lock = threading.Lock()
+_executor = ThreadPoolExecutor(
+    max_workers=QUERY_WORKERS, thread_name_prefix="snowflake"
+)
+
+
+def get_pool(
+    credentials: Dict[str, str],
+    warehouse: Optional[str] = None,
+    database: Optional[str] = None,
+) -> SnowflakeConnectionPool:
+    """
+    Get the shared pool of a user's connections to an account, warehouse and
+    database.
+
+    Args:
+        credentials: Snowflake credentials (username, password, account)
+        warehouse: Warehouse the connections use (the user's default when None)
+        database: Database the connections use (the user's default when None)
+
+    Returns:
+        SnowflakeConnectionPool: The pool
+    """
+    # The password is part of the key, so changed credentials get a new pool
+    user_key = get_credential_key(
+        f"{credentials['username']}:{credentials['password']}"
+    )
+    key = (
+        user_key,
+        credentials["account"],
+        warehouse.upper() if warehouse else None,
+        database.upper() if database else None,
+    )
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            connect_kwargs = {
+                "user": credentials["username"],
+                "password": credentials["password"],
+                "account": credentials["account"],
+            }
+            if warehouse:
+                connect_kwargs["warehouse"] = warehouse
+            pool = _pools[key] = SnowflakeConnectionPool(connect_kwargs, database)
+        return pool
+
+
+async def run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking connector call in the Snowflake thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+@contextmanager
+def pooled_connection(
+    credentials: Dict[str, str],
+    warehouse: Optional[str] = None,
+    database: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Borrow a connection of a user to an account, warehouse and database.
+
+    Idle connections of every pool that have passed the idle timeout are
+    closed first, so pools of users who went away do not hold sessions open.
+    Blocks, so use it from a function passed to run_in_thread.
+    """
+    evict_idle_connections()
+    with get_pool(credentials, warehouse, database).connection() as conn:
+        yield conn
+
+
+def discard_on_release(conn) -> None:
+    """Close a borrowed connection when it is released instead of reusing it"""
+    _discard_on_release.add(conn)
+
+
+def evict_idle_connections() -> None:
+    """Close idle connections of every pool that have passed the idle timeout"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.evict_idle()
+
+
+def close_pools() -> None:
+    """Close the idle connections of every pool"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,136 @@
+"""
+Streamed query results for the Snowflake server.
+
+Results are read one result batch (chunk) at a time and written straight
+into compact CSV or NDJSON chunks, stopping at a row and byte cap. Results
+stay available in Snowflake for 24 hours, so a capped result can be
+continued from its query ID and row offset without running the query again.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.streaming.util import DEFAULT_CHUNK_ROWS, RecordChunkWriter
+
+logger = logging.getLogger(__name__)
+
+# Default and maximum rows returned by one call
+DEFAULT_MAX_ROWS = 1000
+MAX_ROWS = 100000
+# Default and maximum size of the rows returned by one call
+DEFAULT_MAX_BYTES = 1024 * 1024
+MAX_BYTES = 16 * 1024 * 1024
+
+
+def column_names(cursor) -> List[str]:
+    """Names of the result columns, with duplicates (e.g. from joins) made unique"""
+    names = []
+    seen = {}
+    for column in cursor.description:
+        name = column[0]
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 1
+        names.append(name)
+    return names
+
+
+def iter_result_rows(cursor, offset: int = 0) -> Iterator[Tuple[Any, ...]]:
+    """
+    Iterate over the rows of a cursor's result starting at offset.
+
+    Only one result batch is downloaded and held at a time, and batches
+    before offset are skipped without being downloaded.
+    """
+    batches = cursor.get_result_batches()
+    if batches is None:
+        # Results without batches (e.g. some metadata commands) are small
+        for index, row in enumerate(cursor):
+            if index >= offset:
+                yield row
+        return
+
+    skip = offset
+    for batch in batches:
+        if skip >= batch.rowcount:
+            skip -= batch.rowcount
+            continue
+        for index, row in enumerate(batch.create_iter()):
+            if isinstance(row, Exception):
+                raise row
+            if index >= skip:
+                yield row
+        skip = 0
+
+
+def stream_results(
+    cursor,
+    output_format: str = "csv",
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    offset: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Serialize the result of an executed query into CSV or NDJSON chunks.
+
+    Args:
+        cursor: Cursor holding the result (after execute or get_results_from_sfqid)
+        output_format: "csv" or "ndjson"
+        max_rows: Maximum rows to return (capped at MAX_ROWS)
+        max_bytes: Approximate maximum size of the returned rows (capped at MAX_BYTES)
+        offset: Row of the result to start from
+        chunk_rows: Rows per chunk
+
+    Returns:
+        Tuple of a summary (query ID, columns, counts and the offset to
+        continue from when the result was capped) and the text chunks
+    """
+    max_rows = min(max_rows or DEFAULT_MAX_ROWS, MAX_ROWS)
+    max_bytes = min(max_bytes or DEFAULT_MAX_BYTES, MAX_BYTES)
+
+    summary = {"query_id": cursor.sfqid}
+    if cursor.description is None:
+        summary["rows_affected"] = cursor.rowcount
+        return summary, []
+
+    columns = column_names(cursor)
+    writer = RecordChunkWriter(output_format, columns=columns, chunk_rows=chunk_rows)
+
+    chunks = []
+    complete = True
+    for row in iter_result_rows(cursor, offset):
+        if writer.rows >= max_rows or writer.size >= max_bytes:
+            complete = False
+            break
+        chunk = writer.write(dict(zip(columns, row)))
+        if chunk:
+            chunks.append(chunk)
+
+    chunk = writer.flush()
+    if chunk:
+        chunks.append(chunk)
+
+    summary.update(
+        {
+            "columns": columns,
+            "total_rows": cursor.rowcount,
+            "offset": offset,
+            "rows": writer.rows,
+            "bytes": writer.bytes,
+            "output_format": output_format,
+            "next_offset": None if complete else offset + writer.rows,
+        }
+    )
+    logger.info(
+        f"Streamed {writer.rows} rows ({writer.bytes} bytes) of query {cursor.sfqid}"
+    )
+    return summary, chunks
+
+
+def format_results(summary: Dict[str, Any], chunks: List[str]) -> List[str]:
+    """Texts of a streamed result: the JSON summary followed by the row chunks"""
+    return [json.dumps(summary, default=str)] + chunks
@@ -0,0 +1,132 @@
+import csv
+import io
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from mcp.server.lowlevel.server import request_ctx
+from mcp.types import TextContent
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ("ndjson", "csv")
+# Rows serialized into each text chunk of a streamed result
+DEFAULT_CHUNK_ROWS = 1000
+
+
+class RecordChunkWriter:
+    """
+    Serialize records into NDJSON or CSV text chunks.
+
+    Records are encoded as they arrive and handed back in chunks of at most
+    chunk_rows rows, so a large result is never held as a list of records.
+    CSV chunks concatenate into a single valid file: only the first chunk
+    starts with the header row.
+    """
+
+    def __init__(
+        self,
+        output_format: str = "ndjson",
+        columns: Optional[List[str]] = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unsupported output format: {output_format} "
+                f"(expected one of {', '.join(OUTPUT_FORMATS)})"
+            )
+        self.output_format = output_format
+        self.columns = list(columns) if columns else None
+        self.chunk_rows = max(1, chunk_rows)
+        self.rows = 0
+        self.bytes = 0
+        self.chunks = 0
+        self._buffer = io.StringIO()
+        self._buffered_rows = 0
+        self._csv_writer = None
+
+    @property
+    def size(self) -> int:
+        """Approximate size of everything written so far, including buffered rows"""
+        return self.bytes + self._buffer.tell()
+
+    def _write_csv(self, record: Dict[str, Any]) -> None:
+        if self._csv_writer is None:
+            # Without explicit columns, the first record defines them
+            self.columns = self.columns or list(record.keys())
+            self._csv_writer = csv.DictWriter(
+                self._buffer, fieldnames=self.columns, extrasaction="ignore"
+            )
+            self._csv_writer.writeheader()
+        self._csv_writer.writerow(
+            {
+                key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for key, value in record.items()
+            }
+        )
+
+    def write(self, record: Dict[str, Any]) -> Optional[str]:
+        """Add a record, returning a completed chunk once chunk_rows are buffered"""
+        if self.output_format == "csv":
+            self._write_csv(record)
+        else:
+            self._buffer.write(json.dumps(record, default=str))
+            self._buffer.write("\n")
+
+        self.rows += 1
+        self._buffered_rows += 1
+        if self._buffered_rows >= self.chunk_rows:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Return the buffered rows as a chunk (None when nothing is buffered)"""
+        if not self._buffered_rows:
+            return None
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._buffered_rows = 0
+        self.bytes += len(chunk.encode("utf-8"))
+        self.chunks += 1
+        return chunk
+
+
+def records_to_text_contents(
+    records: Iterable[Dict[str, Any]],
+    output_format: str = "ndjson",
+    columns: Optional[List[str]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> List[TextContent]:
+    """Serialize records into NDJSON or CSV chunks, one TextContent per chunk"""
+    writer = RecordChunkWriter(output_format, columns, chunk_rows)
+    chunks = [writer.write(record) for record in records] + [writer.flush()]
+    return [TextContent(type="text", text=chunk) for chunk in chunks if chunk]
+
+
+async def report_progress(progress: float, total: Optional[float] = None) -> None:
+    """
+    Send a progress notification for the tool call being handled.
+
+    Notifications are only sent when the client asked for them by passing a
+    progressToken with the request; otherwise this does nothing.
+
+    Args:
+        progress: Work done so far (e.g. records processed)
+        total: Total amount of work, when known
+    """
+    try:
+        context = request_ctx.get()
+    except LookupError:
+        return
+
+    progress_token = context.meta.progressToken if context.meta else None
+    if progress_token is None:
+        return
+
+    try:
+        await context.session.send_progress_notification(
+            progress_token, progress, total
+        )
+    except Exception as e:
+        logger.debug(f"Could not send progress notification: {e}")
@@ -122,6 +122,31 @@ async def test_get_comments(client):
     print("✅ get_comments passed.")
 
 
+@pytest.mark.asyncio
+async def test_get_comment_tree(client):
+    """Get the comment tree of a story from Hacker News.
+
+    Verifies that the flattened tree is returned within the requested limits.
+
+    Args:
+        client: The test client fixture for the MCP server.
+    """
+    global post_id
+
+    response = await client.process_query(
+        f"Use the get_comment_tree tool to load the discussion of post ID {post_id} with max_depth 2 and max_nodes 20. "
+        "If successful, start your response with 'Here is the comment tree' and then summarize it, including how many comments were loaded."
+    )
+
+    assert (
+        "here is the comment tree" in response.lower()
+    ), f"Expected success phrase not found in response: {response}"
+    assert response, "No response returned from get_comment_tree"
+
+    print(f"Response: {response}")
+    print("✅ get_comment_tree passed.")
+
+
 @pytest.mark.asyncio
 async def test_get_user(client):
     """Get details about a specific user from Hacker News.
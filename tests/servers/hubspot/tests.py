@@ -268,6 +268,63 @@ TOOL_TESTS = [
         "description": "permanently delete a HubSpot contact (GDPR-compliant)",
         "depends_on": ["created_contact_id"],
     },
+    {
+        "name": "batch_create_objects",
+        "args_template": 'with object_type="contacts" records=[{{"properties": {{"email": "bulk1-{random_id}@example.com", "firstname": "Bulk"}}}}, {{"properties": {{"email": "bulk2-{random_id}@example.com", "firstname": "Bulk"}}}}]',
+        "expected_keywords": ["batch_contact_id"],
+        "regex_extractors": {"batch_contact_id": r"batch_contact_id:\s*(\d+)"},
+        "description": "create two HubSpot contacts in one batch and return the ID of one of them as batch_contact_id",
+        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+    },
+    {
+        "name": "batch_update_objects",
+        "args_template": 'with object_type="contacts" records=[{{"id": "{batch_contact_id}", "properties": {{"jobtitle": "Bulk Tester"}}}}]',
+        "expected_keywords": ["succeeded"],
+        "description": "update a HubSpot contact with a batch update",
+        "depends_on": ["batch_contact_id"],
+    },
+    {
+        "name": "batch_upsert_objects",
+        "args_template": 'with object_type="contacts" id_property="email" records=[{{"id": "bulk3-{random_id}@example.com", "properties": {{"firstname": "Upserted"}}}}]',
+        "expected_keywords": ["succeeded"],
+        "description": "upsert a HubSpot contact by email with a batch upsert",
+        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+    },
+    {
+        "name": "stream_objects",
+        "args_template": 'with object_type="contacts" properties=["email", "firstname"] output_format="csv" max_records=200',
+        "expected_keywords": ["records"],
+        "description": "read HubSpot contacts as CSV chunks",
+    },
+    {
+        "name": "start_export",
+        "args_template": 'with object_type="contacts" properties=["email", "firstname", "lastname"]',
+        "expected_keywords": ["export_id"],
+        "regex_extractors": {"export_id": r"export_id:\s*(\d+)"},
+        "description": "start a CSV export of HubSpot contacts and return its export_id",
+    },
+    {
+        "name": "get_export_status",
+        "args_template": 'with export_id="{export_id}" wait_seconds=60',
+        "expected_keywords": ["status"],
+        "description": "get the status of a HubSpot export",
+        "depends_on": ["export_id"],
+    },
+    {
+        "name": "start_import",
+        "args_template": 'with object_type="contacts" id_property="email" records=[{{"email": "import-{random_id}@example.com", "firstname": "Imported"}}]',
+        "expected_keywords": ["import_id"],
+        "regex_extractors": {"import_id": r"import_id:\s*(\d+)"},
+        "description": "import a HubSpot contact with the imports API and return its import_id",
+        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+    },
+    {
+        "name": "get_import_status",
+        "args_template": 'with import_id="{import_id}" wait_seconds=60 include_errors=true',
+        "expected_keywords": ["state"],
+        "description": "get the status of a HubSpot import",
+        "depends_on": ["import_id"],
+    },
 ]
 
 
@@ -6,6 +6,7 @@ SITE_NAME = "testing-mcp"
 project_key = "TEST" + str(uuid.uuid4())[:4].upper()
 
 created_issue_key = None
+created_bulk_issue_keys = []
 created_comment_id = None
 
 
@@ -412,6 +413,72 @@ async def test_list_issues(client):
     print("✅ list_issues passed.")
 
 
+@pytest.mark.asyncio
+async def test_create_issues(client):
+    """Create several JIRA issues in one call.
+
+    Verifies that every issue is created successfully.
+    Stores the created issue keys for use in other tests.
+
+    Args:
+        client: The test client fixture for the MCP server.
+    """
+    global created_bulk_issue_keys
+
+    if not project_key:
+        pytest.skip("No project key available - run create_project test first")
+
+    summaries = [f"Bulk Test Issue {i} " + str(uuid.uuid4())[:8] for i in range(3)]
+
+    response = await client.process_query(
+        f"Use the create_issues tool to create issues in project {project_key} "
+        f"with summaries {summaries} and type 'Task' for SITE_NAME {SITE_NAME}. "
+        "If every issue is created, your response should be 'Created issues with keys: <key>, <key>, ...' and nothing else."
+    )
+
+    response_text = str(response)
+
+    assert (
+        "created issues with keys:" in response_text.lower()
+    ), f"Expected success phrase not found in response: {response_text}"
+    assert response_text, "No response returned from create_issues"
+
+    keys = response_text.lower().split("keys: ")[1].replace(",", " ").split()
+    created_bulk_issue_keys = [key.strip(".").upper() for key in keys]
+
+    print(f"Response: {response_text}")
+    print("✅ create_issues passed.")
+
+
+@pytest.mark.asyncio
+async def test_transition_issues(client):
+    """Transition several JIRA issues to a new status in one call.
+
+    Verifies that the issues are transitioned successfully.
+
+    Args:
+        client: The test client fixture for the MCP server.
+    """
+    if not created_bulk_issue_keys:
+        pytest.skip("No issue keys available - run create_issues test first")
+
+    response = await client.process_query(
+        f"Use the transition_issues tool to transition issues {created_bulk_issue_keys} "
+        f"to status 'In Progress' for SITE_NAME {SITE_NAME}. If every issue succeeded, start your response with "
+        "'Transitioned issues successfully' and then list the results."
+    )
+
+    response_text = str(response)
+
+    assert (
+        "transitioned issues successfully" in response_text.lower()
+    ), f"Expected success phrase not found in response: {response_text}"
+    assert response_text, "No response returned from transition_issues"
+
+    print(f"Response: {response_text}")
+    print("✅ transition_issues passed.")
+
+
 @pytest.mark.asyncio
 async def test_get_my_recent_activity(client):
     """Get recent activity for the authenticated user.
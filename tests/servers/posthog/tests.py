@@ -377,6 +377,35 @@ async def test_capture_event(client):
     print("✅ capture_event passed.")
 
 
+@pytest.mark.asyncio
+async def test_capture_events(client):
+    """Capture several events in PostHog in one call.
+
+    Verifies that every event is captured successfully.
+
+    Args:
+        client: The test client fixture for the MCP server.
+    """
+    distinct_id = f"test-user-{uuid.uuid4()}"
+    events = [
+        {"distinct_id": distinct_id, "event": "test_event", "properties": {"step": i}}
+        for i in range(3)
+    ]
+
+    response = await client.process_query(
+        f"Use the capture_events tool to capture the events {events}. If every event is captured, "
+        "start your response with 'Captured events successfully' and then list the result."
+    )
+
+    assert (
+        "captured events successfully" in response.lower()
+    ), f"Expected success phrase not found in response: {response}"
+    assert response, "No response returned from capture_events"
+
+    print(f"Response: {response}")
+    print("✅ capture_events passed.")
+
+
 @pytest.mark.asyncio
 async def test_identify_user(client):
     """Identify a user in PostHog.
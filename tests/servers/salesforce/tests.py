@@ -94,6 +94,59 @@ TOOL_TESTS = [
         "depends_on": ["account_id"],
         "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
     },
+    {
+        "name": "create_records",
+        "args_template": 'with object_name="Contact" records=[{{"LastName": "Bulk {random_id} 1", "AccountId": "{account_id}"}}, {{"LastName": "Bulk {random_id} 2", "AccountId": "{account_id}"}}]',
+        "expected_keywords": ["bulk_contact_id"],
+        "regex_extractors": {
+            "bulk_contact_id": r"bulk_contact_id:\s*([A-Za-z0-9]{15,18})"
+        },
+        "description": "Create multiple Contact records related to the test Account and return any one created ID as bulk_contact_id",
+        "depends_on": ["account_id"],
+        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+    },
+    {
+        "name": "update_records",
+        "args_template": 'with object_name="Contact" records=[{{"Id": "{bulk_contact_id}", "Title": "Updated {random_id}"}}]',
+        "expected_keywords": ["succeeded"],
+        "regex_extractors": {"succeeded": r"succeeded:\s*(\d+)"},
+        "description": "Update the bulk-created Contact and return the number of records that succeeded",
+        "depends_on": ["bulk_contact_id"],
+        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+    },
+    {
+        "name": "bulk_query",
+        "args_template": 'with query="SELECT Id, LastName FROM Contact WHERE AccountId = \'{account_id}\'" output_format="ndjson"',
+        "expected_keywords": ["job_id"],
+        "regex_extractors": {"job_id": r"job_id:\s*([A-Za-z0-9]{15,18})"},
+        "description": "Run a bulk SOQL query for the test Account's Contacts and return the job_id",
+        "depends_on": ["account_id"],
+    },
+    {
+        "name": "get_bulk_query_results",
+        "args_template": 'with job_id="{job_id}" wait_seconds=30',
+        "expected_keywords": ["state"],
+        "regex_extractors": {"state": r"state:\s*([A-Za-z]+)"},
+        "description": "Get the status and rows of the bulk query job and return its state",
+        "depends_on": ["job_id"],
+    },
+    {
+        "name": "bulk_ingest",
+        "args_template": 'with object_name="Contact" operation="update" records=[{{"Id": "{bulk_contact_id}", "Department": "Bulk {random_id}"}}]',
+        "expected_keywords": ["ingest_job_id"],
+        "regex_extractors": {"ingest_job_id": r"ingest_job_id:\s*([A-Za-z0-9]{15,18})"},
+        "description": "Update the bulk-created Contact with a bulk ingest job and return the job ID as ingest_job_id",
+        "depends_on": ["bulk_contact_id"],
+        "setup": lambda context: {"random_id": str(uuid.uuid4())[:8]},
+    },
+    {
+        "name": "get_bulk_ingest_status",
+        "args_template": 'with job_id="{ingest_job_id}" wait_seconds=30 include_failed_records=true',
+        "expected_keywords": ["state"],
+        "regex_extractors": {"state": r"state:\s*([A-Za-z]+)"},
+        "description": "Get the status of the bulk ingest job and return its state",
+        "depends_on": ["ingest_job_id"],
+    },
     {
         "name": "find_child_records",
         "args_template": 'with parent_id="{account_id}" child_object_name="Contact" parent_field_name="AccountId"',
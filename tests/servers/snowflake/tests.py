@@ -120,3 +120,35 @@ async def test_list_databases(client):
     assert response, "No response returned from list_databases"
     print(f"Response: {response}")
     print("✅ list_databases passed.")
+
+
+@pytest.mark.asyncio
+async def test_submit_query(client):
+    response = await client.process_query(
+        f"Use the submit_query tool to run the query: SELECT * FROM {TABLE_NAME}"
+        f" in the database {DB_NAME}."
+        " If successful, respond with 'Query submitted' followed by 'Query ID: <query_id>'."
+    )
+    assert (
+        "query submitted" in response.lower()
+    ), f"Expected success phrase not found in response: {response}"
+    assert "query id:" in response.lower(), "No query ID returned from submit_query"
+    print(f"Response: {response}")
+    print("✅ submit_query passed.")
+
+
+@pytest.mark.asyncio
+async def test_query_status_and_results(client):
+    response = await client.process_query(
+        f"Use the submit_query tool to run the query: SELECT * FROM {TABLE_NAME}"
+        f" in the database {DB_NAME}. Then use the get_query_status tool with"
+        " wait_seconds=30 to wait for it to finish, and the get_query_results tool"
+        " to fetch its rows as ndjson."
+        " If successful, respond with 'Here are the query results:' followed by the rows."
+    )
+    assert (
+        "here are the query results" in response.lower()
+    ), f"Expected success phrase not found in response: {response}"
+    assert response, "No response returned from get_query_results"
+    print(f"Response: {response}")
+    print("✅ get_query_status and get_query_results passed.")
@@ -336,6 +336,62 @@ async def test_get_channel_messages(client):
     print("✅ get_channel_messages passed.")
 
 
+@pytest.mark.asyncio
+async def test_get_new_team_channel_messages(client):
+    """Poll a channel for new messages twice.
+
+    Verifies that the first read initializes the cursor and the second read
+    only returns messages that arrived in between.
+
+    Args:
+        client: The test client fixture for the MCP server.
+    """
+    if not created_team_id or not created_channel_id:
+        pytest.skip(
+            "No team ID or channel ID available - created_team_id needs to be set at the top of the file and create_channel test needs to be run first"
+        )
+
+    for attempt in ["first", "second"]:
+        response = await client.process_query(
+            f"""Use the get_new_team_channel_messages tool to fetch new messages from team ID {created_team_id}
+            and channel ID {created_channel_id}.
+            If successful, start your response with 'Here are the new channel messages' and then list them."""
+        )
+
+        assert (
+            "here are the new channel messages" in response.lower()
+        ), f"Expected success phrase not found in {attempt} response: {response}"
+
+        print(f"Response ({attempt} poll): {response}")
+
+    print("✅ get_new_team_channel_messages passed.")
+
+
+@pytest.mark.asyncio
+async def test_get_new_chat_messages(client):
+    """Poll a chat for new messages.
+
+    Verifies that new chat messages are retrieved successfully.
+
+    Args:
+        client: The test client fixture for the MCP server.
+    """
+    if not chat_id:
+        pytest.skip("No chat ID available - run get_chats test first and set chat_id")
+
+    response = await client.process_query(
+        f"""Use the get_new_chat_messages tool to fetch new messages from chat ID {chat_id}.
+        If successful, start your response with 'Here are the new chat messages' and then list them."""
+    )
+
+    assert (
+        "here are the new chat messages" in response.lower()
+    ), f"Expected success phrase not found in response: {response}"
+
+    print(f"Response: {response}")
+    print("✅ get_new_chat_messages passed.")
+
+
 @pytest.mark.asyncio
 async def test_add_team_member(client):
     """Add a user to a team.
@@ -0,0 +1,69 @@
+import asyncio
+
+from mcp.types import TextContent
+
+from src.utils.cache.util import SingleFlight, ToolResponseCache
+
+KEY = ("server", "user", "tool", "arguments")
+
+
+async def test_cancelled_owner_does_not_cancel_waiters():
+    cache = ToolResponseCache(cache_dir=None)
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return [TextContent(type="text", text="result")]
+
+    owner = asyncio.create_task(cache.get_or_call(KEY, 60, call))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_call(KEY, 60, call))
+    await asyncio.sleep(0.01)
+    owner.cancel()
+
+    result = await waiter
+    assert owner.cancelled()
+    assert [content.text for content in result] == ["result"]
+    assert calls == 1
+    assert cache.get(KEY) is not None
+
+
+async def test_call_is_cancelled_when_no_caller_waits():
+    single_flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def call():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.create_task(single_flight.do("key", call))
+    await asyncio.sleep(0.01)
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+    assert "key" not in single_flight
+
+
+async def test_errors_reach_every_caller():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("failed")
+
+    results = await asyncio.gather(
+        single_flight.do("key", call),
+        single_flight.do("key", call),
+        return_exceptions=True,
+    )
+    assert [str(result) for result in results] == ["failed", "failed"]
+    assert calls == 1
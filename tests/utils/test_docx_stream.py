@@ -0,0 +1,91 @@
+import io
+import zipfile
+
+import pytest
+from docx import Document
+
+from src.utils.microsoft.docx_stream import (
+    DOCUMENT_PART,
+    append_paragraph_to_docx,
+    extract_docx_text,
+    insert_paragraph_xml,
+)
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+# Body-level sectPr holding a tracked section change, whose own sectPr is
+# nested inside w:sectPrChange
+TRACKED_SECTION_XML = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f"<w:document {W}><w:body>"
+    f"<w:p><w:r><w:t>First</w:t></w:r></w:p>"
+    f'<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    f'<w:sectPrChange w:id="1" w:author="Reviewer" w:date="2024-01-01T00:00:00Z">'
+    f'<w:sectPr><w:pgSz w:w="11906" w:h="16838"/></w:sectPr>'
+    f"</w:sectPrChange></w:sectPr>"
+    f"</w:body></w:document>"
+).encode()
+
+
+def build_docx(document_xml: bytes) -> io.BytesIO:
+    """Package a document.xml with python-docx's default parts"""
+    template = io.BytesIO()
+    Document().save(template)
+    template.seek(0)
+    package = io.BytesIO()
+    with zipfile.ZipFile(template) as source, zipfile.ZipFile(package, "w") as target:
+        for info in source.infolist():
+            data = document_xml if info.filename == DOCUMENT_PART else source.read(info)
+            target.writestr(info, data)
+    package.seek(0)
+    return package
+
+
+def test_paragraph_goes_before_body_section_with_tracked_change():
+    updated = insert_paragraph_xml(TRACKED_SECTION_XML, "Appended")
+
+    body = updated.split(b"<w:body>")[1]
+    assert body.index(b"Appended") < body.index(b"<w:sectPr>")
+    assert b"Appended" not in updated.split(b"<w:sectPrChange")[1]
+
+
+def test_paragraph_goes_before_body_section():
+    document_xml = (
+        f"<w:document {W}><w:body><w:p><w:pPr><w:sectPr/></w:pPr></w:p>"
+        f"<w:tbl/><w:sectPr/></w:body></w:document>"
+    ).encode()
+
+    updated = insert_paragraph_xml(document_xml, "Appended")
+
+    assert updated.endswith(
+        b'<w:p><w:r><w:t xml:space="preserve">Appended</w:t></w:r></w:p>'
+        b"<w:sectPr/></w:body></w:document>"
+    )
+
+
+def test_paragraph_goes_at_body_end_without_section():
+    document_xml = (
+        f"<w:document {W}><w:body><w:p><w:pPr><w:sectPr/></w:pPr></w:p>"
+        f"</w:body></w:document>"
+    ).encode()
+
+    updated = insert_paragraph_xml(document_xml, "Appended")
+
+    assert updated.endswith(b"</w:p></w:body></w:document>")
+    assert updated.index(b"Appended") > updated.index(b"</w:pPr></w:p>")
+
+
+def test_append_to_document_with_tracked_section_change():
+    target = io.BytesIO()
+    append_paragraph_to_docx(build_docx(TRACKED_SECTION_XML), "Appended", target)
+    target.seek(0)
+
+    document = Document(target)
+    assert [p.text for p in document.paragraphs] == ["First", "Appended"]
+    target.seek(0)
+    assert extract_docx_text(target) == "First\nAppended"
+
+
+def test_document_without_body_is_rejected():
+    with pytest.raises(ValueError):
+        insert_paragraph_xml(f"<w:document {W}/>".encode(), "Appended")